@@ -274,7 +274,11 @@ end
 ---============================================================================
 
 function init_gear_sets()
-    include('sets/blm_sets.lua')
+    -- Prebuilt snapshot (python set_snapshot.py); live build if stale/missing
+    local snap_ok, SetSnapshot = pcall(require, 'shared/utils/set_building/set_snapshot')
+    if not (snap_ok and SetSnapshot.apply('Tetsouo', 'blm')) then
+        include('sets/blm_sets.lua')
+    end
 end
 
 ---============================================================================
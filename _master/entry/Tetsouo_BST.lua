@@ -243,7 +243,11 @@ end
 ---============================================================================
 
 function init_gear_sets()
-    include('sets/bst_sets.lua')
+    -- Prebuilt snapshot (python set_snapshot.py); live build if stale/missing
+    local snap_ok, SetSnapshot = pcall(require, 'shared/utils/set_building/set_snapshot')
+    if not (snap_ok and SetSnapshot.apply('Tetsouo', 'bst')) then
+        include('sets/bst_sets.lua')
+    end
 end
 
 ---============================================================================
@@ -217,7 +217,11 @@ function job_update(cmdParams, eventArgs)
 end
 
 function init_gear_sets()
-    include('sets/drk_sets.lua')
+    -- Prebuilt snapshot (python set_snapshot.py); live build if stale/missing
+    local snap_ok, SetSnapshot = pcall(require, 'shared/utils/set_building/set_snapshot')
+    if not (snap_ok and SetSnapshot.apply('Tetsouo', 'drk')) then
+        include('sets/drk_sets.lua')
+    end
 end
 
 function file_unload()
@@ -262,7 +262,11 @@ end
 ---============================================================================
 
 function init_gear_sets()
-    include('sets/geo_sets.lua')
+    -- Prebuilt snapshot (python set_snapshot.py); live build if stale/missing
+    local snap_ok, SetSnapshot = pcall(require, 'shared/utils/set_building/set_snapshot')
+    if not (snap_ok and SetSnapshot.apply('Tetsouo', 'geo')) then
+        include('sets/geo_sets.lua')
+    end
 end
 
 ---============================================================================
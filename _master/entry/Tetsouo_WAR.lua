@@ -136,7 +136,11 @@ end
 --- Called by Mote-Include during initialization
 --- @return void
 function init_gear_sets()
-    include('sets/war_sets.lua')
+    -- Prebuilt snapshot (python set_snapshot.py); live build if stale/missing
+    local snap_ok, SetSnapshot = pcall(require, 'shared/utils/set_building/set_snapshot')
+    if not (snap_ok and SetSnapshot.apply('Tetsouo', 'war')) then
+        include('sets/war_sets.lua')
+    end
 end
 
 ---============================================================================
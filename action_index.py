@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Action Index Builder - Tetsouo GearSwap System
+==============================================
+Builds shared/data/packed/action_index.lua: one name -> owners index over
+every static action database, so a lookup no longer scans them one by one.
+
+    spell    shared/data/magic/*_DATABASE.lua  (+ the <dir>/*.lua leaf modules)
+    ability  shared/data/job_abilities/<JOB>_JA_DATABASE.lua (JA_DATABASE_FACTORY)
+    ws       shared/data/weaponskills/*_WS_DATABASE.lua
+
+Each name maps to its owners: the databases whose merged table holds it,
+in the key each consumer already uses (the magic database module path, the
+job code, the weapon type). The record itself stays in the database. Owner
+keys and owner lists are interned: the index stores small integers.
+
+shared/utils/data/action_index.lua loads it once per Windower session; the
+message handlers and UNIVERSAL_WS_DATABASE.resolve() then open only the
+owning database. The index is used only while every source file still has
+the recorded content stamp (size + Adler-32) - re-run the builder (or
+`--check`) after editing shared/data, like pack_databases.py.
+
+Usage:
+    python action_index.py              (build the index)
+    python action_index.py --check      (exit 1 if stale/missing)
+    python action_index.py --stats      (records and owners per kind)
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from gear_sets import file_stamp, lua_string
+from pack_databases import DATA_DIR, PACK_DIR, NotPackable, read_module, split_groups
+from tool_args import check_args
+
+INDEX_PATH = PACK_DIR / 'action_index.lua'
+INDEX_VERSION = 2
+
+KINDS = ('spell', 'ability', 'ws')
+
+# Record groups a magic database folds into its .spells table
+SPELL_GROUPS = ('spells', 'blood_pacts')
+
+# JA_DATABASE_FACTORY.create() default module list
+DEFAULT_JA_MODULES = ('subjob', 'mainjob', 'sp')
+
+_PACK_REQUIRE = re.compile(r"DataPack\.require\('([^']+)'\)")
+_DB_REQUIRE = re.compile(r"^local \w+ = require\('shared/data/magic/(\w+_DATABASE)'\)", re.M)
+_JA_MODULES = re.compile(r'modules\s*=\s*\{([^}]*)\}')
+_QUOTED = re.compile(r"'([^']+)'")
+_WS_TYPE = re.compile(r"\{file = '(\w+)',\s*type = '([^']+)'")
+
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def _module_file(base_dir, module):
+    return base_dir / (module + '.lua')
+
+
+def _records(path, groups):
+    """{name: record} of the given record groups of one data module ({} if unreadable)."""
+    try:
+        module, _ = read_module(path)
+    except (NotPackable, OSError):
+        return {}
+    found, _ = split_groups(module)
+    out = {}
+    for group in groups:
+        out.update(found.get(group, {}))
+    return out
+
+
+def collect_spells(base_dir, sources):
+    """{name: {owner module path}}"""
+    magic_dir = base_dir / DATA_DIR / 'magic'
+    databases = {}
+    for path in sorted(magic_dir.glob('*_DATABASE.lua')):
+        if path.stem == 'UNIVERSAL_SPELL_DATABASE':
+            continue
+        text = path.read_text(encoding='utf-8')
+        databases[path.stem] = (_PACK_REQUIRE.findall(text), _DB_REQUIRE.findall(text))
+        sources.add(path)
+
+    # Names each database merges straight from its leaf modules
+    direct = {}
+    for db, (leaves, _) in databases.items():
+        merged = direct.setdefault(db, {})
+        for leaf in leaves:
+            leaf_path = _module_file(base_dir, leaf)
+            sources.add(leaf_path)
+            merged.update(_records(leaf_path, SPELL_GROUPS))
+
+    index = {}
+    for db, (_, deps) in databases.items():
+        module = f"shared/data/magic/{db}"
+        held = dict(direct[db])
+        # Job databases (RDM, WHM, BLM, SCH, GEO) keep the skill spells their job can learn
+        job = db.split('_')[0]
+        for dep in deps:
+            for name, record in direct.get(dep, {}).items():
+                if record.get(job):
+                    held.setdefault(name, record)
+        for name in held:
+            index.setdefault(name, set()).add(module)
+    return index
+
+
+def collect_abilities(base_dir, sources):
+    """{name: {job code}}"""
+    ja_dir = base_dir / DATA_DIR / 'job_abilities'
+    index = {}
+    for path in sorted(ja_dir.glob('*_JA_DATABASE.lua')):
+        if path.stem == 'UNIVERSAL_JA_DATABASE':
+            continue
+        sources.add(path)
+        job = path.stem.split('_')[0]
+        match = _JA_MODULES.search(path.read_text(encoding='utf-8'))
+        suffixes = _QUOTED.findall(match.group(1)) if match else DEFAULT_JA_MODULES
+        for suffix in suffixes:
+            leaf_path = ja_dir / job.lower() / f"{job.lower()}_{suffix}.lua"
+            if not leaf_path.exists():
+                continue
+            sources.add(leaf_path)
+            for name in _records(leaf_path, ('abilities',)):
+                index.setdefault(name, set()).add(job)
+    return index
+
+
+def collect_weaponskills(base_dir, sources):
+    """{name: {weapon type}}"""
+    ws_dir = base_dir / DATA_DIR / 'weaponskills'
+    universal = ws_dir / 'UNIVERSAL_WS_DATABASE.lua'
+    sources.add(universal)
+    index = {}
+    for file, weapon_type in _WS_TYPE.findall(universal.read_text(encoding='utf-8')):
+        path = ws_dir / f"{file}.lua"
+        if not path.exists():
+            continue
+        sources.add(path)
+        for name in _records(path, ('weaponskills',)):
+            index.setdefault(name, set()).add(weapon_type)
+    return index
+
+
+def collect(base_dir):
+    """({kind: {name: owners}}, sorted source paths)"""
+    sources = set()
+    kinds = {
+        'spell': collect_spells(base_dir, sources),
+        'ability': collect_abilities(base_dir, sources),
+        'ws': collect_weaponskills(base_dir, sources),
+    }
+    return kinds, sorted(sources)
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def render(base_dir, kinds, sources):
+    strings = {}
+    owner_sets = {}
+
+    def intern(value):
+        if value not in strings:
+            strings[value] = len(strings) + 1
+        return strings[value]
+
+    def owners_id(owners):
+        key = tuple(sorted(intern(o) for o in owners))
+        if key not in owner_sets:
+            owner_sets[key] = len(owner_sets) + 1
+        return owner_sets[key]
+
+    rows = {}
+    for kind in KINDS:
+        rows[kind] = [(name, owners_id(owners)) for name, owners in sorted(kinds[kind].items())]
+
+    lines = [
+        '-- Generated by action_index.py - do not edit',
+        'return {',
+        f'    version = {INDEX_VERSION},',
+        '    sources = {',
+    ]
+    for p in sources:
+        size, adler = file_stamp(p)
+        lines.append(f"        {{{lua_string(p.relative_to(base_dir).as_posix())}, {size}, {adler}}},")
+    lines.append('    },')
+    lines.append('    strings = {')
+    lines.extend(f'        {lua_string(s)},' for s in strings)
+    lines.append('    },')
+    lines.append('    owners = {')
+    lines.extend('        {' + ', '.join(map(str, key)) + '},' for key in owner_sets)
+    lines.append('    },')
+    for kind in KINDS:
+        lines.append(f'    {kind} = {{')
+        lines.extend(f'        [{lua_string(name)}] = {owners},' for name, owners in rows[kind])
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n', len(strings), len(owner_sets)
+
+
+_SOURCE_RE = re.compile(r"^        \{'([^']+)', (\d+), (\d+)\},$", re.M)
+
+
+def index_is_fresh(base_dir, index_path, sources):
+    if not index_path.exists():
+        return False
+    text = index_path.read_text(encoding='utf-8')
+    if f'version = {INDEX_VERSION},' not in text[:200]:
+        return False
+    recorded = {path: (int(size), int(adler)) for path, size, adler in _SOURCE_RE.findall(text)}
+    current = {p.relative_to(base_dir).as_posix(): file_stamp(p) for p in sources}
+    return recorded == current
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+# Command line: flags, and options that take a value
+FLAGS = ('--check', '--stats')
+OPTIONS = ()
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    index_path = base_dir / INDEX_PATH
+
+    started = time.perf_counter()
+    kinds, sources = collect(base_dir)
+
+    if '--check' in sys.argv:
+        fresh = index_is_fresh(base_dir, index_path, sources)
+        print(f"[{'OK' if fresh else 'STALE'}] {INDEX_PATH.as_posix()}")
+        return 0 if fresh else 1
+
+    text, string_count, owner_count = render(base_dir, kinds, sources)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(text, encoding='utf-8')
+    total = sum(len(entries) for entries in kinds.values())
+    print(f"[OK] Indexed {total} actions from {len(sources)} modules into {INDEX_PATH.as_posix()} "
+          f"({index_path.stat().st_size // 1024} KB, {string_count} strings, {owner_count} owner sets) "
+          f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    if '--stats' in sys.argv:
+        for kind in KINDS:
+            entries = kinds[kind]
+            shared = sum(1 for owners in entries.values() if len(owners) > 1)
+            owners = set().union(*entries.values()) if entries else set()
+            print(f"   {kind:<8} {len(entries):>5} names  {len(owners):>3} databases  "
+                  f"{shared:>4} held by several databases")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
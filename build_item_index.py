@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Item Index Builder - Tetsouo GearSwap System
+============================================
+Builds shared/data/packed/item_index.lua from Windower's resource dump
+(res/items.lua): the en and enl (log form) names of every item, keyed by ID.
+
+shared/utils/data/item_index.lua loads this file instead of walking the
+~30k res.items entries in game, and keeps the result in a windower table so
+`gs reload` (every job change) does not pay for it again. The index is used
+only while res/items.lua still has the recorded content stamp (size +
+Adler-32); re-run the builder after a Windower resource update (or `--check`
+to see if it is needed).
+
+Usage:
+    python build_item_index.py                        (Windower/res/items.lua)
+    python build_item_index.py --res D:/Windower/res/items.lua
+    python build_item_index.py --check                (exit 1 if stale/missing)
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from gear_sets import file_stamp, lua_string
+from lua_table import LuaParseError, read_chunk
+from tool_args import arg_value, check_args
+
+INDEX_PATH = Path('shared') / 'data' / 'packed' / 'item_index.lua'
+INDEX_VERSION = 2
+
+
+def default_res_path(base_dir):
+    """Windower/res/items.lua, seen from Windower/addons/GearSwap/data/.
+
+    None when the repo is not three folders deep (not inside a Windower install).
+    """
+    if len(base_dir.parents) < 3:
+        return None
+    return base_dir.parents[2] / 'res' / 'items.lua'
+
+
+def load_items(res_path):
+    """Return {id: {field: value}} from a res/items.lua dump."""
+    text = res_path.read_text(encoding='utf-8', errors='replace')
+    for stmt in read_chunk(text):
+        if isinstance(stmt, tuple) and stmt[0] == 'return':
+            items = stmt[1]
+            if isinstance(items, list):
+                items = dict(enumerate(items, 1))
+            if not isinstance(items, dict):
+                raise ValueError('return value is not a table')
+            return items
+    raise ValueError('no return table')
+
+
+def build_index(items):
+    """Split the item names into {id: en} and {id: enl} (enl only when it differs)."""
+    en, enl = {}, {}
+    for key, item in items.items():
+        if not isinstance(key, (int, float)) or not isinstance(item, dict):
+            continue
+        item_id = int(key)
+        short = item.get('en')
+        if not isinstance(short, str) or not short:
+            continue
+        en[item_id] = short
+        long = item.get('enl')
+        if isinstance(long, str) and long and long.lower() != short.lower():
+            enl[item_id] = long
+    return en, enl
+
+
+def collisions(en, enl):
+    """Count lowercase names shared by several IDs (lowest ID wins in game)."""
+    owners = {}
+    for names in (en, enl):
+        for item_id, name in names.items():
+            owners.setdefault(name.lower(), set()).add(item_id)
+    return sum(1 for ids in owners.values() if len(ids) > 1)
+
+
+def render(en, enl, stamp):
+    lines = [
+        '-- Generated by build_item_index.py - do not edit',
+        'return {',
+        f'    version = {INDEX_VERSION},',
+        f'    source = {{{stamp[0]}, {stamp[1]}}},',
+        f'    count = {len(en)},',
+    ]
+    for field, names in (('en', en), ('enl', enl)):
+        lines.append(f'    {field} = {{')
+        lines.extend(f'        [{item_id}] = {lua_string(names[item_id])},' for item_id in sorted(names))
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+_STAMP_RE = re.compile(r'source = \{(\d+), (\d+)\},')
+
+
+def index_is_fresh(index_path, res_path):
+    if not index_path.exists():
+        return False
+    head = index_path.read_text(encoding='utf-8')[:300]
+    match = _STAMP_RE.search(head)
+    return bool(match) and (int(match.group(1)), int(match.group(2))) == file_stamp(res_path) and \
+        f'version = {INDEX_VERSION},' in head
+
+
+# Command line: flags, and options that take a value
+FLAGS = ('--check',)
+OPTIONS = ('--res',)
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    res_path = arg_value('--res') or default_res_path(base_dir)
+    index_path = base_dir / INDEX_PATH
+
+    if res_path is None or not Path(res_path).exists():
+        print(f"[ERROR] Resource file not found: {res_path or '<Windower>/res/items.lua'}")
+        print("        Pass --res <Windower>/res/items.lua")
+        return 1
+    res_path = Path(res_path)
+
+    if '--check' in sys.argv:
+        fresh = index_is_fresh(index_path, res_path)
+        print(f"[{'OK' if fresh else 'STALE'}] {INDEX_PATH.as_posix()}")
+        return 0 if fresh else 1
+
+    started = time.perf_counter()
+    try:
+        items = load_items(res_path)
+    except (LuaParseError, ValueError, OSError) as exc:
+        print(f"[ERROR] Cannot read {res_path}: {exc}")
+        return 1
+    en, enl = build_index(items)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(render(en, enl, file_stamp(res_path)), encoding='utf-8')
+    print(f"[OK] Indexed {len(en)} items ({len(enl)} log names, "
+          f"{collisions(en, enl)} shared names) into {INDEX_PATH.as_posix()} "
+          f"({index_path.stat().st_size // 1024} KB) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
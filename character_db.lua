@@ -11,7 +11,8 @@
 ---   local is_rdm = CharDB.has_job('Kaories','RDM') -- true
 ---
 --- Usage (Python - clone_character.py):
----   Parsed via regex from CHARACTERS table below.
+---   Parsed by CharacterDB (lua_table.py tokenizer) from the tables below;
+---   any valid Lua table syntax works (comments, nested tables, field order).
 ---
 --- Master data location:
 ---   _master/sets/[job]_sets.lua    - Equipment sets (15 jobs)
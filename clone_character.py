@@ -17,17 +17,35 @@ Usage:
     python clone_character.py              (French - default)
     python clone_character.py --lang en    (English)
 
+Batch mode (no prompts, characters cloned in parallel, one summary table):
+    python clone_character.py --all
+    python clone_character.py --only Tetsouo,Kaories
+    python clone_character.py --all --manifest fleet.json --region EU --workers 4
+
+Incremental sync (rewrite only files whose _master/ source changed, keep
+local edits; works interactively or with --all/--only):
+    python clone_character.py --sync
+    python clone_character.py --all --sync [--force]
+
 Author: Tetsouo GearSwap Project
 Version: 4.0.0 - Smart clone with character_db
 Date: 2026-02-16
 """
 
+import hashlib
+import json
 import os
+import pickle
 import re
 import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import lua_table
+from tool_args import arg_value, check_args
+
 # ============================================================================
 # TRANSLATIONS
 # ============================================================================
@@ -141,6 +159,28 @@ TRANSLATIONS = {
         # Lua comments
         'lua_role_main': 'Reçoit les mises à jour des personnages ALT',
         'lua_role_alt': 'Envoie les mises à jour au personnage MAIN',
+
+        # Batch mode
+        'banner_batch': 'CLONAGE EN LOT',
+        'batch_plan': "[OK] {} personnages à cloner ({} workers)",
+        'batch_unknown': "ERREUR: '{}' absent de character_db.lua et du manifeste",
+        'batch_empty': "ERREUR: Aucun personnage à cloner",
+        'batch_manifest_error': "ERREUR: Manifeste illisible ({}): {}",
+        'batch_header': ['Personnage', 'Rôle', 'Région', 'Source', 'Jobs',
+                         'Entry', 'Sets', 'Config', 'Temps', 'Statut'],
+        'batch_total': "\n[TOTAL] {} OK / {} échecs en {:.2f}s",
+        'batch_only_empty': "ERREUR: --only attend une liste de noms (ex: --only Tetsouo,Kaories)",
+        'batch_workers_error': "ERREUR: --workers attend un entier positif (reçu '{}')",
+        'batch_region_error': "ERREUR: Région '{}' invalide pour {} (us/eu/jp)",
+
+        # Sync mode
+        'banner_sync': 'SYNCHRONISATION INCRÉMENTALE',
+        'sync_added': "   [NOUVEAU] {}",
+        'sync_updated': "   [MAJ] {}",
+        'sync_removed': "   [SUPPRIMÉ] {}",
+        'sync_conflict': "   [CONFLIT] {} (modifié localement, conservé)",
+        'sync_summary': "\n[OK] {} à jour, {} mis à jour, {} ajoutés, {} supprimés, {} conflits",
+        'sync_force_hint': "   Relancez avec --force pour écraser les fichiers en conflit.",
     },
     'en': {
         'banner_title': 'SMART CLONE - TETSOUO GEARSWAP SYSTEM',
@@ -239,6 +279,26 @@ TRANSLATIONS = {
 
         'lua_role_main': 'Receives updates from ALT characters',
         'lua_role_alt': 'Sends updates to MAIN character',
+
+        'banner_batch': 'BATCH CLONE',
+        'batch_plan': "[OK] {} characters to clone ({} workers)",
+        'batch_unknown': "ERROR: '{}' not in character_db.lua or the manifest",
+        'batch_empty': "ERROR: No characters to clone",
+        'batch_manifest_error': "ERROR: Unreadable manifest ({}): {}",
+        'batch_header': ['Character', 'Role', 'Region', 'Source', 'Jobs',
+                         'Entry', 'Sets', 'Config', 'Time', 'Status'],
+        'batch_total': "\n[TOTAL] {} OK / {} failed in {:.2f}s",
+        'batch_only_empty': "ERROR: --only needs a list of names (e.g. --only Tetsouo,Kaories)",
+        'batch_workers_error': "ERROR: --workers needs a positive integer (got '{}')",
+        'batch_region_error': "ERROR: Invalid region '{}' for {} (us/eu/jp)",
+
+        'banner_sync': 'INCREMENTAL SYNC',
+        'sync_added': "   [NEW] {}",
+        'sync_updated': "   [UPDATE] {}",
+        'sync_removed': "   [REMOVED] {}",
+        'sync_conflict': "   [CONFLICT] {} (edited locally, kept)",
+        'sync_summary': "\n[OK] {} current, {} updated, {} added, {} removed, {} conflicts",
+        'sync_force_hint': "   Re-run with --force to overwrite conflicting files.",
     }
 }
 
@@ -248,46 +308,254 @@ ALL_VALID_JOBS = [
     'PLD', 'PUP', 'RDM', 'RUN', 'SAM', 'THF', 'WAR', 'WHM'
 ]
 
+# PlayOnline regions (REGION_CONFIG.lua)
+VALID_REGIONS = ('US', 'EU', 'JP')
+
+# Per-character record of generated files (used by --sync)
+CLONE_MANIFEST = '.clone_manifest.json'
+GENERATED_SOURCE = '<generated>'
+GENERATED_CONFIGS = ('config/DUALBOX_CONFIG.lua', 'config/REGION_CONFIG.lua')
+
+
+def _content_hash(data):
+    """Stable content hash used by the clone manifest."""
+    return hashlib.sha1(data).hexdigest()
+
 
 # ============================================================================
-# CHARACTER DATABASE PARSER
+# TEMPLATE RENDERING
 # ============================================================================
 
+# Lua lexical elements that matter for renaming. Comments are matched so they
+# can be skipped (headers keep "@author Tetsouo"); strings and identifiers are
+# where character names live (require paths, load_ui_config('Tetsouo', ...)).
+_LUA_TOKEN = re.compile(
+    rb"--\[(?P<lc>=*)\[.*?\](?P=lc)\]"     # long comment
+    rb"|--[^\n]*"                          # line comment
+    rb"|\[(?P<ls>=*)\[.*?\](?P=ls)\]"      # long string
+    rb"|\"(?:\\.|[^\"\\\n])*\""            # "string"
+    rb"|'(?:\\.|[^'\\\n])*'"               # 'string'
+    rb"|[A-Za-z_][A-Za-z0-9_]*",           # identifier
+    re.DOTALL,
+)
+
+
+def render_template(data, old_name, new_name):
+    """
+    Token-aware rename of a character name in Lua source bytes.
+
+    Only identifiers and string literals (require paths included) are
+    rewritten, and only where the name is a whole word: 'Tetsouo/config/x',
+    Tetsouo_WAR and 'Tetsouo' change, TetsouoGear or comments do not.
+    Returns `data` itself (same object) when nothing needs rewriting, so
+    callers can take the zero-copy path.
+    """
+    old = old_name.encode('utf-8')
+    if old == new_name.encode('utf-8') or old not in data:
+        return data
+    word = re.compile(rb'(?<![A-Za-z0-9])' + re.escape(old) + rb'(?![A-Za-z0-9])')
+    new = new_name.encode('utf-8')
+
+    out = []
+    pos = 0
+    changed = False
+    for m in _LUA_TOKEN.finditer(data):
+        token = m.group()
+        if token.startswith(b'--') or old not in token:
+            continue
+        renamed = word.sub(new, token)
+        if renamed != token:
+            out.append(data[pos:m.start()])
+            out.append(renamed)
+            pos = m.end()
+            changed = True
+    if not changed:
+        return data
+    out.append(data[pos:])
+    return b''.join(out)
+
+
+def _fast_copy(src, dst):
+    """Copy a file without staging it through Python (copy_file_range, then
+    shutil.copyfile which uses sendfile/fcopyfile/CopyFile2 where available)."""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+# ============================================================================
+# CHARACTER DATABASE
+# ============================================================================
+
+class CharacterDB:
+    """
+    Parsed character_db.lua with O(1) lookups, mirroring the Lua CharDB API
+    (get_jobs, get_role, has_job, get_owner, ...).
+
+    The file is read with lua_table (a real tokenizer/parser), so nested
+    braces, comments containing '}' and any field order are handled. Parsed
+    results are cached in __pycache__/ next to the DB, keyed by the file's
+    size + mtime, so repeated tool runs skip parsing entirely.
+
+    get_owner() returns the first character (file order) playing the job;
+    Lua's pairs() order is unspecified, which only matters for jobs shared
+    through an overlay (see CharDB.validate()).
+    """
+
+    CACHE_VERSION = 1
+    CACHE_FILE = 'character_db.pickle'
+
+    def __init__(self, characters, archive_jobs=(), all_jobs=None, master_paths=None):
+        # Ordered {name: {'jobs': [...], 'role': 'main'|'alt'}}
+        self.characters = characters
+        self.archive_jobs = list(archive_jobs)
+        self.all_jobs = list(all_jobs or ALL_VALID_JOBS)
+        self.master_paths = dict(master_paths or {})
+
+        self._by_lower = {name.lower(): name for name in characters}
+        self._jobs = {name: frozenset(data['jobs']) for name, data in characters.items()}
+        self._owners = {}
+        for name, data in characters.items():
+            for job in data['jobs']:
+                self._owners.setdefault(job, []).append(name)
+        self._archive = frozenset(self.archive_jobs)
+
+    # ------------------------------------------------------------------
+    # LOADING
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_source(cls, text):
+        """Build from character_db.lua source text."""
+        tables = lua_table.local_tables(text)
+        raw = tables.get('CHARACTERS')
+        if not isinstance(raw, dict):
+            raise lua_table.LuaParseError('CHARACTERS table not found')
+
+        characters = {}
+        for name, data in raw.items():
+            if not isinstance(name, str) or not isinstance(data, dict):
+                continue
+            jobs = data.get('jobs') or []
+            if isinstance(jobs, dict):  # mixed/empty table
+                jobs = [v for k, v in sorted(jobs.items(), key=lambda kv: str(kv[0]))
+                        if isinstance(k, int)]
+            characters[name] = {
+                'jobs': [str(j).upper() for j in jobs],
+                'role': str(data.get('role') or 'main'),
+            }
+
+        archive = tables.get('ARCHIVE_JOBS') or []
+        all_jobs = tables.get('ALL_JOBS') or None
+        master = tables.get('MASTER') or {}
+        return cls(characters,
+                   archive_jobs=[str(j).upper() for j in archive if isinstance(j, str)],
+                   all_jobs=[str(j).upper() for j in all_jobs] if isinstance(all_jobs, list) else None,
+                   master_paths=master if isinstance(master, dict) else {})
+
+    @classmethod
+    def load(cls, db_path, use_cache=True):
+        """Load character_db.lua, using the mtime-keyed pickle cache when fresh."""
+        db_path = Path(db_path)
+        st = db_path.stat()
+        key = (cls.CACHE_VERSION, st.st_size, st.st_mtime_ns)
+        cache_path = db_path.parent / '__pycache__' / cls.CACHE_FILE
+
+        if use_cache:
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_key, state = pickle.load(f)
+                if cached_key == key:
+                    return cls(*state)
+            except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+                pass
+
+        db = cls.from_source(db_path.read_text(encoding='utf-8'))
+
+        if use_cache:
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                tmp = cache_path.with_suffix('.tmp')
+                with open(tmp, 'wb') as f:
+                    pickle.dump((key, db._state()), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, cache_path)
+            except OSError:
+                pass  # read-only install: cache is an optimisation only
+        return db
+
+    def _state(self):
+        return (self.characters, self.archive_jobs, self.all_jobs, self.master_paths)
+
+    # ------------------------------------------------------------------
+    # LOOKUPS (same names as the Lua CharDB module)
+    # ------------------------------------------------------------------
+
+    def find(self, name):
+        """Canonical character name for a case-insensitive lookup, or None."""
+        return self._by_lower.get(name.lower()) if name else None
+
+    def get_jobs(self, name):
+        canonical = self.find(name)
+        return self.characters[canonical]['jobs'] if canonical else None
+
+    def get_role(self, name):
+        canonical = self.find(name)
+        return self.characters[canonical]['role'] if canonical else None
+
+    def has_job(self, name, job):
+        canonical = self.find(name)
+        return bool(canonical) and job.upper() in self._jobs[canonical]
+
+    def get_owner(self, job):
+        """First character playing the job, '_archive', or None."""
+        owners = self._owners.get(job.upper())
+        if owners:
+            return owners[0]
+        return '_archive' if job.upper() in self._archive else None
+
+    def get_owners(self, job):
+        """Every character playing the job (multi-owner via overlay)."""
+        return list(self._owners.get(job.upper(), ()))
+
+    def get_archive_jobs(self):
+        return list(self.archive_jobs)
+
+    def get_character_names(self):
+        return list(self.characters)
+
+    def get_all_jobs(self):
+        return list(self.all_jobs)
+
+    def get_master_paths(self):
+        return dict(self.master_paths)
+
+    def as_dict(self):
+        """{ name: {'jobs': [...], 'role': ...} } (legacy parse_character_db shape)."""
+        return {name: {'jobs': list(d['jobs']), 'role': d['role']}
+                for name, d in self.characters.items()}
+
+
 def parse_character_db(db_path):
     """
     Parse character_db.lua to extract character → jobs mapping.
     Returns dict: { 'Tetsouo': {'jobs': ['BLM','BRD',...], 'role': 'main'}, ... }
+    (empty dict when the file is missing or unreadable).
     """
-    characters = {}
-
-    if not db_path.exists():
-        return characters
-
     try:
-        content = db_path.read_text(encoding='utf-8')
-    except Exception:
-        return characters
-
-    # Parse each character block:
-    #   Tetsouo = {
-    #       jobs = { 'BLM', 'BRD', ... },
-    #       role = 'main',
-    #   },
-    # Pattern: Name (mixed case, not ALL_CAPS) = { ... jobs = { ... } ... role = '...' }
-    char_pattern = r"([A-Z][a-z]\w*)\s*=\s*\{[^}]*jobs\s*=\s*\{([^}]*)\}[^}]*role\s*=\s*['\"](\w+)['\"]"
-    for match in re.finditer(char_pattern, content, re.DOTALL):
-        name = match.group(1)
-        jobs_str = match.group(2)
-        role = match.group(3)
-
-        # Extract job abbreviations from the jobs string
-        jobs = re.findall(r"'(\w+)'", jobs_str)
-        characters[name] = {
-            'jobs': [j.upper() for j in jobs],
-            'role': role
-        }
-
-    return characters
+        return CharacterDB.load(db_path).as_dict()
+    except (OSError, ValueError):
+        return {}
 
 
 # ============================================================================
@@ -307,7 +575,7 @@ class SmartCharacterCloner:
 
     DEFAULT_SOURCE = "Tetsouo"  # Default template character
 
-    def __init__(self, base_dir=None, lang='fr', source_name=None):
+    def __init__(self, base_dir=None, lang='fr', source_name=None, verbose=True):
         if base_dir is None:
             self.base_dir = Path(__file__).parent.absolute()
         else:
@@ -327,17 +595,25 @@ class SmartCharacterCloner:
         self.lang = lang
         self.t = TRANSLATIONS.get(lang, TRANSLATIONS['fr'])
         self.yes_answers = ['y', 'o', 'yes', 'oui']
+        # Batch workers run quiet so parallel clones don't interleave output
+        self.verbose = verbose
 
         # Counters for summary
         self.count_entry = 0
         self.count_sets = 0
         self.count_configs = 0
+        self.count_renamed = 0
 
     def banner(self, key):
         """Print a section banner."""
-        print("\n" + "=" * 70)
-        print(f"  {self.t[key]}")
-        print("=" * 70)
+        self._say("\n" + "=" * 70)
+        self._say(f"  {self.t[key]}")
+        self._say("=" * 70)
+
+    def _say(self, message):
+        """Print a progress line unless running quiet (batch workers)."""
+        if self.verbose:
+            print(message)
 
     # ------------------------------------------------------------------
     # VALIDATION
@@ -358,29 +634,35 @@ class SmartCharacterCloner:
 
         return True
 
-    def validate_target(self, name):
-        """Validate target character name."""
+    def validate_target(self, name, overwrite=None, keep_existing=False):
+        """Validate target character name.
+
+        overwrite: None asks before deleting an existing folder, True deletes
+                   it without asking (batch mode), False refuses.
+        keep_existing: accept an existing folder as-is (--sync mode).
+        """
         if not name:
-            print(self.t['target_empty'])
+            self._say(self.t['target_empty'])
             return False
         if not name.isalnum():
-            print(self.t['target_alphanum'])
+            self._say(self.t['target_alphanum'])
             return False
         if len(name) < 2 or len(name) > 15:
-            print(self.t['target_length'])
+            self._say(self.t['target_length'])
             return False
 
         target_dir = self.base_dir / name
-        if target_dir.exists():
-            print(self.t['target_exists'].format(name))
-            print(self.t['target_location'].format(target_dir))
-            response = input(self.t['delete_existing']).lower()
-            if response in self.yes_answers:
+        if target_dir.exists() and not keep_existing:
+            self._say(self.t['target_exists'].format(name))
+            self._say(self.t['target_location'].format(target_dir))
+            if overwrite is None:
+                overwrite = input(self.t['delete_existing']).lower() in self.yes_answers
+            if overwrite:
                 try:
                     shutil.rmtree(target_dir)
-                    print(self.t['delete_ok'].format(name))
+                    self._say(self.t['delete_ok'].format(name))
                 except Exception as e:
-                    print(self.t['delete_failed'].format(e))
+                    self._say(self.t['delete_failed'].format(e))
                     return False
             else:
                 return False
@@ -400,15 +682,20 @@ class SmartCharacterCloner:
             return None, None
 
         print(self.t['db_found'])
-        characters = parse_character_db(self.db_path)
-
-        # Case-insensitive lookup
-        for char_name, data in characters.items():
-            if char_name.lower() == name.lower():
-                print(self.t['db_char_known'].format(char_name))
-                print(self.t['db_char_jobs'].format(', '.join(data['jobs'])))
-                print(self.t['db_char_role'].format(data['role'].upper()))
-                return data['jobs'], data['role']
+        try:
+            db = CharacterDB.load(self.db_path)
+        except (OSError, ValueError) as e:
+            print(f"   [{type(e).__name__}] {e}")
+            db = CharacterDB({})
+
+        # Case-insensitive O(1) lookup
+        char_name = db.find(name)
+        if char_name:
+            jobs, role = db.get_jobs(char_name), db.get_role(char_name)
+            print(self.t['db_char_known'].format(char_name))
+            print(self.t['db_char_jobs'].format(', '.join(jobs)))
+            print(self.t['db_char_role'].format(role.upper()))
+            return list(jobs), role
 
         print(self.t['db_char_unknown'].format(name))
         print(self.t['db_char_unknown_desc'])
@@ -495,7 +782,7 @@ class SmartCharacterCloner:
         print(self.t['region_jp'])
         while True:
             region = input(self.t['region_question'].format(name)).strip().upper()
-            if region in ['US', 'EU', 'JP']:
+            if region in VALID_REGIONS:
                 print(self.t['region_selected'].format(region, name))
                 return region
             print(self.t['region_error'])
@@ -530,163 +817,391 @@ class SmartCharacterCloner:
         jobs_upper = [j.upper() for j in jobs]
 
         # ── Step 1: Create directory structure ─────────────────────────
-        print(self.t['step_dirs'])
+        self._say(self.t['step_dirs'])
         (target_dir / 'sets').mkdir(parents=True, exist_ok=True)
         (target_dir / 'config').mkdir(parents=True, exist_ok=True)
-        print(self.t['copy_ok'].format(f"{target_name}/sets/"))
-        print(self.t['copy_ok'].format(f"{target_name}/config/"))
+        self._say(self.t['copy_ok'].format(f"{target_name}/sets/"))
+        self._say(self.t['copy_ok'].format(f"{target_name}/config/"))
 
         # Note: each file is resolved via _resolve_src() so that any file
         # present under _master/<TEMPLATE_NAME>/ overrides its counterpart in
         # _master/. For default source (Tetsouo) the overlay folder doesn't
         # exist, so behaviour matches the legacy single-source clone.
+        plan, no_config_jobs = self._plan_files(target_name, jobs)
 
-        # Determine entry-file basename. Kaories overlay stores "Kaories_<JOB>"
-        # files; the Tetsouo template uses "Tetsouo_<JOB>". We try the
-        # template-name form first, then fall back to Tetsouo-prefixed form
-        # (since the overlay's file may use the source name as the prefix).
-        def find_entry_src(job_upper):
-            # Try overlay with TEMPLATE_NAME prefix
-            cand = self.override_dir / 'entry' / f'{self.TEMPLATE_NAME}_{job_upper}.lua'
-            if cand.exists():
-                return cand, f'{self.TEMPLATE_NAME}_{job_upper}.lua'
-            # Try master with Tetsouo prefix (the canonical generic template)
-            cand = self.master_dir / 'entry' / f'{self.DEFAULT_SOURCE}_{job_upper}.lua'
-            if cand.exists():
-                return cand, f'{self.DEFAULT_SOURCE}_{job_upper}.lua'
-            return None, None
+        # Every file is rendered straight from its source into the target in
+        # one pass (read once, write once): the Tetsouo >> target rename is
+        # applied on the fly, token-free files take a kernel-side copy.
+        records = {}
+        self.count_renamed = 0
+
+        def emit(rel, src):
+            records[rel] = self._render_file(src, target_dir / rel, target_name)
 
         # ── Step 2: Copy entry files (only selected jobs) ─────────────
-        print(self.t['step_entry'].format(len(jobs)))
+        self._say(self.t['step_entry'].format(len(jobs)))
         self.count_entry = 0
-        for job_upper, job_lower in zip(jobs_upper, jobs_lower):
-            src, src_label = find_entry_src(job_upper)
-            dst = target_dir / f'{target_name}_{job_upper}.lua'
-            if src and src.exists():
-                shutil.copy2(src, dst)
-                print(self.t['copy_ok'].format(f"{target_name}_{job_upper}.lua"))
+        for kind, rel, src in plan:
+            if kind != 'entry':
+                continue
+            if src:
+                emit(rel, src)
+                self._say(self.t['copy_ok'].format(rel))
                 self.count_entry += 1
             else:
-                print(self.t['copy_skip'].format(f"entry/{src_label or job_upper}"))
+                self._say(self.t['copy_skip'].format(f"entry/{rel.split('_', 1)[-1][:-4]}"))
 
         # ── Step 3: Copy set files (only selected jobs) ───────────────
-        print(self.t['step_sets'].format(len(jobs)))
+        self._say(self.t['step_sets'].format(len(jobs)))
         self.count_sets = 0
-        for job_lower in jobs_lower:
-            src = self._resolve_src(('sets', f'{job_lower}_sets.lua'))
-            dst = target_dir / 'sets' / f'{job_lower}_sets.lua'
-            if src.exists():
-                shutil.copy2(src, dst)
-                print(self.t['copy_ok'].format(f"sets/{job_lower}_sets.lua"))
+        for kind, rel, src in plan:
+            if kind != 'sets':
+                continue
+            if src:
+                emit(rel, src)
+                self._say(self.t['copy_ok'].format(rel))
                 self.count_sets += 1
             else:
-                print(self.t['copy_skip'].format(f"sets/{job_lower}_sets.lua"))
+                self._say(self.t['copy_skip'].format(rel))
 
         # ── Step 4: Copy configs (job-specific + global) ──────────────
-        print(self.t['step_configs'].format(len(jobs)))
+        self._say(self.t['step_configs'].format(len(jobs)))
         self.count_configs = 0
 
         # Job-specific configs (per-file overlay so REFILL etc. can be Kaories-specific)
-        no_config_jobs = []
         for job_lower in jobs_lower:
-            master_jobdir = self.master_dir / 'config' / job_lower
-            override_jobdir = self.override_dir / 'config' / job_lower
-            dst_dir = target_dir / 'config' / job_lower
-            if not master_jobdir.exists() and not override_jobdir.exists():
-                no_config_jobs.append(job_lower.upper())
+            if job_lower.upper() in no_config_jobs:
                 continue
+            dst_dir = target_dir / 'config' / job_lower
             dst_dir.mkdir(parents=True, exist_ok=True)
-            # Union of filenames in master and overlay
-            seen = set()
-            for d in (master_jobdir, override_jobdir):
-                if d.exists():
-                    for f in d.glob('*.lua'):
-                        seen.add(f.name)
             file_count = 0
-            for fname in sorted(seen):
-                src = self._resolve_src(('config', job_lower, fname))
-                if src.exists():
-                    shutil.copy2(src, dst_dir / fname)
+            for kind, rel, src in plan:
+                if kind == 'config' and rel.startswith(f'config/{job_lower}/'):
+                    emit(rel, src)
                     file_count += 1
             self.count_configs += file_count
-            print(self.t['copy_ok'].format(f"config/{job_lower}/ ({file_count} files)"))
+            self._say(self.t['copy_ok'].format(f"config/{job_lower}/ ({file_count} files)"))
 
         if no_config_jobs:
-            print(self.t['jobs_no_config'].format(', '.join(no_config_jobs)))
+            self._say(self.t['jobs_no_config'].format(', '.join(no_config_jobs)))
 
         # Global configs (overlay-aware: Kaories' DUALBOX/WARDROBE/REGION
         # override generic templates; new files in overlay are also copied).
-        master_globals = self.master_dir / 'config_global'
-        override_globals = self.override_dir / 'config_global'
-        seen_globals = set()
-        for d in (master_globals, override_globals):
-            if d.exists():
-                for f in d.glob('*.lua'):
-                    seen_globals.add(f.name)
-        for fname in sorted(seen_globals):
-            src = self._resolve_src(('config_global', fname))
-            if src.exists():
-                dst = target_dir / 'config' / fname
-                shutil.copy2(src, dst)
+        for kind, rel, src in plan:
+            if kind == 'global':
+                emit(rel, src)
                 self.count_configs += 1
-                print(self.t['copy_ok'].format(f"config/{fname} (global)"))
+                self._say(self.t['copy_ok'].format(f"{rel} (global)"))
 
         # ── Step 5: Rename references (Tetsouo → target) ─────────────
-        print(self.t['step_rename'])
-        modified = self._replace_references(target_dir, target_name)
-        print(self.t['replace_count'].format(modified, target_name))
-
-        # Rename entry files content (already copied with Tetsouo_ prefix name in content)
-        # The file names were already set correctly in step 2
+        # Already applied while rendering; only report it here.
+        self._say(self.t['step_rename'])
+        self._say(self.t['replace_count'].format(self.count_renamed, target_name))
 
         # ── Step 6: Generate character-specific configs ───────────────
-        print(self.t['step_generate'])
-        self._create_dualbox_config(target_dir, dualbox_config)
-        self._create_region_config(target_dir, target_name, region)
-        self.count_configs += 2  # DUALBOX + REGION
+        self._say(self.t['step_generate'])
+        generated = self._generated_files(target_name, dualbox_config, region)
+        for rel, text in generated.items():
+            records[rel] = self._write_generated(target_dir / rel, text.encode('utf-8'),
+                                                 target_name)
+            self._say(self.t['copy_ok'].format(Path(rel).name))
+        self.count_configs += len(generated)  # DUALBOX + REGION
+
+        # Record what was generated from where, so --sync can re-run
+        # incrementally and detect local edits later.
+        self._save_clone_manifest(target_dir, records)
 
         # ── Summary ───────────────────────────────────────────────────
         self.banner('banner_complete')
-        print(self.t['summary_title'])
-        print(self.t['summary_source'])
-        print(self.t['summary_target'].format(target_name))
-        print(self.t['summary_jobs'].format(len(jobs), ', '.join(jobs_upper)))
-        print(self.t['summary_role'].format(dualbox_config['role'].upper()))
+        self._say(self.t['summary_title'])
+        self._say(self.t['summary_source'])
+        self._say(self.t['summary_target'].format(target_name))
+        self._say(self.t['summary_jobs'].format(len(jobs), ', '.join(jobs_upper)))
+        self._say(self.t['summary_role'].format(dualbox_config['role'].upper()))
 
         partner = (dualbox_config.get('alt_character') or
                    dualbox_config.get('main_character') or
                    self.t['conf_none'])
-        print(self.t['summary_partner'].format(partner))
-        print(self.t['summary_entry'].format(self.count_entry))
-        print(self.t['summary_sets'].format(self.count_sets))
-        print(self.t['summary_configs'].format(self.count_configs))
-        print(self.t['clone_success'].format(target_name, len(jobs)))
+        self._say(self.t['summary_partner'].format(partner))
+        self._say(self.t['summary_entry'].format(self.count_entry))
+        self._say(self.t['summary_sets'].format(self.count_sets))
+        self._say(self.t['summary_configs'].format(self.count_configs))
+        self._say(self.t['clone_success'].format(target_name, len(jobs)))
+
+        return True
+
+    # ------------------------------------------------------------------
+    # INCREMENTAL SYNC
+    # ------------------------------------------------------------------
+
+    def sync(self, target_name, jobs, dualbox_config, region, force=False):
+        """Incremental re-clone driven by <target>/.clone_manifest.json.
 
+        Only files whose source (or applied substitution) changed since the
+        last clone/sync are rewritten. A generated file the user edited is
+        reported as a conflict and kept, unless force=True. Files no longer
+        part of the plan (job removed) are deleted when unedited. Unchanged
+        sources are detected from their recorded size/mtime, so a no-op sync
+        only stats files and never reads or writes them.
+        """
+        self.banner('banner_sync')
+
+        target_dir = self.base_dir / target_name
+        subst = [self.TEMPLATE_NAME, target_name]
+        plan, _ = self._plan_files(target_name, jobs)
+        generated = self._generated_files(target_name, dualbox_config, region)
+        old_files = self._load_clone_manifest(target_dir).get('files', {})
+
+        items = [(rel, src, None) for kind, rel, src in plan if src]
+        items += [(rel, None, text.encode('utf-8')) for rel, text in generated.items()]
+
+        self.count_entry = sum(1 for kind, _, src in plan if kind == 'entry' and src)
+        self.count_sets = sum(1 for kind, _, src in plan if kind == 'sets' and src)
+        self.count_configs = len(items) - self.count_entry - self.count_sets
+
+        stats = dict.fromkeys(('current', 'updated', 'added', 'removed', 'conflicts'), 0)
+        new_files = {}
+        dirty = False
+
+        for rel, src, data in items:
+            rec = old_files.get(rel)
+            dst = target_dir / rel
+
+            if src is not None:
+                src_rel = src.relative_to(self.base_dir).as_posix()
+                st = src.stat()
+                src_stat = [st.st_size, st.st_mtime_ns]
+                if (rec and rec.get('src') == src_rel and rec.get('subst') == subst
+                        and rec.get('src_stat') == src_stat):
+                    src_hash = rec['src_hash']  # untouched since last run
+                else:
+                    data = src.read_bytes()
+                    src_hash = _content_hash(data)
+            else:
+                src_rel, src_stat = GENERATED_SOURCE, None
+                src_hash = _content_hash(data)
+
+            fresh = (rec is not None and rec.get('src') == src_rel
+                     and rec.get('subst') == subst and rec.get('src_hash') == src_hash)
+            if fresh and dst.exists():
+                if rec.get('src_stat') != src_stat:
+                    rec = dict(rec, src_stat=src_stat)
+                    dirty = True
+                new_files[rel] = rec
+                stats['current'] += 1
+                continue
+
+            if data is None:
+                data = src.read_bytes()
+            out = render_template(data, self.TEMPLATE_NAME, target_name) if src is not None else data
+            current = dst.read_bytes() if dst.exists() else None
+
+            # Upstream changed: only overwrite what we generated ourselves
+            if current is not None and current != out and not force:
+                expected = rec['out_hash'] if rec else None
+                if _content_hash(current) != expected:
+                    self._say(self.t['sync_conflict'].format(rel))
+                    stats['conflicts'] += 1
+                    if rec:
+                        new_files[rel] = rec
+                    continue
+
+            if current != out:
+                action = 'added' if current is None else 'updated'
+                self._say(self.t['sync_' + action].format(rel))
+                stats[action] += 1
+            else:
+                stats['current'] += 1
+            if src is not None:
+                new_files[rel] = self._render_file(src, dst, target_name, data=data,
+                                                   out=out, write=current != out)
+            else:
+                new_files[rel] = self._write_generated(dst, data, target_name,
+                                                       write=current != out)
+            dirty = True
+
+        # Files generated by a previous run that are no longer planned
+        planned = {item[0] for item in items}
+        for rel, rec in old_files.items():
+            if rel in planned:
+                continue
+            dst = target_dir / rel
+            dirty = True
+            if not dst.exists():
+                continue
+            if not force and _content_hash(dst.read_bytes()) != rec.get('out_hash'):
+                self._say(self.t['sync_conflict'].format(rel))
+                stats['conflicts'] += 1
+                new_files[rel] = rec
+                continue
+            dst.unlink()
+            self._say(self.t['sync_removed'].format(rel))
+            stats['removed'] += 1
+
+        if dirty:
+            self._save_clone_manifest(target_dir, new_files)
+
+        self._say(self.t['sync_summary'].format(
+            stats['current'], stats['updated'], stats['added'],
+            stats['removed'], stats['conflicts']))
+        if stats['conflicts']:
+            self._say(self.t['sync_force_hint'])
+        self.sync_stats = stats
         return True
 
     # ------------------------------------------------------------------
     # INTERNAL HELPERS
     # ------------------------------------------------------------------
 
-    def _replace_references(self, target_dir, target_name):
-        """Replace all 'Tetsouo' references with target_name in .lua files."""
-        modified = 0
-        for lua_file in target_dir.rglob('*.lua'):
-            try:
-                content = lua_file.read_text(encoding='utf-8')
-                if self.TEMPLATE_NAME in content:
-                    new_content = content.replace(self.TEMPLATE_NAME, target_name)
-                    lua_file.write_text(new_content, encoding='utf-8')
-                    modified += 1
-            except Exception:
-                pass
-        return modified
+    def _find_entry_src(self, job_upper):
+        """Resolve the entry template for a job.
+
+        Kaories overlay stores "Kaories_<JOB>" files; the Tetsouo template
+        uses "Tetsouo_<JOB>". We try the template-name form first, then fall
+        back to the Tetsouo-prefixed form (the canonical generic template).
+        """
+        # Try overlay with TEMPLATE_NAME prefix
+        cand = self.override_dir / 'entry' / f'{self.TEMPLATE_NAME}_{job_upper}.lua'
+        if cand.exists():
+            return cand
+        # Try master with Tetsouo prefix (the canonical generic template)
+        cand = self.master_dir / 'entry' / f'{self.DEFAULT_SOURCE}_{job_upper}.lua'
+        if cand.exists():
+            return cand
+        return None
+
+    def _plan_files(self, target_name, jobs):
+        """Resolve every template file a clone of `jobs` writes.
+
+        Returns (plan, no_config_jobs). plan is an ordered list of
+        (kind, rel, src) where kind is 'entry', 'sets', 'config' or 'global',
+        rel is the posix path inside the character folder and src the
+        resolved _master/ path (None when the template is missing).
+        """
+        plan = []
+        no_config_jobs = []
+
+        for job in jobs:
+            job_upper = job.upper()
+            plan.append(('entry', f'{target_name}_{job_upper}.lua',
+                         self._find_entry_src(job_upper)))
+
+        for job in jobs:
+            job_lower = job.lower()
+            src = self._resolve_src(('sets', f'{job_lower}_sets.lua'))
+            plan.append(('sets', f'sets/{job_lower}_sets.lua', src if src.exists() else None))
+
+        for job in jobs:
+            job_lower = job.lower()
+            master_jobdir = self.master_dir / 'config' / job_lower
+            override_jobdir = self.override_dir / 'config' / job_lower
+            if not master_jobdir.exists() and not override_jobdir.exists():
+                no_config_jobs.append(job_lower.upper())
+                continue
+            # Union of filenames in master and overlay
+            seen = set()
+            for d in (master_jobdir, override_jobdir):
+                if d.exists():
+                    for f in d.glob('*.lua'):
+                        seen.add(f.name)
+            for fname in sorted(seen):
+                src = self._resolve_src(('config', job_lower, fname))
+                if src.exists():
+                    plan.append(('config', f'config/{job_lower}/{fname}', src))
+
+        master_globals = self.master_dir / 'config_global'
+        override_globals = self.override_dir / 'config_global'
+        seen_globals = set()
+        for d in (master_globals, override_globals):
+            if d.exists():
+                for f in d.glob('*.lua'):
+                    seen_globals.add(f.name)
+        for fname in sorted(seen_globals):
+            # DUALBOX/REGION are always regenerated from the clone answers
+            if f'config/{fname}' in GENERATED_CONFIGS:
+                continue
+            src = self._resolve_src(('config_global', fname))
+            if src.exists():
+                plan.append(('global', f'config/{fname}', src))
+
+        return plan, no_config_jobs
+
+    def _render_file(self, src, dst, target_name, data=None, out=None, write=True):
+        """Render one template file into dst and return its manifest record.
 
-    def _create_dualbox_config(self, target_dir, config):
-        """Generate DUALBOX_CONFIG.lua."""
-        config_dir = target_dir / 'config'
-        config_dir.mkdir(parents=True, exist_ok=True)
+        The source is read once (it is hashed for the manifest anyway). Files
+        containing the template name get the token-aware rename and a single
+        write; token-free files go through _fast_copy(). Hard links are not
+        used: a later edit of the character file would write through to
+        _master/.
+        """
+        if data is None:
+            data = src.read_bytes()
+        if out is None:
+            out = render_template(data, self.TEMPLATE_NAME, target_name)
+        if write:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if out is data:
+                _fast_copy(src, dst)
+            else:
+                dst.write_bytes(out)
+                self.count_renamed += 1
+        st_src = src.stat()
+        st = dst.stat()
+        src_hash = _content_hash(data)
+        return {
+            'src': src.relative_to(self.base_dir).as_posix(),
+            'src_hash': src_hash,
+            'src_stat': [st_src.st_size, st_src.st_mtime_ns],
+            'subst': [self.TEMPLATE_NAME, target_name],
+            'out_hash': src_hash if out is data else _content_hash(out),
+            'out_stat': [st.st_size, st.st_mtime_ns],
+        }
 
+    def _write_generated(self, dst, data, target_name, write=True):
+        """Write a generated config and return its manifest record."""
+        if write:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_bytes(data)
+        st = dst.stat()
+        content_hash = _content_hash(data)
+        return {
+            'src': GENERATED_SOURCE,
+            'src_hash': content_hash,
+            'src_stat': None,
+            'subst': [self.TEMPLATE_NAME, target_name],
+            'out_hash': content_hash,
+            'out_stat': [st.st_size, st.st_mtime_ns],
+        }
+
+    def _load_clone_manifest(self, target_dir):
+        """Read <target>/.clone_manifest.json (empty dict if absent/corrupt)."""
+        path = target_dir / CLONE_MANIFEST
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_clone_manifest(self, target_dir, files):
+        """Write <target>/.clone_manifest.json."""
+        manifest = {
+            'version': 1,
+            'template': self.TEMPLATE_NAME,
+            'files': dict(sorted(files.items())),
+        }
+        (target_dir / CLONE_MANIFEST).write_text(
+            json.dumps(manifest, indent=1), encoding='utf-8')
+
+    def _generated_files(self, target_name, dualbox_config, region):
+        """Character-specific configs rendered from the clone answers."""
+        dualbox_rel, region_rel = GENERATED_CONFIGS
+        return {
+            dualbox_rel: self._dualbox_lua(dualbox_config),
+            region_rel: self._region_lua(target_name, region),
+        }
+
+    def _dualbox_lua(self, config):
+        """Render DUALBOX_CONFIG.lua."""
         role = config['role']
         char_name = config['character_name']
         enabled = str(config['enabled']).lower()
@@ -700,7 +1215,7 @@ class SmartCharacterCloner:
             main = config.get('main_character') or 'Unknown'
             partner_block = f'DualBoxConfig.main_character = "{main}"'
 
-        lua = f"""---============================================================================
+        return f"""---============================================================================
 --- Dual-Boxing Configuration - {char_name}
 ---============================================================================
 --- Role: {'MAIN' if role == 'main' else 'ALT'} - {role_desc}
@@ -725,20 +1240,16 @@ DualBoxConfig.alt_name = DualBoxConfig.{'alt_character' if role == 'main' else '
 
 return DualBoxConfig
 """
-        (config_dir / 'DUALBOX_CONFIG.lua').write_text(lua, encoding='utf-8')
-        print(self.t['copy_ok'].format("DUALBOX_CONFIG.lua"))
-
-    def _create_region_config(self, target_dir, char_name, region):
-        """Generate REGION_CONFIG.lua."""
-        config_dir = target_dir / 'config'
 
+    def _region_lua(self, char_name, region):
+        """Render REGION_CONFIG.lua."""
         orange_note = {
             'US': '(NBCP) - Has orange (057)',
             'EU': '(BQJS) - No orange (057)',
             'JP': 'Has orange (057)',
         }
 
-        lua = f"""---============================================================================
+        return f"""---============================================================================
 --- Region Configuration - {char_name}
 ---============================================================================
 --- @file config/REGION_CONFIG.lua
@@ -768,16 +1279,206 @@ end
 
 return RegionConfig
 """
-        (config_dir / 'REGION_CONFIG.lua').write_text(lua, encoding='utf-8')
-        print(self.t['copy_ok'].format("REGION_CONFIG.lua"))
+
+
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+
+def load_manifest(manifest_path):
+    """
+    Load an optional JSON batch manifest. Keys are character names, values
+    override what character_db.lua provides:
+        {
+          "Tetsouo": {"region": "EU", "alt_character": "Kaories"},
+          "Kaories": {"region": "EU", "main_character": "Tetsouo"},
+          "Bob":     {"jobs": ["WAR", "RDM"], "role": "main"}
+        }
+    Supported fields: jobs, role, region, source, alt_character, main_character.
+    """
+    with open(manifest_path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError('top-level value must be an object')
+    return data
+
+
+def build_batch_plan(base_dir, characters, manifest, only=None,
+                     default_region='US', source_name=None):
+    """
+    Resolve every answer the interactive flow would ask for.
+
+    Partners default from the DB: a MAIN receives from the first ALT, an ALT
+    sends to the first MAIN. Source defaults to the character's own overlay
+    (_master/<Name>/) when it exists, otherwise the default template.
+
+    `only=None` selects every character; an empty list selects none.
+
+    Returns (plan, unknown_names).
+    """
+    merged = {name: dict(data) for name, data in characters.items()}
+    for name, extra in manifest.items():
+        merged.setdefault(name, {}).update(extra)
+
+    mains = [n for n, d in merged.items() if d.get('role', 'main') == 'main']
+    alts = [n for n, d in merged.items() if d.get('role') == 'alt']
+
+    by_lower = {n.lower(): n for n in merged}
+    if only is not None:
+        wanted, unknown = [], []
+        for raw in only:
+            name = by_lower.get(raw.lower())
+            if name:
+                wanted.append(name)
+            else:
+                unknown.append(raw.capitalize())
+    else:
+        wanted, unknown = list(merged), []
+
+    master_dir = Path(base_dir) / '_master'
+    plan = []
+    for name in wanted:
+        data = merged[name]
+        jobs = [j.upper() for j in data.get('jobs', []) if j.upper() in ALL_VALID_JOBS]
+        if not jobs:
+            unknown.append(name)
+            continue
+        role = data.get('role', 'main')
+        config = {
+            'role': role,
+            'character_name': name,
+            'enabled': False,
+            'alt_character': None,
+            'main_character': None,
+        }
+        if role == 'main':
+            partner = data.get('alt_character') or next((a for a in alts if a != name), None)
+            config['alt_character'] = partner
+        else:
+            partner = data.get('main_character') or next((m for m in mains if m != name), None)
+            config['main_character'] = partner
+        config['enabled'] = partner is not None
+
+        source = data.get('source') or source_name
+        if not source:
+            source = name if (master_dir / name).is_dir() else SmartCharacterCloner.DEFAULT_SOURCE
+
+        plan.append({
+            'name': name,
+            'jobs': jobs,
+            'dualbox': config,
+            'region': (data.get('region') or default_region).upper(),
+            'source': source,
+        })
+    return plan, unknown
+
+
+def _clone_one(base_dir, lang, item):
+    """Batch worker: clone one character quietly and return its summary row."""
+    started = time.perf_counter()
+    result = {'name': item['name'], 'ok': False, 'error': None,
+              'entry': 0, 'sets': 0, 'configs': 0}
+    try:
+        cloner = SmartCharacterCloner(base_dir=base_dir, lang=lang,
+                                      source_name=item['source'], verbose=False)
+        if item.get('sync'):
+            if cloner.validate_target(item['name'], keep_existing=True):
+                result['ok'] = cloner.sync(item['name'], item['jobs'], item['dualbox'],
+                                           item['region'], force=item.get('force', False))
+                result['conflicts'] = cloner.sync_stats['conflicts']
+        elif cloner.validate_target(item['name'], overwrite=True):
+            result['ok'] = cloner.clone(item['name'], item['jobs'],
+                                        item['dualbox'], item['region'])
+        result['entry'] = cloner.count_entry
+        result['sets'] = cloner.count_sets
+        result['configs'] = cloner.count_configs
+    except Exception as e:
+        result['error'] = str(e)
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def run_batch(lang='fr', only=None, manifest_path=None, default_region='US',
+              source_name=None, workers=None, base_dir=None, sync=False, force=False):
+    """Clone (or --sync) every character (or the --only subset) in a thread pool."""
+    cloner = SmartCharacterCloner(base_dir=base_dir, lang=lang)
+    t = cloner.t
+    cloner.banner('banner_batch')
+
+    if not cloner.validate_master():
+        return 1
+
+    manifest = {}
+    if manifest_path:
+        try:
+            manifest = load_manifest(manifest_path)
+        except (OSError, ValueError) as e:
+            print(t['batch_manifest_error'].format(manifest_path, e))
+            return 1
+
+    characters = parse_character_db(cloner.db_path)
+    plan, unknown = build_batch_plan(cloner.base_dir, characters, manifest,
+                                     only=only, default_region=default_region,
+                                     source_name=source_name)
+    for item in plan:
+        item['sync'] = sync
+        item['force'] = force
+    for name in unknown:
+        print(t['batch_unknown'].format(name))
+    if not plan:
+        print(t['batch_empty'])
+        return 1
+    bad_regions = [item for item in plan if item['region'] not in VALID_REGIONS]
+    for item in bad_regions:
+        print(t['batch_region_error'].format(item['region'], item['name']))
+    if bad_regions:
+        return 1
+
+    workers = max(1, min(workers or os.cpu_count() or 4, len(plan)))
+    print(t['batch_plan'].format(len(plan), workers))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda item: _clone_one(cloner.base_dir, lang, item), plan))
+    elapsed = time.perf_counter() - started
+
+    rows = []
+    for item, res in zip(plan, results):
+        cfg = item['dualbox']
+        status = 'OK' if res['ok'] else f"FAIL {res['error'] or ''}".strip()
+        if res.get('conflicts'):
+            status += f" ({res['conflicts']} conflicts)"
+        rows.append([
+            item['name'], cfg['role'].upper(), item['region'], item['source'],
+            ','.join(item['jobs']), str(res['entry']), str(res['sets']),
+            str(res['configs']), f"{res['elapsed']:.2f}s", status,
+        ])
+
+    header = t['batch_header']
+    widths = [max(len(str(r[i])) for r in [header] + rows) for i in range(len(header))]
+    print()
+    for row in [header, ['-' * w for w in widths]] + rows:
+        print('  '.join(c.ljust(w) for c, w in zip(row, widths)).rstrip())
+
+    failed = sum(1 for r in results if not r['ok'])
+    print(t['batch_total'].format(len(results) - failed, failed, elapsed))
+    return 1 if failed or unknown else 0
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+# Command line: flags, and options that take a value
+FLAGS = ('--all', '--force', '--sync')
+OPTIONS = ('--lang', '--source', '--only', '--manifest', '--region', '--workers')
+
+
 def main():
     """Main entry point."""
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
     try:
         # Parse language
         lang = 'fr'
@@ -796,6 +1497,43 @@ def main():
             if idx + 1 < len(sys.argv):
                 source_name = sys.argv[idx + 1]
 
+        # Batch mode: --all or --only Name,Name (no prompts, parallel clones)
+        if '--all' in sys.argv or '--only' in sys.argv:
+            t = TRANSLATIONS[lang]
+            only = None
+            if '--only' in sys.argv:
+                value = arg_value('--only', '')
+                only = [] if value.startswith('--') else [n.strip() for n in value.split(',') if n.strip()]
+                if not only:
+                    print(t['batch_only_empty'])
+                    return 1
+
+            workers = None
+            if '--workers' in sys.argv:
+                workers = arg_value('--workers', '')
+                if not workers.isdigit() or int(workers) < 1:
+                    print(t['batch_workers_error'].format(workers))
+                    return 1
+                workers = int(workers)
+
+            region = (arg_value('--region', '') if '--region' in sys.argv else 'US').upper()
+            if region not in VALID_REGIONS:
+                print(t['batch_region_error'].format(region, '--region'))
+                return 1
+
+            return run_batch(
+                lang=lang,
+                only=only,
+                manifest_path=arg_value('--manifest'),
+                default_region=region,
+                source_name=source_name,
+                workers=workers,
+                sync='--sync' in sys.argv,
+                force='--force' in sys.argv,
+            )
+
+        sync = '--sync' in sys.argv
+
         cloner = SmartCharacterCloner(lang=lang, source_name=source_name)
         t = cloner.t
 
@@ -817,7 +1555,7 @@ def main():
 
         target_name = target_name.capitalize()
 
-        if not cloner.validate_target(target_name):
+        if not cloner.validate_target(target_name, keep_existing=sync):
             input(t['press_enter'])
             return 1
 
@@ -853,8 +1591,13 @@ def main():
             input(t['press_enter'])
             return 1
 
-        # Execute clone
-        if cloner.clone(target_name, jobs, dualbox_config, region):
+        # Execute clone (or incremental sync of an existing folder)
+        if sync:
+            ok = cloner.sync(target_name, jobs, dualbox_config, region,
+                             force='--force' in sys.argv)
+        else:
+            ok = cloner.clone(target_name, jobs, dualbox_config, region)
+        if ok:
             input(t['press_enter'])
             return 0
         else:
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Debuff State Check - Tetsouo GearSwap System
+============================================
+Runs DebuffChecker.benchmark() outside the game: the blocker state that
+precast reads (shared/utils/debuff/debuff_checker.lua) is compared with
+the per-action scan of buffactive on every combination of the watched
+debuffs, once with every buff_change reported and once with the losses
+missed (zoning, reload). Both the production lists and test mode
+(TEST_DEBUFF_MAPPINGS) are checked. Same check as `//gs c debuffbench`.
+
+Needs a Lua 5.1 interpreter (lua5.1, lua51, luajit or lua on PATH, or
+--lua PATH).
+
+Usage:
+    python debuff_check.py              (exit 1 on any mismatch)
+    python debuff_check.py --lua PATH
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from gear_sets import lua_string
+from hook_bench import LUA_CANDIDATES, find_lua
+from tool_args import arg_value, check_args
+
+MODULE = 'shared/utils/debuff/debuff_checker'
+
+LUA_CHECK = """
+package.path = %s .. '?.lua;' .. package.path
+package.loaded['shared/config/DEBUFF_AUTOCURE_CONFIG'] = {test_mode = arg[1] == 'test'}
+buffactive = {}
+local result = require(%s).benchmark(100)
+print(string.format('%%d\\t%%d\\t%%d', result.watched, result.cases, result.mismatches))
+"""
+
+
+def run_check(base_dir, lua, mode):
+    """(watched, cases, mismatches) for 'real' or 'test' lists, or an error string."""
+    with tempfile.TemporaryDirectory() as work:
+        script = Path(work) / 'debuff_check.lua'
+        script.write_text(LUA_CHECK % (lua_string(base_dir.as_posix() + '/'), lua_string(MODULE)),
+                          encoding='utf-8')
+        proc = subprocess.run([lua, str(script), mode], capture_output=True, text=True, encoding='utf-8')
+    if proc.returncode != 0:
+        return f"Lua: {proc.stderr.strip()}"
+    return tuple(int(field) for field in proc.stdout.split())
+
+
+def main():
+    code = check_args(__doc__, options=('--lua',))
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    lua = find_lua(arg_value('--lua'))
+    if not lua:
+        print(f"[FAIL] No Lua 5.1 interpreter found ({', '.join(LUA_CANDIDATES)}) - pass --lua PATH")
+        return 1
+
+    failed = False
+    for mode in ('real', 'test'):
+        result = run_check(base_dir, lua, mode)
+        if isinstance(result, str):
+            print(f"[FAIL] {mode} debuffs: {result}")
+            failed = True
+            continue
+        watched, cases, mismatches = result
+        failed = failed or mismatches > 0
+        print(f"[{'FAIL' if mismatches else 'OK'}] {mode} debuffs: {watched} watched, "
+              f"{cases} cases, {mismatches} mismatches")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
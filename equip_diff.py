@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Equip Diff Analyzer - Tetsouo GearSwap System
+=============================================
+Offline slot-level diff of the set transitions GearSwap walks through on
+every action:
+
+    idle     -> precast.FC -> midcast      -> idle        (spells)
+    engaged  -> precast.WS                 -> engaged     (weaponskills)
+    engaged  -> precast.JA                 -> engaged     (abilities, rolls...)
+    engaged  -> precast.RA -> midcast.RA   -> engaged     (ranged attacks)
+
+Each job's set files are evaluated (gear_sets.py, Mote sets skeleton
+pre-loaded) and the worn gear is followed slot by slot: a slot whose item is
+already worn when a set is equipped is a redundant swap. The report is a
+matrix of transition x slot (% of equips that re-send the worn item) plus
+the set chains that re-send the most slots.
+
+shared/utils/set_building/equip_diff.lua drops those slots at runtime
+(//gs c equipdiff).
+
+Usage:
+    python equip_diff.py                        (every <Char>/sets/ folder)
+    python equip_diff.py --char Tetsouo [--job war]
+    python equip_diff.py --master               (_master/sets/)
+    python equip_diff.py --master --top 20      (worst chains per job)
+    python equip_diff.py --master --json diff.json
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import gear_sets
+from clone_character import CharacterDB
+from gear_sets import SLOTS, format_path, item_of, iter_sets
+from set_snapshot import _mote_sets
+from tool_args import arg_value, check_args
+
+# Column headers of the matrix (SLOTS order)
+SLOT_LABELS = ('mai', 'sub', 'rng', 'amm', 'hea', 'nec', 'ea1', 'ea2',
+               'bod', 'han', 'ri1', 'ri2', 'bac', 'wai', 'leg', 'fee')
+
+# precast.<Family> sets handled like job abilities (base -> set -> base)
+ABILITY_FAMILIES = ('JA', 'CorsairRoll', 'CorsairShot', 'Waltz', 'Step', 'Samba', 'Jig',
+                    'Flourish1', 'Flourish2', 'Flourish3', 'Rune', 'Ward', 'Effusion',
+                    'BloodPactRage', 'BloodPactWard', 'PetCommand')
+
+
+# ============================================================================
+# SET RESOLUTION
+# ============================================================================
+
+def load_sets(paths):
+    """Evaluate a job's set files on top of the Mote skeleton; returns (sets, errors)."""
+    evaluator = gear_sets.SetEvaluator()
+    evaluator.globals['sets'] = _mote_sets()
+    for path in paths:
+        evaluator.load_file(path)
+    return evaluator.sets, evaluator.errors
+
+
+def resolve(slots):
+    """{slot: item key} for a set's slots; the key compares name, bag and augments."""
+    out = {}
+    for slot, value in slots.items():
+        name, bag = item_of(value)
+        if name is None:
+            out[slot] = ('empty',)
+            continue
+        augments = ()
+        if isinstance(value, dict) and isinstance(value.get('augments'), dict):
+            augments = tuple(str(v) for _, v in sorted(value['augments'].items(), key=lambda kv: str(kv[0])))
+        out[slot] = (name.lower(), (bag or '').lower(), augments)
+    return out
+
+
+def collect(sets):
+    """{path: resolved slots} for every non-empty set."""
+    return {path: resolve(slots) for path, slots in iter_sets(sets) if slots}
+
+
+def _family(table, path_prefix):
+    """Paths (prefix itself included) of the non-empty sets under a prefix."""
+    n = len(path_prefix)
+    return sorted((p for p in table if p[:n] == path_prefix), key=format_path)
+
+
+def _base(table, kind):
+    """sets.<kind>, else sets.<kind>.Normal (Mote's default mode), else its first sub-set."""
+    for path in (('sets', kind), ('sets', kind, 'Normal')):
+        if path in table:
+            return path
+    modes = _family(table, ('sets', kind))
+    return modes[0] if modes else None
+
+
+def build_chains(table):
+    """
+    The action chains of one job.
+
+    Returns [(label, base_path, [step_path, ...])]: the base set is worn
+    before the action and equipped again by aftercast.
+    """
+    idle = _base(table, 'idle')
+    engaged = _base(table, 'engaged')
+    melee = engaged or idle
+    if not melee:
+        return []
+    chains = []
+
+    fc_root = ('sets', 'precast', 'FC')
+    for path in _family(table, ('sets', 'midcast')):
+        if path[2] in ('RA', 'Pet'):
+            continue
+        precast = fc_root + path[2:3]
+        if precast not in table:
+            precast = fc_root if fc_root in table else None
+        steps = ([precast] if precast else []) + [path]
+        chains.append(('spell', idle or melee, steps))
+
+    for path in _family(table, ('sets', 'precast', 'WS')):
+        chains.append(('ws', melee, [path]))
+
+    for family in ABILITY_FAMILIES:
+        for path in _family(table, ('sets', 'precast', family)):
+            chains.append(('ja', melee, [path]))
+
+    ranged = [p for p in (('sets', 'precast', 'RA'), ('sets', 'midcast', 'RA')) if p in table]
+    if ranged:
+        chains.append(('ranged', melee, ranged))
+    return chains
+
+
+# ============================================================================
+# DIFF
+# ============================================================================
+
+def _transition(src, dst):
+    """'idle > precast.FC' style label of one equip step."""
+    def family(path):
+        if path[1] in ('idle', 'engaged'):
+            return path[1]
+        return '.'.join(str(k) for k in path[1:3]) if path[1] == 'precast' else 'midcast' + (
+            '.RA' if path[2:3] == ('RA',) else '')
+    return f"{family(src)} > {family(dst)}"
+
+
+def walk(table, base, steps):
+    """
+    Follow the worn gear through base -> steps -> base.
+
+    Returns [(src, dst, sent, same_slots)] per equip; same_slots lists the
+    slots re-sent with the item already worn.
+    """
+    worn = dict(table[base])
+    out = []
+    previous = base
+    for path in list(steps) + [base]:
+        equip = table[path]
+        same = [slot for slot, item in equip.items() if worn.get(slot) == item]
+        out.append((previous, path, len(equip), same))
+        worn.update(equip)
+        previous = path
+    return out
+
+
+def analyze(table):
+    """
+    Diff every chain of one job.
+
+    Returns {'matrix': {transition: {'equips', 'sent', 'same', 'slots': {slot: [same, sent]}}},
+             'chains': [(label, path, sent, same)], 'sent', 'same'}
+    """
+    matrix = {}
+    chains = []
+    total_sent = total_same = 0
+    for label, base, steps in build_chains(table):
+        chain_sent = chain_same = 0
+        for src, dst, sent, same in walk(table, base, steps):
+            row = matrix.setdefault(_transition(src, dst),
+                                    {'equips': 0, 'sent': 0, 'same': 0, 'slots': {}})
+            row['equips'] += 1
+            row['sent'] += sent
+            row['same'] += len(same)
+            for slot in table[dst]:
+                cell = row['slots'].setdefault(slot, [0, 0])
+                cell[0] += slot in same
+                cell[1] += 1
+            chain_sent += sent
+            chain_same += len(same)
+        chains.append((label, format_path(steps[-1]), chain_sent, chain_same))
+        total_sent += chain_sent
+        total_same += chain_same
+    return {'matrix': matrix, 'chains': chains, 'sent': total_sent, 'same': total_same}
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def _pct(part, whole):
+    return 100.0 * part / whole if whole else 0.0
+
+
+def print_job(job, result, top):
+    chains = result['chains']
+    kinds = {}
+    for label, _, _, _ in chains:
+        kinds[label] = kinds.get(label, 0) + 1
+    print(f"   {job.upper()}: {len(chains)} chains ("
+          + ', '.join(f"{n} {label}" for label, n in sorted(kinds.items())) + ")"
+          + f" - {result['same']}/{result['sent']} slots re-sent"
+          + f" ({_pct(result['same'], result['sent']):.0f}%)")
+    if not chains:
+        return
+    print(f"      {'transition':<28} {'equips':>6} {'same%':>6}  " + ' '.join(f"{s:>3}" for s in SLOT_LABELS))
+    for name, row in sorted(result['matrix'].items()):
+        cells = []
+        for slot in SLOTS:
+            cell = row['slots'].get(slot)
+            cells.append(f"{_pct(*cell):3.0f}" if cell else '  -')
+        print(f"      {name:<28} {row['equips']:>6} {_pct(row['same'], row['sent']):>5.0f}%  " + ' '.join(cells))
+    if top:
+        worst = sorted(chains, key=lambda c: (-c[3], c[1]))[:top]
+        for label, path, sent, same in worst:
+            print(f"      {same:>3}/{sent:<3} re-sent  {label:<6} {path}")
+
+
+def to_json(results):
+    out = {}
+    for job, result in results.items():
+        out[job.upper()] = {
+            'sent': result['sent'],
+            'same': result['same'],
+            'matrix': {
+                name: {'equips': row['equips'], 'sent': row['sent'], 'same': row['same'],
+                       'slots': {slot: {'same': same, 'sent': sent}
+                                 for slot, (same, sent) in row['slots'].items()}}
+                for name, row in result['matrix'].items()
+            },
+            'chains': [{'kind': label, 'set': path, 'sent': sent, 'same': same}
+                       for label, path, sent, same in result['chains']],
+        }
+    return out
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def _targets(base_dir):
+    """[(label, sets_dir)] from --master / --char / character_db.lua."""
+    if '--master' in sys.argv:
+        return [('_master', base_dir / '_master' / 'sets')]
+    char = arg_value('--char')
+    names = [char] if char else []
+    if not char and (base_dir / 'character_db.lua').exists():
+        names = CharacterDB.load(base_dir / 'character_db.lua').get_character_names()
+    targets = []
+    for name in names:
+        match = [d for d in base_dir.iterdir() if d.is_dir() and d.name.lower() == name.lower()]
+        if match and (match[0] / 'sets').is_dir():
+            targets.append((match[0].name, match[0] / 'sets'))
+        else:
+            print(f"[SKIP] {name}: no {name}/sets/ folder")
+    return targets
+
+
+# Command line: flags, and options that take a value
+FLAGS = ('--master',)
+OPTIONS = ('--char', '--job', '--top', '--json')
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS, integers=('--top',))
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    only_job = arg_value('--job')
+    only_job = only_job.lower() if only_job else None
+    top = int(arg_value('--top', '0'))
+    json_path = arg_value('--json')
+
+    targets = _targets(base_dir)
+    if not targets:
+        print("ERROR: nothing to analyze (use --char <Name> or --master)")
+        return 1
+
+    for label, sets_dir in targets:
+        print(f"== {label}")
+        results = {}
+        for job, paths in gear_sets.discover_job_files(sets_dir).items():
+            if only_job and job != only_job:
+                continue
+            sets, errors = load_sets(paths)
+            for error in errors[:3]:
+                print(f"   [ERROR] {job.upper()}: {error}")
+            results[job] = analyze(collect(sets))
+            print_job(job, results[job], top)
+        sent = sum(r['sent'] for r in results.values())
+        same = sum(r['same'] for r in results.values())
+        print(f"   Total: {same}/{sent} slots re-sent with the item already worn ({_pct(same, sent):.0f}%)")
+        if json_path:
+            out = Path(json_path)
+            if len(targets) > 1:
+                out = out.with_name(f"{out.stem}_{label}{out.suffix}")
+            out.write_text(json.dumps(to_json(results), indent=1, ensure_ascii=False), encoding='utf-8')
+            print(f"   Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
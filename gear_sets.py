@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Gear Set Evaluator - Tetsouo GearSwap System
+============================================
+Evaluates job set files (<Char>/sets/**/*.lua, _master/sets/*.lua) offline,
+without a Lua interpreter: statements are read with lua_table and replayed
+against a small environment holding `sets` and the file's local tables.
+
+Supported (everything the set files use):
+  - local item tables       local ChirichRing1 = { name = ..., bag = ... }
+  - field assignments       Senuna.TP = {...}, sets.precast.WS['X'] = {...}
+  - references              ring1 = ChirichRing1, sets.idle = sets.idle.DT
+  - set_combine(a, b, ...)  GearSwap semantics: slot keys only, later wins
+  - `x or y` defaults       sets.precast = sets.precast or {}
+  - Windower set literals  petPhysicalMoves = S{'Foot Kick', ...}
+
+Anything else (calls to other functions, arithmetic on unknowns) evaluates to
+UNKNOWN and is ignored.
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import re
+import zlib
+from pathlib import Path
+
+import lua_table
+from lua_table import Assignment, BinOp, Call, Ref
+
+# ============================================================================
+# SLOTS
+# ============================================================================
+
+# GearSwap slot aliases -> canonical slot name
+SLOT_ALIASES = {
+    'main': 'main', 'sub': 'sub',
+    'range': 'range', 'ranged': 'range', 'ammo': 'ammo',
+    'head': 'head', 'neck': 'neck',
+    'ear1': 'left_ear', 'lear': 'left_ear', 'left_ear': 'left_ear',
+    'ear2': 'right_ear', 'rear': 'right_ear', 'right_ear': 'right_ear',
+    'body': 'body', 'hands': 'hands',
+    'ring1': 'left_ring', 'lring': 'left_ring', 'left_ring': 'left_ring',
+    'ring2': 'right_ring', 'rring': 'right_ring', 'right_ring': 'right_ring',
+    'back': 'back', 'waist': 'waist', 'legs': 'legs', 'feet': 'feet',
+}
+
+# Canonical slot order (equip packet order)
+SLOTS = ('main', 'sub', 'range', 'ammo', 'head', 'neck', 'left_ear', 'right_ear',
+         'body', 'hands', 'left_ring', 'right_ring', 'back', 'waist', 'legs', 'feet')
+
+
+def canonical_slot(key):
+    """Canonical slot for a set key, or None when the key is a sub-set."""
+    return SLOT_ALIASES.get(key) if isinstance(key, str) else None
+
+
+class _Unknown:
+    """Value the evaluator cannot know offline (runtime call, operator...)."""
+
+    def __repr__(self):
+        return 'UNKNOWN'
+
+    def __bool__(self):
+        return False
+
+
+UNKNOWN = _Unknown()
+
+
+class SetLiteral(tuple):
+    """Windower S{...} set literal, kept as its element list."""
+
+
+# ============================================================================
+# EVALUATOR
+# ============================================================================
+
+class SetEvaluator:
+    """Replays set-file statements into a `sets` tree.
+
+    One evaluator per job: its files share a global environment (like the
+    GearSwap user environment); each file gets its own locals.
+    """
+
+    def __init__(self):
+        self.globals = {'sets': {}}
+        self.locals = {}
+        self.errors = []
+        self.unresolved = []  # names/paths only known at runtime (Mote globals...)
+
+    @property
+    def sets(self):
+        value = self.globals.get('sets')
+        return value if isinstance(value, dict) else {}
+
+    def load_file(self, path):
+        """Evaluate one set file. Parse errors are recorded, not raised."""
+        path = Path(path)
+        try:
+            text = path.read_text(encoding='utf-8', errors='replace')
+            statements = lua_table.read_chunk(text)
+        except (OSError, lua_table.LuaParseError) as e:
+            self.errors.append(f"{path}: {e}")
+            return False
+        self.locals = {}
+        for stmt in statements:
+            if isinstance(stmt, Assignment):
+                self._assign(stmt)
+        return True
+
+    # -- statements ----------------------------------------------------
+
+    def _assign(self, stmt):
+        value = self.eval(stmt.value)
+        path = stmt.target
+        if not isinstance(path, tuple):
+            return  # computed target (BinOp)
+        if stmt.local:
+            self.locals[path[0]] = value
+            return
+        if len(path) == 1:
+            scope = self.locals if path[0] in self.locals else self.globals
+            scope[path[0]] = value
+            return
+        container = self.lookup(path[:-1])
+        key = path[-1]
+        if container is None:
+            self.unresolved.append(format_path(path))
+        elif isinstance(container, dict):
+            container[key] = value
+        elif isinstance(container, list) and isinstance(key, int) and 1 <= key <= len(container) + 1:
+            if key == len(container) + 1:
+                container.append(value)
+            else:
+                container[key - 1] = value
+
+    # -- expressions ---------------------------------------------------
+
+    def lookup(self, path):
+        """Resolve a Ref path against locals then globals (None if absent)."""
+        head = path[0]
+        if head in self.locals:
+            node = self.locals[head]
+        elif head in self.globals:
+            node = self.globals[head]
+        else:
+            self.unresolved.append(head)
+            return None
+        for key in path[1:]:
+            if isinstance(node, dict):
+                node = node.get(key)
+            elif isinstance(node, list) and isinstance(key, int) and 1 <= key <= len(node):
+                node = node[key - 1]
+            else:
+                return None
+        return node
+
+    def eval(self, node):
+        if isinstance(node, Ref):
+            return self.lookup(node.path)
+        if isinstance(node, dict):
+            return {k: self.eval(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [self.eval(v) for v in node]
+        if isinstance(node, Call):
+            if node.name == 'set_combine':
+                return set_combine(*[self.eval(a) for a in node.args])
+            if node.name == 'S' and len(node.args) == 1 and isinstance(node.args[0], (list, dict)):
+                items = self.eval(node.args[0])
+                if isinstance(items, list) or items == {}:
+                    return SetLiteral(items)
+            return UNKNOWN
+        if isinstance(node, BinOp):
+            if node.op in ('or', 'and'):
+                left = self.eval(node.left)
+                truthy = left is not None and left is not False and left is not UNKNOWN
+                if node.op == 'or':
+                    return left if truthy else self.eval(node.right)
+                return self.eval(node.right) if truthy else left
+            return UNKNOWN
+        if isinstance(node, lua_table.Function):
+            return UNKNOWN
+        return node
+
+
+def set_combine(*parts):
+    """GearSwap set_combine: merge slot keys left to right.
+
+    Like GearSwap's set_merge, the key keeps the spelling of the set that
+    provided it (ring2 stays ring2) and replaces any alias of the same slot
+    already present; non-slot keys are dropped.
+    """
+    combined = {}
+    slot_keys = {}
+    for part in parts:
+        if isinstance(part, dict):
+            for key, value in part.items():
+                slot = canonical_slot(key)
+                if slot:
+                    previous = slot_keys.get(slot)
+                    if previous is not None and previous != key:
+                        del combined[previous]
+                    slot_keys[slot] = key
+                    combined[key] = value
+    return combined
+
+
+# ============================================================================
+# TREE HELPERS
+# ============================================================================
+
+_IDENT = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def format_path(path):
+    """('sets','precast','WS',"Rudra's Storm") -> sets.precast.WS["Rudra's Storm"]"""
+    out = str(path[0])
+    for key in path[1:]:
+        if isinstance(key, str) and _IDENT.match(key) and key not in lua_table.KEYWORDS:
+            out += '.' + key
+        elif isinstance(key, str):
+            out += '[' + lua_string(key) + ']'
+        else:
+            out += f'[{key}]'
+    return out
+
+
+_CONTROL = re.compile(r'[\x00-\x1f\x7f]')
+
+
+def lua_string(value):
+    """Quote a Python string as a Lua string literal."""
+    escaped = value.replace('\\', '\\\\').replace('\n', '\\n')
+    escaped = _CONTROL.sub(lambda m: '\\%03d' % ord(m.group()), escaped)
+    if "'" not in escaped:
+        return "'" + escaped + "'"
+    return '"' + escaped.replace('"', '\\"') + '"'
+
+
+def file_stamp(path):
+    """(size, adler32) of a file's content - FileStamp.matches() in game."""
+    data = Path(path).read_bytes()
+    return len(data), zlib.adler32(data)
+
+
+def lua_stamp(path):
+    """Content stamp of a file as a Lua literal: {size, adler32}."""
+    return '{%d, %d}' % file_stamp(path)
+
+
+def iter_sets(root, prefix=('sets',)):
+    """Yield (path, slots) for every set table under root, depth first.
+
+    slots maps canonical slot -> raw value (string or item table). Aliased
+    tables (sets.a = sets.b) are visited under each path; cycles are cut.
+    """
+    stack = [(prefix, root, frozenset())]
+    while stack:
+        path, node, seen = stack.pop()
+        if id(node) in seen:
+            continue
+        seen = seen | {id(node)}
+        slots = {}
+        children = []
+        for key, value in node.items():
+            slot = canonical_slot(key)
+            if slot:
+                slots[slot] = value
+            elif isinstance(value, dict):
+                children.append((key, value))
+        yield path, slots
+        for key, value in reversed(children):
+            stack.append((path + (key,), value, seen))
+
+
+def item_of(value):
+    """(name, bag) for a slot value ('X' or {name='X', bag='wardrobe 2'}).
+
+    Returns (None, None) for empty/unknown values.
+    """
+    if isinstance(value, str):
+        name, bag = value, None
+    elif isinstance(value, dict):
+        name = value.get('name', value.get(1))
+        bag = value.get('bag')
+    else:
+        return None, None
+    if not isinstance(name, str) or not name.strip() or name.lower() == 'empty':
+        return None, None
+    return name, bag if isinstance(bag, str) else None
+
+
+# ============================================================================
+# DISCOVERY
+# ============================================================================
+
+VALID_JOBS = frozenset((
+    'blm', 'blu', 'brd', 'bst', 'cor', 'dnc', 'drg', 'drk', 'geo', 'mnk', 'nin',
+    'pld', 'pup', 'rdm', 'rng', 'run', 'sam', 'sch', 'smn', 'thf', 'war', 'whm',
+))
+
+
+def discover_job_files(sets_dir):
+    """Group set files by job, like wardrobe_auditor.lua discover_job_files():
+    flat <job>_sets.lua, modular <job>/*.lua, and common/*.lua for every job.
+
+    Returns {job_lower: [Path, ...]} (common files last).
+    """
+    sets_dir = Path(sets_dir)
+    jobs = {}
+    common = []
+    for path in sorted(sets_dir.rglob('*.lua')):
+        rel = path.relative_to(sets_dir).as_posix()
+        if rel.startswith('common/'):
+            common.append(path)
+            continue
+        m = re.match(r'^(\w+)_sets\.lua$', rel) or re.match(r'^(\w+)/', rel)
+        job = m.group(1).lower() if m else ''
+        if job in VALID_JOBS:
+            jobs.setdefault(job, []).append(path)
+    for paths in jobs.values():
+        paths.extend(common)
+    return dict(sorted(jobs.items()))
+
+
+def evaluate_job(paths):
+    """Evaluate a job's set files; returns the SetEvaluator."""
+    evaluator = SetEvaluator()
+    for path in paths:
+        evaluator.load_file(path)
+    return evaluator
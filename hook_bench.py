@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Hook Benchmark - Tetsouo GearSwap System
+========================================
+Loads each job entry headless in a stock Lua 5.1 interpreter
+(shared/utils/debug/harness/replay.lua, Windower/GearSwap stubbed by
+shared/utils/debug/harness/env.lua), replays an action sequence and reports,
+per job and per hook: latency (mean/p50/p95/max), KB allocated and the equip
+packets / slots GearSwap would send.
+
+The default suite is generated per job from the repo databases (main job
+abilities, weaponskills and spells), the job keybind commands, status and
+buff changes and `update` commands, so every run replays the same sequence.
+Sequences recorded in game with `//gs c perf record` are replayed with --seq.
+
+--bytecode runs every job twice, from source and through the
+shared/utils/core/bytecode_cache.lua loader (cache built in the work dir
+by the same interpreter), and prints the load times side by side - the
+reload cost `//gs c bytecode build` removes in game.
+
+Mote-Include, Modes and the Windower libraries are not part of this repo: the
+harness loads them from a Windower install (default: the one this data folder
+lives in, or --windower).
+
+Usage:
+    python hook_bench.py                                 (15 _master jobs)
+    python hook_bench.py --job WAR                       (per-hook detail)
+    python hook_bench.py --seq harness_rec_Tetsouo_WAR_20261018_201500.lua
+    python hook_bench.py --passes 10 --json bench.json
+    python hook_bench.py --baseline bench.json           (exit 1 on regression)
+    python hook_bench.py --bytecode                      (load ms: source vs bytecode cache)
+    python hook_bench.py --lua luajit --windower D:/Windower --write-suite suite/
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gear_sets import lua_string
+from lua_table import LuaParseError, read_chunk
+from pack_databases import NotPackable, read_module, split_groups
+from require_graph import discover_entries
+from tool_args import arg_value, check_args
+
+REPLAY_SCRIPT = Path('shared') / 'utils' / 'debug' / 'harness' / 'replay.lua'
+# shared/ folders BytecodeCache does not compile (bytecode_cache.lua SKIP_DIRS)
+BYTECODE_SKIP = ('shared/data/packed/', 'shared/utils/debug/harness/')
+LUA_CANDIDATES = ('lua5.1', 'lua51', 'luajit', 'lua')
+HOOK_ORDER = ['pretarget', 'precast', 'midcast', 'aftercast', 'status_change', 'buff_change',
+              'update', 'command', 'scheduled']
+
+DEFAULT_SUB = {
+    'BLM': 'SCH', 'BRD': 'WHM', 'BST': 'DNC', 'COR': 'NIN', 'DNC': 'WAR', 'DRK': 'SAM', 'GEO': 'RDM',
+    'PLD': 'BLU', 'PUP': 'WAR', 'RDM': 'NIN', 'RUN': 'BLU', 'SAM': 'WAR', 'THF': 'DNC', 'WAR': 'SAM',
+    'WHM': 'SCH',
+}
+
+# Suite size per job
+SUITE_JA = 6
+SUITE_WS = 4
+SUITE_SPELLS = 8
+SUITE_KEYBINDS = 6
+SUITE_BUFFS = ('Haste', 'Protect', 'Sleep')
+
+# Regression thresholds (--baseline)
+DEFAULT_THRESHOLD = 0.25
+MIN_DELTA_MS = 0.05
+MIN_DELTA_KB = 1.0
+
+WS_SKILLS = {
+    'ARCHERY': 'Archery', 'AXE': 'Axe', 'CLUB': 'Club', 'DAGGER': 'Dagger', 'GREATAXE': 'Great Axe',
+    'GREATKATANA': 'Great Katana', 'GREATSWORD': 'Great Sword', 'H2H': 'Hand-to-Hand',
+    'KATANA': 'Katana', 'POLEARM': 'Polearm', 'SCYTHE': 'Scythe', 'STAFF': 'Staff', 'SWORD': 'Sword',
+}
+
+# magic/<folder> -> (skill, default type, prefix, offensive)
+MAGIC_FOLDERS = {
+    'healing': ('Healing Magic', 'WhiteMagic', '/magic', False),
+    'enhancing': ('Enhancing Magic', 'WhiteMagic', '/magic', False),
+    'enfeebling': ('Enfeebling Magic', 'WhiteMagic', '/magic', True),
+    'elemental': ('Elemental Magic', 'BlackMagic', '/magic', True),
+    'dark': ('Dark Magic', 'BlackMagic', '/magic', True),
+    'divine': ('Divine Magic', 'WhiteMagic', '/magic', True),
+    'ninjutsu': ('Ninjutsu', 'Ninjutsu', '/ninjutsu', False),
+    'song': ('Singing', 'BardSong', '/song', False),
+    'geomancy': ('Geomancy', 'Geomancy', '/magic', False),
+    'summoning': ('Summoning Magic', 'SummonerPact', '/magic', False),
+    'blu': ('Blue Magic', 'BlueMagic', '/magic', True),
+}
+MAGIC_TYPES = {'White': 'WhiteMagic', 'Black': 'BlackMagic', 'Dark': 'BlackMagic'}
+OFFENSIVE_CATEGORIES = {'Debuff', 'Threnody', 'Elegy', 'Lullaby', 'Requiem', 'Nocturne', 'Helix',
+                        'Geocolure', 'Elemental', 'Magical', 'Physical', 'Breath'}
+
+# JA name suffix -> GearSwap spell.type
+JA_TYPES = (('Roll', 'CorsairRoll'), ('Shot', 'CorsairShot'), ('Samba', 'Samba'), ('Waltz', 'Waltz'),
+            ('Step', 'Step'), ('Jig', 'Jig'))
+
+
+# ============================================================================
+# SUITE
+# ============================================================================
+
+def _records(path):
+    """{name: record} of every record table in a data module (empty if unreadable)."""
+    try:
+        module, _ = read_module(path)
+    except (NotPackable, OSError):
+        return {}
+    groups, _ = split_groups(module)
+    records = {}
+    for group in groups.values():
+        records.update({k: v for k, v in group.items() if isinstance(k, str) and isinstance(v, dict)})
+    return records
+
+
+def _sample(items, count):
+    """count items spread evenly over a list sorted by (level, name)."""
+    items = sorted(items, key=lambda item: (item[0], item[1]['name']))
+    if len(items) <= count:
+        return [step for _, step in items]
+    return [items[i * len(items) // count][1] for i in range(count)]
+
+
+def _level(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def job_abilities(base_dir, job):
+    folder = base_dir / 'shared' / 'data' / 'job_abilities' / job.lower()
+    found = []
+    for path in sorted(folder.glob('*mainjob*.lua')):
+        for name, rec in _records(path).items():
+            level = _level(rec.get('level'))
+            if level is None or level > 99:
+                continue
+            kind = next((t for suffix, t in JA_TYPES if name.endswith(suffix)), 'JobAbility')
+            found.append((level, {'event': 'action', 'name': name, 'type': kind, 'prefix': '/jobability',
+                                  'action_type': 'Ability', 'target': '<me>'}))
+    return _sample(found, SUITE_JA)
+
+
+def weaponskills(base_dir, job):
+    found = []
+    for path in sorted((base_dir / 'shared' / 'data' / 'weaponskills').glob('*_WS_DATABASE.lua')):
+        skill = WS_SKILLS.get(path.stem.replace('_WS_DATABASE', ''))
+        if not skill:
+            continue
+        for name, rec in _records(path).items():
+            jobs = rec.get('jobs')
+            level = _level(jobs.get(job)) if isinstance(jobs, dict) else None
+            if level is None or level > 99:
+                continue
+            found.append((level, {'event': 'action', 'name': name, 'type': 'WeaponSkill', 'skill': skill,
+                                  'prefix': '/weaponskill', 'action_type': 'Ability', 'target': '<t>',
+                                  'tp': 2000}))
+    return _sample(found, SUITE_WS)
+
+
+def spells(base_dir, job):
+    found = []
+    magic = base_dir / 'shared' / 'data' / 'magic'
+    for folder, (skill, kind, prefix, offensive) in sorted(MAGIC_FOLDERS.items()):
+        for path in sorted((magic / folder).glob('*.lua')):
+            for name, rec in _records(path).items():
+                level = _level(rec.get(job))
+                if level is None or level > 99:
+                    continue
+                hostile = offensive or rec.get('category') in OFFENSIVE_CATEGORIES
+                step = {'event': 'action', 'name': name, 'skill': skill, 'prefix': prefix,
+                        'type': MAGIC_TYPES.get(rec.get('magic_type'), kind), 'action_type': 'Magic',
+                        'target': '<t>' if hostile else '<me>'}
+                if isinstance(rec.get('element'), str):
+                    step['element'] = rec['element']
+                found.append((level, step))
+    return _sample(found, SUITE_SPELLS)
+
+
+_STATE_COMMAND_RE = re.compile(r'command\s*=\s*["\']((?:cyclestate|toggle)\s[^"\']+)["\']')
+
+
+def keybind_commands(char_dirs, job):
+    """The state commands (cyclestate / toggle) of <JOB>_KEYBINDS.lua (first SUITE_KEYBINDS)."""
+    for folder in char_dirs:
+        path = folder / 'config' / job.lower() / f'{job}_KEYBINDS.lua'
+        if path.exists():
+            text = path.read_text(encoding='utf-8', errors='replace')
+            return _STATE_COMMAND_RE.findall(text)[:SUITE_KEYBINDS]
+    return []
+
+
+def build_suite(base_dir, job, char_dirs, char_name, sub_job):
+    """Deterministic replay sequence for one job."""
+    steps = [{'event': 'command', 'value': 'update'}]
+    for command in keybind_commands(char_dirs, job):
+        steps += [{'event': 'command', 'value': command}, {'event': 'command', 'value': 'update'}]
+    steps += [{'event': 'status', 'value': 'Engaged'}, {'event': 'wait', 'seconds': 1}]
+    for ws in weaponskills(base_dir, job):
+        steps += [ws, {'event': 'wait', 'seconds': 2}]
+    for ja in job_abilities(base_dir, job):
+        steps += [ja, {'event': 'wait', 'seconds': 1}]
+    for buff in SUITE_BUFFS:
+        steps += [{'event': 'buff', 'name': buff, 'gain': True}, {'event': 'command', 'value': 'update'},
+                  {'event': 'buff', 'name': buff, 'gain': False}]
+    steps += [{'event': 'status', 'value': 'Idle'}, {'event': 'wait', 'seconds': 1}]
+    for spell in spells(base_dir, job):
+        steps += [spell, {'event': 'wait', 'seconds': 3}]
+    steps += [{'event': 'command', 'value': 'update'}] * 3
+    return {'name': char_name, 'job': job, 'sub_job': sub_job, 'steps': steps}
+
+
+def _lua_value(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return lua_string(str(value))
+
+
+def render_sequence(seq):
+    lines = ['-- Generated by hook_bench.py', 'return {', '    version = 1,']
+    for key in ('name', 'job', 'sub_job'):
+        lines.append(f'    {key} = {_lua_value(seq.get(key) or "")},')
+    if seq.get('equipment'):
+        items = ', '.join(f'{slot} = {_lua_value(item)}' for slot, item in sorted(seq['equipment'].items()))
+        lines.append(f'    equipment = {{{items}}},')
+    lines.append('    steps = {')
+    for step in seq['steps']:
+        fields = ', '.join(f'{k} = {_lua_value(v)}' for k, v in sorted(step.items()) if v is not None)
+        lines.append(f'        {{{fields}}},')
+    lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def load_sequence(path):
+    """Sequence table of a recorded / saved sequence file."""
+    for stmt in read_chunk(path.read_text(encoding='utf-8')):
+        if isinstance(stmt, tuple) and stmt[0] == 'return' and isinstance(stmt[1], dict):
+            seq = stmt[1]
+            steps = seq.get('steps') or []
+            seq['steps'] = list(steps.values()) if isinstance(steps, dict) else list(steps)
+            return seq
+    raise ValueError('no return table')
+
+
+# ============================================================================
+# RUN
+# ============================================================================
+
+def find_lua(explicit):
+    if explicit:
+        return shutil.which(explicit) or explicit
+    return next((shutil.which(name) for name in LUA_CANDIDATES if shutil.which(name)), None)
+
+
+def _dir(path):
+    return Path(path).absolute().as_posix().rstrip('/') + '/'
+
+
+def data_root(base_dir, work_dir):
+    """A folder named data/ that is this repo (symlinked when the repo has another name)."""
+    if base_dir.name.lower() == 'data':
+        return base_dir
+    link = work_dir / 'data'
+    os.symlink(base_dir, link, target_is_directory=True)
+    return link
+
+
+def bytecode_files(base_dir, char_dirs):
+    """Files BytecodeCache.collect_files() compiles in game: shared/, then the
+    character folders' entry files, sets/ and config/ (data-relative paths)."""
+    files = [p.relative_to(base_dir).as_posix() for p in sorted((base_dir / 'shared').rglob('*.lua'))]
+    files = [f for f in files if not f.startswith(BYTECODE_SKIP)]
+    for rel in char_dirs:
+        folder = base_dir / rel
+        paths = sorted(folder.glob('*.lua'))
+        paths += sorted((folder / 'sets').rglob('*.lua')) + sorted((folder / 'config').rglob('*.lua'))
+        files += [p.relative_to(base_dir).as_posix() for p in paths]
+    return files
+
+
+def run_job(lua, data_dir, windower_dir, work_dir, entry_rel, char_name, char_dirs, seq, passes,
+            bytecode=None):
+    """Run replay.lua for one sequence; return the parsed result table.
+
+    bytecode: cache dir to load through BytecodeCache (built by build_bytecode), or None.
+    """
+    job = seq['job']
+    tag = f'{job}_bc' if bytecode else job
+    seq_path = work_dir / f'seq_{tag}.lua'
+    out_path = work_dir / f'result_{tag}.lua'
+    conf_path = work_dir / f'config_{tag}.lua'
+    sandbox = work_dir / f'sandbox_{tag}'
+    sandbox.mkdir(exist_ok=True)
+    seq_path.write_text(render_sequence(seq), encoding='utf-8')
+    dirs = ', '.join(lua_string(d) for d in char_dirs)
+    extra = (('bytecode', lua_string(_dir(bytecode))),) if bytecode else ()
+    conf_path.write_text('return {\n' + ''.join(f'    {k} = {v},\n' for k, v in (
+        ('data_dir', lua_string(_dir(data_dir))),
+        ('windower_dir', lua_string(_dir(windower_dir))),
+        ('sandbox_dir', lua_string(_dir(sandbox))),
+        ('out', lua_string(out_path.as_posix())),
+        ('char', lua_string(char_name)),
+        ('char_dirs', '{' + dirs + '}'),
+        ('entry', lua_string(entry_rel)),
+        ('sequence', lua_string(seq_path.as_posix())),
+        ('passes', str(passes)),
+    ) + extra) + '}\n', encoding='utf-8')
+
+    proc = subprocess.run([lua, str(data_dir / REPLAY_SCRIPT), str(conf_path)],
+                          capture_output=True, text=True, timeout=300, cwd=str(work_dir))
+    if not out_path.exists():
+        tail = (proc.stderr or proc.stdout).strip().splitlines()[-3:]
+        return {'errors': ['harness: ' + ' | '.join(tail) if tail else f'harness exit {proc.returncode}']}
+    for stmt in read_chunk(out_path.read_text(encoding='utf-8')):
+        if isinstance(stmt, tuple) and stmt[0] == 'return':
+            return stmt[1]
+    return {'errors': ['harness: unreadable result']}
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _list(value):
+    if isinstance(value, dict):
+        return [value[k] for k in sorted(value)]
+    return list(value or [])
+
+
+def _percentile(samples, p):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(raw):
+    """Per-job summary (per warm pass) from a replay.lua result."""
+    warm = max(int(raw.get('passes', 1)) - 1, 1)
+    hooks = {}
+    totals = {'ms': 0.0, 'kb': 0.0, 'packets': 0, 'slots': 0}
+    for entry in _list(raw.get('hooks')):
+        samples = [float(v) for v in _list(entry.get('ms'))]
+        calls = int(entry.get('calls', 0))
+        hooks[entry['hook']] = {
+            'calls': calls,
+            'mean': sum(samples) / len(samples) if samples else 0.0,
+            'p50': _percentile(samples, 50),
+            'p95': _percentile(samples, 95),
+            'max': max(samples) if samples else 0.0,
+            'kb_per_call': float(entry.get('kb', 0)) / calls if calls else 0.0,
+            'packets': int(entry.get('packets', 0)),
+            'slots': int(entry.get('slots', 0)),
+            'chat': int(entry.get('chat', 0)),
+            'commands': int(entry.get('commands', 0)),
+            'errors': int(entry.get('errors', 0)),
+        }
+        totals['ms'] += sum(samples)
+        totals['kb'] += float(entry.get('kb', 0))
+        totals['packets'] += int(entry.get('packets', 0))
+        totals['slots'] += int(entry.get('slots', 0))
+    return {
+        'load_ms': float(raw.get('load_ms', 0)) + float(raw.get('setup_ms', 0)),
+        'setup_kb': float(raw.get('setup_kb', 0)),
+        'cold_ms': float(raw.get('cold_ms', 0)),
+        'pass_ms': totals['ms'] / warm,
+        'kb_per_pass': totals['kb'] / warm,
+        'packets_per_pass': totals['packets'] / warm,
+        'slots_per_pass': totals['slots'] / warm,
+        'steps': int(raw.get('steps', 0)),
+        'hooks': hooks,
+        'errors': [str(e) for e in _list(raw.get('errors'))],
+        'stubbed': dict(raw.get('stubbed') or {}),
+    }
+
+
+def print_jobs(summaries):
+    print(f"\n   {'Job':<6} {'load ms':>8} {'cold ms':>8} {'pass ms':>8} {'precast p95':>11} "
+          f"{'KB/pass':>8} {'packets':>8} {'slots':>6}  errors")
+    for job, s in summaries.items():
+        precast = s['hooks'].get('precast', {}).get('p95', 0.0)
+        print(f"   {job:<6} {s['load_ms']:>8.1f} {s['cold_ms']:>8.1f} {s['pass_ms']:>8.2f} {precast:>11.3f} "
+              f"{s['kb_per_pass']:>8.1f} {s['packets_per_pass']:>8.1f} {s['slots_per_pass']:>6.1f}  "
+              f"{len(s['errors']) or '-'}")
+
+
+def print_hooks(job, s):
+    print(f"\n   {job}: {s['steps']} steps, per-hook (warm passes)")
+    print(f"   {'hook':<14} {'calls':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8} {'KB/call':>8} "
+          f"{'packets':>8} {'slots':>6} {'chat':>5}")
+    order = [h for h in HOOK_ORDER if h in s['hooks']] + sorted(set(s['hooks']) - set(HOOK_ORDER))
+    for hook in order:
+        h = s['hooks'][hook]
+        print(f"   {hook:<14} {h['calls']:>6} {h['mean']:>8.3f} {h['p50']:>8.3f} {h['p95']:>8.3f} "
+              f"{h['max']:>8.3f} {h['kb_per_call']:>8.2f} {h['packets']:>8} {h['slots']:>6} {h['chat']:>5}")
+    for err in s['errors'][:10]:
+        print(f"   [ERROR] {err.splitlines()[0]}")
+    if s['stubbed']:
+        names = ', '.join(f'{k} x{v}' for k, v in sorted(s['stubbed'].items()))
+        print(f"   Stubbed calls: {names}")
+
+
+def build_bytecode(lua, data_dir, work_dir, files):
+    """Compile files into work_dir/bytecode with BytecodeCache; return (cache dir, errors)."""
+    cache_dir = work_dir / 'bytecode'
+    cache_dir.mkdir(exist_ok=True)
+    conf_path = work_dir / 'config_bytecode.lua'
+    conf_path.write_text('return {\n'
+                         f'    data_dir = {lua_string(_dir(data_dir))},\n'
+                         f'    bytecode = {lua_string(_dir(cache_dir))},\n'
+                         '    bytecode_files = {' + ', '.join(lua_string(f) for f in files) + '},\n'
+                         '}\n', encoding='utf-8')
+    proc = subprocess.run([lua, str(data_dir / REPLAY_SCRIPT), str(conf_path)],
+                          capture_output=True, text=True, timeout=300, cwd=str(work_dir))
+    return cache_dir, (proc.stderr or '').strip().splitlines()
+
+
+def print_bytecode(summaries, cached):
+    """Reload cost per job: source vs bytecode cache."""
+    print(f"\n   {'Job':<6} {'source ms':>10} {'bytecode ms':>12} {'saved':>7}")
+    total_source = total_cached = 0.0
+    for job, s in summaries.items():
+        c = cached.get(job)
+        if not c or s['errors'] or c['errors']:
+            print(f"   {job:<6} {s['load_ms']:>10.1f} {'-':>12} {'-':>7}")
+            continue
+        total_source += s['load_ms']
+        total_cached += c['load_ms']
+        saved = 1 - c['load_ms'] / s['load_ms'] if s['load_ms'] else 0.0
+        print(f"   {job:<6} {s['load_ms']:>10.1f} {c['load_ms']:>12.1f} {saved:>7.0%}")
+    for job, c in cached.items():
+        if c['errors'] and not summaries[job]['errors']:
+            print(f"   [ERROR] {job} (bytecode): {c['errors'][0].splitlines()[0]}")
+    if total_source:
+        print(f"   {'total':<6} {total_source:>10.1f} {total_cached:>12.1f} {1 - total_cached / total_source:>7.0%}")
+
+
+def compare(summaries, baseline, threshold):
+    """Regression messages against a previous --json file."""
+    problems = []
+    for job, s in summaries.items():
+        base = baseline.get('jobs', {}).get(job)
+        if not base:
+            continue
+        limit = 1 + threshold
+        if s['pass_ms'] > base['pass_ms'] * limit and s['pass_ms'] - base['pass_ms'] > MIN_DELTA_MS:
+            problems.append(f"{job}: pass {base['pass_ms']:.2f} -> {s['pass_ms']:.2f} ms")
+        if s['kb_per_pass'] > base['kb_per_pass'] * limit and s['kb_per_pass'] - base['kb_per_pass'] > MIN_DELTA_KB:
+            problems.append(f"{job}: {base['kb_per_pass']:.1f} -> {s['kb_per_pass']:.1f} KB/pass")
+        for key in ('packets_per_pass', 'slots_per_pass'):
+            if s[key] > base[key]:
+                problems.append(f"{job}: {key.replace('_per_pass', '')} {base[key]:.1f} -> {s[key]:.1f} per pass")
+        for hook, h in s['hooks'].items():
+            old = base.get('hooks', {}).get(hook)
+            if old and h['p95'] > old['p95'] * limit and h['p95'] - old['p95'] > MIN_DELTA_MS:
+                problems.append(f"{job}: {hook} p95 {old['p95']:.3f} -> {h['p95']:.3f} ms")
+        if len(s['errors']) > len(base.get('errors', [])):
+            problems.append(f"{job}: {len(s['errors'])} errors (baseline {len(base.get('errors', []))})")
+    return problems
+
+
+# Command line: flags, and options that take a value
+FLAGS = ('--bytecode',)
+OPTIONS = (
+    '--lua', '--windower', '--passes', '--job', '--seq', '--char', '--sub', '--write-suite',
+    '--json', '--baseline', '--threshold',
+)
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS, integers=('--passes',), numbers=('--threshold',))
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    lua = find_lua(arg_value('--lua'))
+    # Windower/addons/GearSwap/data/ -> Windower/ (None when not that deep)
+    windower_dir = arg_value('--windower') or (base_dir.parents[2] if len(base_dir.parents) >= 3 else None)
+    passes = max(int(arg_value('--passes', '5')), 2)
+    job_filter = arg_value('--job')
+    seq_path = arg_value('--seq')
+
+    if not lua:
+        print(f"[ERROR] No Lua 5.1 interpreter found ({', '.join(LUA_CANDIDATES)}) - pass --lua PATH")
+        return 1
+    if windower_dir is None or not (Path(windower_dir) / 'addons' / 'GearSwap' / 'libs' / 'Mote-Include.lua').exists():
+        print(f"[ERROR] Mote-Include.lua not found under {windower_dir or '<Windower>'}/addons/GearSwap/libs")
+        print("        Pass --windower <Windower folder> (needs addons/libs, addons/GearSwap/libs, res)")
+        return 1
+    windower_dir = Path(windower_dir)
+
+    entries = [e for e in discover_entries(base_dir, arg_value('--char')) if ':' not in e[0]]
+    suites = []
+    if seq_path:
+        try:
+            seq = load_sequence(Path(seq_path))
+        except (LuaParseError, ValueError, OSError) as exc:
+            print(f"[ERROR] Cannot read {seq_path}: {exc}")
+            return 1
+        entry = next((e for e in entries if e[0] == str(seq.get('job', '')).upper()), None)
+        if not entry:
+            print(f"[ERROR] No entry file for job {seq.get('job')!r}")
+            return 1
+        suites.append((entry, seq))
+    else:
+        if job_filter:
+            entries = [e for e in entries if e[0] == job_filter.upper()]
+        for entry in entries:
+            job, _, name, dirs = entry
+            sub = arg_value('--sub') or DEFAULT_SUB.get(job, 'WAR')
+            suites.append((entry, build_suite(base_dir, job, dirs, name, sub)))
+    if not suites:
+        print("[ERROR] no entry file found (check --char / --job)")
+        return 1
+
+    suite_dir = arg_value('--write-suite')
+    if suite_dir:
+        Path(suite_dir).mkdir(parents=True, exist_ok=True)
+        for (job, _, _, _), seq in suites:
+            (Path(suite_dir) / f'suite_{job}.lua').write_text(render_sequence(seq), encoding='utf-8')
+        print(f"   Wrote {len(suites)} sequences to {suite_dir}")
+
+    use_bytecode = '--bytecode' in sys.argv
+    started = time.perf_counter()
+    summaries = {}
+    cached = {}
+    with tempfile.TemporaryDirectory(prefix='hook_bench_') as tmp:
+        work_dir = Path(tmp)
+        try:
+            data_dir = data_root(base_dir, work_dir)
+        except OSError as exc:
+            print(f"[ERROR] Cannot link the repo as data/: {exc} (or run from a folder named data)")
+            return 1
+        cache_dir = None
+        if use_bytecode:
+            char_dirs = sorted({d.relative_to(base_dir).as_posix() for (_, _, _, dirs), _ in suites for d in dirs})
+            files = bytecode_files(base_dir, char_dirs)
+            cache_dir, errors = build_bytecode(lua, data_dir, work_dir, files)
+            print(f"[{'ERROR' if errors else 'OK'}] Bytecode cache: {len(files)} files")
+            for err in errors[:5]:
+                print(f"   [ERROR] {err}")
+        for (job, path, name, dirs), seq in suites:
+            entry_rel = path.relative_to(base_dir).as_posix()
+            dir_rels = [d.relative_to(base_dir).as_posix() for d in dirs]
+            try:
+                raw = run_job(lua, data_dir, windower_dir, work_dir, entry_rel, name, dir_rels, seq, passes)
+            except (subprocess.TimeoutExpired, LuaParseError) as exc:
+                raw = {'errors': [f'harness: {exc}']}
+            summaries[job] = summarize(raw)
+            if cache_dir:
+                try:
+                    raw = run_job(lua, data_dir, windower_dir, work_dir, entry_rel, name, dir_rels, seq,
+                                  passes, bytecode=cache_dir)
+                except (subprocess.TimeoutExpired, LuaParseError) as exc:
+                    raw = {'errors': [f'harness: {exc}']}
+                cached[job] = summarize(raw)
+
+    print(f"[OK] {len(summaries)} jobs x {passes} passes in {time.perf_counter() - started:.1f} s ({lua})")
+    print_jobs(summaries)
+    if use_bytecode:
+        print_bytecode(summaries, cached)
+    if len(summaries) == 1:
+        job = next(iter(summaries))
+        print_hooks(job, summaries[job])
+    else:
+        for job, s in summaries.items():
+            for err in s['errors'][:3]:
+                print(f"   [ERROR] {job}: {err.splitlines()[0]}")
+
+    json_path = arg_value('--json')
+    if json_path:
+        data = {'version': 1, 'passes': passes, 'lua': lua, 'jobs': summaries}
+        Path(json_path).write_text(json.dumps(data, indent=1), encoding='utf-8')
+        print(f"   Wrote {json_path}")
+
+    baseline_path = arg_value('--baseline')
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+        threshold = float(arg_value('--threshold', str(DEFAULT_THRESHOLD)))
+        problems = compare(summaries, baseline, threshold)
+        for problem in problems:
+            print(f"   [REGRESSION] {problem}")
+        print(f"[{'ERROR' if problems else 'OK'}] {len(problems)} regressions vs {baseline_path} "
+              f"(threshold {threshold:.0%})")
+        if problems:
+            return 1
+    return 1 if any(s['errors'] for s in summaries.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
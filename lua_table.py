@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Lua Table Reader - Tetsouo GearSwap System
+==========================================
+Tokenizer + parser for the declarative Lua subset used by the data files of
+this project (character_db.lua, _master/sets/*.lua, shared/data/*):
+
+  - literals: strings (short + long brackets, escapes), numbers, true/false/nil
+  - table constructors: { a, b }, { key = v }, { ['key'] = v }
+  - references: Name, a.b.c, a['b'], a[1]
+  - calls: f(args), f{table}, f'string'
+  - operators: unary -, not, #, and binary .. + - * / % ^ == ~= < > <= >= and or
+    (constant-folded when both sides are literals, kept as BinOp otherwise)
+  - function bodies are skipped and represented by Function()
+
+Top-level statements are read by read_chunk(), which yields assignments,
+call statements and the module's return value; control blocks
+(function/if/for/while/do/repeat) are skipped and reported as Skipped().
+Nothing is executed.
+
+Value mapping:
+    string/number/bool   -> str/int/float/bool
+    nil                  -> None
+    { 'a', 'b' }         -> list
+    { k = v } / mixed    -> dict (positional items keyed 1..n, like Lua)
+    { }                  -> {} (empty dict)
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import re
+from collections import namedtuple
+
+# ============================================================================
+# TOKENIZER
+# ============================================================================
+
+KEYWORDS = frozenset((
+    'and', 'break', 'do', 'else', 'elseif', 'end', 'false', 'for', 'function',
+    'goto', 'if', 'in', 'local', 'nil', 'not', 'or', 'repeat', 'return', 'then',
+    'true', 'until', 'while',
+))
+
+Token = namedtuple('Token', 'kind value line')  # kind: name kw string number op eof
+
+_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_NUMBER = re.compile(r'0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_LONG_OPEN = re.compile(r'\[(=*)\[')
+_SPACE = re.compile(r'\s+')
+_OPS = ('...', '..', '==', '~=', '<=', '>=', '::')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'a': '\a', 'b': '\b', 'f': '\f',
+            'v': '\v', '\\': '\\', '"': '"', "'": "'", '\n': '\n'}
+
+
+class LuaParseError(ValueError):
+    """Raised on Lua syntax this reader does not understand."""
+
+    def __init__(self, message, line=None):
+        super().__init__(f"line {line}: {message}" if line else message)
+        self.line = line
+
+
+def _read_long_bracket(text, pos, line):
+    """Read a [==[ ... ]==] block starting at pos. Returns (body, end_pos)."""
+    m = _LONG_OPEN.match(text, pos)
+    close = ']' + m.group(1) + ']'
+    end = text.find(close, m.end())
+    if end < 0:
+        raise LuaParseError('unfinished long bracket', line)
+    body = text[m.end():end]
+    if body.startswith('\r\n'):
+        body = body[2:]
+    elif body.startswith('\n'):
+        body = body[1:]
+    return body, end + len(close)
+
+
+def _read_short_string(text, pos, line):
+    """Read a '...' or "..." string starting at pos. Returns (value, end_pos)."""
+    quote = text[pos]
+    out = []
+    i = pos + 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == quote:
+            return ''.join(out), i + 1
+        if c == '\n':
+            break
+        if c == '\\':
+            i += 1
+            e = text[i] if i < n else ''
+            if e in _ESCAPES:
+                out.append(_ESCAPES[e])
+                i += 1
+            elif e.isdigit():
+                digits = re.match(r'\d{1,3}', text[i:]).group()
+                out.append(chr(int(digits)))
+                i += len(digits)
+            elif e == 'x':
+                out.append(chr(int(text[i + 1:i + 3], 16)))
+                i += 3
+            elif e == 'z':
+                i = _SPACE.match(text, i + 1).end() if _SPACE.match(text, i + 1) else i + 1
+            else:
+                out.append(e)
+                i += 1
+            continue
+        out.append(c)
+        i += 1
+    raise LuaParseError('unfinished string', line)
+
+
+def tokenize(text):
+    """Split Lua source into tokens (comments and whitespace dropped)."""
+    tokens = []
+    pos = 0
+    line = 1
+    n = len(text)
+    while pos < n:
+        c = text[pos]
+        if c in ' \t\r\n\f\v':
+            m = _SPACE.match(text, pos)
+            line += text.count('\n', pos, m.end())
+            pos = m.end()
+            continue
+        if text.startswith('--', pos):
+            if _LONG_OPEN.match(text, pos + 2):
+                _, end = _read_long_bracket(text, pos + 2, line)
+            else:
+                end = text.find('\n', pos)
+                end = n if end < 0 else end
+            line += text.count('\n', pos, end)
+            pos = end
+            continue
+        if c.isalpha() or c == '_':
+            word = _NAME.match(text, pos).group()
+            tokens.append(Token('kw' if word in KEYWORDS else 'name', word, line))
+            pos += len(word)
+            continue
+        if c.isdigit() or (c == '.' and pos + 1 < n and text[pos + 1].isdigit()):
+            raw = _NUMBER.match(text, pos).group()
+            if raw[:2].lower() == '0x':
+                value = int(raw, 16)
+            elif any(ch in raw for ch in '.eE'):
+                value = float(raw)
+            else:
+                value = int(raw)
+            tokens.append(Token('number', value, line))
+            pos += len(raw)
+            continue
+        if c in '"\'':
+            value, end = _read_short_string(text, pos, line)
+            tokens.append(Token('string', value, line))
+            pos = end
+            continue
+        if c == '[' and _LONG_OPEN.match(text, pos):
+            value, end = _read_long_bracket(text, pos, line)
+            tokens.append(Token('string', value, line))
+            line += text.count('\n', pos, end)
+            pos = end
+            continue
+        for op in _OPS:
+            if text.startswith(op, pos):
+                tokens.append(Token('op', op, line))
+                pos += len(op)
+                break
+        else:
+            tokens.append(Token('op', c, line))
+            pos += 1
+    tokens.append(Token('eof', None, line))
+    return tokens
+
+
+# ============================================================================
+# EXPRESSION NODES
+# ============================================================================
+
+class Ref:
+    """Reference to a variable or field path, e.g. sets.precast.FC -> ('sets','precast','FC')."""
+
+    __slots__ = ('path',)
+
+    def __init__(self, path):
+        self.path = tuple(path)
+
+    def __eq__(self, other):
+        return isinstance(other, Ref) and other.path == self.path
+
+    def __hash__(self):
+        return hash(('Ref', self.path))
+
+    def __repr__(self):
+        return f"Ref({'.'.join(map(str, self.path))})"
+
+
+class Call:
+    """Function call with parsed arguments, e.g. set_combine(sets.idle, {...})."""
+
+    __slots__ = ('func', 'args', 'line')
+
+    def __init__(self, func, args, line=None):
+        self.func = func
+        self.args = args
+        self.line = line
+
+    @property
+    def name(self):
+        """Dotted callee name ('set_combine', 'CharDB.get_jobs') or None."""
+        if isinstance(self.func, Ref):
+            return '.'.join(map(str, self.func.path))
+        return None
+
+    def __repr__(self):
+        return f"Call({self.name or self.func!r}, {self.args!r})"
+
+
+class BinOp:
+    """Binary/unary expression that could not be constant-folded."""
+
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f"BinOp({self.left!r} {self.op} {self.right!r})"
+
+
+class Function:
+    """Placeholder for a function body (never evaluated)."""
+
+    __slots__ = ('line',)
+
+    def __init__(self, line=None):
+        self.line = line
+
+    def __repr__(self):
+        return 'Function()'
+
+
+Assignment = namedtuple('Assignment', 'target value line local')
+Skipped = namedtuple('Skipped', 'keyword line')  # function/if/for/... not read
+
+
+# ============================================================================
+# PARSER
+# ============================================================================
+
+# Binary operator precedence (left, right) as in the Lua 5.1 manual
+_BINARY = {
+    'or': (1, 1), 'and': (2, 2),
+    '<': (3, 3), '>': (3, 3), '<=': (3, 3), '>=': (3, 3), '~=': (3, 3), '==': (3, 3),
+    '..': (5, 4),  # right associative
+    '+': (6, 6), '-': (6, 6),
+    '*': (7, 7), '/': (7, 7), '%': (7, 7),
+    '^': (10, 9),  # right associative
+}
+_UNARY_PRIORITY = 8
+
+_BLOCK_OPEN = frozenset(('function', 'if', 'do', 'repeat'))
+_BLOCK_CLOSE = frozenset(('end', 'until'))
+
+
+def _fold(op, left, right):
+    """Constant-fold literal operands; otherwise build a BinOp."""
+    literal = (str, int, float, bool, type(None))
+    if not (isinstance(left, literal) and isinstance(right, literal)):
+        return BinOp(op, left, right)
+    try:
+        if op == '..':
+            return _tostr(left) + _tostr(right)
+        if op == '+':
+            return left + right
+        if op == '-':
+            return left - right
+        if op == '*':
+            return left * right
+        if op == '/':
+            return left / right
+        if op == '%':
+            return left % right
+        if op == '^':
+            return float(left) ** right
+        if op == '==':
+            return left == right
+        if op == '~=':
+            return left != right
+        if op == 'and':
+            return right if left not in (None, False) else left
+        if op == 'or':
+            return left if left not in (None, False) else right
+        return {'<': left < right, '>': left > right,
+                '<=': left <= right, '>=': left >= right}[op]
+    except (TypeError, ZeroDivisionError, KeyError):
+        return BinOp(op, left, right)
+
+
+def _tostr(value):
+    """Lua tostring for concatenation of literals."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (int, float, str)):
+        return str(value)
+    raise TypeError(value)
+
+
+class Parser:
+    """Recursive-descent parser over a token list."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    # -- token helpers -------------------------------------------------
+
+    @property
+    def tok(self):
+        return self.tokens[self.pos]
+
+    def peek(self, offset=1):
+        idx = min(self.pos + offset, len(self.tokens) - 1)
+        return self.tokens[idx]
+
+    def check(self, value, kind=None):
+        t = self.tok
+        return t.value == value and (kind is None or t.kind == kind) and t.kind != 'string'
+
+    def accept(self, value):
+        if self.check(value):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, value):
+        if not self.accept(value):
+            raise LuaParseError(f"expected '{value}' near '{self.tok.value}'", self.tok.line)
+
+    def expect_name(self):
+        t = self.tok
+        if t.kind != 'name':
+            raise LuaParseError(f"expected name near '{t.value}'", t.line)
+        self.pos += 1
+        return t.value
+
+    # -- expressions ---------------------------------------------------
+
+    def parse_expr(self, limit=0):
+        t = self.tok
+        if t.kind in ('kw', 'op') and t.value in ('-', 'not', '#'):
+            self.pos += 1
+            operand = self.parse_expr(_UNARY_PRIORITY)
+            if t.value == '-' and isinstance(operand, (int, float)) and not isinstance(operand, bool):
+                left = -operand
+            elif t.value == 'not' and isinstance(operand, (bool, type(None))):
+                left = not operand
+            elif t.value == '#' and isinstance(operand, (str, list)):
+                left = len(operand)
+            else:
+                left = BinOp(t.value, None, operand)
+        else:
+            left = self.parse_simple()
+
+        while True:
+            t = self.tok
+            if t.kind not in ('op', 'kw') or t.value not in _BINARY:
+                return left
+            lprio, rprio = _BINARY[t.value]
+            if lprio <= limit:
+                return left
+            self.pos += 1
+            right = self.parse_expr(rprio)
+            left = _fold(t.value, left, right)
+
+    def parse_simple(self):
+        t = self.tok
+        if t.kind in ('string', 'number'):
+            self.pos += 1
+            return t.value
+        if t.kind == 'kw':
+            if t.value in ('true', 'false'):
+                self.pos += 1
+                return t.value == 'true'
+            if t.value == 'nil':
+                self.pos += 1
+                return None
+            if t.value == 'function':
+                self.pos += 1
+                self.skip_function_body()
+                return Function(t.line)
+        if t.kind == 'op':
+            if t.value == '{':
+                return self.parse_table()
+            if t.value == '...':
+                self.pos += 1
+                return Ref(('...',))
+        return self.parse_suffixed()
+
+    def parse_primary(self):
+        t = self.tok
+        if t.kind == 'name':
+            self.pos += 1
+            return Ref((t.value,))
+        if self.accept('('):
+            expr = self.parse_expr()
+            self.expect(')')
+            return expr
+        raise LuaParseError(f"unexpected '{t.value}'", t.line)
+
+    def parse_suffixed(self):
+        expr = self.parse_primary()
+        while True:
+            t = self.tok
+            if self.check('.'):
+                self.pos += 1
+                key = self.expect_name()
+                expr = self._index(expr, key)
+            elif self.check('['):
+                self.pos += 1
+                key = self.parse_expr()
+                self.expect(']')
+                expr = self._index(expr, key)
+            elif self.check(':'):
+                self.pos += 1
+                method = self.expect_name()
+                args = self.parse_args()
+                expr = Call(self._index(expr, method), [expr] + args, t.line)
+            elif self.check('(') or self.check('{') or t.kind == 'string':
+                expr = Call(expr, self.parse_args(), t.line)
+            else:
+                return expr
+
+    @staticmethod
+    def _index(expr, key):
+        if isinstance(expr, Ref) and isinstance(key, (str, int, float)) and not isinstance(key, bool):
+            return Ref(expr.path + (key,))
+        return BinOp('[]', expr, key)
+
+    def parse_args(self):
+        t = self.tok
+        if t.kind == 'string':
+            self.pos += 1
+            return [t.value]
+        if self.check('{'):
+            return [self.parse_table()]
+        self.expect('(')
+        args = []
+        if not self.check(')'):
+            args.append(self.parse_expr())
+            while self.accept(','):
+                args.append(self.parse_expr())
+        self.expect(')')
+        return args
+
+    def parse_table(self):
+        self.expect('{')
+        array = []
+        keyed = {}
+        order = []  # preserves source order of keyed fields
+        while not self.check('}'):
+            if self.check('['):
+                self.pos += 1
+                key = self.parse_expr()
+                self.expect(']')
+                self.expect('=')
+                keyed[key] = self.parse_expr()
+                order.append(key)
+            elif self.tok.kind == 'name' and self.peek().value == '=' and self.peek().kind == 'op':
+                key = self.tok.value
+                self.pos += 2
+                keyed[key] = self.parse_expr()
+                order.append(key)
+            else:
+                array.append(self.parse_expr())
+            if not (self.accept(',') or self.accept(';')):
+                break
+        self.expect('}')
+        if not keyed:
+            return array if array else {}
+        result = {i + 1: v for i, v in enumerate(array)}
+        for key in order:
+            result[key] = keyed[key]
+        return result
+
+    # -- blocks --------------------------------------------------------
+
+    def skip_function_body(self):
+        """Skip '(params) ... end' after the 'function' keyword (and name)."""
+        while not self.check('('):
+            if self.tok.kind == 'eof':
+                raise LuaParseError('unfinished function', self.tok.line)
+            self.pos += 1
+        self.skip_block(depth=1)
+
+    def skip_block(self, depth=1):
+        """Advance past the matching end/until for `depth` open blocks."""
+        while depth:
+            t = self.tok
+            if t.kind == 'eof':
+                raise LuaParseError('unfinished block', t.line)
+            if t.kind == 'kw':
+                if t.value in _BLOCK_OPEN:
+                    depth += 1
+                elif t.value in _BLOCK_CLOSE:
+                    depth -= 1
+            self.pos += 1
+
+    def parse_chunk(self):
+        """Yield top-level Assignment / Call / Skipped statements and ('return', value)."""
+        while self.tok.kind != 'eof':
+            t = self.tok
+            if t.kind == 'kw':
+                if t.value == 'local':
+                    self.pos += 1
+                    if self.accept('function'):
+                        self.skip_function_body()
+                        yield Skipped('function', t.line)
+                        continue
+                    names = [self.expect_name()]
+                    while self.accept(','):
+                        names.append(self.expect_name())
+                    if self.accept('='):
+                        values = self._expr_list()
+                        for i, name in enumerate(names):
+                            value = values[i] if i < len(values) else None
+                            yield Assignment((name,), value, t.line, True)
+                    continue
+                if t.value == 'function':
+                    self.pos += 1
+                    self.skip_function_body()
+                    yield Skipped('function', t.line)
+                    continue
+                if t.value == 'return':
+                    self.pos += 1
+                    if self.tok.kind == 'eof' or self.check('end', 'kw') or self.check(';'):
+                        yield ('return', None)
+                    else:
+                        yield ('return', self.parse_expr())
+                    continue
+                if t.value in _BLOCK_OPEN or t.value in ('for', 'while'):
+                    self.pos += 1
+                    if t.value in ('for', 'while'):
+                        while not self.check('do', 'kw'):
+                            self.pos += 1
+                        self.pos += 1
+                    self.skip_block(depth=1)
+                    yield Skipped(t.value, t.line)
+                    continue
+                self.pos += 1
+                continue
+            if t.kind == 'name' or self.check('('):
+                expr = self.parse_suffixed()
+                if self.check('=') or self.check(','):
+                    targets = [expr]
+                    while self.accept(','):
+                        targets.append(self.parse_suffixed())
+                    self.expect('=')
+                    values = self._expr_list()
+                    for i, target in enumerate(targets):
+                        value = values[i] if i < len(values) else None
+                        path = target.path if isinstance(target, Ref) else target
+                        yield Assignment(path, value, t.line, False)
+                elif isinstance(expr, Call):
+                    yield expr
+                continue
+            self.pos += 1
+
+    def _expr_list(self):
+        values = [self.parse_expr()]
+        while self.accept(','):
+            values.append(self.parse_expr())
+        return values
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def parse_value(text):
+    """Parse a single Lua expression (e.g. a table constructor)."""
+    parser = Parser(tokenize(text))
+    value = parser.parse_expr()
+    if parser.tok.kind != 'eof':
+        raise LuaParseError(f"trailing input near '{parser.tok.value}'", parser.tok.line)
+    return value
+
+
+def read_chunk(text):
+    """Return the top-level statements of a Lua file (see Parser.parse_chunk)."""
+    return list(Parser(tokenize(text)).parse_chunk())
+
+
+def local_tables(text):
+    """Map each top-level `local NAME = <value>` to its parsed value."""
+    return {stmt.target[0]: stmt.value
+            for stmt in read_chunk(text)
+            if isinstance(stmt, Assignment) and stmt.local}
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Database Packer - Tetsouo GearSwap System
+=========================================
+Packs the static spell / weapon skill / job ability data modules into compact
+generated modules under shared/data/packed/:
+
+    shared/data/magic/<dir>/*.lua            (leaf modules behind *_SPELL_DATABASE)
+    shared/data/job_abilities/<job>/*.lua    (leaf modules behind JA_DATABASE_FACTORY)
+    shared/data/weaponskills/*_WS_DATABASE.lua
+
+Each record table (`X.spells`, `X.abilities`, `X.weaponskills`, `X.blood_pacts`...)
+becomes one name array plus one dense array per field (element, skillchain,
+ftp, mods, jobs, level...). Identical nested tables (mods, ftp, jobs lists)
+are written once and shared. Cold text (description, notes, special_notes...)
+goes to a separate <module>_text.lua that is only loaded the first time one of
+those fields is read.
+
+shared/utils/data/data_pack.lua loads a pack only while the source module still
+has the recorded content stamp (byte size + Adler-32, checked by FileStamp);
+otherwise it requires the source module as before. Re-run the packer - or
+`--check` - after editing shared/data.
+
+Modules with helper functions (weapon skill databases) are packed as
+`partial`: the pack carries the data tables only and is used by the merging
+databases, a plain require() still returns the full module.
+
+Usage:
+    python pack_databases.py             (pack every module)
+    python pack_databases.py --check     (exit 1 if any pack is stale/missing)
+    python pack_databases.py --stats     (size summary per database family)
+    python pack_databases.py --clean     (delete shared/data/packed/)
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import lua_table
+from gear_sets import file_stamp, lua_string
+from tool_args import check_args
+
+DATA_DIR = Path('shared') / 'data'
+PACK_DIR = DATA_DIR / 'packed'
+PACK_VERSION = 2
+
+SOURCE_GLOBS = (
+    'magic/*/**/*.lua',
+    'job_abilities/*/*.lua',
+    'weaponskills/*_WS_DATABASE.lua',
+)
+SKIP_SOURCES = {'weaponskills/UNIVERSAL_WS_DATABASE.lua'}
+
+# Display-only text fields, split into the lazily loaded text module
+COLD_FIELDS = ('description', 'notes', 'special_notes', 'effect', 'quest_name')
+
+_IDENT = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class NotPackable(Exception):
+    """Raised when a module is not plain data."""
+
+
+# ============================================================================
+# SOURCE READING
+# ============================================================================
+
+def discover_sources(base_dir):
+    """Return the data modules to pack, relative to base_dir (sorted)."""
+    data_dir = base_dir / DATA_DIR
+    found = set()
+    for pattern in SOURCE_GLOBS:
+        for path in data_dir.glob(pattern):
+            rel = path.relative_to(data_dir).as_posix()
+            if rel not in SKIP_SOURCES and not rel.startswith('packed/'):
+                found.add(path)
+    return sorted(found)
+
+
+def _check_plain(value, where):
+    """Reject references, calls and unfolded expressions anywhere in value."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _check_plain(item, f'{where}.{key}')
+    elif isinstance(value, list):
+        for i, item in enumerate(value, 1):
+            _check_plain(item, f'{where}[{i}]')
+    elif not isinstance(value, (str, int, float, bool)) and value is not None:
+        raise NotPackable(f'{where}: {value!r} is not a literal')
+
+
+def read_module(path):
+    """
+    Rebuild the table a data module returns.
+
+    Returns (module, partial): module is the returned table as a dict, partial
+    is True when the file also defines functions (not carried by the pack).
+    Raises NotPackable for anything that is not plain data.
+    """
+    text = path.read_text(encoding='utf-8')
+    try:
+        statements = lua_table.read_chunk(text)
+    except lua_table.LuaParseError as exc:
+        raise NotPackable(f'parse error: {exc}') from None
+
+    tables = {}
+    returned = None
+    partial = False
+    for stmt in statements:
+        if isinstance(stmt, lua_table.Skipped):
+            if stmt.keyword != 'function':
+                raise NotPackable(f"'{stmt.keyword}' block at line {stmt.line}")
+            partial = True
+        elif isinstance(stmt, lua_table.Assignment):
+            head, rest = stmt.target[0], stmt.target[1:]
+            if isinstance(stmt.value, lua_table.Function):
+                partial = True
+                continue
+            if not rest:
+                if not isinstance(stmt.value, dict):
+                    raise NotPackable(f"'{head}' is not a table (line {stmt.line})")
+                tables[head] = stmt.value
+                continue
+            if head not in tables or len(rest) != 1:
+                raise NotPackable(f"assignment to {'.'.join(map(str, stmt.target))} (line {stmt.line})")
+            tables[head][rest[0]] = stmt.value
+        elif isinstance(stmt, tuple) and stmt[0] == 'return':
+            returned = stmt[1]
+        else:
+            raise NotPackable(f'statement {stmt!r}')
+
+    if not isinstance(returned, lua_table.Ref) or len(returned.path) != 1 or returned.path[0] not in tables:
+        raise NotPackable('module does not return a local table')
+    module = tables[returned.path[0]]
+    for key in [k for k, v in module.items() if isinstance(v, lua_table.Function)]:
+        del module[key]
+        partial = True
+    _check_plain(module, returned.path[0])
+    return module, partial
+
+
+def is_record_table(value):
+    """True for {name = {field = ...}, ...} tables (spells, abilities...)."""
+    return (isinstance(value, dict) and bool(value)
+            and all(isinstance(k, str) and isinstance(v, dict) and v
+                    and all(isinstance(f, str) for f in v)
+                    for k, v in value.items()))
+
+
+# ============================================================================
+# LUA EMITTER
+# ============================================================================
+
+def lua_key(key):
+    if isinstance(key, str):
+        if _IDENT.match(key) and key not in lua_table.KEYWORDS:
+            return key
+        return f'[{lua_string(key)}]'
+    return f'[{lua_scalar(key)}]'
+
+
+def lua_scalar(value):
+    if value is None:
+        return 'nil'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return lua_string(value)
+
+
+class Emitter:
+    """Writes values as Lua; nested tables seen more than once share a K[n] entry."""
+
+    def __init__(self):
+        self.pool = []
+        self.pool_index = {}
+        self.uses = {}
+
+    def literal(self, value):
+        if isinstance(value, list):
+            return '{' + ', '.join(self.literal(v) for v in value) + '}'
+        if isinstance(value, dict):
+            return '{' + ', '.join(f'{lua_key(k)} = {self.literal(v)}' for k, v in value.items()) + '}'
+        return lua_scalar(value)
+
+    def count(self, value):
+        """First pass: count nested table occurrences."""
+        if isinstance(value, (list, dict)):
+            text = self.literal(value)
+            self.uses[text] = self.uses.get(text, 0) + 1
+
+    def value(self, value):
+        """Second pass: literal, or K[n] when the same table appears again."""
+        if not isinstance(value, (list, dict)):
+            return lua_scalar(value)
+        text = self.literal(value)
+        if self.uses.get(text, 0) < 2:
+            return text
+        if text not in self.pool_index:
+            self.pool.append(text)
+            self.pool_index[text] = len(self.pool)
+        return f'K[{self.pool_index[text]}]'
+
+
+def dense_array(cells):
+    """{a, nil, c}: positional constructor, nil keeps the slot empty.
+    Mostly empty columns (per-job levels...) use {[i] = v} instead."""
+    while cells and cells[-1] == 'nil':
+        cells = cells[:-1]
+    filled = sum(1 for c in cells if c != 'nil')
+    if filled * 2 < len(cells):
+        return '{' + ', '.join(f'[{i}] = {c}' for i, c in enumerate(cells, 1) if c != 'nil') + '}'
+    return '{' + ', '.join(cells) + '}'
+
+
+def split_groups(module):
+    """Split a module into record groups and plain fields."""
+    groups = {k: v for k, v in module.items() if is_record_table(v)}
+    plain = {k: v for k, v in module.items() if k not in groups}
+    return groups, plain
+
+
+def render_pack(rel_source, stamp, module, partial, text_module):
+    """Return (pack_source, text_source_or_None, stats) for one module."""
+    groups, plain = split_groups(module)
+    emitter = Emitter()
+    layouts = {}
+    for group, records in groups.items():
+        names = sorted(records)
+        fields = sorted({f for r in records.values() for f in r})
+        hot = [f for f in fields if f not in COLD_FIELDS]
+        cold = [f for f in fields if f in COLD_FIELDS]
+        layouts[group] = (names, hot, cold)
+        for name in names:
+            for field in hot:
+                emitter.count(records[name].get(field))
+
+    body = []
+    text_body = []
+    for group in sorted(groups):
+        records = groups[group]
+        names, hot, cold = layouts[group]
+        body.append(f'        {lua_key(group)} = {{')
+        body.append('            names = ' + dense_array([lua_string(n) for n in names]) + ',')
+        body.append('            fields = ' + dense_array([lua_string(f) for f in hot]) + ',')
+        body.append('            columns = {')
+        for field in hot:
+            cells = [emitter.value(records[n].get(field)) for n in names]
+            body.append(f'                {dense_array(cells)}, -- {field}')
+        body.append('            },')
+        if cold:
+            body.append('            cold = ' + dense_array([lua_string(f) for f in cold]) + ',')
+            text_body.append(f'    {lua_key(group)} = {{')
+            for field in cold:
+                cells = [lua_scalar(records[n].get(field)) for n in names]
+                text_body.append(f'        {lua_key(field)} = {dense_array(cells)},')
+            text_body.append('    },')
+        body.append('        },')
+
+    header = [
+        '---============================================================================',
+        f'--- PACKED {rel_source}',
+        '---============================================================================',
+        '--- GENERATED by pack_databases.py - do not edit, re-run the script instead.',
+        '--- Loaded by shared/utils/data/data_pack.lua.',
+        '---============================================================================',
+        '',
+    ]
+    lines = list(header)
+    if emitter.pool:
+        lines.append('local K = {')
+        lines.extend(f'    {text},' for text in emitter.pool)
+        lines.append('}')
+        lines.append('')
+    lines += [
+        'return {',
+        f'    version = {PACK_VERSION},',
+        f"    generated = '{time.strftime('%Y-%m-%d %H:%M')}',",
+        f'    source = {{path = {lua_string(rel_source)}, size = {stamp[0]}, adler32 = {stamp[1]}}},',
+        f'    partial = {lua_scalar(partial)},',
+    ]
+    if text_body:
+        lines.append(f'    text = {lua_string(text_module)},')
+    lines.append('    plain = ' + emitter.literal(plain) + ',')
+    lines.append('    groups = {')
+    lines += body
+    lines.append('    },')
+    lines.append('}')
+
+    text_source = None
+    if text_body:
+        text_source = '\n'.join(header + ['return {'] + text_body + ['}']) + '\n'
+    stats = {
+        'records': sum(len(r) for r in groups.values()),
+        'shared': len(emitter.pool),
+    }
+    return '\n'.join(lines) + '\n', text_source, stats
+
+
+# ============================================================================
+# BUILD / CHECK
+# ============================================================================
+
+def pack_paths(base_dir, source):
+    """(pack, text) output paths for a source module."""
+    rel = source.relative_to(base_dir / DATA_DIR).with_suffix('')
+    pack = base_dir / PACK_DIR / rel.with_suffix('.lua')
+    return pack, pack.with_name(pack.stem + '_text.lua')
+
+
+def module_name(path, base_dir):
+    """'shared/data/packed/magic/song/song_buffs' style require path."""
+    return path.relative_to(base_dir).with_suffix('').as_posix()
+
+
+def build_one(base_dir, source):
+    """Pack one module. Returns stats dict; raises NotPackable."""
+    module, partial = read_module(source)
+    groups, _ = split_groups(module)
+    if not groups:
+        raise NotPackable('no record tables')
+    pack_path, text_path = pack_paths(base_dir, source)
+    rel_source = source.relative_to(base_dir).as_posix()
+    pack_src, text_src, stats = render_pack(
+        rel_source, file_stamp(source), module, partial, module_name(text_path, base_dir))
+
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    pack_path.write_text(pack_src, encoding='utf-8')
+    if text_src:
+        text_path.write_text(text_src, encoding='utf-8')
+    elif text_path.exists():
+        text_path.unlink()
+    stats.update(partial=partial, source=source.stat().st_size,
+                 pack=pack_path.stat().st_size,
+                 text=text_path.stat().st_size if text_src else 0)
+    return stats
+
+
+_STAMP_RE = re.compile(r'source = \{path = .*?, size = (\d+), adler32 = (\d+)\}')
+
+
+def pack_is_fresh(base_dir, source):
+    pack_path, _ = pack_paths(base_dir, source)
+    if not pack_path.exists():
+        return False
+    text = pack_path.read_text(encoding='utf-8')
+    match = _STAMP_RE.search(text)
+    return bool(match) and (int(match.group(1)), int(match.group(2))) == file_stamp(source) and \
+        f'version = {PACK_VERSION},' in text
+
+
+def family(base_dir, source):
+    return source.relative_to(base_dir / DATA_DIR).parts[0]
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+# Command line: flags, and options that take a value
+FLAGS = ('--check', '--stats', '--clean')
+OPTIONS = ()
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+
+    if '--clean' in sys.argv:
+        target = base_dir / PACK_DIR
+        if target.exists():
+            shutil.rmtree(target)
+            print(f"[OK] Removed {PACK_DIR.as_posix()}/")
+        return 0
+
+    sources = discover_sources(base_dir)
+
+    if '--check' in sys.argv:
+        stale = [s for s in sources if not pack_is_fresh(base_dir, s)]
+        for source in stale:
+            print(f"[STALE] {source.relative_to(base_dir).as_posix()}")
+        print(f"[{'OK' if not stale else 'FAIL'}] {len(sources) - len(stale)}/{len(sources)} packs up to date")
+        return 1 if stale else 0
+
+    started = time.perf_counter()
+    totals = {}
+    skipped = []
+    for source in sources:
+        try:
+            stats = build_one(base_dir, source)
+        except NotPackable as exc:
+            skipped.append((source, exc))
+            continue
+        fam = totals.setdefault(family(base_dir, source), {
+            'modules': 0, 'records': 0, 'source': 0, 'pack': 0, 'text': 0, 'shared': 0, 'partial': 0})
+        fam['modules'] += 1
+        for key in ('records', 'source', 'pack', 'text', 'shared'):
+            fam[key] += stats[key]
+        fam['partial'] += 1 if stats['partial'] else 0
+
+    packed = sum(f['modules'] for f in totals.values())
+    print(f"[OK] Packed {packed}/{len(sources)} modules into {PACK_DIR.as_posix()}/ "
+          f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    if '--stats' in sys.argv or skipped:
+        for name, fam in sorted(totals.items()):
+            print(f"   {name:<14} {fam['modules']:>3} modules {fam['records']:>5} records  "
+                  f"source {fam['source'] // 1024:>4} KB -> hot {fam['pack'] // 1024:>4} KB "
+                  f"+ text {fam['text'] // 1024:>4} KB  ({fam['shared']} shared tables, "
+                  f"{fam['partial']} partial)")
+    for source, exc in skipped:
+        print(f"   [SKIP] {source.relative_to(base_dir).as_posix()}: {exc}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
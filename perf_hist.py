@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Hook Latency Report - Tetsouo GearSwap System
+=============================================
+Reads the histogram exports written by `//gs c perf export`
+(data/perf_hist_<Char>_<date>.lua, see shared/utils/debug/performance_profiler.lua),
+merges them per character / job / hook and prints a comparison report:
+sample count, mean, p50/p95/p99 and max per hook.
+
+Exports of several sessions of the same character are summed bucket by
+bucket; exports of different characters are kept side by side so the same
+job can be compared across characters.
+
+Usage:
+    python perf_hist.py                              (every perf_hist_*.lua here)
+    python perf_hist.py exports/ old/perf_hist_Tetsouo_20261018_201500.lua
+    python perf_hist.py --job WAR --hook precast
+    python perf_hist.py --merge-chars                (one column per job only)
+    python perf_hist.py --json report.json
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from lua_table import LuaParseError, read_chunk
+from tool_args import arg_value, check_args
+
+EXPORT_GLOB = 'perf_hist_*.lua'
+EXPORT_VERSION = 1
+HOOK_ORDER = ['precast', 'midcast', 'aftercast', 'status_change', 'update', 'command']
+PERCENTILES = (50, 95, 99)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (same layout as the Lua profiler)."""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(self.bounds) + 1)
+
+    def add(self, data):
+        """Add one exported {count, sum, max, buckets} table."""
+        buckets = data.get('buckets') or []
+        if len(buckets) != len(self.buckets):
+            raise ValueError(f"bucket count {len(buckets)} != {len(self.buckets)}")
+        self.count += int(data.get('count', 0))
+        self.sum += float(data.get('sum', 0))
+        self.max = max(self.max, float(data.get('max', 0)))
+        for i, n in enumerate(buckets):
+            self.buckets[i] += int(n)
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Estimate a percentile, linear inside the bucket (matches Profiler.percentile)."""
+        if not self.count:
+            return 0.0
+        rank = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = self.bounds[i - 1] if i > 0 else 0.0
+                high = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(low + (high - low) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+
+def load_export(path):
+    """Return the table of one export file."""
+    for stmt in read_chunk(path.read_text(encoding='utf-8')):
+        if isinstance(stmt, tuple) and stmt[0] == 'return':
+            data = stmt[1]
+            if not isinstance(data, dict) or data.get('version') != EXPORT_VERSION:
+                raise ValueError('not a version 1 histogram export')
+            return data
+    raise ValueError('no return table')
+
+
+def collect_paths(args, base_dir):
+    """Expand file / directory arguments into export paths."""
+    if not args:
+        args = [str(base_dir)]
+    paths = []
+    for arg in args:
+        path = Path(arg)
+        if path.is_dir():
+            paths.extend(sorted(path.glob(EXPORT_GLOB)))
+        elif path.exists():
+            paths.append(path)
+        else:
+            print(f"   [!] Not found: {arg}")
+    return paths
+
+
+def merge(paths, merge_chars=False):
+    """Merge exports into {(character, job): {hook: Histogram}}.
+
+    Returns (merged, sessions, bounds); sessions counts files per character.
+    """
+    merged = {}
+    sessions = {}
+    bounds = None
+    for path in paths:
+        try:
+            data = load_export(path)
+        except (LuaParseError, ValueError, OSError) as exc:
+            print(f"   [!] Skipped {path.name}: {exc}")
+            continue
+        file_bounds = [float(b) for b in data.get('bounds') or []]
+        if bounds is None:
+            bounds = file_bounds
+        elif file_bounds != bounds:
+            print(f"   [!] Skipped {path.name}: different bucket bounds")
+            continue
+        character = str(data.get('character') or 'Unknown')
+        sessions[character] = sessions.get(character, 0) + 1
+        owner = '*' if merge_chars else character
+        for job, hooks in (data.get('jobs') or {}).items():
+            target = merged.setdefault((owner, job), {})
+            for hook, hist in hooks.items():
+                target.setdefault(hook, Histogram(bounds)).add(hist)
+    return merged, sessions, bounds or []
+
+
+def _hooks_of(hooks):
+    return [h for h in HOOK_ORDER if h in hooks] + sorted(h for h in hooks if h not in HOOK_ORDER)
+
+
+def print_report(merged, hook_filter=None):
+    """Print one block per hook, one row per character/job, slowest p95 first."""
+    all_hooks = set()
+    for hooks in merged.values():
+        all_hooks.update(hooks)
+    for hook in _hooks_of(all_hooks):
+        if hook_filter and hook != hook_filter:
+            continue
+        rows = [(owner, job, hooks[hook]) for (owner, job), hooks in merged.items() if hook in hooks]
+        rows.sort(key=lambda row: -row[2].percentile(95))
+        print(f"\n   {hook}")
+        print(f"   {'Character':<14} {'Job':<5} {'Samples':>8} {'Mean':>8} "
+              f"{'p50':>8} {'p95':>8} {'p99':>8} {'Max':>9}")
+        print(f"   {'-' * 14} {'-' * 5} {'-' * 8} {'-' * 8} {'-' * 8} {'-' * 8} {'-' * 8} {'-' * 9}")
+        for owner, job, hist in rows:
+            p50, p95, p99 = (hist.percentile(p) for p in PERCENTILES)
+            print(f"   {owner:<14} {job:<5} {hist.count:>8} {hist.mean:>8.2f} "
+                  f"{p50:>8.2f} {p95:>8.2f} {p99:>8.2f} {hist.max:>9.2f}")
+
+
+def to_json(merged, sessions, bounds):
+    """JSON-friendly form of the merged report (ms)."""
+    rows = []
+    for (owner, job), hooks in sorted(merged.items()):
+        for hook in _hooks_of(hooks):
+            hist = hooks[hook]
+            rows.append({
+                'character': owner, 'job': job, 'hook': hook,
+                'count': hist.count, 'mean': round(hist.mean, 4), 'max': round(hist.max, 4),
+                **{f"p{p}": round(hist.percentile(p), 4) for p in PERCENTILES},
+                'buckets': hist.buckets,
+            })
+    return {'bounds': bounds, 'sessions': sessions, 'rows': rows}
+
+
+# Command line: flags, and options that take a value
+FLAGS = ('--merge-chars',)
+OPTIONS = ('--job', '--hook', '--json')
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS, positional=True)
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    job_filter = arg_value('--job')
+    hook_filter = arg_value('--hook')
+    json_path = arg_value('--json')
+
+    args = []
+    skip = False
+    for arg in sys.argv[1:]:
+        if skip:
+            skip = False
+        elif arg in ('--job', '--hook', '--json'):
+            skip = True
+        elif not arg.startswith('--'):
+            args.append(arg)
+
+    paths = collect_paths(args, base_dir)
+    print("=" * 60)
+    print("   GearSwap Hook Latency Report")
+    print("=" * 60)
+    if not paths:
+        print("   No exports found - run //gs c perf hist, play, then //gs c perf export")
+        return 1
+
+    merged, sessions, bounds = merge(paths, '--merge-chars' in sys.argv)
+    if job_filter:
+        merged = {key: hooks for key, hooks in merged.items() if key[1].upper() == job_filter.upper()}
+    summary = ', '.join(f"{name} x{count}" for name, count in sorted(sessions.items()))
+    print(f"   Exports : {sum(sessions.values())} ({summary})")
+    print(f"   Buckets : {len(bounds) + 1} (<= {bounds[-1] if bounds else 0:g} ms + overflow)")
+    if not merged:
+        print("   No samples match the filters")
+        return 1
+
+    print_report(merged, hook_filter)
+    if json_path:
+        Path(json_path).write_text(json.dumps(to_json(merged, sessions, bounds), indent=1),
+                                   encoding='utf-8')
+        print(f"\n   Wrote {json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Require Graph Analyzer - Tetsouo GearSwap System
+================================================
+Builds the static require/include graph of each job entry file and reports
+what a `gs load` / job change (full GearSwap reload) executes:
+
+  - transitive module count, total bytes and depth of the eager graph
+  - most required modules (fan-in)
+  - lazy-load candidates: modules required at load time but only used inside
+    rare handlers (commands, debug, reports...), with the bytes that making
+    them lazy would take off every reload
+  - a warm-start bundle: eager modules in dependency order (--bundle)
+
+Eager vs lazy is decided statically: a require/include at the top level of a
+file, or inside a load hook (get_sets, init_gear_sets, job_setup, user_setup),
+runs on every reload; one inside any other function runs when that function
+is first called. Requires built from concatenated strings are counted as
+dynamic and not followed.
+
+Paths resolve like GearSwap does from data/: 'shared/...' and '../shared/...'
+from the repo root, '<Char>/...' and 'sets/...' from the character folder
+(or its _master/ templates), Mote-Include and other GearSwap libs are external.
+
+Usage:
+    python require_graph.py                      (_master/entry/*.lua)
+    python require_graph.py --job WAR            (one entry, detailed)
+    python require_graph.py --char Tetsouo       (cloned <Char>/<Char>_<JOB>.lua)
+    python require_graph.py --top 20             (rows per table)
+    python require_graph.py --json graph.json
+    python require_graph.py --bundle require_bundle.lua
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import json
+import re
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from gear_sets import lua_string
+from lua_table import LuaParseError, tokenize
+from tool_args import arg_value, check_args
+
+# Functions GearSwap / Mote-Include call while loading the job file
+LOAD_HOOKS = frozenset(('get_sets', 'init_gear_sets', 'job_setup', 'user_setup'))
+
+# Handlers that only run on explicit user action
+RARE_FUNCTION = re.compile(
+    r'command|cmd|handle_|debug|test|bench|report|export|audit|help|dump|profile|toggle',
+    re.IGNORECASE)
+
+_BLOCK_OPEN = frozenset(('function', 'if', 'do', 'repeat'))
+_BLOCK_CLOSE = frozenset(('end', 'until'))
+
+Edge = namedtuple('Edge', 'source target kind literal line eager functions binding')
+Dynamic = namedtuple('Dynamic', 'source kind line prefix')
+
+
+# ============================================================================
+# SCANNER
+# ============================================================================
+
+def _function_name(tokens, i):
+    """Name of the function whose 'function' keyword is tokens[i]."""
+    j = i + 1
+    if tokens[j].kind == 'name':
+        parts = [tokens[j].value]
+        j += 1
+        while tokens[j].value in ('.', ':') and tokens[j + 1].kind == 'name':
+            parts.append(tokens[j + 1].value)
+            j += 2
+        return '.'.join(parts)
+    if i >= 2 and tokens[i - 1].value == '=' and tokens[i - 2].kind == 'name':
+        return tokens[i - 2].value
+    return '<anonymous>'
+
+
+def _call_target(tokens, i):
+    """
+    Read the module argument of require/include at tokens[i].
+
+    Returns (literal, prefix): literal is the module string when it is a plain
+    constant, prefix the leading string of a concatenation (dynamic).
+    """
+    nxt = tokens[i + 1]
+    if nxt.kind == 'string':                        # require 'x'
+        return nxt.value, None
+    if nxt.value == '(':                            # require('x') / require(x .. y)
+        arg = tokens[i + 2]
+    elif nxt.value == ',' and tokens[i - 1].value == '(':   # pcall(require, 'x')
+        arg = tokens[i + 2]
+    else:
+        return None, None
+    if arg.kind != 'string':
+        return None, ''
+    if tokens[i + 3].value in (')', ','):
+        return arg.value, None
+    return None, arg.value
+
+
+def _binding(tokens, i):
+    """Local name a require result is stored in (`local X = require(...)`)."""
+    j = i - 1
+    if tokens[j].value == '(' and tokens[j - 1].value == 'pcall':
+        j -= 2
+    if tokens[j].value != '=' or tokens[j - 1].kind != 'name':
+        return None
+    return tokens[j - 1].value
+
+
+def scan_file(text):
+    """
+    Scan one Lua file.
+
+    Returns (calls, uses): calls is a list of
+    (kind, literal, prefix, line, functions, binding) for every require/include,
+    uses maps each identifier to the list of enclosing-function chains it is
+    read from (() = top level).
+    """
+    tokens = tokenize(text)
+    stack = []
+    calls = []
+    uses = {}
+    for i, tok in enumerate(tokens):
+        if tok.kind == 'kw':
+            if tok.value in _BLOCK_OPEN:
+                stack.append(_function_name(tokens, i) if tok.value == 'function' else None)
+            elif tok.value in _BLOCK_CLOSE and stack:
+                stack.pop()
+            continue
+        if tok.kind != 'name':
+            continue
+        functions = tuple(name for name in stack if name)
+        if tok.value in ('require', 'include'):
+            literal, prefix = _call_target(tokens, i)
+            if literal is not None or prefix is not None:
+                calls.append((tok.value, literal, prefix, tok.line, functions, _binding(tokens, i)))
+                continue
+        if i and tokens[i - 1].value in ('.', ':'):
+            continue
+        if tokens[i + 1].value == '=':          # write or table key, not a read
+            continue
+        uses.setdefault(tok.value, []).append(functions)
+    return calls, uses
+
+
+# ============================================================================
+# GRAPH
+# ============================================================================
+
+# Scan results shared by every entry graph: path -> (calls, uses)
+_SCANS = {}
+
+
+class RequireGraph:
+    """Files reachable from a set of entry files, with typed edges."""
+
+    def __init__(self, base_dir, char_dirs):
+        self.base_dir = Path(base_dir)
+        self.char_dirs = char_dirs          # {'tetsouo': [dir, fallback...]}
+        self.files = {}                     # rel -> {'size', 'uses', 'name'}
+        self.edges = {}                     # rel -> [Edge]
+        self.dynamic = []
+        self.missing = {}                   # literal -> [source]
+        self.external = set()
+        self.errors = []
+
+    # ----------------------------------------------------------------- paths
+
+    def resolve(self, literal, kind, source_dir):
+        """Map a require/include string to a repo-relative file, or None."""
+        name = literal.replace('\\', '/')
+        while name.startswith('../'):
+            name = name[3:]
+        if not name.endswith('.lua'):
+            name += '.lua'
+        head, _, rest = name.partition('/')
+        candidates = [self.base_dir / name]
+        if head.lower() in self.char_dirs:
+            candidates = [d / rest for d in self.char_dirs[head.lower()]]
+            if rest.startswith('config/'):
+                candidates += [d / 'config_global' / rest[7:] for d in self.char_dirs[head.lower()]]
+        elif kind == 'include' and not name.startswith('shared/'):
+            candidates = [d / name for d in source_dir] + candidates
+        for cand in candidates:
+            if cand.is_file():
+                return cand.relative_to(self.base_dir).as_posix()
+        return None
+
+    # ------------------------------------------------------------------ load
+
+    def add_file(self, rel, source_dir):
+        """Scan rel and everything it reaches (iterative)."""
+        pending = [rel]
+        while pending:
+            current = pending.pop()
+            if current in self.files:
+                continue
+            path = self.base_dir / current
+            if path not in _SCANS:
+                try:
+                    _SCANS[path] = scan_file(path.read_text(encoding='utf-8', errors='replace'))
+                except LuaParseError as exc:
+                    self.errors.append(f'{current}: {exc}')
+                    _SCANS[path] = ([], {})
+            calls, uses = _SCANS[path]
+            self.files[current] = {'size': path.stat().st_size, 'uses': uses, 'name': None}
+            self.edges[current] = []
+            for kind, literal, prefix, line, functions, binding in calls:
+                if literal is None:
+                    self.dynamic.append(Dynamic(current, kind, line, prefix))
+                    continue
+                target = self.resolve(literal, kind, source_dir)
+                if target is None:
+                    if literal.replace('\\', '/').lstrip('./').startswith('shared/') or \
+                            literal.split('/')[0].lower() in self.char_dirs or \
+                            literal.startswith('sets/'):
+                        self.missing.setdefault(literal, []).append(current)
+                    else:
+                        self.external.add(literal)
+                    continue
+                eager = not functions or functions[0] in LOAD_HOOKS
+                self.edges[current].append(Edge(current, target, kind, literal, line, eager, functions, binding))
+                pending.append(target)
+        for edges in self.edges.values():
+            for edge in edges:
+                if edge.kind == 'require' and self.files[edge.target]['name'] is None:
+                    self.files[edge.target]['name'] = edge.literal
+        return rel
+
+    # -------------------------------------------------------------- queries
+
+    def closure(self, root, eager_only=True, skip=frozenset()):
+        """Files reachable from root -> {rel: depth} (BFS, shortest depth)."""
+        depth = {root: 0}
+        frontier = [root]
+        while frontier:
+            nxt = []
+            for rel in frontier:
+                for edge in self.edges.get(rel, ()):
+                    if eager_only and not edge.eager:
+                        continue
+                    if (edge.source, edge.target) in skip or edge.target in depth:
+                        continue
+                    depth[edge.target] = depth[rel] + 1
+                    nxt.append(edge.target)
+            frontier = nxt
+        return depth
+
+    def size_of(self, rels):
+        return sum(self.files[r]['size'] for r in rels)
+
+    def bundle_order(self, root):
+        """Eager required modules, dependencies first (post-order DFS)."""
+        order = []
+        seen = {root}
+        stack = [(root, iter(self.edges.get(root, ())))]
+        while stack:
+            rel, it = stack[-1]
+            for edge in it:
+                if edge.eager and edge.target not in seen:
+                    seen.add(edge.target)
+                    stack.append((edge.target, iter(self.edges.get(edge.target, ()))))
+                    break
+            else:
+                stack.pop()
+                if rel != root and self.files[rel]['name']:
+                    order.append(self.files[rel]['name'])
+        return order
+
+    def deferred_edges(self, root):
+        """
+        Eager require edges whose binding is only read inside functions that
+        do not run at load time.
+
+        Returns [(edge, [function chains], rare)]; rare is True when every use
+        sits in a rare handler (RARE_FUNCTION).
+        """
+        reach = self.closure(root)
+        result = []
+        for rel in reach:
+            uses = self.files[rel]['uses']
+            for edge in self.edges[rel]:
+                if not edge.eager or edge.kind != 'require' or not edge.binding:
+                    continue
+                chains = uses.get(edge.binding, [])
+                if not chains or not all(chain and chain[0] not in LOAD_HOOKS for chain in chains):
+                    continue
+                rare = all(any(RARE_FUNCTION.search(fn.split('.')[-1]) for fn in chain)
+                           for chain in chains)
+                result.append((edge, chains, rare))
+        return result
+
+
+# ============================================================================
+# ANALYSIS
+# ============================================================================
+
+def analyze_entry(graph, entry_rel):
+    """Metrics + lazy-load candidates for one entry file."""
+    reach = graph.closure(entry_rel)
+    full = graph.closure(entry_rel, eager_only=False)
+    candidates = {}
+    for edge, chains, rare in graph.deferred_edges(entry_rel):
+        entry = candidates.setdefault(edge.target, {'edges': [], 'functions': set(), 'rare': True})
+        entry['edges'].append(edge)
+        entry['rare'] = entry['rare'] and rare
+        for chain in chains:
+            entry['functions'].add(chain[-1])
+    for target, entry in candidates.items():
+        skip = frozenset((e.source, e.target) for e in entry['edges'])
+        without = graph.closure(entry_rel, skip=skip)
+        saved = set(reach) - set(without)
+        entry['saved_files'] = len(saved)
+        entry['saved_bytes'] = graph.size_of(saved)
+        entry['still_eager'] = target in without
+    return {
+        'entry': entry_rel,
+        'eager_files': len(reach),
+        'eager_bytes': graph.size_of(reach),
+        'depth': max(reach.values()),
+        'all_files': len(full),
+        'all_bytes': graph.size_of(full),
+        'reach': reach,
+        'candidates': candidates,
+    }
+
+
+def fan_in(graph, rels):
+    """Number of distinct files requiring/including each file (within rels)."""
+    counts = {}
+    for rel in rels:
+        for target in {e.target for e in graph.edges[rel]}:
+            counts[target] = counts.get(target, 0) + 1
+    return counts
+
+
+def discover_entries(base_dir, char):
+    """[(job, entry_rel, char_key, search dirs)] for _master or a cloned character."""
+    entries = []
+    if char:
+        char_dir = next((d for d in base_dir.iterdir()
+                         if d.is_dir() and d.name.lower() == char.lower()), None)
+        if not char_dir:
+            return []
+        for path in sorted(char_dir.glob(f'{char_dir.name}_*.lua')):
+            job = path.stem.split('_')[-1].upper()
+            entries.append((job, path, char_dir.name, [char_dir]))
+        return entries
+    master = base_dir / '_master'
+    for path in sorted((master / 'entry').glob('*_*.lua')):
+        name, job = path.stem.rsplit('_', 1)
+        entries.append((job.upper(), path, name, [master / name, master] if (master / name).is_dir() else [master]))
+    for path in sorted(master.glob('*/entry/*_*.lua')):
+        name, job = path.stem.rsplit('_', 1)
+        entries.append((f'{name}:{job.upper()}', path, name, [path.parent.parent, master]))
+    return entries
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def kb(size):
+    return f'{size / 1024:,.0f} KB'
+
+
+def print_entry_table(results):
+    print(f"   {'Entry':<14} {'Eager':>6} {'Bytes':>9} {'Depth':>6} {'All':>6} {'Bytes':>9} {'Rare':>5}")
+    for job, res in results:
+        print(f"   {job:<14} {res['eager_files']:>6} {kb(res['eager_bytes']):>9} {res['depth']:>6} "
+              f"{res['all_files']:>6} {kb(res['all_bytes']):>9} {sum(1 for c in res['candidates'].values() if c['rare']):>5}")
+
+
+def print_fan_in(graph, counts, top):
+    print(f"\n   Most required files (fan-in):")
+    for rel, count in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:top]:
+        print(f"      {count:>4}  {rel} ({kb(graph.files[rel]['size'])})")
+
+
+def print_candidates(results, top, detailed):
+    merged = {}
+    for job, res in results:
+        for target, cand in res['candidates'].items():
+            row = merged.setdefault(target, {'jobs': [], 'saved': 0, 'files': 0, 'rare': True,
+                                             'functions': set(), 'edges': set(), 'still': False})
+            row['jobs'].append(job)
+            row['saved'] = max(row['saved'], cand['saved_bytes'])
+            row['files'] = max(row['files'], cand['saved_files'])
+            row['rare'] = row['rare'] and cand['rare']
+            row['functions'] |= cand['functions']
+            row['edges'] |= {(e.source, e.line) for e in cand['edges']}
+            row['still'] = row['still'] or cand['still_eager']
+    rows = sorted(merged.items(), key=lambda kv: (-kv[1]['saved'], kv[0]))
+    sections = (
+        ('Lazy-load candidates (required at load, used only in rare handlers)',
+         [r for r in rows if r[1]['rare']]),
+        ('Deferred uses (required at load, first used inside a runtime function)',
+         [r for r in rows if not r[1]['rare']]),
+    )
+    for title, section in sections:
+        if not section:
+            print(f"\n   {title}: none")
+            continue
+        print(f"\n   {title}:")
+        for target, row in section[:top]:
+            note = ' (also required eagerly elsewhere)' if row['still'] else ''
+            print(f"      {target}: -{row['files']} files / -{kb(row['saved'])} per reload, "
+                  f"{len(row['jobs'])} entries{note}")
+            if detailed:
+                for source, line in sorted(row['edges']):
+                    print(f"         required at {source}:{line}")
+                print(f"         used in: {', '.join(sorted(row['functions']))}")
+        if len(section) > top:
+            print(f"      ... {len(section) - top} more (--top N)")
+
+
+def write_bundle(path, bundles):
+    """Lua file: per-entry eager module order + the modules common to all."""
+    jobs = list(bundles)
+    common = None
+    for order in bundles.values():
+        common = set(order) if common is None else common & set(order)
+    first = bundles[jobs[0]] if jobs else []
+    common_order = [name for name in first if name in (common or set())]
+    lines = [
+        '---============================================================================',
+        '--- Warm-start Require Bundle',
+        '---============================================================================',
+        '--- GENERATED by require_graph.py - do not edit, re-run the script instead.',
+        '--- Eager require() modules of each entry file, dependencies first.',
+        '--- `common` lists the modules every entry loads, in the same order.',
+        '---============================================================================',
+        '',
+        'return {',
+        '    version = 1,',
+        f"    generated = '{time.strftime('%Y-%m-%d %H:%M')}',",
+        '    common = {',
+    ]
+    lines += [f'        {lua_string(name)},' for name in common_order]
+    lines.append('    },')
+    lines.append('    entries = {')
+    for job in jobs:
+        lines.append(f'        [{lua_string(job)}] = {{')
+        lines += [f'            {lua_string(name)},' for name in bundles[job] if name not in (common or ())]
+        lines.append('        },')
+    lines.append('    },')
+    lines.append('}')
+    Path(path).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def to_json(graph, results):
+    return {
+        'entries': {
+            job: {
+                'entry': res['entry'],
+                'eager_files': res['eager_files'],
+                'eager_bytes': res['eager_bytes'],
+                'depth': res['depth'],
+                'all_files': res['all_files'],
+                'all_bytes': res['all_bytes'],
+                'eager': sorted(res['reach']),
+                'candidates': {
+                    target: {
+                        'saved_files': c['saved_files'],
+                        'saved_bytes': c['saved_bytes'],
+                        'still_eager': c['still_eager'],
+                        'rare': c['rare'],
+                        'required_at': [f'{e.source}:{e.line}' for e in c['edges']],
+                        'used_in': sorted(c['functions']),
+                    }
+                    for target, c in res['candidates'].items()
+                },
+            }
+            for job, res in results
+        },
+        'edges': [
+            {'source': e.source, 'target': e.target, 'kind': e.kind, 'line': e.line,
+             'eager': e.eager, 'function': e.functions[-1] if e.functions else None}
+            for edges in graph.edges.values() for e in edges
+        ],
+        'dynamic': [d._asdict() for d in graph.dynamic],
+        'missing': graph.missing,
+        'external': sorted(graph.external),
+        'errors': graph.errors,
+    }
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+# Command line: flags, and options that take a value
+FLAGS = ()
+OPTIONS = ('--job', '--char', '--top', '--json', '--bundle')
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS, integers=('--top',))
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    job_filter = arg_value('--job')
+    top = int(arg_value('--top', '15'))
+
+    entries = discover_entries(base_dir, arg_value('--char'))
+    if job_filter:
+        entries = [e for e in entries if e[0].split(':')[-1] == job_filter.upper() or e[0] == job_filter]
+    if not entries:
+        print("ERROR: no entry file found (check --char / --job)")
+        return 1
+
+    started = time.perf_counter()
+    results = []
+    graphs = []
+    bundles = {}
+    for job, path, char_name, dirs in entries:
+        graph = RequireGraph(base_dir, {char_name.lower(): dirs})
+        rel = graph.add_file(path.relative_to(base_dir).as_posix(), dirs)
+        res = analyze_entry(graph, rel)
+        results.append((job, res))
+        graphs.append(graph)
+        bundles[job] = graph.bundle_order(rel)
+
+    print(f"[OK] {len(results)} entries analyzed in {(time.perf_counter() - started) * 1000:.0f} ms")
+    print_entry_table(results)
+
+    union = {}
+    for graph, (job, res) in zip(graphs, results):
+        for rel, count in fan_in(graph, graph.files).items():
+            union[rel] = max(union.get(rel, 0), count)
+    print_fan_in(graphs[0] if len(graphs) == 1 else _merged_sizes(graphs), union, top)
+    print_candidates(results, top, detailed=bool(job_filter))
+
+    dynamic = {(d.source, d.line): d for g in graphs for d in g.dynamic}
+    missing = {lit for g in graphs for lit in g.missing}
+    if dynamic:
+        print(f"\n   {len(dynamic)} dynamic require/include calls not followed"
+              + (':' if job_filter else ' (--job for details)'))
+        if job_filter:
+            for d in sorted(dynamic.values()):
+                arg = f"'{d.prefix}' .. ..." if d.prefix else '<expression>'
+                print(f"      {d.source}:{d.line} {d.kind}({arg})")
+    if missing:
+        print(f"   {len(missing)} unresolved modules: {', '.join(sorted(missing)[:top])}")
+    for err in sorted({e for g in graphs for e in g.errors}):
+        print(f"   [WARNING] {err}")
+
+    json_path = arg_value('--json')
+    if json_path:
+        data = {'analyzed': [to_json(g, [r]) for g, r in zip(graphs, results)]}
+        Path(json_path).write_text(json.dumps(data, indent=1), encoding='utf-8')
+        print(f"   Wrote {json_path}")
+    bundle_path = arg_value('--bundle')
+    if bundle_path:
+        write_bundle(bundle_path, bundles)
+        print(f"   Wrote {bundle_path}")
+    return 0
+
+
+def _merged_sizes(graphs):
+    """Graph-like object exposing the file sizes of several graphs."""
+    merged = RequireGraph(graphs[0].base_dir, {})
+    for graph in graphs:
+        merged.files.update(graph.files)
+    return merged
+
+
+if __name__ == "__main__":
+    sys.exit(main())
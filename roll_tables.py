@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Roll Tables Builder - Tetsouo GearSwap System
+=============================================
+Builds shared/data/packed/roll_tables.lua: exact Double-Up decision tables
+for every Phantom Roll in shared/jobs/cor/functions/logic/roll_data.lua.
+
+A state is (roll value 1-11, Crooked Cards, job bonus, Phantom Roll +X,
+Snake Eye ready, bust covered). "Bust covered" is Fold ready or a Natural 11
+already active: a bust then costs the roll but applies no bust effect.
++X takes the values RollTracker.get_phantom_roll_bonus() can return.
+
+Stopping pays the roll bonus (RollData.calculate_bonus, x1.2 with Crooked
+Cards); a bust pays bust_effect (0 when covered). Double-Up adds 1d6, Snake
+Eye adds exactly 1. Working back from 11, each state keeps the action with
+the highest exact expected value (ties: stop, then Double-Up) and the chance
+that this plan ends in a bust. Values are compared in the roll's favourable
+direction (Choral Roll is better when lower).
+
+Per roll the pack holds two strings, one byte per state:
+    advice  'S' stop, 'D' Double-Up, 'E' Snake Eye then Double-Up
+    risk    plan bust chance in whole percent, stored as byte 32 + percent
+RollTracker reads them in O(1) through shared/jobs/cor/functions/logic/
+roll_advice.lua. The tables are used only while roll_data.lua still has the
+recorded content stamp (size + Adler-32) - re-run the builder (or `--check`)
+after editing it.
+
+`--check` also runs RollData.calculate_bonus / calculate_bust_rate in a Lua
+5.1 interpreter (lua5.1, lua51, luajit or lua on PATH, or --lua PATH) and
+compares every (roll, value, job bonus, +X) with the payoffs used here;
+without an interpreter the check fails.
+
+Usage:
+    python roll_tables.py                      (build the tables)
+    python roll_tables.py --check              (exit 1 if stale/missing, formulas differ or no Lua)
+    python roll_tables.py --show "Chaos Roll"  (exact EV / bust chance per value)
+    python roll_tables.py --show "Chaos Roll" --crooked --job --bonus 8 --snake --fold
+
+Unknown arguments (and --help) print this usage and exit 2.
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from fractions import Fraction
+from pathlib import Path
+
+from gear_sets import file_stamp, lua_string
+from hook_bench import LUA_CANDIDATES, find_lua
+from lua_table import Assignment, read_chunk
+from pack_databases import PACK_DIR
+from tool_args import arg_value, check_args
+
+ROLL_DATA = Path('shared') / 'jobs' / 'cor' / 'functions' / 'logic' / 'roll_data.lua'
+TABLES_PATH = PACK_DIR / 'roll_tables.lua'
+TABLES_VERSION = 2
+
+# Phantom Roll +X values RollTracker.get_phantom_roll_bonus() can return
+BONUS_VALUES = (0, 3, 5, 6, 7, 8)
+CROOKED = Fraction(6, 5)
+RISK_BASE = 32
+
+ACTIONS = {'S': 'Stop', 'D': 'Double-Up', 'E': 'Snake Eye'}
+
+# Command line: flags, and options that take a value
+FLAGS = ('--check', '--crooked', '--job', '--snake', '--fold')
+OPTIONS = ('--show', '--bonus', '--lua')
+
+
+# ============================================================================
+# ROLL DATA
+# ============================================================================
+
+def load_rolls(base_dir):
+    """RollData.rolls as {name: record}."""
+    text = (base_dir / ROLL_DATA).read_text(encoding='utf-8')
+    for statement in read_chunk(text):
+        if isinstance(statement, Assignment) and tuple(statement.target) == ('RollData', 'rolls'):
+            return statement.value
+    raise ValueError(f"RollData.rolls not found in {ROLL_DATA.as_posix()}")
+
+
+def exact(value):
+    return Fraction(str(value))
+
+
+def bonus(roll, value, job, x):
+    """RollData.calculate_bonus() for a value, job bonus flag and +X."""
+    total = exact(roll['values'][value - 1])
+    if roll.get('job_bonus') and job:
+        total += exact(roll['job_bonus'][1])
+    return total + x * exact(roll.get('phantom_roll_bonus') or 0)
+
+
+def bust_rate(value):
+    """RollData.calculate_bust_rate(): bust chance (%) of the next Double-Up."""
+    return Fraction(0) if value <= 5 else Fraction(value - 5, 6) * 100
+
+
+# ============================================================================
+# DECISION TABLES
+# ============================================================================
+
+def state_index(value, crooked, job, x_index, snake, fold):
+    """0-based offset of a state in the advice/risk strings (Lua adds 1)."""
+    return ((((value - 1) * 2 + crooked) * 2 + job) * len(BONUS_VALUES) + x_index) * 4 + snake * 2 + fold
+
+
+def solve(roll, crooked, job, x, snake, fold):
+    """Optimal plan per value: {value: (action, ev, bust_chance, stop_payoff)}.
+
+    ev and stop_payoff are in the roll's own units; bust_chance is 0-1.
+    """
+    sign = -1 if roll['values'][-1] < roll['values'][0] else 1
+    bust_payoff = Fraction(0) if fold else exact(roll['bust_effect'])
+
+    # plans[snake_ready][value] = (action, utility, bust_chance, ev)
+    plans = {0: {}, 1: {}}
+    for ready in (0, 1) if snake else (0,):
+        for value in range(11, 0, -1):
+            stop = bonus(roll, value, job, x) * (CROOKED if crooked else 1)
+            best = ('S', sign * stop, Fraction(0), stop)
+
+            utility, chance, ev = Fraction(0), Fraction(0), Fraction(0)
+            for die in range(1, 7):
+                if value + die > 11:
+                    utility += sign * bust_payoff
+                    chance += 1
+                    ev += bust_payoff
+                else:
+                    _, u, c, e = plans[ready][value + die]
+                    utility, chance, ev = utility + u, chance + c, ev + e
+            if utility / 6 > best[1]:
+                best = ('D', utility / 6, chance / 6, ev / 6)
+
+            if ready and value < 11:
+                _, u, c, e = plans[0][value + 1]
+                if u > best[1]:
+                    best = ('E', u, c, e)
+            plans[ready][value] = best
+
+    result = {}
+    for value, (action, _, chance, ev) in plans[snake].items():
+        result[value] = (action, ev, chance, bonus(roll, value, job, x) * (CROOKED if crooked else 1))
+    return result
+
+
+def build(rolls):
+    """{name: (advice, risk)} - one byte per state, state_index() order."""
+    tables = {}
+    size = state_index(11, 1, 1, len(BONUS_VALUES) - 1, 1, 1) + 1
+    for name, roll in rolls.items():
+        advice = [''] * size
+        risk = [0] * size
+        for crooked in (0, 1):
+            for job in (0, 1):
+                for x_index, x in enumerate(BONUS_VALUES):
+                    for snake in (0, 1):
+                        for fold in (0, 1):
+                            for value, (action, _, chance, _) in solve(roll, crooked, job, x, snake, fold).items():
+                                i = state_index(value, crooked, job, x_index, snake, fold)
+                                advice[i] = action
+                                risk[i] = round(chance * 100)
+        tables[name] = (''.join(advice), bytes(RISK_BASE + r for r in risk))
+    return tables
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def lua_bytes(data):
+    """Lua string literal for arbitrary bytes (printable ASCII kept as is)."""
+    out = []
+    for byte in data:
+        char = chr(byte)
+        if char in "'\\" or not 32 <= byte < 127:
+            out.append(f'\\{byte:03d}')
+        else:
+            out.append(char)
+    return "'" + ''.join(out) + "'"
+
+
+def render(base_dir, tables):
+    lines = [
+        '-- Generated by roll_tables.py - do not edit',
+        'return {',
+        f'    version = {TABLES_VERSION},',
+        '    sources = {',
+        "        {{{}, {}, {}}},".format(lua_string(ROLL_DATA.as_posix()), *file_stamp(base_dir / ROLL_DATA)),
+        '    },',
+        '    bonus_values = {' + ', '.join(map(str, BONUS_VALUES)) + '},',
+        f'    risk_base = {RISK_BASE},',
+        '    rolls = {',
+    ]
+    for name in sorted(tables):
+        advice, risk = tables[name]
+        lines.append(f'        [{lua_string(name)}] = {{')
+        lines.append(f"            advice = '{advice}',")
+        lines.append(f'            risk = {lua_bytes(risk)},')
+        lines.append('        },')
+    lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+# ============================================================================
+# CHECK
+# ============================================================================
+
+LUA_FORMULAS = r"""
+local RollData = dofile(arg[1])
+local values = {%s}
+local names = RollData.get_roll_names()
+for _, name in ipairs(names) do
+    for v = 1, 11 do
+        for job = 0, 1 do
+            for _, x in ipairs(values) do
+                print(string.format('bonus\t%%s\t%%d\t%%d\t%%d\t%%.17g', name, v, job, x,
+                    RollData.calculate_bonus(name, v, 'COR', x, job == 1)))
+            end
+        end
+    end
+end
+for v = 1, 11 do
+    print(string.format('bust\t%%d\t%%.17g', v, RollData.calculate_bust_rate(v)))
+end
+"""
+
+
+def check_formulas(base_dir, rolls, lua):
+    """Compare the payoffs used here with roll_data.lua run in Lua. -> problems"""
+    with tempfile.TemporaryDirectory() as work:
+        script = Path(work) / 'roll_formulas.lua'
+        script.write_text(LUA_FORMULAS % ', '.join(map(str, BONUS_VALUES)), encoding='utf-8')
+        proc = subprocess.run([lua, str(script), str(base_dir / ROLL_DATA)],
+                              capture_output=True, text=True, encoding='utf-8')
+    if proc.returncode != 0:
+        return [f"Lua: {proc.stderr.strip()}"]
+
+    problems = []
+    seen = set()
+    for line in proc.stdout.splitlines():
+        fields = line.split('\t')
+        if fields[0] == 'bonus':
+            name, value, job, x, got = fields[1], int(fields[2]), int(fields[3]), int(fields[4]), float(fields[5])
+            seen.add(name)
+            expected = bonus(rolls[name], value, job, x) if name in rolls else None
+        else:
+            value, got = int(fields[1]), float(fields[2])
+            name, job, x = 'bust rate', 0, 0
+            expected = bust_rate(value)
+        if expected is None or abs(float(expected) - got) > 1e-9:
+            problems.append(f"{name} {value} (job {job}, +{x}): Lua {got:g}, tables {expected}")
+    if seen != set(rolls):
+        problems.append(f"rolls differ: {sorted(seen ^ set(rolls))}")
+    return problems
+
+
+def tables_are_fresh(base_dir, tables_path, tables):
+    if not tables_path.exists():
+        return False
+    return tables_path.read_text(encoding='utf-8') == render(base_dir, tables)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def show(rolls, name):
+    if name not in rolls:
+        print(f"[ERROR] Unknown roll '{name}'")
+        return 1
+    flags = {flag: int(f'--{flag}' in sys.argv) for flag in ('crooked', 'job', 'snake', 'fold')}
+    x = int(arg_value('--bonus', '0'))
+    plan = solve(rolls[name], flags['crooked'], flags['job'], x, flags['snake'], flags['fold'])
+    print(f"{name}  crooked={flags['crooked']} job={flags['job']} +{x} "
+          f"snake={flags['snake']} fold={flags['fold']}  (bust effect {rolls[name]['bust_effect']})")
+    print(f"   {'value':>5}  {'stop':>9}  {'action':<10} {'plan EV':>14}  {'plan bust':>9}  {'next DU bust':>12}")
+    for value in range(1, 12):
+        action, ev, chance, stop = plan[value]
+        print(f"   {value:>5}  {float(stop):>9.2f}  {ACTIONS[action]:<10} {float(ev):>14.4f}  "
+              f"{float(chance) * 100:>8.1f}%  {float(bust_rate(value)):>11.1f}%")
+    return 0
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS, integers=('--bonus',))
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    tables_path = base_dir / TABLES_PATH
+
+    started = time.perf_counter()
+    rolls = load_rolls(base_dir)
+
+    if '--show' in sys.argv:
+        return show(rolls, arg_value('--show', ''))
+
+    tables = build(rolls)
+
+    if '--check' in sys.argv:
+        fresh = tables_are_fresh(base_dir, tables_path, tables)
+        print(f"[{'OK' if fresh else 'STALE'}] {TABLES_PATH.as_posix()}")
+        lua = find_lua(arg_value('--lua'))
+        if not lua:
+            print(f"[FAIL] Formula check: no Lua 5.1 interpreter found ({', '.join(LUA_CANDIDATES)}) "
+                  "- pass --lua PATH")
+            return 1
+        problems = check_formulas(base_dir, rolls, lua)
+        for problem in problems[:20]:
+            print(f"   {problem}")
+        print(f"[{'FAIL' if problems else 'OK'}] {ROLL_DATA.as_posix()} formulas vs tables "
+              f"({len(rolls)} rolls, {len(problems)} mismatches)")
+        return 0 if fresh and not problems else 1
+
+    text = render(base_dir, tables)
+    tables_path.parent.mkdir(parents=True, exist_ok=True)
+    tables_path.write_text(text, encoding='utf-8')
+    states = len(next(iter(tables.values()))[0])
+    print(f"[OK] Solved {len(tables)} rolls x {states} states into {TABLES_PATH.as_posix()} "
+          f"({tables_path.stat().st_size // 1024} KB) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
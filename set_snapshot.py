@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Set Snapshot Builder - Tetsouo GearSwap System
+==============================================
+Evaluates <Char>/sets/<job>_sets.lua offline (gear_sets.py) and writes a
+flattened snapshot to <Char>/snapshots/<job>_sets.lua: every set path holds
+its fully resolved table, so set_combine chains are not re-run on each
+`gs load` / job change.
+
+The entry file's init_gear_sets() asks shared/utils/set_building/set_snapshot.lua
+for the snapshot; it is used only when the source file still has the recorded
+size and Adler-32 checksum, otherwise the entry falls back to
+include('sets/<job>_sets.lua') as before. Editing a set file therefore never
+needs a rebuild to take effect - only to get the fast path back.
+
+A set file is snapshotted only when it is pure data: plain assignments,
+set_combine(), S{...} and `or` defaults. Files with functions, include() or runtime
+values (state, player, Mote `gear` tables...) are reported and skipped.
+
+Usage:
+    python set_snapshot.py                      (every <Char>/sets/ folder)
+    python set_snapshot.py --char Tetsouo [--job rdm]
+    python set_snapshot.py --check              (exit 1 if any snapshot is stale)
+    python set_snapshot.py --clean              (delete snapshots)
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+import gear_sets
+import lua_table
+from clone_character import CharacterDB
+from gear_sets import UNKNOWN, SetLiteral, lua_string
+from lua_table import Assignment
+from tool_args import arg_value, check_args
+
+SNAPSHOT_DIR = 'snapshots'
+SNAPSHOT_VERSION = 1
+
+# Mirrors Mote-Include init_include(): sub-tables that exist before the job's
+# set file runs. Files that don't start with `sets = {}` build on top of them.
+MOTE_SETS_SKELETON = {
+    'precast': ('FC', 'JA', 'WS', 'RangedAttack'),
+    'midcast': ('RA', 'Pet'),
+    'idle': (),
+    'resting': (),
+    'engaged': (),
+    'defense': (),
+    'buff': (),
+}
+
+_IDENT = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class NotSnapshottable(Exception):
+    """The set file depends on something only known at runtime."""
+
+
+# ============================================================================
+# EVALUATION
+# ============================================================================
+
+def _mote_sets():
+    return {key: {sub: {} for sub in subs} for key, subs in MOTE_SETS_SKELETON.items()}
+
+
+def evaluate(path):
+    """
+    Evaluate one set file with the Mote skeleton pre-loaded.
+
+    Returns (globals, reset): globals maps every global the file assigns
+    (always including 'sets') to its final value; reset is True when the
+    file replaces `sets` wholesale (`sets = {}`) before touching it.
+    Raises NotSnapshottable.
+    """
+    try:
+        statements = lua_table.read_chunk(path.read_text(encoding='utf-8', errors='replace'))
+    except lua_table.LuaParseError as e:
+        raise NotSnapshottable(f"parse error line {e.line}: {e}")
+
+    reset = None
+    assigned = ['sets']
+    for stmt in statements:
+        if isinstance(stmt, lua_table.Skipped):
+            raise NotSnapshottable(f"'{stmt.keyword}' block at line {stmt.line}")
+        if not isinstance(stmt, Assignment):
+            raise NotSnapshottable("top-level call or return statement")
+        if not isinstance(stmt.target, tuple):
+            raise NotSnapshottable(f"computed assignment target (line {stmt.line})")
+        if stmt.local:
+            continue
+        if stmt.target[0] == 'sets' and reset is None:
+            reset = len(stmt.target) == 1
+        if len(stmt.target) == 1 and stmt.target[0] not in assigned:
+            assigned.append(stmt.target[0])
+
+    evaluator = gear_sets.SetEvaluator()
+    evaluator.globals['sets'] = _mote_sets()
+    evaluator.load_file(path)
+    if evaluator.unresolved:
+        names = sorted(set(evaluator.unresolved))
+        raise NotSnapshottable("runtime references: " + ', '.join(names[:5])
+                               + (' ...' if len(names) > 5 else ''))
+
+    globals_ = {name: evaluator.globals.get(name) for name in assigned
+                if name not in evaluator.locals}
+    seen = set()
+    for name, value in globals_.items():
+        _check_data(value, name, seen)
+    return globals_, bool(reset)
+
+
+def _check_data(value, where, seen):
+    """Reject values the snapshot cannot reproduce (functions, calls...)."""
+    if value is UNKNOWN:
+        raise NotSnapshottable(f"runtime value at {where}")
+    if isinstance(value, (dict, list, SetLiteral)) and id(value) not in seen:
+        seen.add(id(value))
+        items = value.items() if isinstance(value, dict) else enumerate(value, 1)
+        for key, child in items:
+            _check_data(child, f"{where}.{key}", seen)
+
+
+# ============================================================================
+# EMISSION
+# ============================================================================
+
+class _Emitter:
+    """Writes Lua constructors for the evaluated globals.
+
+    Tables reached more than once are hoisted into T[n] so aliases
+    (sets.a = sets.b, shared ring tables) stay shared like in the live build;
+    self-references (sets.precast.FC['Enhancing Magic'] = sets.precast.FC)
+    are left out of the constructor and patched in afterwards.
+    """
+
+    def __init__(self, roots):
+        self.refs = {}
+        self.back_edges = set()   # (id(parent), key) closing a cycle
+        self.fixups = []          # (id(parent), key, id(child))
+        for root in roots:
+            self._count(root, set())
+        self.hoisted = {}
+        self.lines = []
+        self.uses_set_literal = False
+
+    def _count(self, value, stack):
+        if not isinstance(value, (dict, list)):
+            return
+        self.refs[id(value)] = self.refs.get(id(value), 0) + 1
+        if self.refs[id(value)] > 1:
+            return
+        stack.add(id(value))
+        items = value.items() if isinstance(value, dict) else enumerate(value, 1)
+        for key, child in items:
+            if isinstance(child, (dict, list)) and id(child) in stack:
+                if not isinstance(value, dict):
+                    raise NotSnapshottable("self-referencing array")
+                self.back_edges.add((id(value), key))
+                self.fixups.append((id(value), key, id(child)))
+                self.refs[id(value)] += 1   # both ends must be addressable
+                self.refs[id(child)] += 1
+            else:
+                self._count(child, stack)
+        stack.discard(id(value))
+
+    def value(self, value, indent):
+        if isinstance(value, (dict, list)) and self.refs.get(id(value), 0) > 1:
+            if id(value) not in self.hoisted:
+                body = self._table(value, 2)
+                self.hoisted[id(value)] = len(self.hoisted) + 1
+                self.lines.append(f"        T[{self.hoisted[id(value)]}] = {body}")
+            return f"T[{self.hoisted[id(value)]}]"
+        if isinstance(value, SetLiteral):
+            self.uses_set_literal = True
+            return 'S' + self._table(list(value), indent)
+        if isinstance(value, (dict, list)):
+            return self._table(value, indent)
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, str):
+            return lua_string(value)
+        if isinstance(value, (int, float)):
+            return repr(value)
+        raise NotSnapshottable(f"unsupported value {value!r}")
+
+    def _table(self, value, indent):
+        if isinstance(value, list):
+            items = [self.value(v, indent + 1) for v in value]
+        else:
+            items = []
+            for key, child in value.items():
+                if child is None or (id(value), key) in self.back_edges:
+                    continue  # nil removes the key; cycles are patched later
+                items.append(f"{self._key(key)} = {self.value(child, indent + 1)}")
+        if not items:
+            return '{}'
+        flat = '{' + ', '.join(items) + '}'
+        if len(flat) <= 100 and '\n' not in flat:
+            return flat
+        pad = '    ' * (indent + 1)
+        return '{\n' + ''.join(f"{pad}{item},\n" for item in items) + '    ' * indent + '}'
+
+    def fixup_lines(self):
+        """Assignments restoring the self-references left out of constructors."""
+        lines = []
+        for parent, key, child in self.fixups:
+            index = lua_string(key) if isinstance(key, str) else repr(key)
+            lines.append(f"        T[{self.hoisted[parent]}][{index}] = T[{self.hoisted[child]}]")
+        return lines
+
+    @staticmethod
+    def _key(key):
+        if isinstance(key, str) and _IDENT.match(key) and key not in lua_table.KEYWORDS:
+            return key
+        if isinstance(key, str):
+            return '[' + lua_string(key) + ']'
+        return f'[{key!r}]'
+
+
+def render_snapshot(job, rel, stamp, globals_, reset):
+    """Lua source of a snapshot file (stamp: gear_sets.file_stamp of the set file)."""
+    emitter = _Emitter(globals_.values())
+    fields = [f"            {name} = {emitter.value(value, 3)}," for name, value in globals_.items()
+              if value is not None]
+    lines = [
+        '---============================================================================',
+        f'--- Set Snapshot - {job.upper()} (flattened {rel})',
+        '---============================================================================',
+        '--- GENERATED by set_snapshot.py - do not edit, re-run the script instead.',
+        '--- Loaded by shared/utils/set_building/set_snapshot.lua; ignored as soon as',
+        '--- the source no longer matches `source` (live include() is used instead).',
+        '---============================================================================',
+        '',
+        'return {',
+        f'    version = {SNAPSHOT_VERSION},',
+        f"    generated = '{time.strftime('%Y-%m-%d %H:%M')}',",
+        f'    source = {{ path = {lua_string(rel)}, size = {stamp[0]}, adler32 = {stamp[1]} }},',
+        f'    reset = {"true" if reset else "false"},',
+        f'    uses_set_literal = {"true" if emitter.uses_set_literal else "false"},',
+        '    build = function(S)',
+        '        local T = {}',
+    ]
+    lines.extend(emitter.lines)
+    lines.extend(emitter.fixup_lines())
+    lines.append('        return {')
+    lines.extend(fields)
+    lines.append('        }')
+    lines.append('    end,')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+# ============================================================================
+# BUILD / CHECK
+# ============================================================================
+
+def reload_snapshot(text):
+    """Evaluate the build() body of a rendered snapshot back into Python."""
+    body = text[text.index('build = function(S)') + len('build = function(S)'):text.rindex('    end,')]
+    evaluator = gear_sets.SetEvaluator()
+    for stmt in lua_table.read_chunk(body):
+        if isinstance(stmt, Assignment):
+            evaluator._assign(stmt)
+        elif isinstance(stmt, tuple) and stmt[0] == 'return':
+            return evaluator.eval(stmt[1])
+    return None
+
+
+def same_tree(a, b, pairs=None):
+    """Deep equality that also requires the same aliasing (a shared table in
+    `a` must map to one shared table in `b`)."""
+    pairs = {} if pairs is None else pairs
+    if isinstance(a, dict) and isinstance(b, dict):
+        if id(a) in pairs:
+            return pairs[id(a)] is b
+        pairs[id(a)] = b
+        a_keys = {k for k, v in a.items() if v is not None}
+        b_keys = {k for k, v in b.items() if v is not None}
+        return a_keys == b_keys and all(same_tree(a[k], b[k], pairs) for k in a_keys)
+    if isinstance(a, list) and isinstance(b, list):
+        if id(a) in pairs:
+            return pairs[id(a)] is b
+        pairs[id(a)] = b
+        return len(a) == len(b) and all(same_tree(x, y, pairs) for x, y in zip(a, b))
+    if isinstance(a, SetLiteral) or isinstance(b, SetLiteral):
+        return isinstance(a, SetLiteral) and isinstance(b, SetLiteral) and tuple(a) == tuple(b)
+    return type(a) is type(b) and a == b
+
+def snapshot_path(char_dir, job):
+    return Path(char_dir) / SNAPSHOT_DIR / f"{job}_sets.lua"
+
+
+def job_files(char_dir, only_job=None):
+    """{job_lower: Path} for the flat <job>_sets.lua files the entries include."""
+    out = {}
+    for path in sorted((Path(char_dir) / 'sets').glob('*_sets.lua')):
+        job = path.name[:-len('_sets.lua')].lower()
+        if job in gear_sets.VALID_JOBS and (only_job is None or job == only_job):
+            out[job] = path
+    return out
+
+
+def build_job(char_dir, job, src):
+    """Write one snapshot. Returns (status, detail) with status OK/SKIP."""
+    out = snapshot_path(char_dir, job)
+    try:
+        globals_, reset = evaluate(src)
+        stamp = gear_sets.file_stamp(src)
+        text = render_snapshot(job, src.relative_to(char_dir).as_posix(), stamp, globals_, reset)
+        reloaded = reload_snapshot(text)
+        expected = {k: v for k, v in globals_.items() if v is not None}
+        if not same_tree(expected, reloaded):
+            raise NotSnapshottable("round-trip mismatch (snapshot would differ from the live build)")
+    except NotSnapshottable as e:
+        if out.exists():
+            out.unlink()
+        return 'SKIP', str(e)
+    out.parent.mkdir(exist_ok=True)
+    tmp = out.with_suffix('.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    tmp.replace(out)
+    paths = sum(1 for _ in gear_sets.iter_sets(globals_['sets']))
+    return 'OK', f"{paths} set paths, {len(text) // 1024} KB"
+
+
+def is_fresh(char_dir, job, src):
+    """True when the snapshot records the current size/checksum of src."""
+    out = snapshot_path(char_dir, job)
+    if not out.exists():
+        return False
+    try:
+        info = lua_table.parse_value(_source_field(out.read_text(encoding='utf-8')))
+    except (lua_table.LuaParseError, ValueError):
+        return False
+    return (info.get('size'), info.get('adler32')) == gear_sets.file_stamp(src)
+
+
+def _source_field(text):
+    match = re.search(r'^\s*source = (\{.*\}),$', text, re.M)
+    if not match:
+        raise ValueError('no source field')
+    return match.group(1)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def _character_dirs(base_dir, char):
+    names = [char] if char else []
+    if not char and (base_dir / 'character_db.lua').exists():
+        names = CharacterDB.load(base_dir / 'character_db.lua').get_character_names()
+    dirs = []
+    for name in names:
+        match = [d for d in base_dir.iterdir() if d.is_dir() and d.name.lower() == name.lower()]
+        if match and (match[0] / 'sets').is_dir():
+            dirs.append(match[0])
+        elif char:
+            print(f"[SKIP] {name}: no {name}/sets/ folder")
+    return dirs
+
+
+# Command line: flags, and options that take a value
+FLAGS = ('--check', '--clean')
+OPTIONS = ('--char', '--job')
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    only_job = arg_value('--job')
+    only_job = only_job.lower() if only_job else None
+    char_dirs = _character_dirs(base_dir, arg_value('--char'))
+    if not char_dirs:
+        print("ERROR: no character with a sets/ folder (use --char <Name>)")
+        return 1
+
+    stale = 0
+    for char_dir in char_dirs:
+        print(f"== {char_dir.name}")
+        for job, src in job_files(char_dir, only_job).items():
+            out = snapshot_path(char_dir, job)
+            if '--clean' in sys.argv:
+                if out.exists():
+                    out.unlink()
+                    print(f"   [DEL]  {job.upper()}")
+            elif '--check' in sys.argv:
+                if out.exists() and not is_fresh(char_dir, job, src):
+                    stale += 1
+                    print(f"   [STALE] {job.upper()}: {src.name} changed since the snapshot")
+                elif out.exists():
+                    print(f"   [OK]   {job.upper()}")
+            else:
+                started = time.perf_counter()
+                status, detail = build_job(char_dir, job, src)
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"   [{status}]{' ' * (5 - len(status))}{job.upper()}: {detail} ({elapsed:.0f} ms)")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
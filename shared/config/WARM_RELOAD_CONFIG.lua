@@ -0,0 +1,45 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Warm Reload Configuration - Modules kept loaded across job changes
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Allowlist of the job-agnostic modules that warm job changes keep in
+---   memory instead of reloading (//gs c warmreload on). Everything else -
+---   job entry, sets, job functions/, UI, managers with state - reloads as
+---   usual.
+---
+---   Entries:
+---     • 'shared/x/module'  - one module (require name, without .lua)
+---     • 'shared/x/'        - every module under the folder
+---
+---   A listed module is only kept when it passes the self-check
+---   (//gs c warmreload check): it writes no globals, reads only the
+---   Lua/Windower globals that survive a reload (player, windower,
+---   add_to_chat...), requires no character file and only modules that pass
+---   the same check or are listed in load_time.
+---
+---   @file    shared/config/WARM_RELOAD_CONFIG.lua
+---   @author  Tetsouo
+---   @version 1.0
+---   @date    Created: 2026-10-18
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local WarmReloadConfig = {}
+
+WarmReloadConfig.modules = {
+    -- Spell / job ability / weaponskill / warp data (leaf modules, packs)
+    'shared/data/',
+
+    -- Message templates (the renderer holds the per-load chat queue)
+    'shared/utils/messages/data/',
+
+    -- Static lookups
+    'shared/utils/warp/warp_command_registry',
+    'shared/utils/inventory/refill/bag_scanner',
+}
+
+-- Modules the kept ones call while they load only (never kept themselves):
+-- the spell/JA databases build their tables through DataPack.require()
+WarmReloadConfig.load_time = {
+    'shared/utils/data/data_pack',
+}
+
+return WarmReloadConfig
@@ -176,6 +176,29 @@ function MessageSettings.set_enfeebling_mode(mode)
     MessageSettings.set_spell_mode(mode)
 end
 
+---  ═══════════════════════════════════════════════════════════════════════════
+---   CHAT OUTPUT BUDGET (shared/utils/messages/core/chat_queue.lua)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+-- Lines a category sends straight to chat per tick. Past its budget a line
+-- waits for the next tick (identical lines merged as "(xN)"); debug lines
+-- are dropped instead. Categories not listed use 'default'.
+MessageSettings.CHAT_QUEUE = {
+    enabled   = true,
+    interval  = 0.1,       -- seconds between flush ticks
+    max_queue = 400,       -- waiting lines (all categories), newer ones dropped
+    budgets = {
+        default  = 12,     -- MessageCore info/success/warning, system messages
+        error    = 30,
+        debug    = 4,      -- DebugLogger / show_debug traces
+        commands = 24,     -- //gs c help listings
+        wardrobe = 16,     -- wardrobe organizer phases
+        refill   = 16,     -- refill panels
+        audit    = 16,     -- wardrobe auditor report
+        roll     = 8,      -- COR roll tracker
+    },
+}
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   EXPORT
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -16,6 +16,9 @@
 ---     - shared/utils/messages/handlers/ability_message_handler.lua (per-job)
 ---     - shared/data/job_abilities/UNIVERSAL_JA_DATABASE.lua (main+sub)
 ---
+---   Modules load through DataPack (packed copy from pack_databases.py when
+---   fresh, source module otherwise).
+---
 ---   @file    shared/data/job_abilities/JA_DATABASE_FACTORY.lua
 ---   @author  Tetsouo
 ---   @version 1.0
@@ -24,6 +27,8 @@
 
 local Factory = {}
 
+local DataPack = require('shared/utils/data/data_pack')
+
 ---   Build a JA database table by loading and merging job-specific modules.
 ---   @param job_code string Uppercase 3-letter job code (e.g. "WAR", "COR")
 ---   @param opts table|nil Optional overrides:
@@ -42,7 +47,7 @@ function Factory.create(job_code, opts)
     local function load_modules(mod_list, field)
         for _, suffix in ipairs(mod_list) do
             local path = 'shared/data/job_abilities/' .. job .. '/' .. job .. '_' .. suffix
-            local ok, mod = pcall(require, path)
+            local ok, mod = pcall(DataPack.require, path)
             if ok and mod and mod[field] then
                 for name, data in pairs(mod[field]) do
                     DB[name] = data
@@ -33,36 +33,38 @@ local BLUSpells = {}
 --- LOAD MODULAR FILES (NEW ARCHITECTURE - 19 files organized by category)
 ---============================================================================
 
+local DataPack = require('shared/utils/data/data_pack')
+
 -- Physical spells (5 files - 59 spells)
-local physical_slashing = require('shared/data/magic/blu/physical/blu_physical_slashing')
-local physical_blunt = require('shared/data/magic/blu/physical/blu_physical_blunt')
-local physical_piercing = require('shared/data/magic/blu/physical/blu_physical_piercing')
-local physical_h2h = require('shared/data/magic/blu/physical/blu_physical_h2h')
-local physical_ranged = require('shared/data/magic/blu/physical/blu_physical_ranged')
+local physical_slashing = DataPack.require('shared/data/magic/blu/physical/blu_physical_slashing')
+local physical_blunt = DataPack.require('shared/data/magic/blu/physical/blu_physical_blunt')
+local physical_piercing = DataPack.require('shared/data/magic/blu/physical/blu_physical_piercing')
+local physical_h2h = DataPack.require('shared/data/magic/blu/physical/blu_physical_h2h')
+local physical_ranged = DataPack.require('shared/data/magic/blu/physical/blu_physical_ranged')
 
 -- Magical spells (8 files - 60 spells)
-local magical_dark = require('shared/data/magic/blu/magical/blu_magical_dark')
-local magical_water = require('shared/data/magic/blu/magical/blu_magical_water')
-local magical_wind = require('shared/data/magic/blu/magical/blu_magical_wind')
-local magical_fire = require('shared/data/magic/blu/magical/blu_magical_fire')
-local magical_light = require('shared/data/magic/blu/magical/blu_magical_light')
-local magical_thunder = require('shared/data/magic/blu/magical/blu_magical_thunder')
-local magical_earth = require('shared/data/magic/blu/magical/blu_magical_earth')
-local magical_ice = require('shared/data/magic/blu/magical/blu_magical_ice')
+local magical_dark = DataPack.require('shared/data/magic/blu/magical/blu_magical_dark')
+local magical_water = DataPack.require('shared/data/magic/blu/magical/blu_magical_water')
+local magical_wind = DataPack.require('shared/data/magic/blu/magical/blu_magical_wind')
+local magical_fire = DataPack.require('shared/data/magic/blu/magical/blu_magical_fire')
+local magical_light = DataPack.require('shared/data/magic/blu/magical/blu_magical_light')
+local magical_thunder = DataPack.require('shared/data/magic/blu/magical/blu_magical_thunder')
+local magical_earth = DataPack.require('shared/data/magic/blu/magical/blu_magical_earth')
+local magical_ice = DataPack.require('shared/data/magic/blu/magical/blu_magical_ice')
 
 -- Breath spells (1 file - 11 spells)
-local breath_spells = require('shared/data/magic/blu/breath/blu_breath')
+local breath_spells = DataPack.require('shared/data/magic/blu/breath/blu_breath')
 
 -- Healing spells (1 file - 9 spells)
-local healing_spells = require('shared/data/magic/blu/healing/blu_healing')
+local healing_spells = DataPack.require('shared/data/magic/blu/healing/blu_healing')
 
 -- Buff spells (2 files - 28 spells)
-local buffs_offensive = require('shared/data/magic/blu/buffs/blu_buffs_offensive')
-local buffs_defensive = require('shared/data/magic/blu/buffs/blu_buffs_defensive')
+local buffs_offensive = DataPack.require('shared/data/magic/blu/buffs/blu_buffs_offensive')
+local buffs_defensive = DataPack.require('shared/data/magic/blu/buffs/blu_buffs_defensive')
 
 -- Debuff spells (2 files - 29 spells)
-local debuffs_control = require('shared/data/magic/blu/debuffs/blu_debuffs_control')
-local debuffs_stats = require('shared/data/magic/blu/debuffs/blu_debuffs_stats')
+local debuffs_control = DataPack.require('shared/data/magic/blu/debuffs/blu_debuffs_control')
+local debuffs_stats = DataPack.require('shared/data/magic/blu/debuffs/blu_debuffs_stats')
 
 ---============================================================================
 --- MERGE SPELL DATA (196 total BLU spells)
@@ -35,9 +35,11 @@ local BRDSpells = {}
 --- LOAD MODULES
 ---============================================================================
 
-local buff_songs = require('shared/data/magic/song/song_buffs')
-local debuff_songs = require('shared/data/magic/song/song_debuffs')
-local special_songs = require('shared/data/magic/song/song_special')
+local DataPack = require('shared/utils/data/data_pack')
+
+local buff_songs = DataPack.require('shared/data/magic/song/song_buffs')
+local debuff_songs = DataPack.require('shared/data/magic/song/song_debuffs')
+local special_songs = DataPack.require('shared/data/magic/song/song_special')
 
 ---============================================================================
 --- MERGE SPELL DATA
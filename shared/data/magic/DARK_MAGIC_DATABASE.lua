@@ -41,10 +41,12 @@ local DARK_MAGIC_DATABASE = {}
 --- LOAD SUB-MODULES
 ---============================================================================
 
-local ABSORB = require('shared/data/magic/dark/dark_absorb')
-local DRAIN = require('shared/data/magic/dark/dark_drain')
-local BIO = require('shared/data/magic/dark/dark_bio')
-local UTILITY = require('shared/data/magic/dark/dark_utility')
+local DataPack = require('shared/utils/data/data_pack')
+
+local ABSORB = DataPack.require('shared/data/magic/dark/dark_absorb')
+local DRAIN = DataPack.require('shared/data/magic/dark/dark_drain')
+local BIO = DataPack.require('shared/data/magic/dark/dark_bio')
+local UTILITY = DataPack.require('shared/data/magic/dark/dark_utility')
 
 ---============================================================================
 --- MERGE ALL SPELL DATABASES
@@ -35,9 +35,11 @@ local DivineSpells = {}
 --- LOAD MODULES
 ---============================================================================
 
-local banish = require('shared/data/magic/divine/divine_banish')
-local enlight = require('shared/data/magic/divine/divine_enlight')
-local utility = require('shared/data/magic/divine/divine_utility')
+local DataPack = require('shared/utils/data/data_pack')
+
+local banish = DataPack.require('shared/data/magic/divine/divine_banish')
+local enlight = DataPack.require('shared/data/magic/divine/divine_enlight')
+local utility = DataPack.require('shared/data/magic/divine/divine_utility')
 
 ---============================================================================
 --- MERGE SPELL TABLES
@@ -45,13 +45,15 @@ local ElementalSpells = {}
 --- LOAD MODULES
 ---============================================================================
 
-local single = require('shared/data/magic/elemental/elemental_single')
-local aoe_ga = require('shared/data/magic/elemental/elemental_aoe_ga')
-local aoe_ja = require('shared/data/magic/elemental/elemental_aoe_ja')
-local aoe_ra = require('shared/data/magic/elemental/elemental_aoe_ra')
-local ancient = require('shared/data/magic/elemental/elemental_ancient')
-local dot = require('shared/data/magic/elemental/elemental_dot')
-local special = require('shared/data/magic/elemental/elemental_special')
+local DataPack = require('shared/utils/data/data_pack')
+
+local single = DataPack.require('shared/data/magic/elemental/elemental_single')
+local aoe_ga = DataPack.require('shared/data/magic/elemental/elemental_aoe_ga')
+local aoe_ja = DataPack.require('shared/data/magic/elemental/elemental_aoe_ja')
+local aoe_ra = DataPack.require('shared/data/magic/elemental/elemental_aoe_ra')
+local ancient = DataPack.require('shared/data/magic/elemental/elemental_ancient')
+local dot = DataPack.require('shared/data/magic/elemental/elemental_dot')
+local special = DataPack.require('shared/data/magic/elemental/elemental_special')
 
 ---============================================================================
 --- MERGE SPELL TABLES
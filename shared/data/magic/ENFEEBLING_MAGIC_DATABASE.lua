@@ -39,9 +39,11 @@ local ENFEEBLING_MAGIC_DATABASE = {}
 --- LOAD SUB-MODULES
 ---============================================================================
 
-local DOTS = require('shared/data/magic/enfeebling/enfeebling_dots')
-local DEBUFFS = require('shared/data/magic/enfeebling/enfeebling_debuffs')
-local CONTROL = require('shared/data/magic/enfeebling/enfeebling_control')
+local DataPack = require('shared/utils/data/data_pack')
+
+local DOTS = DataPack.require('shared/data/magic/enfeebling/enfeebling_dots')
+local DEBUFFS = DataPack.require('shared/data/magic/enfeebling/enfeebling_debuffs')
+local CONTROL = DataPack.require('shared/data/magic/enfeebling/enfeebling_control')
 
 ---============================================================================
 --- MERGE ALL SPELL DATABASES
@@ -29,11 +29,13 @@
 --- MODULE DEPENDENCIES
 ---============================================================================
 
-local ENHANCING_BARS = require('shared/data/magic/enhancing/enhancing_bars')
-local ENHANCING_BUFFS = require('shared/data/magic/enhancing/enhancing_buffs')
-local ENHANCING_COMBAT = require('shared/data/magic/enhancing/enhancing_combat')
-local ENHANCING_UTILITY = require('shared/data/magic/enhancing/enhancing_utility')
-local STORM = require('shared/data/magic/enhancing/storm')
+local DataPack = require('shared/utils/data/data_pack')
+
+local ENHANCING_BARS = DataPack.require('shared/data/magic/enhancing/enhancing_bars')
+local ENHANCING_BUFFS = DataPack.require('shared/data/magic/enhancing/enhancing_buffs')
+local ENHANCING_COMBAT = DataPack.require('shared/data/magic/enhancing/enhancing_combat')
+local ENHANCING_UTILITY = DataPack.require('shared/data/magic/enhancing/enhancing_utility')
+local STORM = DataPack.require('shared/data/magic/enhancing/storm')
 
 ---============================================================================
 --- UNIFIED SPELL DATABASE
@@ -38,9 +38,11 @@ local GEOSpells = {}
 --- LOAD MODULES
 ---============================================================================
 
+local DataPack = require('shared/utils/data/data_pack')
+
 -- Geomancy-specific modules
-local indi = require('shared/data/magic/geomancy/geomancy_indi')
-local geo = require('shared/data/magic/geomancy/geomancy_geo')
+local indi = DataPack.require('shared/data/magic/geomancy/geomancy_indi')
+local geo = DataPack.require('shared/data/magic/geomancy/geomancy_geo')
 
 -- Universal skill databases
 local ElementalDB = require('shared/data/magic/ELEMENTAL_MAGIC_DATABASE')
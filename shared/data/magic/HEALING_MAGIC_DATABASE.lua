@@ -42,10 +42,12 @@ local HEALING_MAGIC_DATABASE = {}
 --- LOAD SUB-MODULES
 ---============================================================================
 
-local CURE = require('shared/data/magic/healing/healing_cure')
-local CURAGA = require('shared/data/magic/healing/healing_curaga')
-local RAISE = require('shared/data/magic/healing/healing_raise')
-local STATUS = require('shared/data/magic/healing/healing_status')
+local DataPack = require('shared/utils/data/data_pack')
+
+local CURE = DataPack.require('shared/data/magic/healing/healing_cure')
+local CURAGA = DataPack.require('shared/data/magic/healing/healing_curaga')
+local RAISE = DataPack.require('shared/data/magic/healing/healing_raise')
+local STATUS = DataPack.require('shared/data/magic/healing/healing_status')
 
 ---============================================================================
 --- MERGE ALL SPELL DATABASES
@@ -41,9 +41,11 @@ local NINJUTSU_DATABASE = {}
 --- LOAD SUB-MODULES
 ---============================================================================
 
-local BUFFS = require('shared/data/magic/ninjutsu/ninjutsu_buffs')
-local DEBUFFS = require('shared/data/magic/ninjutsu/ninjutsu_debuffs')
-local NUKES = require('shared/data/magic/ninjutsu/ninjutsu_nukes')
+local DataPack = require('shared/utils/data/data_pack')
+
+local BUFFS = DataPack.require('shared/data/magic/ninjutsu/ninjutsu_buffs')
+local DEBUFFS = DataPack.require('shared/data/magic/ninjutsu/ninjutsu_debuffs')
+local NUKES = DataPack.require('shared/data/magic/ninjutsu/ninjutsu_nukes')
 
 ---============================================================================
 --- MERGE ALL SPELL MODULES
@@ -50,9 +50,11 @@ local EnfeeblngDB = require('shared/data/magic/ENFEEBLING_MAGIC_DATABASE')
 local ElementalDB = require('shared/data/magic/ELEMENTAL_MAGIC_DATABASE')
 local DarkDB = require('shared/data/magic/DARK_MAGIC_DATABASE')
 
+local DataPack = require('shared/utils/data/data_pack')
+
 -- Job-specific modules (SCH-unique spells)
-local helix = require('shared/data/magic/elemental/helix')
-local storm = require('shared/data/magic/enhancing/storm')
+local helix = DataPack.require('shared/data/magic/elemental/helix')
+local storm = DataPack.require('shared/data/magic/enhancing/storm')
 
 ---============================================================================
 --- MERGE SPELL TABLES
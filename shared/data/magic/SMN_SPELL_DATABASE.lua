@@ -33,22 +33,24 @@ local SMNSpells = {}
 --- LOAD MODULAR FILES (NEW ARCHITECTURE - 12 files organized by avatar)
 ---============================================================================
 
+local DataPack = require('shared/utils/data/data_pack')
+
 -- Load all avatar files from summoning/ directory
-local carbuncle = require('shared/data/magic/summoning/carbuncle')
-local cait_sith = require('shared/data/magic/summoning/cait_sith')
-local diabolos = require('shared/data/magic/summoning/diabolos')
-local fenrir = require('shared/data/magic/summoning/fenrir')
-local garuda = require('shared/data/magic/summoning/garuda')
-local ifrit = require('shared/data/magic/summoning/ifrit')
-local leviathan = require('shared/data/magic/summoning/leviathan')
-local ramuh = require('shared/data/magic/summoning/ramuh')
-local shiva = require('shared/data/magic/summoning/shiva')
-local siren = require('shared/data/magic/summoning/siren')
-local spirits = require('shared/data/magic/summoning/spirits')
-local titan = require('shared/data/magic/summoning/titan')
-local odin = require('shared/data/magic/summoning/odin')
-local alexander = require('shared/data/magic/summoning/alexander')
-local atomos = require('shared/data/magic/summoning/atomos')
+local carbuncle = DataPack.require('shared/data/magic/summoning/carbuncle')
+local cait_sith = DataPack.require('shared/data/magic/summoning/cait_sith')
+local diabolos = DataPack.require('shared/data/magic/summoning/diabolos')
+local fenrir = DataPack.require('shared/data/magic/summoning/fenrir')
+local garuda = DataPack.require('shared/data/magic/summoning/garuda')
+local ifrit = DataPack.require('shared/data/magic/summoning/ifrit')
+local leviathan = DataPack.require('shared/data/magic/summoning/leviathan')
+local ramuh = DataPack.require('shared/data/magic/summoning/ramuh')
+local shiva = DataPack.require('shared/data/magic/summoning/shiva')
+local siren = DataPack.require('shared/data/magic/summoning/siren')
+local spirits = DataPack.require('shared/data/magic/summoning/spirits')
+local titan = DataPack.require('shared/data/magic/summoning/titan')
+local odin = DataPack.require('shared/data/magic/summoning/odin')
+local alexander = DataPack.require('shared/data/magic/summoning/alexander')
+local atomos = DataPack.require('shared/data/magic/summoning/atomos')
 
 ---============================================================================
 --- MERGE SPELL DATA (143 total SMN spells from 15 files)
@@ -57,6 +57,12 @@ end
 
 local UniversalWS = {}
 
+-- Packed weapon skill data (pack_databases.py), source module fallback
+local DataPack = require('shared/utils/data/data_pack')
+
+-- Name -> weapon type (action_index.py), full scan fallback
+local ActionIndex = require('shared/utils/data/action_index')
+
 ---============================================================================
 --- WEAPON TYPE CONFIGURATION
 ---============================================================================
@@ -95,7 +101,7 @@ local function merge_weapon_db(config)
         return  -- Already merged
     end
 
-    local success, weapon_db = pcall(require, 'shared/data/weaponskills/' .. config.file)
+    local success, weapon_db = pcall(DataPack.require, 'shared/data/weaponskills/' .. config.file)
     if not (success and weapon_db and weapon_db.weaponskills) then
         return
     end
@@ -127,8 +133,9 @@ function UniversalWS.ensure_weapon_type(weapon_type)
 end
 
 --- Resolve a weapon skill by name, loading only the database(s) actually needed.
---- Fast path: try the equipped weapon's type first (1 file). Fallback: scan the
---- remaining weapon types until found. Avoids merging all 13 databases at once.
+--- Fast path: try the equipped weapon's type first (1 file). Fallback: the weapon
+--- type(s) named by the action index, else scan the remaining weapon types until
+--- found. Avoids merging all 13 databases at once.
 --- @param ws_name string Weapon skill name
 --- @param weapon_type_hint string|nil Preferred weapon type to try first
 --- @return table|nil Weapon skill data, or nil if not found in any database
@@ -144,11 +151,21 @@ function UniversalWS.resolve(ws_name, weapon_type_hint)
         end
     end
 
-    for _, config in ipairs(weapon_type_configs) do
-        merge_weapon_db(config)
-        if _G.WS_DATABASE.weaponskills[ws_name] then
-            return _G.WS_DATABASE.weaponskills[ws_name]
+    -- Action index: the weapon type(s) holding the WS; a stale entry falls
+    -- through to the full scan.
+    local entry = ActionIndex.get('ws', ws_name)
+    local owners = entry and entry.owners
+
+    for pass = 1, owners and 2 or 1 do
+        for _, config in ipairs(weapon_type_configs) do
+            if not owners or owners[config.type] then
+                merge_weapon_db(config)
+                if _G.WS_DATABASE.weaponskills[ws_name] then
+                    return _G.WS_DATABASE.weaponskills[ws_name]
+                end
+            end
         end
+        owners = nil
     end
 
     return nil
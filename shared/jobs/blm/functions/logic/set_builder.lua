@@ -24,6 +24,9 @@ local BaseSetBuilder = require('shared/utils/set_building/base_set_builder')
 -- Load message formatter for error reporting
 local MessageFormatter = require('shared/utils/messages/message_formatter')
 
+-- Midcast lookup index must be dropped when the dynamic nuke set is swapped
+local MidcastManager = require('shared/utils/midcast/midcast_manager')
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   CONSTANTS AND CONFIGURATION
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -90,12 +93,18 @@ function SetBuilder.SaveMP()
 
     -- Apply the set based on casting mode
     if state.CastingMode.value == 'Normal' then
-        sets.midcast['Elemental Magic'] = dynamicSet
+        if sets.midcast['Elemental Magic'] ~= dynamicSet then
+            sets.midcast['Elemental Magic'] = dynamicSet
+            MidcastManager.invalidate_index()
+        end
     else
         if not sets.midcast['Elemental Magic'] then
             sets.midcast['Elemental Magic'] = {}
         end
-        sets.midcast['Elemental Magic'].MagicBurst = dynamicSet
+        if sets.midcast['Elemental Magic'].MagicBurst ~= dynamicSet then
+            sets.midcast['Elemental Magic'].MagicBurst = dynamicSet
+            MidcastManager.invalidate_index()
+        end
     end
 end
 
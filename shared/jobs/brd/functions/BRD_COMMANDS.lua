@@ -320,11 +320,8 @@ function job_self_command(cmdParams, eventArgs)
 
     -- Common commands (reload, checksets, warp)
     if CommonCommands.is_common_command(command) then
-        local args = {}
-        for i = 2, #cmdParams do
-            table.insert(args, cmdParams[i])
-        end
-        if CommonCommands.handle_command(command, 'BRD', table.unpack(args)) then
+        -- cmdParams goes to the command table as is (no argument copy)
+        if CommonCommands.handle_command(cmdParams, 'BRD') then
             eventArgs.handled = true
         end
         return
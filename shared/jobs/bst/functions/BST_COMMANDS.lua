@@ -236,11 +236,8 @@ function job_self_command(cmdParams, eventArgs)
     ---══════════════════════════════════════════════════════════════════════════
 
     if CommonCommands and CommonCommands.is_common_command(command) then
-        local args = {}
-        for i = 2, #cmdParams do
-            table.insert(args, cmdParams[i])
-        end
-        if CommonCommands.handle_command(command, 'BST', table.unpack(args)) then
+        -- cmdParams goes to the command table as is (no argument copy)
+        if CommonCommands.handle_command(cmdParams, 'BST') then
             eventArgs.handled = true
         end
         return
@@ -126,12 +126,8 @@ function job_self_command(cmdParams, eventArgs)
 
     -- Common commands (reload, checksets, lockstyle, etc.)
     if CommonCommands.is_common_command(command) then
-        -- Pass all arguments after command (cmdParams[2], cmdParams[3], etc.)
-        local args = {}
-        for i = 2, #cmdParams do
-            table.insert(args, cmdParams[i])
-        end
-        if CommonCommands.handle_command(command, 'COR', table.unpack(args)) then
+        -- cmdParams goes to the command table as is (no argument copy)
+        if CommonCommands.handle_command(cmdParams, 'COR') then
             eventArgs.handled = true
         end
         return
@@ -17,14 +17,14 @@
 ---            removed earlier in the same update.
 ---
 ---   Features:
----   • Phantom Roll detection via raw_register_event('action')
+---   • Phantom Roll detection via the shared action listener (PacketDispatcher)
 ---   • Auto-detection of party member jobs for accurate roll bonuses
----     (incoming chunk 0xDD/0xDF parsed via the packets library)
+---     (0xDD/0xDF fields read lazily through PacketDispatcher)
 ---   • Event handler lifecycle management (init/cleanup, idempotent)
 ---
 ---   Dependencies:
 ---   • RollTracker module (shared/jobs/cor/functions/logic/roll_tracker.lua)
----   • Windower packets library (for party member detection)
+---   • PacketDispatcher (shared/utils/core/packet_dispatcher.lua)
 ---   • Windower resources library (job ID >> job code conversion)
 ---
 ---   Usage:
@@ -35,6 +35,8 @@
 
 local PartyTracker = {}
 
+local PacketDispatcher = require('shared/utils/core/packet_dispatcher')
+
 -- Message formatter (lazy-loaded to prevent module-level require failures)
 local MessageCOR = nil
 local function get_MessageCOR()
@@ -55,17 +57,13 @@ end
 ---   centralized here so there is one canonical roll-detection path.
 ---   Idempotent: unregisters any previous handler before registering a new
 ---   one, so calling init() repeatedly is safe.
+---   Goes through PacketDispatcher (category 6 only): the same key again
+---   replaces the handler.
 function PartyTracker.init_roll_listener()
-    if _G.cor_action_event_id then
-        windower.unregister_event(_G.cor_action_event_id)
-        _G.cor_action_event_id = nil
-    end
-
-    _G.cor_action_event_id = windower.raw_register_event('action', function(act)
+    PacketDispatcher.on_action('cor_roll', function(act)
         if not act or type(act) ~= 'table' then return end
         if not player or not player.id then return end
         if player.main_job ~= 'COR' then return end
-        if act.category ~= 6 then return end
         if act.actor_id ~= player.id then return end
         if act.param == 195 then return end  -- Exclude Fold
 
@@ -106,7 +104,7 @@ function PartyTracker.init_roll_listener()
                 end
             end
         end
-    end)
+    end, 6)
 end
 
 ---   Initialize party tracking event handlers
@@ -139,14 +137,6 @@ function PartyTracker.init()
         }
     end
 
-    -- Load packets library for party member parsing (0xDD/0xDF)
-    local packets_loaded, packets = pcall(require, 'packets')
-    if not packets_loaded or not packets then
-        local mc = get_MessageCOR()
-        if mc then mc.show_packets_load_failed() end
-        return  -- Exit early if packets library not available
-    end
-
     -- Load resources library for job/ability conversion
     local res_loaded, res = pcall(require, 'resources')
     if not res_loaded or not res then
@@ -162,22 +152,11 @@ function PartyTracker.init()
     --- above). Splitting the two avoids the historical double-fire of
     --- RollTracker.on_roll_cast we used to get when both paths processed the
     --- same Phantom Roll packet.
-    _G.cor_party_event_id = windower.raw_register_event('incoming chunk', function(id, original, modified, injected, blocked)
-        if id ~= 0xDD and id ~= 0xDF then
-            return
-        end
-
-        -- Parse the packet
-        local success, packet = pcall(packets.parse, 'incoming', original)
-        if not success or not packet then
-            return
-        end
-
-        -- Extract party member info
-        local name = packet['Name']
+    --- Both ids go through PacketDispatcher: fields are read from the raw
+    --- packet on access (Name only for members missing from the party list).
+    local function on_party_update(packet)
         local player_id = packet['ID']
         local main_job_id = packet['Main job']
-        local sub_job_id = packet['Sub job']
         local main_job_level = packet['Main job level']
 
         -- Validate data (main job level > 0 means valid data)
@@ -188,6 +167,7 @@ function PartyTracker.init()
             end
 
             -- Convert job IDs to job codes using res.jobs
+            local sub_job_id = packet['Sub job']
             local main_job = nil
             local sub_job = nil
 
@@ -202,18 +182,19 @@ function PartyTracker.init()
 
             if main_job then
                 -- Try to get name from windower party list
-                local player_name = name or "Unknown"
+                local player_name = nil
 
                 local party = windower.ffxi.get_party()
                 if party then
                     for i = 0, 5 do
                         local member = party['p' .. i]
                         if member and member.mob and member.mob.id == player_id then
-                            player_name = member.name or player_name
+                            player_name = member.name
                             break
                         end
                     end
                 end
+                player_name = player_name or packet['Name'] or "Unknown"
 
                 -- Re-initialize if needed (safety check)
                 if not _G.cor_party_jobs then
@@ -231,7 +212,10 @@ function PartyTracker.init()
                 }
             end
         end
-    end)
+    end
+
+    PacketDispatcher.subscribe(0xDD, 'cor_party', on_party_update)
+    PacketDispatcher.subscribe(0xDF, 'cor_party', on_party_update)
 end
 
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -242,7 +226,7 @@ end
 ---   Must be called in file_unload()
 function PartyTracker.cleanup()
     -- Unregister event handlers (CRITICAL for preventing duplicate handlers)
-    -- Legacy: cor_action_event_id was used for register_event('action') in v1.x
+    -- Legacy: event ids registered directly by older versions of this module
     if _G.cor_action_event_id then
         windower.unregister_event(_G.cor_action_event_id)
         _G.cor_action_event_id = nil
@@ -253,6 +237,10 @@ function PartyTracker.cleanup()
         _G.cor_party_event_id = nil
     end
 
+    PacketDispatcher.off_action('cor_roll')
+    PacketDispatcher.unsubscribe(0xDD, 'cor_party')
+    PacketDispatcher.unsubscribe(0xDF, 'cor_party')
+
     -- Clear pending roll detection state (prevents stale data after reload)
     _G.cor_pending_roll_value = nil
     _G.cor_pending_roll_timestamp = nil
@@ -0,0 +1,161 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   COR Roll Advice - Precomputed Double-Up decisions
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Reads shared/data/packed/roll_tables.lua, written by roll_tables.py from
+---   roll_data.lua. For every roll and state (value, Crooked Cards, job bonus,
+---   Phantom Roll +X, Snake Eye ready, bust covered by Fold or an active
+---   Natural 11) the tables hold the action with the best exact expected
+---   bonus and the chance that this plan ends in a bust. A lookup is one
+---   string index: nothing is simulated in game.
+---
+---   Load order (first hit wins):
+---     1. windower._roll_tables - loaded earlier in this Windower session
+---     2. shared/data/packed/roll_tables.lua - used only while roll_data.lua
+---        still has the recorded content stamp (size + Adler-32, FileStamp;
+---        same rule as ActionIndex)
+---     3. None - get() returns nil and the roll message shows no advice
+---
+---   Public API:
+---     • RollAdvice.get(roll_name, value, crooked, job_bonus, phantom_bonus, snake, covered)
+---           -> action ('S' stop | 'D' Double-Up | 'E' Snake Eye), bust_percent | nil
+---     • RollAdvice.abilities_ready() -> snake_eye_ready, fold_ready
+---     • RollAdvice.available()       -> boolean (loads the tables)
+---     • RollAdvice.stats             -> {source, rolls, ms}
+---
+---   @file    shared/jobs/cor/functions/logic/roll_advice.lua
+---   @author  Tetsouo
+---   @version 1.0
+---   @date    Created: 2026-10-18
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local RollAdvice = {}
+
+local DebugLogger = require('shared/utils/debug/debug_logger')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local TABLES_VERSION = 2
+local TABLES_PATH = 'shared/data/packed/roll_tables.lua'
+
+-- Ability recast ids
+local SNAKE_EYE_RECAST = 197
+local FOLD_RECAST = 198
+
+-- {source = 'session'|'prebuilt'|'none', rolls, ms}
+RollAdvice.stats = {source = nil, rolls = 0, ms = 0}
+
+-- Active tables: {rolls = {[name] = {advice, risk}}, x_index = {[bonus] = i}, risk_base} or false
+local tables = nil
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   LOAD
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Load the prebuilt tables if roll_data.lua still has its recorded stamp
+--- @return table|nil pack
+local function load_prebuilt()
+    local root = windower.addon_path .. 'data/'
+    local ok, pack = pcall(dofile, root .. TABLES_PATH)
+    if not ok or type(pack) ~= 'table' or pack.version ~= TABLES_VERSION
+        or type(pack.sources) ~= 'table' or type(pack.rolls) ~= 'table' or type(pack.bonus_values) ~= 'table' then
+        return nil
+    end
+    for _, source in ipairs(pack.sources) do
+        if not FileStamp.matches(root .. source[1], {source[2], source[3]}) then
+            DebugLogger.logf_if('DATA_DEBUG', 'RollAdvice', 'Stale tables: %s changed', source[1])
+            return nil
+        end
+    end
+    return pack
+end
+
+--- Resolve the active tables (session -> prebuilt -> none)
+--- @return table|false tables
+local function ensure()
+    if tables ~= nil then
+        return tables
+    end
+
+    local persisted = windower._roll_tables
+    if type(persisted) == 'table' and persisted.version == TABLES_VERSION then
+        tables = persisted
+        RollAdvice.stats.source, RollAdvice.stats.rolls, RollAdvice.stats.ms = 'session', persisted.count, 0
+        return tables
+    end
+
+    local started = os.clock()
+    local pack = load_prebuilt()
+    if pack then
+        local x_index = {}
+        for i, bonus in ipairs(pack.bonus_values) do
+            x_index[bonus] = i - 1
+        end
+        local count = 0
+        for _ in pairs(pack.rolls) do
+            count = count + 1
+        end
+        tables = {
+            version = TABLES_VERSION,
+            count = count,
+            rolls = pack.rolls,
+            x_index = x_index,
+            x_count = #pack.bonus_values,
+            risk_base = pack.risk_base or 32,
+        }
+        windower._roll_tables = tables
+    else
+        tables = false
+    end
+
+    local ms = (os.clock() - started) * 1000
+    RollAdvice.stats.source = pack and 'prebuilt' or 'none'
+    RollAdvice.stats.rolls = tables and tables.count or 0
+    RollAdvice.stats.ms = ms
+    DebugLogger.logf_if('DATA_DEBUG', 'RollAdvice', 'Loaded from %s: %d rolls in %.0f ms',
+        RollAdvice.stats.source, RollAdvice.stats.rolls, ms)
+    return tables
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PUBLIC API
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Best action for the current roll state
+--- @param roll_name string Roll name (as in roll_data.lua)
+--- @param value number Current roll value (1-11)
+--- @param crooked boolean Crooked Cards on this roll
+--- @param job_bonus boolean Job bonus applies
+--- @param phantom_bonus number Phantom Roll +X (RollTracker.get_phantom_roll_bonus)
+--- @param snake boolean Snake Eye ready
+--- @param covered boolean A bust applies no bust effect (Fold ready or Natural 11 active)
+--- @return string|nil action 'S', 'D' or 'E'; nil without tables or for an unknown state
+--- @return number|nil bust_percent Chance (%) that the advised plan ends in a bust
+function RollAdvice.get(roll_name, value, crooked, job_bonus, phantom_bonus, snake, covered)
+    local t = ensure()
+    local roll = t and t.rolls[roll_name]
+    local x = t and t.x_index[phantom_bonus or 0]
+    if not roll or not x or type(value) ~= 'number' or value < 1 or value > 11 then
+        return nil
+    end
+    local i = ((((value - 1) * 2 + (crooked and 1 or 0)) * 2 + (job_bonus and 1 or 0)) * t.x_count + x) * 4
+        + (snake and 2 or 0) + (covered and 1 or 0) + 1
+    return roll.advice:sub(i, i), roll.risk:byte(i) - t.risk_base
+end
+
+--- Snake Eye / Fold readiness (main job COR only)
+--- @return boolean snake_eye_ready
+--- @return boolean fold_ready
+function RollAdvice.abilities_ready()
+    if not player or player.main_job ~= 'COR' then
+        return false, false
+    end
+    local recasts = windower.ffxi.get_ability_recasts() or {}
+    return recasts[SNAKE_EYE_RECAST] == 0, recasts[FOLD_RECAST] == 0
+end
+
+--- Load the tables if needed
+--- @return boolean True when tables are in use
+function RollAdvice.available()
+    return ensure() ~= false
+end
+
+return RollAdvice
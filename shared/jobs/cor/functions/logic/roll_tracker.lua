@@ -9,14 +9,16 @@
 ---   - Tracks Natural 11 benefits (instant recast + 30s recast + bust immunity)
 ---   - Monitors Double-Up windows (45 seconds)
 ---   - Calculates bust rates with color-coded warnings
+---   - Double-Up advice from precomputed tables (roll_advice.lua, roll_tables.py)
 ---   - Non-cumulative Phantom Roll +X gear (only highest bonus applies)
 ---   - Job bonus detection: COR main/sub OR any party member OR Tricorne proc
 ---
 ---   @file    jobs/cor/functions/logic/roll_tracker.lua
 ---   @author  Tetsouo
----   @version 1.2
+---   @version 1.3
 ---   @date    Created: 2025-10-08
 ---   @date    Updated: 2025-10-09 - Added automatic party job detection
+---   @date    Updated: 2026-10-18 - Double-Up advice line (RollAdvice)
 ---   @requires roll_data, MessageFormatter
 ---  ═══════════════════════════════════════════════════════════════════════════
 
@@ -25,6 +27,7 @@ local RollTracker = {}
 -- Load dependencies
 local RollData = require('shared/jobs/cor/functions/logic/roll_data')
 local MessageFormatter = require('shared/utils/messages/message_formatter')
+local RollAdvice = require('shared/jobs/cor/functions/logic/roll_advice')
 
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   STATE TRACKING
@@ -240,6 +243,7 @@ function RollTracker.on_roll_cast(roll_name, roll_value)
     -- - Benefits persist as long as ANY 11 roll remains active on the Corsair
     -- - Multiple 11s can be active simultaneously (2 max, or 3 with Crooked Cards)
     local is_natural_eleven = (roll_value == 11)
+    local natural_eleven_before = _G.cor_natural_eleven_active
     if is_natural_eleven then
         _G.cor_natural_eleven_active = true
     end
@@ -260,11 +264,23 @@ function RollTracker.on_roll_cast(roll_name, roll_value)
     -- Display shows risk for the NEXT Double-Up, not current roll
     local bust_rate = RollData.calculate_bust_rate(roll_value)
 
+    -- Double-Up advice (nil without roll tables). Bust is covered by Fold or
+    -- an 11 already active on another roll (checked before this one is set)
+    local advice = nil
+    if not is_natural_eleven then
+        local snake_ready, fold_ready = RollAdvice.abilities_ready()
+        local action, plan_bust = RollAdvice.get(roll_name, roll_value, is_crooked, has_job_bonus,
+            phantom_roll_bonus, snake_ready, fold_ready or natural_eleven_before)
+        if action then
+            advice = {action = action, bust = plan_bust}
+        end
+    end
+
     -- Track this roll as active (with Crooked flag if applicable)
     RollTracker.track_active_roll(roll_name, roll_value, is_crooked)
 
     -- Display formatted message
-    RollTracker.display_roll_result(roll_name, roll_value, final_bonus, effect_type, is_lucky, is_unlucky, is_natural_eleven, bust_rate, job_bonus_info, is_crooked, missed_names)
+    RollTracker.display_roll_result(roll_name, roll_value, final_bonus, effect_type, is_lucky, is_unlucky, is_natural_eleven, bust_rate, job_bonus_info, is_crooked, missed_names, advice)
 end
 
 ---   Track active roll in state
@@ -620,7 +636,8 @@ end
 ---   @param job_bonus_info string|nil Job code if job bonus active (e.g., "RNG")
 ---   @param is_crooked boolean If Crooked Cards buff active
 ---   @param missed_names table Array of player names who missed the roll
-function RollTracker.display_roll_result(roll_name, roll_value, final_bonus, effect_type, is_lucky, is_unlucky, is_natural_eleven, bust_rate, job_bonus_info, is_crooked, missed_names)
+---   @param advice table|nil {action = 'S'|'D'|'E', bust = plan bust %} from RollAdvice
+function RollTracker.display_roll_result(roll_name, roll_value, final_bonus, effect_type, is_lucky, is_unlucky, is_natural_eleven, bust_rate, job_bonus_info, is_crooked, missed_names, advice)
     -- Format roll value with Lucky/Unlucky status (ASCII only)
     local value_display = tostring(roll_value)
     if is_lucky then
@@ -650,7 +667,7 @@ function RollTracker.display_roll_result(roll_name, roll_value, final_bonus, eff
     end
 
     -- Main roll message with bust rate integrated (Natural 11 message now integrated inside)
-    MessageFormatter.show_roll_result(roll_name, value_display, bonus_display, is_crooked, affected_count, total_count, lucky_num, unlucky_num, missed_names, bust_rate, job_bonus_info, roll_range)
+    MessageFormatter.show_roll_result(roll_name, value_display, bonus_display, is_crooked, affected_count, total_count, lucky_num, unlucky_num, missed_names, bust_rate, job_bonus_info, roll_range, advice)
 end
 
 ---   Display Double-Up window status
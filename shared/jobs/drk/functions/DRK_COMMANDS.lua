@@ -104,13 +104,8 @@ function job_self_command(cmdParams, eventArgs)
     -- COMMON COMMANDS (reload, checksets, waltz, etc.)
     -- ══════════════════════════════════════════════════════════════════════════
     if CommonCommands.is_common_command(command) then
-        -- Extract arguments after command
-        local args = {}
-        for i = 2, #cmdParams do
-            table.insert(args, cmdParams[i])
-        end
-
-        if CommonCommands.handle_command(command, 'DRK', table.unpack(args)) then
+        -- cmdParams goes to the command table as is (no argument copy)
+        if CommonCommands.handle_command(cmdParams, 'DRK') then
             eventArgs.handled = true
         end
         return
@@ -150,12 +150,8 @@ function job_self_command(cmdParams, eventArgs)
 
     -- Common commands (reload, checksets, waltz, aoewaltz, jump, etc.)
     if CommonCommands.is_common_command(command) then
-        -- Pass all arguments after command
-        local args = {}
-        for i = 2, #cmdParams do
-            table.insert(args, cmdParams[i])
-        end
-        if CommonCommands.handle_command(command, 'GEO', table.unpack(args)) then
+        -- cmdParams goes to the command table as is (no argument copy)
+        if CommonCommands.handle_command(cmdParams, 'GEO') then
             eventArgs.handled = true
         end
         return
@@ -19,6 +19,8 @@
 ---  ═══════════════════════════════════════════════════════════════════════════
 local CureSetBuilder = {}
 
+local MidcastManager = require('shared/utils/midcast/midcast_manager')
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   CURE SET SELECTION
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -41,7 +43,10 @@ function CureSetBuilder.generate(spell, target_type)
     end
 
     -- Update global midcast cure set (used by GearSwap)
-    sets.midcast.Cure = selected_set
+    if sets.midcast.Cure ~= selected_set then
+        sets.midcast.Cure = selected_set
+        MidcastManager.invalidate_index()
+    end
 
     return sets.midcast.Cure
 end
@@ -119,6 +119,9 @@ end
 ---   `//gs c wo global`           - cross-job freq-based static layout
 ---   `//gs c wo global preview`   - dry-run of global mode
 ---   `//gs c wo verify`           - check current layout matches the plan
+---   `//gs c wo plan [alt]`       - precomputed move plan, replayed without re-discovery
+---   `//gs c wo bench [alt|saved|cases]` - planner vs current algorithm (simulated, no moves)
+---   `//gs c wo snapshot [alt]`   - save bags to data/<char>/wardrobe_snapshot.lua
 --- W7 (craft) and W8 (reserve) are always protected.
 function CommonCommands.handle_wardrobeorganize(arg, arg2)
     local ok, WardrobeOrganizer = pcall(require, 'shared/utils/wardrobe/wardrobe_organizer')
@@ -141,6 +144,12 @@ function CommonCommands.handle_wardrobeorganize(arg, arg2)
             local MessageFormatter = require('shared/utils/messages/message_formatter')
             MessageFormatter.show_error("organize_alt not available in this version.")
         end
+    elseif arg == 'plan' then
+        WardrobeOrganizer.organize_plan(arg2)
+    elseif arg == 'bench' then
+        WardrobeOrganizer.bench(arg2)
+    elseif arg == 'snapshot' then
+        WardrobeOrganizer.save_snapshot(arg2)
     elseif arg == 'global' then
         if arg2 == 'preview' or arg2 == 'dry' then
             WardrobeOrganizer.preview_global()
@@ -302,6 +311,17 @@ CommonCommands.handle_perf        = DebugCommands.handle_perf
 CommonCommands.handle_fulltest    = DebugCommands.handle_fulltest
 CommonCommands.handle_syscheck    = DebugCommands.handle_syscheck
 CommonCommands.handle_lagdebug    = DebugCommands.handle_lagdebug
+CommonCommands.handle_midcastbench = DebugCommands.handle_midcastbench
+CommonCommands.handle_equipdiff   = DebugCommands.handle_equipdiff
+CommonCommands.handle_actionindex = DebugCommands.handle_actionindex
+CommonCommands.handle_bytecode    = DebugCommands.handle_bytecode
+CommonCommands.handle_warmreload  = DebugCommands.handle_warmreload
+CommonCommands.handle_chatqueue   = DebugCommands.handle_chatqueue
+CommonCommands.handle_tpbench     = DebugCommands.handle_tpbench
+CommonCommands.handle_cmdbench    = DebugCommands.handle_cmdbench
+CommonCommands.handle_debuffbench = DebugCommands.handle_debuffbench
+CommonCommands.handle_packets     = DebugCommands.handle_packets
+CommonCommands.handle_automove    = DebugCommands.handle_automove
 CommonCommands.handle_debugsubjob = DebugCommands.handle_debugsubjob
 CommonCommands.handle_jamsg       = DebugCommands.handle_jamsg
 CommonCommands.handle_spellmsg    = DebugCommands.handle_spellmsg
@@ -491,106 +511,43 @@ end
 
 -- MAIN COMMAND ROUTER
 
---- Handle common commands (centralized for all jobs)
-function CommonCommands.handle_command(command, job_name, ...)
-    if not command then
-        return false
-    end
-
-    -- Support both string command and table cmdParams (for warp system)
-    local cmd
-    local cmdParams
-    local varargs = {...} -- Capture varargs first (after job_name)
-
-    if type(command) == "table" then
-        -- Table format (used by warp system via job_self_command)
-        cmdParams = command
-        cmd = cmdParams[1] and cmdParams[1]:lower() or ""
-    else
-        -- String format (legacy)
-        cmd = command:lower()
-        -- Build cmdParams including command + all varargs
-        cmdParams = {command}
-        for i = 1, #varargs do
-            table.insert(cmdParams, varargs[i])
-        end
-    end
-
-    -- Extract arguments (everything after command, which is cmdParams[1])
-    local args = {}
-    for i = 2, #cmdParams do
-        table.insert(args, cmdParams[i])
-    end
-
-    -- ==========================================================================
-    -- WARP COMMANDS (50+ commands: spells + 40+ destinations)
-    -- ==========================================================================
-    -- Check warp commands first (includes: w, w2, ret, esc, tph, tpd, tpm, tpa,
-    -- tpy, tpv, rj, rp, rm, warp [status|unlock|lock|test|help])
-
-    -- Check exact matches first
-    for _, warp_cmd in ipairs(WARP_COMMANDS) do
-        if cmd == warp_cmd then
-            return CommonCommands.handle_warp_commands(cmdParams)
-        end
-    end
-
-    -- Check for "all" suffix (multi-boxing commands like warpall, tphall, sdall)
-    if cmd:find('all$') then
-        local base_cmd = cmd:gsub('all$', '')
-        -- Verify base command is a valid warp command
-        for _, warp_cmd in ipairs(WARP_COMMANDS) do
-            if base_cmd == warp_cmd then
-                return CommonCommands.handle_warp_commands(cmdParams)
-            end
-        end
-    end
+--- Toggle a _G debug flag and report it with MessageFormatter.show_debug
+local function toggle_debug_flag(flag, tag)
+    _G[flag] = not _G[flag]
+    MessageFormatter.show_debug(tag, 'Debug mode: ' .. (_G[flag] and 'ON' or 'OFF'))
+end
 
-    -- ==========================================================================
-    -- OTHER COMMON COMMANDS
-    -- ==========================================================================
-    if cmd == 'naked' then
-        return CommonCommands.handle_naked()
-    elseif cmd == 'equip' and args[1] and args[1]:lower() == 'naked' then
-        return CommonCommands.handle_naked()
-    elseif cmd == 'reload' then
-        return CommonCommands.handle_reload(job_name)
-    elseif cmd == 'checksets' then
-        return CommonCommands.handle_checksets(job_name)
-    elseif cmd == 'wardrobeaudit' or cmd == 'wa' then
-        return CommonCommands.handle_wardrobeaudit()
-    elseif cmd == 'worganize' or cmd == 'wo' then
-        return CommonCommands.handle_wardrobeorganize(args[1], args[2])
-    elseif cmd == 'refill' or cmd == 'rf' then
-        return CommonCommands.handle_refill()
-    elseif cmd == 'craft' then
-        return CommonCommands.handle_craft(args[1])
-    elseif cmd == 'fish' or cmd == 'fishing' then
-        return CommonCommands.handle_fish(args[1])
-    elseif cmd == 'uncraft' then
-        return CommonCommands.handle_uncraft()
-    elseif cmd == 'lockstyle' or cmd == 'ls' then
-        return CommonCommands.handle_lockstyle()
-    elseif cmd == 'dressup' then
-        return CommonCommands.handle_dressup()
-    elseif cmd == 'perf' then
-        return CommonCommands.handle_perf(args[1])
-    elseif cmd == 'testcolors' or cmd == 'colors' then
-        return CommonCommands.handle_testcolors()
-    elseif cmd == 'jump' then
-        return CommonCommands.handle_jump()
-    elseif cmd == 'waltz' then
-        return CommonCommands.handle_waltz()
-    elseif cmd == 'aoewaltz' then
-        return CommonCommands.handle_aoewaltz()
-    elseif cmd == 'debugsubjob' or cmd == 'dsj' then
-        return CommonCommands.handle_debugsubjob()
-    elseif cmd == 'debugwarp' then
+-- Common commands in their historical dispatch order. A handler receives
+-- (job_name, params, ...): params is the cmdParams table of a table call or
+-- the command string of a string call, ... the arguments after the command.
+local COMMON = {
+    {{'naked'}, function() return CommonCommands.handle_naked() end},
+    {{'equip'}, function(_, _, arg)
+        return arg ~= nil and arg:lower() == 'naked' and CommonCommands.handle_naked()
+    end},
+    {{'reload'}, function(job_name) return CommonCommands.handle_reload(job_name) end},
+    {{'checksets'}, function(job_name) return CommonCommands.handle_checksets(job_name) end},
+    {{'wardrobeaudit', 'wa'}, function() return CommonCommands.handle_wardrobeaudit() end},
+    {{'worganize', 'wo'}, function(_, _, arg, arg2) return CommonCommands.handle_wardrobeorganize(arg, arg2) end},
+    {{'refill', 'rf'}, function() return CommonCommands.handle_refill() end},
+    {{'craft'}, function(_, _, arg) return CommonCommands.handle_craft(arg) end},
+    {{'fish', 'fishing'}, function(_, _, arg) return CommonCommands.handle_fish(arg) end},
+    {{'uncraft'}, function() return CommonCommands.handle_uncraft() end},
+    {{'lockstyle', 'ls'}, function() return CommonCommands.handle_lockstyle() end},
+    {{'dressup'}, function() return CommonCommands.handle_dressup() end},
+    {{'perf'}, function(_, _, arg) return CommonCommands.handle_perf(arg) end},
+    {{'testcolors', 'colors'}, function() return CommonCommands.handle_testcolors() end},
+    {{'jump'}, function() return CommonCommands.handle_jump() end},
+    {{'waltz'}, function() return CommonCommands.handle_waltz() end},
+    {{'aoewaltz'}, function() return CommonCommands.handle_aoewaltz() end},
+    {{'debugsubjob', 'dsj'}, function() return CommonCommands.handle_debugsubjob() end},
+    {{'debugwarp'}, function()
         -- Toggle warp debug mode
         _G.WARP_DEBUG = not _G.WARP_DEBUG
         MessageCommands.show_warp_debug_toggled(_G.WARP_DEBUG)
         return true
-    elseif cmd == 'debugprecast' then
+    end},
+    {{'debugprecast'}, function()
         -- Toggle precast debug mode
         _G.PrecastDebugState = not _G.PrecastDebugState
         local MessagePrecast = require('shared/utils/messages/formatters/magic/message_precast')
@@ -600,15 +557,15 @@ function CommonCommands.handle_command(command, job_name, ...)
             MessagePrecast.show_debug_disabled()
         end
         return true
-    elseif cmd == 'automovedebug' or cmd == 'amd' then
+    end},
+    {{'automovedebug', 'amd'}, function()
         -- Toggle AutoMove timing debug mode
-        _G.AUTOMOVE_DEBUG = not _G.AUTOMOVE_DEBUG
-        MessageFormatter.show_debug('AutoMove', 'Debug mode: ' .. (_G.AUTOMOVE_DEBUG and 'ON' or 'OFF'))
+        toggle_debug_flag('AUTOMOVE_DEBUG', 'AutoMove')
         return true
-    elseif cmd == 'debugjobchange' or cmd == 'djc' then
+    end},
+    {{'debugjobchange', 'djc'}, function()
         -- Toggle job change debug mode
-        _G.JOBCHANGE_DEBUG = not _G.JOBCHANGE_DEBUG
-        MessageFormatter.show_debug('JobChange', 'Debug mode: ' .. (_G.JOBCHANGE_DEBUG and 'ON' or 'OFF'))
+        toggle_debug_flag('JOBCHANGE_DEBUG', 'JobChange')
         -- Show current state
         if _G.JOBCHANGE_DEBUG and _G.JobChangeManagerSTATE then
             local S = _G.JobChangeManagerSTATE
@@ -618,9 +575,9 @@ function CommonCommands.handle_command(command, job_name, ...)
                 tostring(S.target_main_job), tostring(S.target_sub_job)))
         end
         return true
-    elseif cmd == 'debugstate' or cmd == 'ds' then
-        return CommonCommands.handle_debugstate()
-    elseif cmd == 'debugupdate' or cmd == 'du' then
+    end},
+    {{'debugstate', 'ds'}, function() return CommonCommands.handle_debugstate() end},
+    {{'debugupdate', 'du'}, function()
         -- Toggle UPDATE debug mode (traces full gs c update flow)
         -- Use windower table for persistence across job changes
         windower._gs_debug = windower._gs_debug or {}
@@ -630,21 +587,26 @@ function CommonCommands.handle_command(command, job_name, ...)
         MessageFormatter.show_debug('UPDATE', string.format('%s (traces: AutoMove > job_update > UI.update > customize_set)',
             _G.UPDATE_DEBUG and 'ON' or 'OFF'))
         return true
-    elseif cmd == 'fulltest' or cmd == 'ft' then
-        return CommonCommands.handle_fulltest(args[1])
-    elseif cmd == 'syscheck' or cmd == 'sc' then
-        return CommonCommands.handle_syscheck(args[1])
-    elseif cmd == 'lagdebug' or cmd == 'ldb' then
-        return CommonCommands.handle_lagdebug(args[1])
-    elseif cmd == 'jamsg' then
-        return CommonCommands.handle_jamsg(args[1])
-    elseif cmd == 'spellmsg' then
-        return CommonCommands.handle_spellmsg(args[1])
-    elseif cmd == 'wsmsg' then
-        return CommonCommands.handle_wsmsg(args[1])
-    elseif cmd == 'info' then
-        return CommonCommands.handle_info(args)
-    elseif cmd == 'debugmsg' then
+    end},
+    {{'fulltest', 'ft'}, function(_, _, arg) return CommonCommands.handle_fulltest(arg) end},
+    {{'syscheck', 'sc'}, function(_, _, arg) return CommonCommands.handle_syscheck(arg) end},
+    {{'lagdebug', 'ldb'}, function(_, _, arg) return CommonCommands.handle_lagdebug(arg) end},
+    {{'midcastbench'}, function(_, _, arg) return CommonCommands.handle_midcastbench(arg) end},
+    {{'equipdiff'}, function(_, _, arg) return CommonCommands.handle_equipdiff(arg) end},
+    {{'actionindex'}, function(_, _, arg) return CommonCommands.handle_actionindex(arg) end},
+    {{'bytecode'}, function(_, _, arg) return CommonCommands.handle_bytecode(arg) end},
+    {{'warmreload'}, function(_, _, arg) return CommonCommands.handle_warmreload(arg) end},
+    {{'chatqueue'}, function(_, _, arg) return CommonCommands.handle_chatqueue(arg) end},
+    {{'cmdbench'}, function(_, _, arg) return CommonCommands.handle_cmdbench(arg) end},
+    {{'debuffbench'}, function(_, _, arg) return CommonCommands.handle_debuffbench(arg) end},
+    {{'packets'}, function(_, _, arg) return CommonCommands.handle_packets(arg) end},
+    {{'automove'}, function(_, _, arg) return CommonCommands.handle_automove(arg) end},
+    {{'tpbench'}, function(_, _, arg) return CommonCommands.handle_tpbench(arg) end},
+    {{'jamsg'}, function(_, _, arg) return CommonCommands.handle_jamsg(arg) end},
+    {{'spellmsg'}, function(_, _, arg) return CommonCommands.handle_spellmsg(arg) end},
+    {{'wsmsg'}, function(_, _, arg) return CommonCommands.handle_wsmsg(arg) end},
+    {{'info'}, function(_, _, ...) return CommonCommands.handle_info({...}) end},
+    {{'debugmsg'}, function()
         -- Debug message settings
         if _G.MESSAGE_SETTINGS then
             MessageFormatter.show_debug('MSG', 'MESSAGE_SETTINGS:')
@@ -655,79 +617,163 @@ function CommonCommands.handle_command(command, job_name, ...)
             MessageFormatter.show_error('MSG', 'MESSAGE_SETTINGS is nil!')
         end
         return true
-    elseif cmd == 'testmsg' or cmd == 'msgtest' then
+    end},
+    {{'testmsg', 'msgtest'}, function(_, _, job_filter)
         -- Test new message system
         -- Usage: //gs c testmsg [job]
         -- Examples: //gs c testmsg, //gs c testmsg brd, //gs c testmsg system
         local M = require('shared/utils/messages/api/messages')
-        local job_filter = args[1] -- Optional job filter (e.g., "brd", "geo", "system")
         M.test(job_filter)
         return true
-    elseif cmd == 'msgtests' then
+    end},
+    {{'msgtests'}, function()
         -- Validate entire message system
         local MessageValidator = require('shared/utils/messages/message_validator')
         MessageValidator.run_all_tests()
         return true
-    elseif cmd == 'memcheck' or cmd == 'mem' then
-        return CommonCommands.handle_memcheck(args[1])
-    elseif cmd == 'commands' or cmd == 'cmds' then
+    end},
+    {{'memcheck', 'mem'}, function(_, _, arg) return CommonCommands.handle_memcheck(arg) end},
+    {{'commands', 'cmds'}, function()
         -- Show list of all common commands
         MessageCommands.show_commands_list()
         return true
-    elseif cmd == 'help' or cmd == '?' then
+    end},
+    {{'help', '?'}, function()
         -- Show quick help (redirects to main commands)
         MessageCommands.show_help()
         return true
+    end},
+}
+
+--- Warp commands take the full cmdParams (built only for string calls)
+local function warp_handler(_, params, ...)
+    if type(params) ~= 'table' then
+        params = {params, ...}
     end
+    return CommonCommands.handle_warp_commands(params)
+end
 
-    return false
+-- Command table built once at load: lowercase command -> handler. Warp
+-- aliases and their multi-box "<alias>all" variants go in last, so they win
+-- a name clash the way the warp scan used to run first.
+local COMMANDS = {}
+for _, entry in ipairs(COMMON) do
+    for _, name in ipairs(entry[1]) do
+        COMMANDS[name] = entry[2]
+    end
+end
+for _, warp_cmd in ipairs(WARP_COMMANDS) do
+    COMMANDS[warp_cmd .. 'all'] = warp_handler
+end
+for _, warp_cmd in ipairs(WARP_COMMANDS) do
+    COMMANDS[warp_cmd] = warp_handler
+end
+
+--- Handle common commands (centralized for all jobs)
+--- Table call: handle_command(cmdParams, job_name) - no argument copy.
+--- String call: handle_command(command, job_name, ...) (legacy).
+--- @return boolean True if the command was handled
+function CommonCommands.handle_command(command, job_name, ...)
+    if not command then
+        return false
+    end
+
+    if type(command) == 'table' then
+        local handler = COMMANDS[command[1] and command[1]:lower() or '']
+        if not handler then
+            return false
+        end
+        return handler(job_name, command, unpack(command, 2)) or false
+    end
+
+    local handler = COMMANDS[command:lower()]
+    if not handler then
+        return false
+    end
+    return handler(job_name, command, ...) or false
 end
 
 -- HELPER FUNCTIONS
 
 --- Check if command is a common command
+--- `update` / `cycle` (AutoMove, keybinds) miss with one table lookup.
 function CommonCommands.is_common_command(command)
     if not command then
         return false
     end
+    return COMMANDS[command:lower()] ~= nil
+end
 
-    local cmd = command:lower()
-
-    -- Check existing common commands
-    if cmd == 'naked' or cmd == 'equip' or cmd == 'reload' or cmd == 'checksets' or cmd == 'wardrobeaudit' or cmd == 'wa' or cmd == 'worganize' or cmd == 'wo' or cmd == 'refill' or cmd == 'rf' or cmd == 'craft' or cmd == 'uncraft' or cmd == 'fish' or cmd == 'fishing' or
-        cmd == 'lockstyle' or cmd == 'ls' or cmd == 'dressup' or
-        cmd == 'perf' or cmd == 'testcolors' or cmd == 'colors' or cmd == 'jump' or cmd == 'waltz' or
-        cmd == 'aoewaltz' or cmd == 'debugsubjob' or cmd == 'dsj' or cmd == 'debugwarp' or cmd == 'debugprecast' or
-        cmd == 'automovedebug' or cmd == 'amd' or cmd == 'debugjobchange' or cmd == 'djc' or
-        cmd == 'debugstate' or cmd == 'ds' or cmd == 'debugupdate' or cmd == 'du' or
-        cmd == 'fulltest' or cmd == 'ft' or
-        cmd == 'syscheck' or cmd == 'sc' or
-        cmd == 'lagdebug' or cmd == 'ldb' or
-        cmd == 'jamsg' or cmd == 'spellmsg' or cmd == 'wsmsg' or cmd == 'info' or cmd == 'debugmsg' or
-        cmd == 'testmsg' or cmd == 'msgtest' or cmd == 'msgtests' or
-        cmd == 'memcheck' or cmd == 'mem' or
-        cmd == 'commands' or cmd == 'cmds' or cmd == 'help' or cmd == '?' then
-        return true
-    end
+-- DISPATCH BENCHMARK
 
-    -- Check warp commands (50+ commands total)
+--- The pre-table lookup: warp scan, "all" scan after gsub, then the
+--- common commands one by one (as the elseif chain compared them)
+local function scan_lookup(cmd)
     for _, warp_cmd in ipairs(WARP_COMMANDS) do
         if cmd == warp_cmd then
-            return true
+            return warp_handler
         end
     end
-
-    -- Check for "all" suffix (multi-boxing commands)
     if cmd:find('all$') then
         local base_cmd = cmd:gsub('all$', '')
         for _, warp_cmd in ipairs(WARP_COMMANDS) do
             if base_cmd == warp_cmd then
-                return true
+                return warp_handler
+            end
+        end
+    end
+    for _, entry in ipairs(COMMON) do
+        for _, name in ipairs(entry[1]) do
+            if cmd == name then
+                return entry[2]
             end
         end
     end
+    return nil
+end
 
-    return false
+--- Check the command table against the scan, then time both lookups
+--- (the job modules' argument copy included for the scan, as it was)
+--- @param iterations number|nil Lookups per command (default 20000)
+--- @return table {commands, mismatches, rows = {{cmd, scan_us, table_us}}}
+function CommonCommands.benchmark(iterations)
+    iterations = math.max(tonumber(iterations) or 20000, 1)
+    local result = {commands = 0, mismatches = 0, rows = {}}
+
+    -- Every known name, its "all" form and a few misses resolve the same way
+    local names = {'update', 'cycle', 'cycleback', 'toggle', 'ui', 'xyzall', ''}
+    for name in pairs(COMMANDS) do
+        names[#names + 1] = name
+        names[#names + 1] = name .. 'all'
+    end
+    for _, name in ipairs(names) do
+        result.commands = result.commands + 1
+        if scan_lookup(name) ~= COMMANDS[name] then
+            result.mismatches = result.mismatches + 1
+        end
+    end
+
+    local samples = {'update', 'cycle', 'help', WARP_COMMANDS[#WARP_COMMANDS], WARP_COMMANDS[1] .. 'all'}
+    for _, cmd in ipairs(samples) do
+        local cmdParams = {cmd, 'Offense', 'Mode'}
+        local started = os.clock()
+        for _ = 1, iterations do
+            if scan_lookup(cmdParams[1]:lower()) then
+                local args = {}
+                for i = 2, #cmdParams do
+                    table.insert(args, cmdParams[i])
+                end
+            end
+        end
+        local scan_us = (os.clock() - started) * 1e6 / iterations
+        started = os.clock()
+        for _ = 1, iterations do
+            local _ = COMMANDS[cmdParams[1]:lower()]
+        end
+        local table_us = (os.clock() - started) * 1e6 / iterations
+        result.rows[#result.rows + 1] = {cmd = cmd, scan_us = scan_us, table_us = table_us}
+    end
+    return result
 end
 
-return CommonCommands
\ No newline at end of file
+return CommonCommands
@@ -7,10 +7,21 @@
 ---   gameplay commands.
 ---
 ---   Public API (called by COMMON_COMMANDS.handle_command dispatcher):
----     DebugCommands.handle_perf(action)        - performance profiler control
+---     DebugCommands.handle_perf(action)        - performance profiler / hook histograms
 ---     DebugCommands.handle_fulltest(action)    - full system test runner
 ---     DebugCommands.handle_syscheck(action)    - system health check
 ---     DebugCommands.handle_lagdebug(action)    - lag debugger toggle
+---     DebugCommands.handle_midcastbench(n)     - midcast chain vs index benchmark
+---     DebugCommands.handle_equipdiff(action)   - slot-diff equip toggle / counters
+---     DebugCommands.handle_tpbench(n)          - TP bonus search vs lookup table benchmark
+---     DebugCommands.handle_cmdbench(n)         - command scan vs command table benchmark
+---     DebugCommands.handle_debuffbench(n)      - debuff scan vs blocker state benchmark
+---     DebugCommands.handle_actionindex(action) - spell/ability/WS index stats / check
+---     DebugCommands.handle_bytecode(action)    - bytecode cache build / bench / toggle
+---     DebugCommands.handle_warmreload(action)  - warm job change toggle / self-check
+---     DebugCommands.handle_chatqueue(action)   - chat queue counters / flush
+---     DebugCommands.handle_packets(action)     - packet dispatcher counters
+---     DebugCommands.handle_automove(action)    - AutoMove mode (poll/event) / wakeup counters
 ---     DebugCommands.handle_debugsubjob()       - dump player subjob info
 ---     DebugCommands.handle_jamsg(mode)         - JA messages display mode
 ---     DebugCommands.handle_spellmsg(mode)      - Spell messages display mode
@@ -28,7 +39,7 @@ local MessageCommands = require('shared/utils/messages/formatters/ui/message_com
 ---   PERFORMANCE PROFILER
 ---  ═══════════════════════════════════════════════════════════════════════════
 
---- Handle //gs c perf [start|stop|toggle|status]
+--- Handle //gs c perf [start|stop|toggle|status|hist|report|export|reset|record]
 function DebugCommands.handle_perf(action)
     local profiler_success, Profiler = pcall(require, 'shared/utils/debug/performance_profiler')
     if not profiler_success or not Profiler then
@@ -45,12 +56,259 @@ function DebugCommands.handle_perf(action)
         Profiler.disable()
     elseif action == 'toggle' then
         Profiler.toggle()
+    elseif action == 'hist' or action == 'histogram' then
+        Profiler.hist_toggle()
+    elseif action == 'report' then
+        Profiler.hist_report()
+    elseif action == 'export' then
+        Profiler.hist_export()
+    elseif action == 'reset' then
+        Profiler.hist_reset()
+    elseif action == 'record' then
+        require('shared/utils/debug/harness/recorder').toggle()
     else
         Profiler.status()
     end
     return true
 end
 
+--- Benchmark MidcastManager's P0-P9 chain against its lookup index.
+--- Usage: //gs c midcastbench [iterations]
+function DebugCommands.handle_midcastbench(iterations)
+    local ok, MidcastManager = pcall(require, 'shared/utils/midcast/midcast_manager')
+    if not ok or not MidcastManager then
+        add_to_chat(207, '[MidcastBench] Failed to load: ' .. tostring(MidcastManager))
+        return false
+    end
+    local result = MidcastManager.benchmark(tonumber(iterations))
+    if not result then
+        add_to_chat(207, '[MidcastBench] sets.midcast is not loaded')
+        return false
+    end
+    local stats = MidcastManager.index_stats()
+    add_to_chat(207, string.format('[MidcastBench] %d samples x %d: chain %.2f us/cast | index %.2f us/cast (x%.1f)',
+        result.samples, result.iterations, result.chain_us, result.index_us,
+        result.chain_us / math.max(result.index_us, 0.001)))
+    add_to_chat(result.mismatches == 0 and 207 or 167, string.format(
+        '[MidcastBench] mismatches: %d | index hits %d, misses %d, resets %d',
+        result.mismatches, stats.hits, stats.misses, stats.resets))
+    return true
+end
+
+--- Check TPBonusCalculator's lookup table against its search, then time both.
+--- Usage: //gs c tpbench [iterations]
+function DebugCommands.handle_tpbench(iterations)
+    local job = player and player.main_job or 'UNK'
+    local tp_config = _G[job .. 'TPConfig']
+    if not tp_config then
+        add_to_chat(207, '[TPBench] No ' .. job .. ' TP config loaded')
+        return false
+    end
+    local ok, TPBonusCalculator = pcall(require, 'shared/utils/weaponskill/tp_bonus_calculator')
+    if not ok or not TPBonusCalculator then
+        add_to_chat(207, '[TPBench] Failed to load: ' .. tostring(TPBonusCalculator))
+        return false
+    end
+    local result = TPBonusCalculator.benchmark(tp_config, tonumber(iterations))
+    add_to_chat(207, string.format('[TPBench] %s: %d entries | search %.2f us/WS | lookup %.2f us/WS (x%.1f)',
+        job, result.entries, result.search_us, result.lookup_us,
+        result.search_us / math.max(result.lookup_us, 0.001)))
+    add_to_chat(result.mismatches == 0 and 207 or 167, string.format(
+        '[TPBench] %d cases checked (TP 0-3000 x weapon x sub x buffs): %d mismatches%s',
+        result.samples, result.mismatches, result.exact and '' or ' (fractional bonus: search only)'))
+    return true
+end
+
+--- Check the //gs c command table against the old scan, then time both.
+--- Usage: //gs c cmdbench [iterations]
+function DebugCommands.handle_cmdbench(iterations)
+    local CommonCommands = require('shared/utils/core/COMMON_COMMANDS')
+    local result = CommonCommands.benchmark(tonumber(iterations))
+    for _, row in ipairs(result.rows) do
+        add_to_chat(207, string.format('[CmdBench] %-10s scan %.2f us | table %.2f us (x%.1f)',
+            row.cmd, row.scan_us, row.table_us, row.scan_us / math.max(row.table_us, 0.001)))
+    end
+    add_to_chat(result.mismatches == 0 and 207 or 167, string.format(
+        '[CmdBench] %d names checked (commands, "all" variants, misses): %d mismatches',
+        result.commands, result.mismatches))
+    return true
+end
+
+--- Check DebuffChecker's blocker state against its scan, then time both.
+--- Usage: //gs c debuffbench [iterations]
+function DebugCommands.handle_debuffbench(iterations)
+    local DebuffChecker = require('shared/utils/debuff/debuff_checker')
+    local result = DebuffChecker.benchmark(tonumber(iterations))
+    for _, row in ipairs(result.rows) do
+        add_to_chat(207, string.format('[DebuffBench] %-9s scan %.2f us | state %.2f us (x%.1f)',
+            row.kind, row.scan_us, row.state_us, row.scan_us / math.max(row.state_us, 0.001)))
+    end
+    add_to_chat(result.mismatches == 0 and 207 or 167, string.format(
+        '[DebuffBench] %d cases checked (%d debuffs, every combination x 5 kinds, losses reported or missed): %d mismatches',
+        result.cases, result.watched, result.mismatches))
+    return true
+end
+
+--- Handle slot-diff equip commands.
+--- Usage: //gs c equipdiff [on|off|stats|reset]  (no arg = stats)
+function DebugCommands.handle_equipdiff(action)
+    local ok, EquipDiff = pcall(require, 'shared/utils/set_building/equip_diff')
+    if not ok or not EquipDiff then
+        add_to_chat(207, '[EquipDiff] Failed to load: ' .. tostring(EquipDiff))
+        return false
+    end
+    action = action and action:lower() or 'stats'
+    if action == 'on' or action == 'enable' then
+        EquipDiff.set_enabled(true)
+    elseif action == 'off' or action == 'disable' then
+        EquipDiff.set_enabled(false)
+    elseif action == 'toggle' then
+        EquipDiff.set_enabled(not EquipDiff.is_enabled())
+    elseif action == 'reset' then
+        EquipDiff.reset()
+    else
+        EquipDiff.stats()
+    end
+    return true
+end
+
+--- Show the action index state or check it against the databases.
+--- Usage: //gs c actionindex [stats|check|reset]  (no arg = stats)
+function DebugCommands.handle_actionindex(action)
+    local ok, ActionIndex = pcall(require, 'shared/utils/data/action_index')
+    if not ok or not ActionIndex then
+        add_to_chat(207, '[ActionIndex] Failed to load: ' .. tostring(ActionIndex))
+        return false
+    end
+    action = action and action:lower() or 'stats'
+    if action == 'reset' then
+        ActionIndex.reset()
+        add_to_chat(207, '[ActionIndex] Session index dropped')
+        return true
+    end
+    if action == 'check' then
+        local result = ActionIndex.check()
+        if not result then
+            add_to_chat(167, '[ActionIndex] No usable index (run python action_index.py)')
+            return false
+        end
+        local bad = #result.missing + #result.extra
+        add_to_chat(bad == 0 and 207 or 167, string.format(
+            '[ActionIndex] %d database entries checked: %d not indexed, %d indexed but absent',
+            result.checked, #result.missing, #result.extra))
+        for i = 1, math.min(bad, 5) do
+            add_to_chat(167, '[ActionIndex]   ' .. (result.missing[i] or result.extra[i - #result.missing]))
+        end
+        return bad == 0
+    end
+    ActionIndex.available()
+    local stats = ActionIndex.stats
+    add_to_chat(207, string.format('[ActionIndex] source %s | %d actions (%.1f ms) | hits %d, misses %d',
+        tostring(stats.source), stats.count, stats.ms, stats.hits, stats.misses))
+    return true
+end
+
+--- Build, time or toggle the bytecode cache of shared/ and the character files.
+--- Usage: //gs c bytecode [status|build|bench|clear|on|off]  (no arg = status)
+function DebugCommands.handle_bytecode(action)
+    local ok, BytecodeCache = pcall(require, 'shared/utils/core/bytecode_cache')
+    if not ok or not BytecodeCache then
+        add_to_chat(207, '[Bytecode] Failed to load: ' .. tostring(BytecodeCache))
+        return false
+    end
+    action = action and action:lower() or 'status'
+    if action == 'build' then
+        return #BytecodeCache.build_all().failed == 0
+    elseif action == 'bench' then
+        local result = BytecodeCache.benchmark()
+        if not result then
+            add_to_chat(167, '[Bytecode] No cache or loader (//gs c bytecode build, then gs reload)')
+            return false
+        end
+        add_to_chat(207, string.format('[Bytecode] %d files: source %.1f ms, cache %.1f ms (%d stale, loaded from source)',
+            result.files, result.source_ms, result.cache_ms, result.stale))
+    elseif action == 'clear' then
+        BytecodeCache.clear()
+    elseif action == 'on' or action == 'off' then
+        BytecodeCache.set_enabled(action == 'on')
+    else
+        BytecodeCache.status()
+    end
+    return true
+end
+
+--- Toggle warm job changes or run their eligibility check.
+--- Usage: //gs c warmreload [status|check|on|off]  (no arg = status)
+function DebugCommands.handle_warmreload(action)
+    local ok, WarmReload = pcall(require, 'shared/utils/core/warm_reload')
+    if not ok or not WarmReload then
+        add_to_chat(207, '[WarmReload] Failed to load: ' .. tostring(WarmReload))
+        return false
+    end
+    action = action and action:lower() or 'status'
+    if action == 'check' then
+        local result = WarmReload.check()
+        add_to_chat(207, string.format('[WarmReload] %d allowlisted modules kept, %d refused',
+            result.kept, #result.refused))
+        for _, line in ipairs(result.refused) do
+            add_to_chat(167, '[WarmReload]   ' .. line)
+        end
+    elseif action == 'on' or action == 'off' then
+        WarmReload.set_enabled(action == 'on')
+    else
+        WarmReload.status()
+    end
+    return true
+end
+
+--- Show or reset the chat queue counters, or send the waiting lines now.
+--- Usage: //gs c chatqueue [status|flush|reset]  (no arg = status)
+function DebugCommands.handle_chatqueue(action)
+    local ChatQueue = require('shared/utils/messages/core/chat_queue')
+    action = action and action:lower() or 'status'
+    if action == 'flush' then
+        ChatQueue.flush_all()
+    elseif action == 'reset' then
+        ChatQueue.reset_stats()
+    end
+    ChatQueue.status()
+    return true
+end
+
+--- Switch AutoMove between polling and event-driven detection, or show /
+--- reset its wakeup counters.
+--- Usage: //gs c automove [status|poll|event|reset]  (no arg = status)
+function DebugCommands.handle_automove(action)
+    if not AutoMove or not AutoMove.get_stats then
+        add_to_chat(207, '[AutoMove] Not loaded on this job')
+        return false
+    end
+    action = action and action:lower() or 'status'
+    if action == 'poll' or action == 'event' then
+        AutoMove.set_mode(action)
+    elseif action == 'reset' then
+        AutoMove.reset_stats()
+    end
+    local s = AutoMove.get_stats()
+    add_to_chat(207, string.format('[AutoMove] %s mode | %.1f wakeups/min over %.1f min (%d wakeups, %d position checks)',
+        s.mode, s.per_minute, s.minutes, s.wakeups, s.steps))
+    add_to_chat(207, string.format('[AutoMove] unchanged position updates skipped %d, watchdog checks %d, moving/stopped %d, gs c update %d',
+        s.skipped, s.watchdog, s.transitions, s.updates))
+    return true
+end
+
+--- Show or reset the shared packet dispatcher counters.
+--- Usage: //gs c packets [status|reset]  (no arg = status)
+function DebugCommands.handle_packets(action)
+    local PacketDispatcher = require('shared/utils/core/packet_dispatcher')
+    action = action and action:lower() or 'status'
+    if action == 'reset' then
+        PacketDispatcher.reset()
+    end
+    PacketDispatcher.status()
+    return true
+end
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   FULL TEST / SYSTEM CHECK / LAG DEBUGGER
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -37,6 +37,13 @@ end
 -- Track total gs reload count (persists across reloads via windower table)
 windower._gs_reload_count = (windower._gs_reload_count or 0) + 1
 
+-- Warm job change (//gs c warmreload) - put back the job-agnostic modules
+-- kept by the last unload, before the job functions require them
+local warm_reload_ok, WarmReload = pcall(require, 'shared/utils/core/warm_reload')
+if warm_reload_ok and WarmReload.is_enabled() then
+    WarmReload.restore()
+end
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   LAG DEBUGGER (loaded immediately, lightweight - only active when toggled)
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -54,6 +61,32 @@ if _G.LagDebugger then
     _G.LagDebugger.on_reload_complete(job, sub, windower._automove_seq)
 end
 
+-- Hook latency histograms (//gs c perf hist) - wraps precast/midcast/... only when enabled
+local perf_hist_on = windower._perf_hist and windower._perf_hist.enabled
+if perf_hist_on == nil then
+    local state_file = io.open(windower.addon_path .. 'data/.profiler_histogram', 'r')
+    perf_hist_on = state_file ~= nil
+    if state_file then state_file:close() end
+end
+if perf_hist_on then
+    local ok, Profiler = pcall(require, 'shared/utils/debug/performance_profiler')
+    if ok and Profiler.hist_enabled() then
+        Profiler.install_hooks()
+    end
+end
+
+-- Slot-diff equip (opt-in, //gs c equipdiff on) - drops already-worn slots from equip() calls
+local equip_diff_ok, EquipDiff = pcall(require, 'shared/utils/set_building/equip_diff')
+if equip_diff_ok and EquipDiff.is_enabled() then
+    EquipDiff.install()
+end
+
+-- Bytecode cache (//gs c bytecode) - next reloads load fresh precompiled chunks
+local bytecode_ok, BytecodeCache = pcall(require, 'shared/utils/core/bytecode_cache')
+if bytecode_ok and BytecodeCache.is_enabled() then
+    BytecodeCache.install()
+end
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   DEPENDENCIES (LAZY LOADING for performance)
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,617 @@
+---============================================================================
+--- Bytecode Cache - Precompiled shared/ and character files for gs reload
+---============================================================================
+--- Every job change reloads GearSwap, which parses the same few hundred files
+--- (shared/, <Char>/sets, <Char>/config) from text again. `//gs c bytecode
+--- build` compiles them once with the game's own Lua (string.dump, so the
+--- bytecode always matches the interpreter), strips the debug info and
+--- writes them to data/.bytecode/ with a manifest of each source's size and
+--- Adler-32.
+---
+--- The cache is used through GearSwap's loadfile: the wrapper is installed
+--- on the addon environment (`gearswap.loadfile`), which survives reloads,
+--- so from the second load on every require()/include() of a cached file -
+--- entry file included - reads bytecode instead of parsing.
+---
+--- Scope of the wrapper: only paths under data/ that are in the manifest
+--- are looked up; everything else (GearSwap's libs, files outside data/)
+--- goes straight to the original loadfile. `//gs c bytecode off` and
+--- `clear` call uninstall(), which puts the original loadfile back on the
+--- addon environment (`//gs c bytecode` shows whether it is installed).
+--- Unloading GearSwap drops the environment, wrapper included.
+---
+--- Safety:
+---   • A cached file is used only while its source keeps the recorded
+---     content stamp (size + Adler-32, FileStamp). Otherwise the source is
+---     loaded as before. Each load hashes the sources it checks again
+---     (FileStamp keeps no file content between loads).
+---   • The manifest records the interpreter's bytecode header; another Lua
+---     build ignores the whole cache.
+---   • Stripped chunks raise errors without the file:line prefix -
+---     `//gs c bytecode off` brings it back while debugging.
+---
+--- Usage:
+---   INIT_SYSTEMS installs the loader once per session;
+---   //gs c bytecode [build|bench|status|clear|on|off]
+---   (state persisted in data/.bytecode_off, counters survive reloads)
+---
+--- @file    utils/core/bytecode_cache.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local BytecodeCache = {}
+
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local CACHE_VERSION = 2
+local CACHE_DIR = '.bytecode/'
+local MANIFEST = 'manifest.lua'
+local STATE_FILE = '.bytecode_off'
+
+-- shared/ folders that never run inside GearSwap (or are loaded with dofile)
+local SKIP_DIRS = {
+    ['shared/data/packed/'] = true,
+    ['shared/utils/debug/harness/'] = true,
+}
+
+---============================================================================
+--- FILE HELPERS
+---============================================================================
+
+--- data/ folder (trailing slash)
+local function data_root()
+    return windower.addon_path .. 'data/'
+end
+
+--- Manifest key of a path: data-relative, '/' separated, lowercase, no '..'
+--- (GearSwap lowercases require/include names and reaches shared/ via '../')
+--- @param path string Absolute or data-relative path
+--- @param root string Lowercase data root
+--- @return string|nil Key, nil for files outside data/
+local function key_of(path, root)
+    local key = path:gsub('\\', '/'):lower()
+    if key:sub(1, #root) == root then
+        key = key:sub(#root + 1)
+    elseif key:match('^%a:') or key:sub(1, 1) == '/' then
+        return nil
+    end
+    local parts = {}
+    for part in key:gmatch('[^/]+') do
+        if part == '..' then
+            if #parts == 0 then return nil end
+            parts[#parts] = nil
+        elseif part ~= '.' then
+            parts[#parts + 1] = part
+        end
+    end
+    return table.concat(parts, '/')
+end
+
+--- Cache file name of a key (flat folder, no sub-directories to create)
+local function cache_name(key)
+    return key:gsub('/', '.') .. 'c'
+end
+
+--- Bytecode header of the running interpreter as "27,76,117,..."
+local function header_signature()
+    return table.concat({string.dump(function() end):byte(1, 12)}, ',')
+end
+
+---============================================================================
+--- STRIP (Lua 5.1 chunk format, sizes read from the chunk header)
+---============================================================================
+
+--- Reader over a Lua 5.1 chunk (sizes and byte order from the chunk header)
+--- @param dump string string.dump() output
+--- @return table|nil Reader {pos, int_size, instr_size, number_size, uint(size), string()}
+local function chunk_reader(dump)
+    if dump:sub(1, 5) ~= '\27Lua\81' or #dump < 12 then
+        return nil
+    end
+    local byte, sub = string.byte, string.sub
+    local little = byte(dump, 7) == 1
+    local r = {pos = 13, int_size = byte(dump, 8), size_t_size = byte(dump, 9),
+        instr_size = byte(dump, 10), number_size = byte(dump, 11)}
+
+    function r.uint(size)
+        local pos, value = r.pos, 0
+        if little then
+            for i = pos + size - 1, pos, -1 do
+                value = value * 256 + byte(dump, i)
+            end
+        else
+            for i = pos, pos + size - 1 do
+                value = value * 256 + byte(dump, i)
+            end
+        end
+        r.pos = pos + size
+        return value
+    end
+
+    --- String field (nil for the empty/NULL string)
+    function r.string()
+        local len = r.uint(r.size_t_size)
+        local start = r.pos
+        r.pos = start + len
+        return len > 0 and sub(dump, start, start + len - 2) or nil
+    end
+
+    --- Constant list of a function: {[0-based index] = value} (strings and numbers only)
+    function r.constants()
+        local list = {}
+        for i = 0, r.uint(r.int_size) - 1 do
+            local kind = byte(dump, r.pos)
+            r.pos = r.pos + 1
+            if kind == 1 then
+                r.pos = r.pos + 1
+            elseif kind == 3 then
+                r.pos = r.pos + r.number_size
+            elseif kind == 4 then
+                list[i] = r.string()
+            elseif kind ~= 0 then
+                error('bad constant')
+            end
+        end
+        return list
+    end
+
+    --- Skip the debug section of a function
+    function r.skip_debug()
+        local lines = r.uint(r.int_size)
+        r.pos = r.pos + lines * r.int_size
+        for _ = 1, r.uint(r.int_size) do
+            r.string()
+            r.pos = r.pos + 2 * r.int_size
+        end
+        for _ = 1, r.uint(r.int_size) do
+            r.string()
+        end
+    end
+
+    return r
+end
+
+--- Remove line info, local and upvalue names from a string.dump() chunk.
+--- The top-level source name is kept (tracebacks still name the file).
+--- @param dump string Lua 5.1 bytecode
+--- @return string|nil Stripped bytecode, nil if the format is not Lua 5.1
+function BytecodeCache.strip(dump)
+    local r = chunk_reader(dump)
+    if not r then
+        return nil
+    end
+    local zero_int = string.rep('\0', r.int_size)
+    local out = {dump:sub(1, 12)}
+
+    local function function_block()
+        local start = r.pos
+        r.string()                                      -- source
+        r.pos = r.pos + 2 * r.int_size + 4              -- lines, nups, params, vararg, stack
+        local code = r.uint(r.int_size)
+        r.pos = r.pos + code * r.instr_size
+        r.constants()
+        local protos = r.uint(r.int_size)
+        out[#out + 1] = dump:sub(start, r.pos - 1)
+        for _ = 1, protos do
+            function_block()
+        end
+        -- Debug info: line info, local names, upvalue names -> empty
+        r.skip_debug()
+        out[#out + 1] = zero_int .. zero_int .. zero_int
+    end
+
+    local ok = pcall(function_block)
+    if not ok or r.pos ~= #dump + 1 then
+        return nil
+    end
+    return table.concat(out)
+end
+
+-- Lua 5.1 opcodes read by inspect()
+local OP_LOADK, OP_GETGLOBAL, OP_SETGLOBAL, OP_CALL = 1, 5, 7, 28
+
+--- Globals a chunk reads and writes, and the modules it requires.
+--- A require() whose argument is not a lone string literal is reported as
+--- dynamic (require('a/' .. name) loads the literal, then concatenates).
+--- @param dump string Lua 5.1 bytecode (string.dump of the compiled file)
+--- @return table|nil {reads = {[name] = true}, writes = {..}, requires = {[module] = true}, dynamic = boolean}
+function BytecodeCache.inspect(dump)
+    local r = chunk_reader(dump)
+    if not r then
+        return nil
+    end
+    local floor = math.floor
+    local result = {reads = {}, writes = {}, requires = {}, dynamic = false}
+
+    local function function_block()
+        r.string()
+        r.pos = r.pos + 2 * r.int_size + 4
+        local code = {}
+        for i = 1, r.uint(r.int_size) do
+            code[i] = r.uint(r.instr_size)
+        end
+        local k = r.constants()
+        -- After GETGLOBAL 'require': LOADK of the module name, then CALL
+        local after_require, module_name = false, nil
+        for _, instruction in ipairs(code) do
+            local op = instruction % 64
+            local bx = floor(instruction / 16384)
+            if module_name then
+                if op == OP_CALL then
+                    result.requires[module_name] = true
+                else
+                    result.dynamic = true
+                end
+                module_name = nil
+            elseif after_require then
+                if op == OP_LOADK and k[bx] then
+                    module_name = k[bx]
+                else
+                    result.dynamic = true
+                end
+                after_require = false
+            end
+            if op == OP_GETGLOBAL and k[bx] then
+                result.reads[k[bx]] = true
+                after_require = k[bx] == 'require'
+            elseif op == OP_SETGLOBAL and k[bx] then
+                result.writes[k[bx]] = true
+            end
+        end
+        for _ = 1, r.uint(r.int_size) do
+            function_block()
+        end
+        r.skip_debug()
+    end
+
+    local ok = pcall(function_block)
+    if not ok or r.pos ~= #dump + 1 then
+        return nil
+    end
+    return result
+end
+
+---============================================================================
+--- STATE
+---============================================================================
+
+-- Enabled flag, manifest and counters live in the windower table (survive reloads)
+if not windower._bytecode then
+    local state_file = io.open(data_root() .. STATE_FILE, 'r')
+    windower._bytecode = {
+        enabled = state_file == nil,
+        manifest = nil,     -- loaded manifest (false: none usable)
+        cache_dir = nil,    -- override of data/.bytecode/ (hook_bench.py)
+        original = nil,     -- gearswap.loadfile before install()
+        wrapper = nil,      -- installed wrapper
+        hits = 0,           -- chunks served from bytecode
+        stale = 0,          -- cached, but the source changed
+        misses = 0,         -- data/ files not in the cache
+    }
+    if state_file then
+        state_file:close()
+    end
+end
+local B = windower._bytecode
+
+--- Folder holding the cache files and the manifest ('/'-ended)
+local function cache_dir()
+    return B.cache_dir or (data_root() .. CACHE_DIR)
+end
+
+--- Load the manifest once per session (false when missing or for another Lua)
+--- @return table|false
+local function manifest()
+    if B.manifest ~= nil then
+        return B.manifest
+    end
+    local ok, data = pcall(dofile, cache_dir() .. MANIFEST)
+    if ok and type(data) == 'table' and data.version == CACHE_VERSION
+        and data.header == header_signature() and type(data.files) == 'table' then
+        B.manifest = data
+    else
+        B.manifest = false
+    end
+    return B.manifest
+end
+
+---============================================================================
+--- LOADER
+---============================================================================
+
+--- Cached bytecode of a source file, if fresh
+--- @param load function Original loadfile
+--- @param path string Source path as GearSwap passes it
+--- @return function|nil Chunk
+local function cached_chunk(load, path)
+    local files = manifest()
+    if not files then
+        return nil
+    end
+    local root = data_root():gsub('\\', '/'):lower()
+    local key = key_of(path, root)
+    local entry = key and files.files[key]
+    if not entry then
+        if key then
+            B.misses = B.misses + 1
+        end
+        return nil
+    end
+    if not FileStamp.matches(path, {entry.size, entry.adler32}) then
+        B.stale = B.stale + 1
+        return nil
+    end
+    local chunk = load(cache_dir() .. cache_name(key))
+    if chunk then
+        B.hits = B.hits + 1
+    end
+    return chunk
+end
+
+--- Wrap a loadfile function: fresh bytecode first, source otherwise
+--- (paths outside data/ or not in the manifest go to load unchanged)
+--- @param load function loadfile to wrap
+--- @return function Wrapper with the same signature
+function BytecodeCache.wrap(load)
+    return function(path, ...)
+        if B.enabled and type(path) == 'string' then
+            local chunk = cached_chunk(load, path)
+            if chunk then
+                return chunk
+            end
+        end
+        return load(path, ...)
+    end
+end
+
+--- Install the wrapper on GearSwap's loadfile (INIT_SYSTEMS, every load).
+--- The addon environment persists across reloads, so this runs its body once.
+function BytecodeCache.install()
+    local env = rawget(_G, 'gearswap')
+    if type(env) ~= 'table' or type(rawget(env, 'loadfile')) ~= 'function' then
+        return false
+    end
+    if env.loadfile ~= B.wrapper then
+        B.original = env.loadfile
+        B.wrapper = BytecodeCache.wrap(B.original)
+        env.loadfile = B.wrapper
+    end
+    return true
+end
+
+--- Put GearSwap's own loadfile back (off / clear)
+function BytecodeCache.uninstall()
+    local env = rawget(_G, 'gearswap')
+    if B.wrapper and type(env) == 'table' and env.loadfile == B.wrapper then
+        env.loadfile = B.original
+    end
+    B.original, B.wrapper = nil, nil
+end
+
+--- @return boolean True while the wrapper is GearSwap's loadfile
+function BytecodeCache.is_installed()
+    local env = rawget(_G, 'gearswap')
+    return B.wrapper ~= nil and type(env) == 'table' and env.loadfile == B.wrapper
+end
+
+---============================================================================
+--- BUILD
+---============================================================================
+
+--- List the .lua files under a data-relative folder (recursive, in game)
+--- @param rel string Folder relative to data/ ('/'-ended)
+--- @param out table List to fill with data-relative paths
+local function walk(rel, out)
+    if SKIP_DIRS[rel] then
+        return
+    end
+    local root = data_root()
+    for _, name in ipairs(windower.get_dir(root .. rel) or {}) do
+        if name:sub(1, 1) ~= '.' then
+            if name:lower():match('%.lua$') then
+                out[#out + 1] = rel .. name
+            elseif windower.dir_exists(root .. rel .. name) then
+                walk(rel .. name .. '/', out)
+            end
+        end
+    end
+end
+
+--- Files to precompile: shared/, then each character's entry files,
+--- sets/ and config/ (character folders: capitalized names with a sets/ folder)
+--- @return table List of data-relative paths
+function BytecodeCache.collect_files()
+    local files = {}
+    walk('shared/', files)
+    local root = data_root()
+    for _, name in ipairs(windower.get_dir(root) or {}) do
+        if name:match('^[A-Z]') and windower.dir_exists(root .. name .. '/sets') then
+            for _, file in ipairs(windower.get_dir(root .. name) or {}) do
+                if file:lower():match('%.lua$') then
+                    files[#files + 1] = name .. '/' .. file
+                end
+            end
+            walk(name .. '/sets/', files)
+            walk(name .. '/config/', files)
+        end
+    end
+    return files
+end
+
+--- Compile files to stripped bytecode and write the manifest.
+--- @param files table Data-relative paths
+--- @param opts table|nil {data_dir} (absolute, '/'-ended; default data/)
+--- @return table {files, compiled, failed = {..}, source_kb, cache_kb, ms}
+function BytecodeCache.build(files, opts)
+    opts = opts or {}
+    local root = opts.data_dir or data_root()
+    local out_dir = cache_dir()
+    if windower.create_dir and not windower.dir_exists(out_dir) then
+        windower.create_dir(out_dir)
+    end
+    local lower_root = root:gsub('\\', '/'):lower()
+    local result = {files = #files, compiled = 0, failed = {}, source_kb = 0, cache_kb = 0, ms = 0}
+    local started = os.clock()
+    local lines = {}
+
+    for _, rel in ipairs(files) do
+        local path = root .. rel
+        local source = FileStamp.read(path)
+        local chunk, err = source and loadstring(source, '@' .. path)
+        local code = chunk and BytecodeCache.strip(string.dump(chunk))
+        local key = key_of(rel, lower_root)
+        local out = code and io.open(out_dir .. cache_name(key), 'wb')
+        if out then
+            out:write(code)
+            out:close()
+            result.compiled = result.compiled + 1
+            result.source_kb = result.source_kb + #source / 1024
+            result.cache_kb = result.cache_kb + #code / 1024
+            lines[#lines + 1] = string.format('        [%q] = {size = %d, adler32 = %d},', key, #source,
+                FileStamp.checksum(path, source))
+        else
+            table.insert(result.failed, rel .. ': ' .. tostring(err or (chunk and 'strip/write failed') or 'unreadable'))
+        end
+    end
+
+    table.sort(lines)
+    local manifest_file = io.open(out_dir .. MANIFEST, 'w')
+    if manifest_file then
+        manifest_file:write(table.concat({
+            '-- Generated by //gs c bytecode build - do not edit',
+            'return {',
+            '    version = ' .. CACHE_VERSION .. ',',
+            string.format('    header = %q,', header_signature()),
+            string.format('    built = %q,', os.date('%Y-%m-%d %H:%M:%S')),
+            '    files = {',
+            table.concat(lines, '\n'),
+            '    },',
+            '}',
+        }, '\n') .. '\n')
+        manifest_file:close()
+    else
+        table.insert(result.failed, MANIFEST .. ': cannot write')
+    end
+
+    B.manifest = nil
+    result.ms = (os.clock() - started) * 1000
+    return result
+end
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- Compile everything and report in chat
+function BytecodeCache.build_all()
+    add_to_chat(207, '[Bytecode] Compiling shared/ and character files...')
+    local result = BytecodeCache.build(BytecodeCache.collect_files())
+    add_to_chat(207, string.format('[Bytecode] %d/%d files in %.0f ms: %.0f KB source -> %.0f KB bytecode',
+        result.compiled, result.files, result.ms, result.source_kb, result.cache_kb))
+    for i = 1, math.min(#result.failed, 5) do
+        add_to_chat(167, '[Bytecode]   ' .. result.failed[i])
+    end
+    BytecodeCache.install()
+    return result
+end
+
+--- Time source compile vs cache load for every cached file
+--- @return table|nil {files, source_ms, cache_ms, stale}, nil without cache or loader
+function BytecodeCache.benchmark()
+    local files = manifest()
+    local load = B.original
+    if not files or not load then
+        return nil
+    end
+    local root = data_root()
+    local paths = {}
+    for key in pairs(files.files) do
+        paths[#paths + 1] = root .. key
+    end
+    local result = {files = #paths, source_ms = 0, cache_ms = 0, stale = 0}
+
+    local stale_before = B.stale
+    local hits_before = B.hits
+    local started = os.clock()
+    for _, path in ipairs(paths) do
+        if not cached_chunk(load, path) then
+            load(path)
+        end
+    end
+    result.cache_ms = (os.clock() - started) * 1000
+    result.stale = B.stale - stale_before
+    B.hits, B.stale = hits_before, stale_before
+
+    started = os.clock()
+    for _, path in ipairs(paths) do
+        load(path)
+    end
+    result.source_ms = (os.clock() - started) * 1000
+    return result
+end
+
+--- Delete the cache files and the manifest
+function BytecodeCache.clear()
+    local files = manifest()
+    local dir = cache_dir()
+    local removed = 0
+    for key in pairs(files and files.files or {}) do
+        if os.remove(dir .. cache_name(key)) then
+            removed = removed + 1
+        end
+    end
+    os.remove(dir .. MANIFEST)
+    B.manifest = nil
+    BytecodeCache.uninstall()
+    add_to_chat(207, string.format('[Bytecode] Cache cleared (%d files)', removed))
+end
+
+--- Read and build the cache in another folder (hook_bench.py work dir)
+--- @param dir string|nil Absolute '/'-ended folder, nil for data/.bytecode/
+function BytecodeCache.set_cache_dir(dir)
+    B.cache_dir = dir
+    B.manifest = nil
+end
+
+--- Enable or disable the cache (persisted in data/.bytecode_off)
+--- @param enabled boolean
+function BytecodeCache.set_enabled(enabled)
+    B.enabled = enabled
+    if enabled then
+        os.remove(data_root() .. STATE_FILE)
+        BytecodeCache.install()
+    else
+        local file = io.open(data_root() .. STATE_FILE, 'w')
+        if file then
+            file:write('off')
+            file:close()
+        end
+        BytecodeCache.uninstall()
+    end
+    add_to_chat(207, '[Bytecode] ' .. (enabled and 'ON - fresh bytecode is loaded instead of source'
+        or 'OFF - every file is parsed from source'))
+end
+
+--- @return boolean
+function BytecodeCache.is_enabled()
+    return B.enabled == true
+end
+
+--- Show cache state and counters in chat
+function BytecodeCache.status()
+    local files = manifest()
+    local count = 0
+    for _ in pairs(files and files.files or {}) do
+        count = count + 1
+    end
+    add_to_chat(207, string.format('[Bytecode] %s | %s | loader %s',
+        B.enabled and 'ON' or 'OFF',
+        files and string.format('%d files built %s', count, tostring(files.built)) or 'no cache (//gs c bytecode build)',
+        BytecodeCache.is_installed() and 'installed' or 'not installed'))
+    add_to_chat(207, string.format('[Bytecode] loaded from bytecode %d, stale source %d, not cached %d',
+        B.hits, B.stale, B.misses))
+end
+
+return BytecodeCache
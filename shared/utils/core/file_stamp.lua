@@ -0,0 +1,127 @@
+---============================================================================
+--- File Stamp - Content stamps for prebuilt data
+---============================================================================
+--- Prebuilt files (packs, indexes, bytecode, kept modules) are trusted only
+--- while their sources are unchanged. A stamp is {size, adler32} of the
+--- source content: a same-length edit (0.5 -> 0.7) changes the Adler-32,
+--- where a byte size alone would not. The Python builders write the same
+--- stamp (gear_sets.lua_stamp, zlib.adler32).
+---
+--- Every check reads and hashes the file again: keeping the content to
+--- skip unchanged files held every checked source (~5 MB) in the windower
+--- table, and a sampled fingerprint would miss a same-length edit. The
+--- windower table keeps only the last stamp of each path and counters
+--- (FileStamp.stats).
+---
+--- Usage:
+---   local FileStamp = require('shared/utils/core/file_stamp')
+---   FileStamp.matches(path, stamp)   -- stamp = {size, adler32}
+---   FileStamp.of(path)               -- -> {size, adler32} | nil
+---
+--- @file    utils/core/file_stamp.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local FileStamp = {}
+
+-- Checked files of this session: [path] = {size, adler32}; counters.
+-- A table with `reused` is the older memo that kept file contents: dropped.
+if not windower._file_stamps or windower._file_stamps.reused then
+    windower._file_stamps = {files = {}, hashed = 0, kb = 0}
+end
+local S = windower._file_stamps
+
+--- Adler-32 checksum (same value as Python zlib.adler32)
+--- @param data string Raw file content
+--- @return number Checksum
+function FileStamp.adler32(data)
+    local byte = string.byte
+    local a, b = 1, 0
+    local len = #data
+    local i = 1
+    -- 16 bytes per step: b gains 16*a plus each byte weighted by its distance
+    -- to the end of the block. Sums stay far below 2^53 within 4096 bytes.
+    while i + 15 <= len do
+        local stop = math.min(i + 4095, len - 15)
+        while i <= stop do
+            local c1, c2, c3, c4, c5, c6, c7, c8, c9, c10, c11, c12, c13, c14, c15, c16 = byte(data, i, i + 15)
+            b = b + 16 * a + 16 * c1 + 15 * c2 + 14 * c3 + 13 * c4 + 12 * c5 + 11 * c6 + 10 * c7
+                + 9 * c8 + 8 * c9 + 7 * c10 + 6 * c11 + 5 * c12 + 4 * c13 + 3 * c14 + 2 * c15 + c16
+            a = a + c1 + c2 + c3 + c4 + c5 + c6 + c7 + c8 + c9 + c10 + c11 + c12 + c13 + c14 + c15 + c16
+            i = i + 16
+        end
+        a = a % 65521
+        b = b % 65521
+    end
+    for j = i, len do
+        a = a + byte(data, j)
+        b = b + a
+    end
+    return (b % 65521) * 65536 + a % 65521
+end
+
+--- Read a file in binary mode
+--- @param path string Absolute path
+--- @return string|nil Content, nil if unreadable
+function FileStamp.read(path)
+    local file = io.open(path, 'rb')
+    if not file then return nil end
+    local content = file:read('*all')
+    file:close()
+    return content
+end
+
+--- Adler-32 of a file's content (recorded with its size for stats)
+--- @param path string Absolute path
+--- @param data string Content just read from path
+--- @return number Checksum
+function FileStamp.checksum(path, data)
+    local sum = FileStamp.adler32(data)
+    S.files[path] = {#data, sum}
+    S.hashed = S.hashed + 1
+    S.kb = S.kb + #data / 1024
+    return sum
+end
+
+--- Stamp of a file
+--- @param path string Absolute path
+--- @return table|nil {size, adler32}, nil if unreadable
+function FileStamp.of(path)
+    local data = FileStamp.read(path)
+    if not data then
+        return nil
+    end
+    return {#data, FileStamp.checksum(path, data)}
+end
+
+--- True when a file still has the content a stamp was taken from
+--- @param path string Absolute path
+--- @param stamp table|nil {size, adler32}
+--- @return boolean
+function FileStamp.matches(path, stamp)
+    if type(stamp) ~= 'table' or type(stamp[1]) ~= 'number' or type(stamp[2]) ~= 'number' then
+        return false
+    end
+    local data = FileStamp.read(path)
+    return data ~= nil and #data == stamp[1] and FileStamp.checksum(path, data) == stamp[2]
+end
+
+--- Lua literal of a stamp ("{size, adler32}") for generated files
+--- @param stamp table {size, adler32}
+--- @return string
+function FileStamp.format(stamp)
+    return string.format('{%d, %d}', stamp[1], stamp[2])
+end
+
+--- @return table {files, hashed, kb}
+function FileStamp.stats()
+    local files = 0
+    for _ in pairs(S.files) do
+        files = files + 1
+    end
+    return {files = files, hashed = S.hashed, kb = S.kb}
+end
+
+return FileStamp
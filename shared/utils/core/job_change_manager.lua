@@ -16,6 +16,17 @@ local function get_MessageFormatter()
     return MessageFormatter
 end
 
+-- WarmReload lazy-loaded (warm job changes, //gs c warmreload)
+local WarmReload = nil
+local function get_WarmReload()
+    if not WarmReload then
+        local success
+        success, WarmReload = pcall(require, 'shared/utils/core/warm_reload')
+        if not success then WarmReload = nil end
+    end
+    return WarmReload
+end
+
 -- State persisted in _G to survive module reloads (resets on full GearSwap reload)
 -- (Reload GearSwap will reset these, but they persist during debounce delays)
 if not _G.JobChangeManagerSTATE then
@@ -32,6 +43,9 @@ if not _G.JobChangeManagerSTATE then
         debounce_timer            = nil,
         debounce_counter          = 0,  -- Increments on each change to invalidate old timers
 
+        -- Manual reload pending: the unload keeps nothing (WarmReload)
+        cold_reload               = false,
+
         -- Global registry of all job lockstyle cancel functions
         lockstyle_cancel_registry = {}
     }
@@ -187,6 +201,13 @@ function JobChangeManager.force_reload(main_job, sub_job)
     -- Increment counter to invalidate any pending debounced changes
     STATE.debounce_counter = STATE.debounce_counter + 1
 
+    -- Manual reload is always a full one
+    STATE.cold_reload = true
+    local warm = get_WarmReload()
+    if warm then
+        warm.drop('manual reload')
+    end
+
     -- Reload job file immediately (no debounce) - fast reload
     windower.send_command('gs reload')
 end
@@ -195,6 +216,18 @@ end
 function JobChangeManager.cancel_all()
     cancel_all_pending()
 
+    -- Send the chat lines still waiting for their budget
+    local chat_queue = package.loaded['shared/utils/messages/core/chat_queue']
+    if chat_queue then
+        chat_queue.flush_all()
+    end
+
+    -- Warm mode: hand the job-agnostic modules to the next load
+    local warm = not STATE.cold_reload and get_WarmReload()
+    if warm and warm.is_enabled() then
+        warm.capture()
+    end
+
     -- Cancel all registered job lockstyle operations
     for job_name, cancel_func in pairs(STATE.lockstyle_cancel_registry) do
         if cancel_func then
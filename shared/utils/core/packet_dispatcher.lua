@@ -0,0 +1,361 @@
+---============================================================================
+--- Packet Dispatcher - One incoming chunk / action listener for all modules
+---============================================================================
+--- Registers a single raw 'incoming chunk', 'outgoing chunk' and 'action'
+--- handler (each only while someone subscribes) and routes by packet id /
+--- action category, so a busy zone costs one table lookup per packet instead of
+--- one closure call and id check per module.
+---
+--- Subscribers of a packet id receive one shared lazy view of it:
+---   • packet.id, packet.original (raw string), packet.injected
+---   • packet['Main job'] decodes only that field from the raw buffer when
+---     it is in LAYOUTS; any other field runs packets.parse once and the
+---     result is shared by every subscriber of that packet
+---   • the first VERIFY_READS raw field reads of each id are checked against
+---     packets.parse; a mismatch turns that id's layout off (full parse
+---     from then on) and shows in //gs c packets
+---
+--- Usage:
+---   PacketDispatcher.subscribe(0xDD, 'cor_party', function(packet) ... end)
+---   PacketDispatcher.on_action('cor_roll', function(act) ... end, 6)
+---   PacketDispatcher.subscribe_outgoing(0x015, 'automove', function(packet) ... end)
+---   PacketDispatcher.unsubscribe(0xDD, 'cor_party')  -- file_unload()
+---
+--- @file    shared/utils/core/packet_dispatcher.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local PacketDispatcher = {}
+
+local VERIFY_READS = 20
+
+-- Field offsets (from the packet start, header included) in Windower's
+-- packets/fields.lua. false = the packet has no such field (nil, no parse).
+local LAYOUTS = {
+    [0x0DD] = {  -- Party Member Update
+        ['ID'] = {0x04, 'uint32'}, ['HP'] = {0x08, 'uint32'}, ['MP'] = {0x0C, 'uint32'},
+        ['TP'] = {0x10, 'uint32'}, ['Index'] = {0x18, 'uint16'},
+        ['HP%'] = {0x1D, 'uint8'}, ['MP%'] = {0x1E, 'uint8'}, ['Zone'] = {0x20, 'uint16'},
+        ['Main job'] = {0x22, 'uint8'}, ['Main job level'] = {0x23, 'uint8'},
+        ['Sub job'] = {0x24, 'uint8'}, ['Sub job level'] = {0x25, 'uint8'},
+        ['Name'] = {0x28, 'string'},
+    },
+    [0x0DF] = {  -- Char Update
+        ['ID'] = {0x04, 'uint32'}, ['HP'] = {0x08, 'uint32'}, ['MP'] = {0x0C, 'uint32'},
+        ['TP'] = {0x10, 'uint32'}, ['Index'] = {0x14, 'uint16'},
+        ['HPP'] = {0x16, 'uint8'}, ['MPP'] = {0x17, 'uint8'},
+        ['Main job'] = {0x20, 'uint8'}, ['Main job level'] = {0x21, 'uint8'},
+        ['Sub job'] = {0x22, 'uint8'}, ['Sub job level'] = {0x23, 'uint8'},
+        ['Name'] = false,
+    },
+}
+
+-- Event ids and counters live in the windower table: a reload unregisters
+-- the previous load's handlers (their subscribers are gone with its _G)
+if not windower._packet_dispatcher then
+    windower._packet_dispatcher = {
+        chunk_event = nil,
+        outgoing_event = nil,
+        action_event = nil,
+        counts = {},        -- [id] = packets seen
+        handled = {},       -- [id] = packets given to subscribers
+        ms = {},            -- [id] = subscriber time
+        parses = 0,         -- full packets.parse calls
+        decoded = 0,        -- fields read from the raw buffer
+        verified = {},      -- [id] = field reads checked / false after a mismatch
+        mismatch = nil,     -- last mismatch, "0xDD Main job: 3 ~= 5"
+    }
+end
+local P = windower._packet_dispatcher
+for _, key in ipairs({'chunk_event', 'outgoing_event', 'action_event'}) do
+    if P[key] then
+        pcall(windower.unregister_event, P[key])
+        P[key] = nil
+    end
+end
+
+local subscribers = {}          -- [id] = {{key, handler}, ...}
+local outgoing_subscribers = {} -- [id] = {{key, handler}, ...}
+local action_subscribers = {}   -- {{key, handler, category}, ...}
+
+-- Private view keys (no clash with packet field labels)
+local ID, RAW, PARSED, DIR = {}, {}, {}, {}
+
+---============================================================================
+--- LAZY PACKET VIEW
+---============================================================================
+
+local packets_lib = nil
+
+--- Full parse of a view, done once and shared by its subscribers
+local function parse(view)
+    local parsed = rawget(view, PARSED)
+    if parsed == nil then
+        if packets_lib == nil then
+            local ok, lib = pcall(require, 'packets')
+            packets_lib = ok and lib or false
+        end
+        local ok, result = false, nil
+        if packets_lib then
+            ok, result = pcall(packets_lib.parse, rawget(view, DIR), rawget(view, RAW))
+        end
+        parsed = ok and result or false
+        P.parses = P.parses + 1
+        rawset(view, PARSED, parsed)
+    end
+    return parsed or nil
+end
+
+--- Read one field of the raw packet
+local function decode(raw, spec)
+    local offset, kind = spec[1] + 1, spec[2]
+    if kind == 'string' then
+        return raw:match('^[^%z]*', offset)
+    end
+    local b1, b2, b3, b4 = raw:byte(offset, offset + 3)
+    if not b1 then
+        return nil
+    elseif kind == 'uint8' then
+        return b1
+    elseif kind == 'uint16' then
+        return b1 + (b2 or 0) * 256
+    end
+    return b1 + (b2 or 0) * 256 + (b3 or 0) * 65536 + (b4 or 0) * 16777216
+end
+
+local View = {}
+View.__index = function(view, label)
+    local id = rawget(view, ID)
+    local layout = rawget(view, DIR) == 'incoming' and P.verified[id] ~= false and LAYOUTS[id] or nil
+    local spec = layout and layout[label]
+    local value
+    if spec == nil then
+        local parsed = parse(view)
+        value = parsed and parsed[label]
+    else
+        if spec then
+            value = decode(rawget(view, RAW), spec)
+            P.decoded = P.decoded + 1
+        end
+        -- First reads of an id: the layout must match packets.parse
+        local checked = P.verified[id] or 0
+        if checked < VERIFY_READS then
+            local parsed = parse(view)
+            if parsed then
+                if parsed[label] ~= value then
+                    P.verified[id] = false
+                    P.mismatch = string.format('0x%02X %s: %s ~= %s', id, label, tostring(value), tostring(parsed[label]))
+                    value = parsed[label]
+                else
+                    P.verified[id] = checked + 1
+                end
+            end
+        end
+    end
+    rawset(view, label, value)
+    return value
+end
+
+---============================================================================
+--- EVENT HANDLERS
+---============================================================================
+
+--- Hand one packet to its subscribers
+--- @param key any Counter key (id for incoming, 'out 0x015' for outgoing)
+local function dispatch(list, key, direction, id, original, modified, injected, blocked)
+    local view = setmetatable({[ID] = id, [RAW] = original, [DIR] = direction,
+        id = id, original = original, modified = modified, injected = injected, blocked = blocked}, View)
+    local started = os.clock()
+    for i = 1, #list do
+        local ok, err = pcall(list[i][2], view)
+        if not ok then
+            add_to_chat(167, string.format('[Packets] %s (0x%02X): %s', list[i][1], id, tostring(err)))
+        end
+    end
+    P.ms[key] = (P.ms[key] or 0) + (os.clock() - started) * 1000
+    P.handled[key] = (P.handled[key] or 0) + 1
+end
+
+local function on_incoming_chunk(id, original, modified, injected, blocked)
+    P.counts[id] = (P.counts[id] or 0) + 1
+    local list = subscribers[id]
+    if list then
+        dispatch(list, id, 'incoming', id, original, modified, injected, blocked)
+    end
+end
+
+-- Only subscribed ids are counted (outgoing traffic is not shown by id)
+local OUT_KEYS = {}
+local function on_outgoing_chunk(id, original, modified, injected, blocked)
+    local list = outgoing_subscribers[id]
+    if list then
+        local key = OUT_KEYS[id]
+        if not key then
+            key = string.format('out 0x%03X', id)
+            OUT_KEYS[id] = key
+        end
+        P.counts[key] = (P.counts[key] or 0) + 1
+        dispatch(list, key, 'outgoing', id, original, modified, injected, blocked)
+    end
+end
+
+local function on_action(act)
+    if not act then
+        return
+    end
+    local started = os.clock()
+    local category = act.category
+    for i = 1, #action_subscribers do
+        local entry = action_subscribers[i]
+        if entry[3] == nil or entry[3] == category then
+            local ok, err = pcall(entry[2], act)
+            if not ok then
+                add_to_chat(167, string.format('[Packets] %s (action): %s', entry[1], tostring(err)))
+            end
+        end
+    end
+    local key = 'action ' .. tostring(category)
+    P.counts[key] = (P.counts[key] or 0) + 1
+    P.ms[key] = (P.ms[key] or 0) + (os.clock() - started) * 1000
+end
+
+--- Register / unregister the shared handlers as subscriptions come and go
+local function sync_events()
+    local has_chunk = next(subscribers) ~= nil
+    if has_chunk and not P.chunk_event then
+        P.chunk_event = windower.raw_register_event('incoming chunk', on_incoming_chunk)
+    elseif not has_chunk and P.chunk_event then
+        windower.unregister_event(P.chunk_event)
+        P.chunk_event = nil
+    end
+    local has_outgoing = next(outgoing_subscribers) ~= nil
+    if has_outgoing and not P.outgoing_event then
+        P.outgoing_event = windower.raw_register_event('outgoing chunk', on_outgoing_chunk)
+    elseif not has_outgoing and P.outgoing_event then
+        windower.unregister_event(P.outgoing_event)
+        P.outgoing_event = nil
+    end
+    local has_action = #action_subscribers > 0
+    if has_action and not P.action_event then
+        P.action_event = windower.raw_register_event('action', on_action)
+    elseif not has_action and P.action_event then
+        windower.unregister_event(P.action_event)
+        P.action_event = nil
+    end
+end
+
+--- Replace or drop the entry of `key` in a subscriber list
+local function set_entry(list, key, entry)
+    for i = #list, 1, -1 do
+        if list[i][1] == key then
+            table.remove(list, i)
+        end
+    end
+    if entry then
+        list[#list + 1] = entry
+    end
+end
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- Subscribe to an incoming packet id (same key again replaces the handler)
+--- @param id number Packet id (0xDD, ...)
+--- @param key string Subscriber name (counters, unsubscribe)
+--- @param handler function(packet) Receives the shared lazy view
+function PacketDispatcher.subscribe(id, key, handler)
+    subscribers[id] = subscribers[id] or {}
+    set_entry(subscribers[id], key, {key, handler})
+    sync_events()
+end
+
+--- @param id number Packet id
+--- @param key string Subscriber name
+function PacketDispatcher.unsubscribe(id, key)
+    if subscribers[id] then
+        set_entry(subscribers[id], key, nil)
+        if #subscribers[id] == 0 then
+            subscribers[id] = nil
+        end
+    end
+    sync_events()
+end
+
+--- Subscribe to an outgoing packet id (same key again replaces the handler)
+--- @param id number Packet id (0x015, ...)
+--- @param key string Subscriber name
+--- @param handler function(packet) Receives the shared lazy view (no raw layouts)
+function PacketDispatcher.subscribe_outgoing(id, key, handler)
+    outgoing_subscribers[id] = outgoing_subscribers[id] or {}
+    set_entry(outgoing_subscribers[id], key, {key, handler})
+    sync_events()
+end
+
+--- @param id number Packet id
+--- @param key string Subscriber name
+function PacketDispatcher.unsubscribe_outgoing(id, key)
+    if outgoing_subscribers[id] then
+        set_entry(outgoing_subscribers[id], key, nil)
+        if #outgoing_subscribers[id] == 0 then
+            outgoing_subscribers[id] = nil
+        end
+    end
+    sync_events()
+end
+
+--- Subscribe to the action event (same key again replaces the handler)
+--- @param key string Subscriber name
+--- @param handler function(act) Windower action table
+--- @param category number|nil Only this action category (nil = all)
+function PacketDispatcher.on_action(key, handler, category)
+    set_entry(action_subscribers, key, {key, handler, category})
+    sync_events()
+end
+
+--- @param key string Subscriber name
+function PacketDispatcher.off_action(key)
+    set_entry(action_subscribers, key, nil)
+    sync_events()
+end
+
+--- Show per-id counters in chat
+function PacketDispatcher.status()
+    local keys = {}
+    for key in pairs(P.counts) do
+        keys[#keys + 1] = key
+    end
+    table.sort(keys, function(a, b) return P.counts[a] > P.counts[b] end)
+
+    local subscribed = 0
+    for _ in pairs(subscribers) do
+        subscribed = subscribed + 1
+    end
+    for _ in pairs(outgoing_subscribers) do
+        subscribed = subscribed + 1
+    end
+    add_to_chat(207, string.format('[Packets] %d packet ids / %d action handlers subscribed | %d full parses, %d raw field reads',
+        subscribed, #action_subscribers, P.parses, P.decoded))
+    for i = 1, math.min(#keys, 10) do
+        local key = keys[i]
+        local name = type(key) == 'number' and string.format('0x%03X', key) or key
+        local handled = P.handled[key]
+        add_to_chat(207, string.format('[Packets]   %-10s seen %6d%s | %.1f ms in handlers', name, P.counts[key],
+            handled and string.format(', to subscribers %d', handled) or '', P.ms[key] or 0))
+    end
+    for id in pairs(LAYOUTS) do
+        if P.verified[id] == false then
+            add_to_chat(167, '[Packets] Raw layout off after a mismatch: ' .. tostring(P.mismatch))
+        end
+    end
+end
+
+--- Reset the counters (layout checks included)
+function PacketDispatcher.reset()
+    P.counts, P.handled, P.ms, P.verified = {}, {}, {}, {}
+    P.parses, P.decoded, P.mismatch = 0, 0, nil
+end
+
+return PacketDispatcher
@@ -0,0 +1,341 @@
+---============================================================================
+--- Warm Reload - Keep job-agnostic modules loaded across job changes
+---============================================================================
+--- A job change sends `gs reload`, which drops package.loaded and runs the
+--- shared graph again. In warm mode JobChangeManager hands the loaded
+--- modules of the allowlist (shared/config/WARM_RELOAD_CONFIG.lua) to the
+--- windower table when the job file unloads, and INIT_SYSTEMS puts them
+--- back in package.loaded on the next load, so only the job entry, sets,
+--- job functions/ and the stateful systems run again.
+---
+--- Self-check (the next load falls back to a cold reload on any failure):
+---   • Eligibility, per module and cached per source stamp: the compiled
+---     file writes no globals, reads only STABLE_GLOBALS, requires no
+---     character file, no computed module name, and only modules that pass
+---     the same check (a kept module holds its requires in upvalues) or are
+---     declared load-time helpers (DataPack).
+---   • On restore: same character, same allowlist, every source file still
+---     has its captured content stamp (size + Adler-32, FileStamp), and
+---     every global the kept modules read is still the same object (they
+---     keep the environment they were loaded in, so player/windower/
+---     add_to_chat must be the shared ones).
+---   • A load that ends without gear sets (error in get_sets) is not
+---     captured: the next one is cold.
+---   • Packed data modules (DataPack) get their lazy text loaded before
+---     capture, so no kept record holds a loader of the old load.
+---
+--- Usage:
+---   //gs c warmreload [on|off|status|check]  (off by default, persisted in
+---   data/.warm_reload_on; a manual //gs c reload is always cold)
+---
+--- @file    utils/core/warm_reload.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local WarmReload = {}
+
+local DebugLogger = require('shared/utils/debug/debug_logger')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local STATE_FILE = windower.addon_path .. 'data/.warm_reload_on'
+local CONFIG_MODULE = 'shared/config/WARM_RELOAD_CONFIG'
+
+-- Globals that are the same object in every GearSwap load (Lua library,
+-- Windower libraries, GearSwap's live tables). Anything else - state, sets,
+-- _G, Mote functions, package - belongs to one load.
+local STABLE_GLOBALS = {}
+for name in ([[
+    assert collectgarbage dofile error getmetatable ipairs loadstring next pairs pcall print
+    rawequal rawget rawset select setmetatable tonumber tostring type unpack xpcall
+    coroutine io math os string table require
+    windower gearswap add_to_chat send_command player world buffactive alliance party pet fellow
+    T S L
+]]):gmatch('%S+') do
+    STABLE_GLOBALS[name] = true
+end
+
+-- Cache and counters live in the windower table (survive reloads)
+if not windower._warm_reload then
+    local state_file = io.open(STATE_FILE, 'r')
+    windower._warm_reload = {
+        enabled = state_file ~= nil,
+        cache = nil,        -- {char, allowlist, modules = {[name] = {module, stamp}}, globals = {[name] = value}}
+        eligible = {},      -- [name] = {stamp, ok, reason, reads}
+        loading = false,    -- a load is running (no capture from its get_sets)
+        warm = 0,           -- loads that restored the cache
+        cold = 0,           -- loads that fell back to a cold reload
+        restored = 0,       -- modules put back (last warm load)
+        last_reason = nil,  -- why the last load was cold
+    }
+    if state_file then
+        state_file:close()
+    end
+end
+local W = windower._warm_reload
+
+---============================================================================
+--- ELIGIBILITY
+---============================================================================
+
+--- Source path of a module
+local function module_path(name)
+    return windower.addon_path .. 'data/' .. name .. '.lua'
+end
+
+--- Allowlist entries (lowercase), their signature and the load-time helpers
+--- @return table entries, string signature, table load_time ([name] = true)
+local function allowlist()
+    local ok, config = pcall(require, CONFIG_MODULE)
+    config = ok and type(config) == 'table' and config or {}
+    local entries, load_time, helpers = {}, {}, {}
+    for _, entry in ipairs(config.modules or {}) do
+        entries[#entries + 1] = entry:lower()
+    end
+    for _, name in ipairs(config.load_time or {}) do
+        load_time[name:lower()] = true
+        helpers[#helpers + 1] = name:lower()
+    end
+    return entries, table.concat(entries, ';') .. '|' .. table.concat(helpers, ';'), load_time
+end
+
+--- @return boolean True when the module is listed (exactly or by folder)
+local function allowed(name, entries)
+    local lower = name:lower()
+    for _, entry in ipairs(entries) do
+        if lower == entry or (entry:sub(-1) == '/' and lower:sub(1, #entry) == entry) then
+            return true
+        end
+    end
+    return false
+end
+
+--- Check that a module can be kept across reloads (cached per source stamp)
+--- @param name string Module name
+--- @param visiting table|nil Modules being checked (require cycles)
+--- @return boolean ok, string|nil reason
+local function check_module(name, visiting)
+    local key = name:lower()
+    local path = module_path(name)
+    local source = FileStamp.read(path)
+    if not source then
+        return false, 'no source file'
+    end
+    local stamp = {#source, FileStamp.checksum(path, source)}
+    local known = W.eligible[key]
+    if known and known.stamp and known.stamp[1] == stamp[1] and known.stamp[2] == stamp[2] then
+        return known.ok, known.reason
+    end
+    visiting = visiting or {}
+    if visiting[key] then
+        return true
+    end
+    visiting[key] = true
+
+    local reason
+    local chunk = loadstring(source)
+    local BytecodeCache = require('shared/utils/core/bytecode_cache')
+    local found = chunk and BytecodeCache.inspect(string.dump(chunk))
+    if not found then
+        reason = 'does not compile'
+    elseif next(found.writes) then
+        reason = 'writes global ' .. next(found.writes)
+    elseif found.dynamic then
+        reason = 'computed require()'
+    else
+        for global in pairs(found.reads) do
+            if not STABLE_GLOBALS[global] then
+                reason = 'reads global ' .. global
+                break
+            end
+        end
+        local _, _, load_time = allowlist()
+        for dep in pairs(found.requires) do
+            if reason then break end
+            if load_time[dep:lower()] then
+                -- Used while the module loads only: its state does not matter
+            elseif dep:lower():sub(1, 7) == 'shared/' then
+                if not check_module(dep, visiting) then
+                    reason = 'requires ' .. dep
+                end
+            elseif dep:find('/') then
+                reason = 'requires ' .. dep
+            end
+        end
+    end
+
+    W.eligible[key] = {stamp = stamp, ok = reason == nil, reason = reason,
+        reads = found and found.reads}
+    return reason == nil, reason
+end
+
+---============================================================================
+--- CAPTURE / RESTORE
+---============================================================================
+
+--- Drop the cache: the next load is cold
+--- @param reason string Shown by //gs c warmreload status
+function WarmReload.drop(reason)
+    if W.cache then
+        DebugLogger.logf_if('JOBCHANGE_DEBUG', 'WarmReload', 'Cold reload: %s', reason)
+    end
+    W.cache = nil
+    W.last_reason = reason
+end
+
+--- Hand the loaded allowlisted modules to the windower table
+--- (JobChangeManager: job file unload, job change before `gs reload`)
+--- @return number Modules kept
+function WarmReload.capture()
+    if not W.enabled or W.loading or type(package) ~= 'table' or type(package.loaded) ~= 'table' then
+        return 0
+    end
+    if type(sets) ~= 'table' or next(sets) == nil then
+        WarmReload.drop('last load did not finish')
+        return 0
+    end
+    local entries, signature = allowlist()
+    local cache = {char = player and player.name, allowlist = signature, modules = {}, globals = {}}
+    local DataPack = package.loaded['shared/utils/data/data_pack']
+    local count = 0
+    for name, module in pairs(package.loaded) do
+        if type(name) == 'string' and type(module) == 'table' and allowed(name, entries)
+            and check_module(name) then
+            -- Packed data: load the lazy text now, its loader belongs to this load
+            if type(DataPack) == 'table' and DataPack.load_text then
+                DataPack.load_text(module)
+            end
+            cache.modules[name] = {module = module, stamp = W.eligible[name:lower()].stamp}
+            for global in pairs(W.eligible[name:lower()].reads or {}) do
+                cache.globals[global] = true
+            end
+            count = count + 1
+        end
+    end
+    for global in pairs(cache.globals) do
+        cache.globals[global] = {value = _G[global]}
+    end
+    W.cache = count > 0 and cache or nil
+    DebugLogger.logf_if('JOBCHANGE_DEBUG', 'WarmReload', 'Captured %d modules', count)
+    return count
+end
+
+--- Why the cache cannot be used by this load (nil when it can)
+--- @return string|nil reason
+local function stale_reason(cache)
+    if cache.char ~= (player and player.name) then
+        return 'character changed'
+    end
+    local _, signature = allowlist()
+    if cache.allowlist ~= signature then
+        return 'allowlist changed'
+    end
+    for name, entry in pairs(cache.modules) do
+        if not FileStamp.matches(module_path(name), entry.stamp) then
+            return name .. ' changed'
+        end
+    end
+    for global, entry in pairs(cache.globals) do
+        if not rawequal(_G[global], entry.value) then
+            return 'global ' .. global .. ' is a new object'
+        end
+    end
+    return nil
+end
+
+--- Put the cached modules back into package.loaded (INIT_SYSTEMS, every load).
+--- Modules this load already required keep their fresh copy.
+--- @return number Modules restored
+function WarmReload.restore()
+    local cache = W.cache
+    if not W.enabled or type(package) ~= 'table' or type(package.loaded) ~= 'table' then
+        return 0
+    end
+    -- No capture until this load is over (the scheduler runs after it)
+    W.loading = true
+    coroutine.schedule(function() W.loading = false end, 0)
+    if not cache then
+        return 0
+    end
+    -- One use per capture: this load's unload captures again
+    W.cache = nil
+    local reason = stale_reason(cache)
+    if reason then
+        W.cold = W.cold + 1
+        WarmReload.drop(reason)
+        add_to_chat(207, '[WarmReload] Cold reload: ' .. reason)
+        return 0
+    end
+
+    local restored = 0
+    for name, entry in pairs(cache.modules) do
+        if package.loaded[name] == nil then
+            package.loaded[name] = entry.module
+            restored = restored + 1
+        end
+    end
+    W.warm = W.warm + 1
+    W.restored = restored
+    W.last_reason = nil
+    DebugLogger.logf_if('JOBCHANGE_DEBUG', 'WarmReload', 'Restored %d modules', restored)
+    return restored
+end
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- @return boolean
+function WarmReload.is_enabled()
+    return W.enabled == true
+end
+
+--- Enable or disable warm job changes (persisted in data/.warm_reload_on)
+--- @param enabled boolean
+function WarmReload.set_enabled(enabled)
+    W.enabled = enabled
+    if enabled then
+        local file = io.open(STATE_FILE, 'w')
+        if file then
+            file:write('on')
+            file:close()
+        end
+    else
+        os.remove(STATE_FILE)
+        WarmReload.drop('warm mode off')
+    end
+    add_to_chat(207, '[WarmReload] ' .. (enabled and 'ON - job changes keep the allowlisted modules loaded'
+        or 'OFF - every job change is a full reload'))
+end
+
+--- Show state and counters in chat
+function WarmReload.status()
+    add_to_chat(207, string.format('[WarmReload] %s | warm loads %d (%d modules last), cold fallbacks %d',
+        W.enabled and 'ON' or 'OFF', W.warm, W.restored, W.cold))
+    if W.last_reason then
+        add_to_chat(207, '[WarmReload] Last cold reload: ' .. W.last_reason)
+    end
+end
+
+--- Run the eligibility check on every allowlisted module loaded now
+--- @return table {kept = n, refused = {"name: reason", ...}}
+function WarmReload.check()
+    local entries = allowlist()
+    local result = {kept = 0, refused = {}}
+    W.eligible = {}
+    for name, module in pairs(type(package) == 'table' and package.loaded or {}) do
+        if type(name) == 'string' and type(module) == 'table' and allowed(name, entries) then
+            local ok, reason = check_module(name)
+            if ok then
+                result.kept = result.kept + 1
+            else
+                table.insert(result.refused, name .. ': ' .. tostring(reason))
+            end
+        end
+    end
+    table.sort(result.refused)
+    return result
+end
+
+return WarmReload
@@ -0,0 +1,222 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Action Index - One name -> database lookup for spells, abilities and WS
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Spell, job ability and weapon skill data is spread over ~50 merged
+---   databases (shared/data/magic/*_DATABASE, <JOB>_JA_DATABASE built by
+---   JA_DATABASE_FACTORY, *_WS_DATABASE). Consumers used to scan them in
+---   priority order until the name turned up, loading each one on the way.
+---   The index tells them which database(s) hold a name, so they open only
+---   those; the record itself still comes from the database (one copy).
+---
+---   Load order (first hit wins):
+---     1. windower._action_index - loaded earlier in this Windower session.
+---        windower.* survives `gs reload`, so job changes pay nothing.
+---     2. shared/data/packed/action_index.lua - written by action_index.py.
+---        Used only while every source module still has the recorded content
+---        stamp (size + Adler-32, FileStamp; same rule as DataPack).
+---     3. None - get() returns nil and consumers keep their full scan.
+---
+---   Entry: {kind, owners = {[key] = true}}
+---     owners keys: magic database module path (spell), job code (ability),
+---     weapon type (ws). Owner sets are shared between entries.
+---
+---   Public API:
+---     • ActionIndex.get(kind, name)  -> entry|nil  (kind: 'spell'|'ability'|'ws')
+---     • ActionIndex.available()      -> boolean (loads the index)
+---     • ActionIndex.stats            -> {source, count, ms, hits, misses}
+---     • ActionIndex.check()          -> index vs databases (//gs c actionindex check)
+---     • ActionIndex.reset()
+---
+---   @file    shared/utils/data/action_index.lua
+---   @author  Tetsouo
+---   @version 1.0
+---   @date    Created: 2026-10-18
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local ActionIndex = {}
+
+local DebugLogger = require('shared/utils/debug/debug_logger')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local INDEX_VERSION = 2
+local INDEX_PATH = 'shared/data/packed/action_index.lua'
+local KINDS = {'spell', 'ability', 'ws'}
+
+-- {source = 'session'|'prebuilt'|'none', count, ms, hits, misses}
+ActionIndex.stats = {source = nil, count = 0, ms = 0, hits = 0, misses = 0}
+
+-- Active index: {version, count, spell = {}, ability = {}, ws = {}} or false
+local index = nil
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   LOAD
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Load the prebuilt index if every source still has its recorded stamp
+--- @return table|nil pack
+local function load_prebuilt()
+    local root = windower.addon_path .. 'data/'
+    local ok, pack = pcall(dofile, root .. INDEX_PATH)
+    if not ok or type(pack) ~= 'table' or pack.version ~= INDEX_VERSION
+        or type(pack.sources) ~= 'table' or type(pack.strings) ~= 'table' or type(pack.owners) ~= 'table' then
+        return nil
+    end
+    for _, source in ipairs(pack.sources) do
+        if not FileStamp.matches(root .. source[1], {source[2], source[3]}) then
+            DebugLogger.logf_if('DATA_DEBUG', 'ActionIndex', 'Stale index: %s changed', source[1])
+            return nil
+        end
+    end
+    return pack
+end
+
+--- Expand the interned rows into entries
+--- @param pack table Prebuilt index
+--- @return table index
+local function decode(pack)
+    local strings = pack.strings
+    local owner_sets = {}
+    for i, ids in ipairs(pack.owners) do
+        local set = {}
+        for _, id in ipairs(ids) do
+            set[strings[id]] = true
+        end
+        owner_sets[i] = set
+    end
+
+    local result = {version = INDEX_VERSION, count = 0}
+    for _, kind in ipairs(KINDS) do
+        local entries = {}
+        for name, owners_id in pairs(pack[kind] or {}) do
+            entries[name] = {kind = kind, owners = owner_sets[owners_id]}
+            result.count = result.count + 1
+        end
+        result[kind] = entries
+    end
+    return result
+end
+
+--- Resolve the active index (session -> prebuilt -> none)
+--- @return table|false index
+local function ensure()
+    if index ~= nil then
+        return index
+    end
+
+    local persisted = windower._action_index
+    if type(persisted) == 'table' and persisted.version == INDEX_VERSION then
+        index = persisted
+        ActionIndex.stats.source, ActionIndex.stats.count, ActionIndex.stats.ms = 'session', persisted.count, 0
+        return index
+    end
+
+    local started = os.clock()
+    local pack = load_prebuilt()
+    if pack then
+        index = decode(pack)
+        windower._action_index = index
+    else
+        index = false
+    end
+
+    local ms = (os.clock() - started) * 1000
+    ActionIndex.stats.source = pack and 'prebuilt' or 'none'
+    ActionIndex.stats.count = index and index.count or 0
+    ActionIndex.stats.ms = ms
+    DebugLogger.logf_if('DATA_DEBUG', 'ActionIndex', 'Loaded from %s: %d actions in %.0f ms',
+        ActionIndex.stats.source, ActionIndex.stats.count, ms)
+    return index
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PUBLIC API
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Index entry of an action
+--- @param kind string 'spell', 'ability' or 'ws'
+--- @param name string Action name (exact case, as in the databases)
+--- @return table|nil Entry, nil when there is no index or the name is unknown
+function ActionIndex.get(kind, name)
+    local idx = ensure()
+    if not idx or not idx[kind] or type(name) ~= 'string' then
+        return nil
+    end
+    local entry = idx[kind][name]
+    if entry then
+        ActionIndex.stats.hits = ActionIndex.stats.hits + 1
+    else
+        ActionIndex.stats.misses = ActionIndex.stats.misses + 1
+    end
+    return entry
+end
+
+--- Load the index if needed
+--- @return boolean True when an index is in use
+function ActionIndex.available()
+    return ensure() ~= false
+end
+
+--- Compare the index with the databases it was built from (loads all of them).
+--- Every name of every database must be indexed with that database as an
+--- owner, and every owner must hold the name.
+--- @return table|nil {checked, missing = {..}, extra = {..}}, nil without index
+function ActionIndex.check()
+    local idx = ensure()
+    if not idx then
+        return nil
+    end
+    local result = {checked = 0, missing = {}, extra = {}}
+
+    local function compare(kind, owner, names)
+        for name in pairs(names) do
+            result.checked = result.checked + 1
+            local entry = idx[kind][name]
+            if not (entry and entry.owners[owner]) then
+                table.insert(result.missing, kind .. ' ' .. name .. ' (' .. owner .. ')')
+            end
+        end
+        for name, entry in pairs(idx[kind]) do
+            if entry.owners[owner] and names[name] == nil then
+                table.insert(result.extra, kind .. ' ' .. name .. ' (' .. owner .. ')')
+            end
+        end
+    end
+
+    -- Owner keys come from the index itself (one database per key)
+    local owners = {spell = {}, ability = {}, ws = {}}
+    for kind, keys in pairs(owners) do
+        for _, entry in pairs(idx[kind]) do
+            for key in pairs(entry.owners) do
+                keys[key] = true
+            end
+        end
+    end
+
+    for path in pairs(owners.spell) do
+        local ok, db = pcall(require, path)
+        compare('spell', path, ok and type(db) == 'table' and db.spells or {})
+    end
+    for job in pairs(owners.ability) do
+        local ok, db = pcall(require, 'shared/data/job_abilities/' .. job .. '_JA_DATABASE')
+        compare('ability', job, ok and type(db) == 'table' and (db.abilities or db) or {})
+    end
+    local ok, UniversalWS = pcall(require, 'shared/data/weaponskills/UNIVERSAL_WS_DATABASE')
+    local weapon_types = ok and UniversalWS.load().weapon_types or {}
+    for weapon_type in pairs(owners.ws) do
+        local info = weapon_types[weapon_type]
+        local db_ok, db = pcall(require, 'shared/data/weaponskills/' .. (info and info.file or weapon_type))
+        compare('ws', weapon_type, db_ok and type(db) == 'table' and db.weaponskills or {})
+    end
+
+    table.sort(result.missing)
+    table.sort(result.extra)
+    return result
+end
+
+--- Drop the session index (next lookup reloads the prebuilt file)
+function ActionIndex.reset()
+    index = nil
+    windower._action_index = nil
+end
+
+return ActionIndex
@@ -33,6 +33,9 @@ local DataLoader = {}
 -- Debug logging (silent unless DATA_DEBUG is toggled) - avoids direct print()
 local DebugLogger = require('shared/utils/debug/debug_logger')
 
+-- Packed data modules (pack_databases.py), source module fallback
+local DataPack = require('shared/utils/data/data_pack')
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   GLOBAL DATA TABLE (Accessible everywhere via _G)
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -159,7 +162,7 @@ function DataLoader.load_abilities()
     for _, job in ipairs(ABILITY_JOBS) do
         for _, type in ipairs(ABILITY_TYPES) do
             local path = string.format('shared/data/job_abilities/%s/%s_%s', job, job, type)
-            local success, db = pcall(require, path)
+            local success, db = pcall(DataPack.require, path)
 
             if success and db and db.abilities then
                 -- Merge abilities
@@ -197,7 +200,7 @@ function DataLoader.load_abilities()
         }
 
         for _, path in ipairs(special_patterns) do
-            local success, db = pcall(require, path)
+            local success, db = pcall(DataPack.require, path)
             if success and db and db.abilities then
                 for ability_name, ability_data in pairs(db.abilities) do
                     if not _G.FFXI_DATA.abilities[ability_name] then
@@ -226,7 +229,7 @@ function DataLoader.load_weaponskills()
     local ws_count = 0
 
     for _, db_path in ipairs(WEAPONSKILL_DATABASES) do
-        local success, db = pcall(require, db_path)
+        local success, db = pcall(DataPack.require, db_path)
         if success and db and db.weaponskills then
             -- Merge all weaponskills
             for ws_name, ws_data in pairs(db.weaponskills) do
@@ -0,0 +1,235 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Data Pack Loader - Packed spell / weapon skill / job ability modules
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Loads shared/data/packed/<module>.lua generated by pack_databases.py in
+---   place of the source data module. A pack stores each record table as a
+---   name array + one dense array per hot field (element, skillchain, ftp,
+---   mods, jobs, level...); cold text (description, notes, special_notes...)
+---   lives in <module>_text.lua and is read the first time one of those fields
+---   is accessed on any record of the module.
+---
+---   The rebuilt records are plain tables with the same fields as the source
+---   module, so consumers (facades, JA factory, UNIVERSAL_* databases) keep
+---   using data[name].field unchanged.
+---
+---   Safety:
+---     - A pack is used only while the source file still has the recorded
+---       content stamp (size + Adler-32, FileStamp); otherwise (or on any
+---       error) the source module is required.
+---     - Full packs are registered in package.loaded under the source module
+---       name, so a later plain require() returns the same tables.
+---     - `partial` packs (sources that also define helper functions) are
+---       returned to DataPack.require() callers only; require() still loads
+---       the complete source module.
+---
+---   Usage:
+---     local DataPack = require('shared/utils/data/data_pack')
+---     local songs = DataPack.require('shared/data/magic/song/song_buffs')
+---     DataPack.load_text(songs)   -- force the cold text (warm reload capture)
+---
+---   @file    shared/utils/data/data_pack.lua
+---   @author  Tetsouo
+---   @version 1.0
+---   @date    Created: 2026-10-18
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local DataPack = {}
+
+local DebugLogger = require('shared/utils/debug/debug_logger')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local PACK_VERSION = 2
+local SOURCE_ROOT = 'shared/data/'
+local PACK_ROOT = 'shared/data/packed/'
+
+-- Partial packs, keyed by source module name (not in package.loaded)
+local partial_cache = {}
+
+-- Modules whose cold text is not loaded yet: [module] = loader
+local pending_text = setmetatable({}, {__mode = 'k'})
+
+-- Load counters (//gs c datapack)
+DataPack.stats = {packed = 0, source = 0, stale = 0, text_loads = 0}
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   FILE HELPERS
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local function data_root()
+    return windower.addon_path .. 'data/'
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   RECORD BUILD
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Rebuild the records of one group from its columns
+--- @param group table {names, fields, columns}
+--- @return table records name -> record
+local function build_records(group)
+    local names, fields, columns = group.names, group.fields, group.columns
+    local field_count = #fields
+    local records = {}
+    for i = 1, #names do
+        local record = {}
+        for f = 1, field_count do
+            local value = columns[f][i]
+            if value ~= nil then
+                record[fields[f]] = value
+            end
+        end
+        records[names[i]] = record
+    end
+    return records
+end
+
+--- Attach the lazy text loader to every record of a pack.
+--- The first read of a cold field fills all cold fields of the module, then
+--- the metatables are removed (records become plain tables again).
+--- @param pack table Loaded pack
+--- @param built table group -> records
+--- @return function|nil Loader (nil when the pack has no cold text)
+local function attach_text(pack, built)
+    local cold_fields = {}
+    for _, group in pairs(pack.groups) do
+        for _, field in ipairs(group.cold or {}) do
+            cold_fields[field] = true
+        end
+    end
+    if not next(cold_fields) then return nil end
+
+    local text_path = pack.text
+    local names = {}
+    for group_name, group in pairs(pack.groups) do
+        names[group_name] = group.names
+    end
+
+    local function load_text()
+        if not next(cold_fields) then
+            return
+        end
+        cold_fields = {}
+
+        local ok, text = pcall(dofile, data_root() .. text_path .. '.lua')
+        for group_name, records in pairs(built) do
+            local group_names = names[group_name]
+            local columns = ok and type(text) == 'table' and text[group_name]
+            for i = 1, #group_names do
+                local row = records[group_names[i]]
+                if columns then
+                    for field, column in pairs(columns) do
+                        if column[i] ~= nil then
+                            rawset(row, field, column[i])
+                        end
+                    end
+                end
+                setmetatable(row, nil)
+            end
+        end
+        DataPack.stats.text_loads = DataPack.stats.text_loads + 1
+        DebugLogger.logf_if('DATA_DEBUG', 'DataPack', 'Text loaded: %s (%s)', text_path, ok and 'ok' or 'error')
+    end
+
+    local meta = {}
+    meta.__index = function(record, key)
+        if not cold_fields[key] then
+            return nil
+        end
+        load_text()
+        return rawget(record, key)
+    end
+
+    for _, records in pairs(built) do
+        for _, record in pairs(records) do
+            setmetatable(record, meta)
+        end
+    end
+    return load_text
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PUBLIC API
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Load a packed module if it matches its source.
+--- @param module_path string Source module name (e.g. 'shared/data/magic/song/song_buffs')
+--- @return table|nil module Rebuilt module table
+--- @return boolean|string partial flag on success, reason ('missing'|'stale'|'error') on failure
+function DataPack.load(module_path)
+    if module_path:sub(1, #SOURCE_ROOT) ~= SOURCE_ROOT then
+        return nil, 'missing'
+    end
+    local root = data_root()
+    local ok, pack = pcall(dofile, root .. PACK_ROOT .. module_path:sub(#SOURCE_ROOT + 1) .. '.lua')
+    if not ok or type(pack) ~= 'table' or pack.version ~= PACK_VERSION
+        or type(pack.source) ~= 'table' or type(pack.groups) ~= 'table' then
+        return nil, 'missing'
+    end
+    if not FileStamp.matches(root .. pack.source.path, {pack.source.size, pack.source.adler32}) then
+        return nil, 'stale'
+    end
+
+    local built_ok, module = pcall(function()
+        local result = {}
+        for key, value in pairs(pack.plain or {}) do
+            result[key] = value
+        end
+        local built = {}
+        for group_name, group in pairs(pack.groups) do
+            built[group_name] = build_records(group)
+            result[group_name] = built[group_name]
+        end
+        pending_text[result] = attach_text(pack, built)
+        return result
+    end)
+    if not built_ok then
+        return nil, 'error'
+    end
+    return module, pack.partial == true
+end
+
+--- Load the cold text of a packed module now (no-op when already loaded or
+--- not a pack). Its records become plain tables, with no closure of this
+--- load left on them (WarmReload keeps modules across reloads).
+--- @param module table Module returned by DataPack.load / DataPack.require
+--- @return boolean True when the text was still pending
+function DataPack.load_text(module)
+    local load_text = pending_text[module]
+    if not load_text then
+        return false
+    end
+    pending_text[module] = nil
+    load_text()
+    return true
+end
+
+--- require() replacement for the static data modules.
+--- Returns the packed module when it is fresh, the source module otherwise.
+--- @param module_path string Source module name
+--- @return table Module table
+function DataPack.require(module_path)
+    local loaded = package.loaded[module_path] or partial_cache[module_path]
+    if loaded then
+        return loaded
+    end
+
+    local module, info = DataPack.load(module_path)
+    if not module then
+        if info == 'stale' then
+            DataPack.stats.stale = DataPack.stats.stale + 1
+            DebugLogger.logf_if('DATA_DEBUG', 'DataPack', 'Stale pack: %s', module_path)
+        end
+        DataPack.stats.source = DataPack.stats.source + 1
+        return require(module_path)
+    end
+
+    DataPack.stats.packed = DataPack.stats.packed + 1
+    if info then
+        partial_cache[module_path] = module
+    else
+        package.loaded[module_path] = module
+    end
+    return module
+end
+
+return DataPack
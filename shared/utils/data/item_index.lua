@@ -0,0 +1,194 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Item Index - Shared item name <-> resource ID lookup
+---  ═══════════════════════════════════════════════════════════════════════════
+---   One name/ID index for every module that needs to go from an item name to
+---   its ID (refill, warp rings) or from an ID to its name variants (wardrobe
+---   audit). Replaces the per-module walks over res.items (~30k entries).
+---
+---   Load order (first hit wins):
+---     1. windower._item_index - built earlier in this Windower session.
+---        windower.* survives `gs reload`, so job changes pay nothing.
+---     2. shared/data/packed/item_index.lua - written by build_item_index.py
+---        from Windower's res/items.lua. Used only while res/items.lua still
+---        has the recorded content stamp (size + Adler-32, FileStamp); if
+---        res/items.lua cannot be read the index is not trusted.
+---     3. res.items scan - the old one-time cost, as a fallback.
+---
+---   Only `en` and `enl` are stored: the resources library serves `name`,
+---   `english`, `name_log` and `english_log` from those two fields.
+---   Name keys are lowercase; on collisions the lowest item ID wins.
+---
+---   Public API:
+---     • ItemIndex.id_of(name)     -> number|nil
+---     • ItemIndex.name_of(id)     -> string|nil  (en form)
+---     • ItemIndex.names_of(id)    -> list of lowercase variants
+---     • ItemIndex.stats           -> {source, count, ms}
+---
+---   @file    shared/utils/data/item_index.lua
+---   @author  Tetsouo
+---   @version 1.0
+---   @date    Created: 2026-10-18
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local ItemIndex = {}
+
+local DebugLogger = require('shared/utils/debug/debug_logger')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local INDEX_VERSION = 2
+local INDEX_PATH = 'shared/data/packed/item_index.lua'
+local SOURCE_PATH = 'res/items.lua'
+
+-- {source = 'session'|'prebuilt'|'scan', count = number, ms = number}
+ItemIndex.stats = {source = nil, count = 0, ms = 0}
+
+-- Active index: {en = {[id]=name}, enl = {[id]=name}, ids = {[lower]=id}}
+local index = nil
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   BUILD
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Derive the lowercase name -> id map from the en / enl maps
+--- @param en table {[id] = name}
+--- @param enl table {[id] = name}
+--- @return table ids, number count
+local function build_ids(en, enl)
+    local ids = {}
+    local count = 0
+    for _, names in ipairs({en, enl}) do
+        for id, name in pairs(names) do
+            local key = name:lower()
+            local current = ids[key]
+            if not current or id < current then
+                ids[key] = id
+            end
+        end
+    end
+    for _ in pairs(en) do
+        count = count + 1
+    end
+    return ids, count
+end
+
+--- Load the prebuilt index if it matches res/items.lua
+--- @return table|nil en, table|nil enl
+local function load_prebuilt()
+    local ok, pack = pcall(dofile, windower.addon_path .. 'data/' .. INDEX_PATH)
+    if not ok or type(pack) ~= 'table' or pack.version ~= INDEX_VERSION
+        or type(pack.en) ~= 'table' or type(pack.enl) ~= 'table' then
+        return nil
+    end
+    -- Checked once per session (the index is kept in the windower table)
+    local source = (windower.windower_path or '') .. SOURCE_PATH
+    local stamp = FileStamp.of(source)
+    if not stamp then
+        DebugLogger.logf_if('DATA_DEBUG', 'ItemIndex', 'Cannot read %s, prebuilt index not checked',
+            SOURCE_PATH)
+        return nil
+    end
+    if type(pack.source) ~= 'table' or stamp[1] ~= pack.source[1] or stamp[2] ~= pack.source[2] then
+        DebugLogger.logf_if('DATA_DEBUG', 'ItemIndex', 'Stale index: %s does not match %s',
+            INDEX_PATH, SOURCE_PATH)
+        return nil
+    end
+    return pack.en, pack.enl
+end
+
+--- Walk res.items once (fallback when no prebuilt index is usable)
+--- @return table en, table enl
+local function scan_resources()
+    local res = require('resources')
+    local en, enl = {}, {}
+    for id, item in pairs(res.items) do
+        if type(id) == 'number' and item then
+            local short = item.en
+            local long = item.enl
+            if type(short) == 'string' and short ~= '' then
+                en[id] = short
+                if type(long) == 'string' and long ~= '' and long:lower() ~= short:lower() then
+                    enl[id] = long
+                end
+            end
+        end
+    end
+    return en, enl
+end
+
+--- Resolve the active index (session -> prebuilt -> scan)
+--- @return table index
+local function ensure()
+    if index then
+        return index
+    end
+
+    local persisted = windower._item_index
+    if type(persisted) == 'table' and persisted.version == INDEX_VERSION then
+        index = persisted
+        ItemIndex.stats = {source = 'session', count = persisted.count, ms = 0}
+        return index
+    end
+
+    local started = os.clock()
+    local source = 'prebuilt'
+    local en, enl = load_prebuilt()
+    if not en then
+        source = 'scan'
+        en, enl = scan_resources()
+    end
+    local ids, count = build_ids(en, enl)
+
+    index = {version = INDEX_VERSION, en = en, enl = enl, ids = ids, count = count}
+    windower._item_index = index
+
+    local ms = (os.clock() - started) * 1000
+    ItemIndex.stats = {source = source, count = count, ms = ms}
+    DebugLogger.logf_if('DATA_DEBUG', 'ItemIndex', 'Built from %s: %d items in %.0f ms', source, count, ms)
+    return index
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PUBLIC API
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Resolve an item name (en or log form, any case) to its resource ID
+--- @param name string Item name
+--- @return number|nil Item ID
+function ItemIndex.id_of(name)
+    if type(name) ~= 'string' then
+        return nil
+    end
+    return ensure().ids[name:lower()]
+end
+
+--- Short (en) name of an item
+--- @param id number Item ID
+--- @return string|nil Name
+function ItemIndex.name_of(id)
+    return ensure().en[id]
+end
+
+--- Every lowercase name variant of an item (en first, then log form)
+--- @param id number Item ID
+--- @return table List of lowercase names (empty if unknown)
+function ItemIndex.names_of(id)
+    local idx = ensure()
+    local names = {}
+    local short = idx.en[id]
+    if short then
+        table.insert(names, short:lower())
+        local long = idx.enl[id]
+        if long then
+            table.insert(names, long:lower())
+        end
+    end
+    return names
+end
+
+--- Drop the session index (next lookup reloads the prebuilt file or rescans)
+function ItemIndex.reset()
+    index = nil
+    windower._item_index = nil
+end
+
+return ItemIndex
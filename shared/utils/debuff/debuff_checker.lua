@@ -10,10 +10,18 @@
 ---     - Aggressor >> Amnesia (blocks JA/WS)
 ---     - Warcry    >> Stun (blocks EVERYTHING)
 ---
+---   Blocking debuffs are tracked incrementally: DoomManager feeds every
+---   buff_change to DebuffChecker.on_buff_change(), which keeps the current
+---   blocker of each action kind, so a precast check is a single read.
+---   A blocker is confirmed in buffactive before it is returned (a missed
+---   buff_change must not block actions); if it is gone the state is read
+---   again. //gs c debuffbench (or python debuff_check.py) checks it against
+---   the per-action scan.
+---
 ---   @file    shared/utils/debuff/debuff_checker.lua
 ---   @author  Tetsouo
----   @version 1.3 - DRY refactor: Helper function for check_X_blocked() (-30 lines)
----   @date    Created: 2025-10-02 | Updated: 2025-11-13
+---   @version 1.4 - Incremental blocker state (precast check = one read)
+---   @date    Created: 2025-10-02 | Updated: 2026-10-18
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 local DebuffChecker = {}
@@ -125,7 +133,7 @@ else
 end
 
 ---  ═══════════════════════════════════════════════════════════════════════════
----   DETECTION FUNCTIONS
+---   REFERENCE SCAN (//gs c debuffbench)
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 --- Get the highest priority debuff from a list
@@ -155,7 +163,7 @@ local function get_active_blocking_debuff(debuff_list)
 end
 
 --- Helper: Check if action is blocked by universal or specific debuffs
---- @param specific_debuffs table Specific debuff list to check
+--- @param specific_debuffs table|nil Specific debuff list to check (nil = universal only)
 --- @return boolean blocked True if action is blocked
 --- @return string|nil debuff_name The debuff blocking the action
 --- @return string|nil message User-friendly message
@@ -167,7 +175,7 @@ local function check_blocking_debuffs(specific_debuffs)
     end
 
     -- Check specific blocks
-    local specific_debuff, specific_msg = get_active_blocking_debuff(specific_debuffs)
+    local specific_debuff, specific_msg = get_active_blocking_debuff(specific_debuffs or {})
     if specific_debuff then
         return true, specific_debuff, specific_msg
     end
@@ -175,12 +183,134 @@ local function check_blocking_debuffs(specific_debuffs)
     return false, nil, nil
 end
 
+---  ═══════════════════════════════════════════════════════════════════════════
+---   ACTIVE DEBUFF STATE
+---  ═══════════════════════════════════════════════════════════════════════════
+
+-- Debuffs are checked on every precast but change rarely: the blocker of
+-- each action kind is kept up to date from buff_change (DoomManager, called
+-- first by every job_buff_change) and a precast check reads it.
+
+-- Lists per action kind, in the order the scan checks them
+local KIND_LISTS = {
+    magic     = {UNIVERSAL_BLOCKING_DEBUFFS, MAGIC_BLOCKING_DEBUFFS},
+    ja        = {UNIVERSAL_BLOCKING_DEBUFFS, JA_BLOCKING_DEBUFFS},
+    ws        = {UNIVERSAL_BLOCKING_DEBUFFS, WS_BLOCKING_DEBUFFS},
+    item      = {UNIVERSAL_BLOCKING_DEBUFFS, ITEM_BLOCKING_DEBUFFS},
+    universal = {UNIVERSAL_BLOCKING_DEBUFFS},
+}
+
+-- GearSwap action type >> kind (anything else: universal blocks only)
+local ACTION_KINDS = {
+    Magic = 'magic',
+    Ability = 'ja', JobAbility = 'ja', PetCommand = 'ja',
+    WeaponSkill = 'ws', Weaponskill = 'ws',
+    Ranged = 'ws',  -- Ranged attacks have same restrictions as WS generally
+    Item = 'item',
+}
+
+-- [kind] = entries {name, priority, message} by priority, universal first.
+-- Equal priorities (test mode: Aggressor / Defender) go by name.
+local ORDER = {}
+-- [lowercase buff name] = key in the lists / buffactive
+local WATCHED = {}
+
+for kind, lists in pairs(KIND_LISTS) do
+    ORDER[kind] = {}
+    for _, list in ipairs(lists) do
+        local entries = {}
+        for debuff_name, debuff_info in pairs(list) do
+            table.insert(entries, {name = debuff_name, priority = debuff_info.priority, message = debuff_info.message})
+            WATCHED[debuff_name:lower()] = debuff_name
+        end
+        table.sort(entries, function(a, b)
+            if a.priority ~= b.priority then
+                return a.priority < b.priority
+            end
+            return a.name < b.name
+        end)
+        for _, entry in ipairs(entries) do
+            table.insert(ORDER[kind], entry)
+        end
+    end
+end
+
+local active = {}       -- [key] = true while the debuff is on
+local blockers = nil    -- [kind] = entry or false; nil until read from buffactive
+
+--- Pick the blocker of every kind from the active debuffs
+local function recompute()
+    blockers = {}
+    for kind, entries in pairs(ORDER) do
+        blockers[kind] = false
+        for _, entry in ipairs(entries) do
+            if active[entry.name] then
+                blockers[kind] = entry
+                break
+            end
+        end
+    end
+end
+
+--- Read every watched debuff from buffactive
+local function resync()
+    active = {}
+    for _, key in pairs(WATCHED) do
+        if buffactive[key] then
+            active[key] = true
+        end
+    end
+    recompute()
+end
+
+--- @param kind string Action kind (magic, ja, ws, item, universal)
+--- @return boolean blocked, string|nil debuff_name, string|nil message
+local function blocked_by(kind)
+    if not buffactive then
+        return false, nil, nil
+    end
+    if not blockers then
+        resync()
+    end
+    local entry = blockers[kind]
+    -- Lost without a buff_change (zoning, reload): read the state again
+    if entry and not buffactive[entry.name] then
+        resync()
+        entry = blockers[kind]
+    end
+    if entry then
+        return true, entry.name, entry.message
+    end
+    return false, nil, nil
+end
+
+--- Update the state after a buff change (cheap for non-blocking buffs)
+--- @param buff string Buff name from buff_change
+function DebuffChecker.on_buff_change(buff)
+    local key = type(buff) == 'string' and WATCHED[buff:lower()]
+    if not key or not blockers or not buffactive then
+        return
+    end
+    -- buffactive is already updated (and counts both Paralysis IDs)
+    active[key] = buffactive[key] and true or nil
+    recompute()
+end
+
+--- Read the state again from buffactive on the next check
+function DebuffChecker.reset_state()
+    blockers = nil
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   DETECTION FUNCTIONS
+---  ═══════════════════════════════════════════════════════════════════════════
+
 --- Check if magic casting is blocked
 --- @return boolean blocked True if magic is blocked
 --- @return string|nil debuff_name The debuff blocking magic
 --- @return string|nil message User-friendly message
 function DebuffChecker.check_magic_blocked()
-    return check_blocking_debuffs(MAGIC_BLOCKING_DEBUFFS)
+    return blocked_by('magic')
 end
 
 --- Check if job abilities are blocked
@@ -188,7 +318,7 @@ end
 --- @return string|nil debuff_name The debuff blocking JA
 --- @return string|nil message User-friendly message
 function DebuffChecker.check_ja_blocked()
-    return check_blocking_debuffs(JA_BLOCKING_DEBUFFS)
+    return blocked_by('ja')
 end
 
 --- Check if weapon skills are blocked
@@ -196,7 +326,7 @@ end
 --- @return string|nil debuff_name The debuff blocking WS
 --- @return string|nil message User-friendly message
 function DebuffChecker.check_ws_blocked()
-    return check_blocking_debuffs(WS_BLOCKING_DEBUFFS)
+    return blocked_by('ws')
 end
 
 --- Check if item usage is blocked
@@ -204,7 +334,7 @@ end
 --- @return string|nil debuff_name The debuff blocking items
 --- @return string|nil message User-friendly message
 function DebuffChecker.check_item_blocked()
-    return check_blocking_debuffs(ITEM_BLOCKING_DEBUFFS)
+    return blocked_by('item')
 end
 
 --- Check if ANY action is blocked (catch-all)
@@ -213,26 +343,8 @@ end
 --- @return string|nil debuff_name The debuff blocking the action
 --- @return string|nil message User-friendly message
 function DebuffChecker.check_action_blocked(action_type)
-    if action_type == "Magic" then
-        return DebuffChecker.check_magic_blocked()
-    elseif action_type == "Ability" or action_type == "JobAbility" or action_type == "PetCommand" then
-        return DebuffChecker.check_ja_blocked()
-    elseif action_type == "WeaponSkill" or action_type == "Weaponskill" then
-        return DebuffChecker.check_ws_blocked()
-    elseif action_type == "Item" then
-        return DebuffChecker.check_item_blocked()
-    elseif action_type == "Ranged" then
-        -- Ranged attacks have same restrictions as WS generally
-        return DebuffChecker.check_ws_blocked()
-    else
-        -- Unknown action type, check universal blocks only
-        local universal_debuff, universal_msg = get_active_blocking_debuff(UNIVERSAL_BLOCKING_DEBUFFS)
-        if universal_debuff then
-            return true, universal_debuff, universal_msg
-        end
-    end
-
-    return false, nil, nil
+    -- Unknown action type: universal blocks only
+    return blocked_by(ACTION_KINDS[action_type] or 'universal')
 end
 
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -287,8 +399,96 @@ end
 --- Check if player is currently incapacitated (any blocking debuff active)
 --- @return boolean incapacitated True if any blocking debuff is active
 function DebuffChecker.is_incapacitated()
-    local universal_debuff = get_active_blocking_debuff(UNIVERSAL_BLOCKING_DEBUFFS)
-    return universal_debuff ~= nil
+    return (blocked_by('universal'))
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   EQUIVALENCE CHECK / BENCHMARK
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Same answer as the scan? Equal-priority debuffs of the same tier are
+--- interchangeable (the scan's pick depends on pairs() order).
+local function same_result(kind, blocked, name, ref_blocked, ref_name)
+    if blocked ~= ref_blocked or name == ref_name then
+        return blocked == ref_blocked
+    end
+    local lists = KIND_LISTS[kind]
+    local universal = UNIVERSAL_BLOCKING_DEBUFFS[name] ~= nil
+    if universal ~= (UNIVERSAL_BLOCKING_DEBUFFS[ref_name] ~= nil) then
+        return false
+    end
+    local list = universal and lists[1] or lists[2]
+    return list[name].priority == list[ref_name].priority
+end
+
+--- Check the state against the scan on every combination of watched
+--- debuffs (each step gains or loses one, through on_buff_change), then
+--- again with the losses not reported (missed buff_change), then time both
+--- on the current buffs.
+--- @param iterations number|nil Timed checks per kind (default 20000)
+--- @return table {watched, cases, mismatches, rows = {{kind, scan_us, state_us}}}
+function DebuffChecker.benchmark(iterations)
+    iterations = math.max(tonumber(iterations) or 20000, 1)
+    local result = {watched = 0, cases = 0, mismatches = 0, rows = {}}
+    local keys = {}
+    for _, key in pairs(WATCHED) do
+        table.insert(keys, key)
+    end
+    table.sort(keys)
+    result.watched = #keys
+
+    local real = buffactive
+    local ok, err = pcall(function()
+        for pass = 1, 2 do
+            local fake = {}
+            buffactive = fake
+            resync()
+            -- Gray code: step i flips one debuff (pass 2: only gains reported)
+            for i = 0, 2 ^ #keys - 1 do
+                if i > 0 then
+                    local bit, value = 1, i
+                    while value % 2 == 0 do
+                        bit, value = bit + 1, value / 2
+                    end
+                    local key = keys[bit]
+                    fake[key] = not fake[key] and 1 or nil
+                    if pass == 1 or fake[key] then
+                        DebuffChecker.on_buff_change(key:lower())
+                    end
+                end
+                for kind in pairs(KIND_LISTS) do
+                    local lists = KIND_LISTS[kind]
+                    local ref_blocked, ref_name = check_blocking_debuffs(lists[2])
+                    local blocked, name = blocked_by(kind)
+                    result.cases = result.cases + 1
+                    if not same_result(kind, blocked, name, ref_blocked, ref_name) then
+                        result.mismatches = result.mismatches + 1
+                    end
+                end
+            end
+        end
+    end)
+    buffactive = real
+    blockers = nil
+    if not ok then
+        error(err, 0)
+    end
+
+    for _, kind in ipairs({'magic', 'ja', 'ws', 'item', 'universal'}) do
+        local specific = KIND_LISTS[kind][2]
+        local started = os.clock()
+        for _ = 1, iterations do
+            check_blocking_debuffs(specific)
+        end
+        local scan_us = (os.clock() - started) * 1e6 / iterations
+        started = os.clock()
+        for _ = 1, iterations do
+            blocked_by(kind)
+        end
+        local state_us = (os.clock() - started) * 1e6 / iterations
+        table.insert(result.rows, {kind = kind, scan_us = scan_us, state_us = state_us})
+    end
+    return result
 end
 
 return DebuffChecker
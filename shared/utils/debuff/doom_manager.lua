@@ -11,6 +11,7 @@
 ---   • Safety unlock when player dies (prevents stuck locked slots after raise)
 ---   • Centralized logic - no code duplication across 15 jobs
 ---   • Integrates with MessageFormatter for user feedback
+---   • Feeds every buff change to DebuffChecker (precast guard state)
 ---
 --- Usage (in job_buff_change):
 ---   ```lua
@@ -46,6 +47,7 @@
 ---============================================================================
 
 local MessageFormatter = require('shared/utils/messages/message_formatter')
+local DebuffChecker = require('shared/utils/debuff/debuff_checker')
 
 ---============================================================================
 --- MODULE INITIALIZATION
@@ -73,6 +75,10 @@ local DOOM_SLOTS = {'neck', 'ring1', 'ring2', 'waist'}
 --- @param gain boolean True if buff gained, false if lost
 --- @return boolean True if Doom was handled (caller should return), false otherwise
 function DoomManager.handle_buff_change(buff, gain)
+    -- Every job_buff_change starts here: keep the precast guard's
+    -- blocking-debuff state current
+    DebuffChecker.on_buff_change(buff)
+
     -- Only handle 'doom' buff
     if buff ~= 'doom' then
         return false
@@ -0,0 +1,639 @@
+---============================================================================
+--- Harness Environment - Headless Windower / GearSwap stand-in
+---============================================================================
+--- Recreates, in a stock Lua 5.1 interpreter, the part of the GearSwap user
+--- environment the job files touch, so an entry file (Tetsouo_WAR.lua) can be
+--- loaded and its hooks replayed outside the game (see replay.lua).
+---
+--- Real code, fake game:
+---   • Mote-Include, Modes and the Windower libraries (tables, sets, texts,
+---     resources...) are loaded from a Windower install (--windower), so the
+---     harness runs the same code as the game.
+---   • windower.*, player, world, buffactive, equip(), set_combine(),
+---     coroutine.schedule(), include() and require() are stubs: equip() collects the
+---     slots, flush() turns them into "equip packets" the way GearSwap does
+---     after each hook, coroutine.schedule() runs on a virtual clock.
+---   • Unknown windower.ffxi / gearswap functions answer nil and are listed
+---     in Env.stubbed, so missing stubs show up in the report.
+---   • Files written under the data folder go to a sandbox directory.
+---
+--- Paths: data_dir must end with 'data/' (windower.addon_path .. 'data/').
+--- `<Char>/...` requires are served from char_dirs, then their config_global
+--- folder for `<Char>/config/...` (same lookup as require_graph.py), so
+--- _master/entry/<Char>_<JOB>.lua loads without cloning the character.
+---
+--- @file    shared/utils/debug/harness/env.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local Env = {}
+
+local JOBS = {
+    {'WAR', 'Warrior'}, {'MNK', 'Monk'}, {'WHM', 'White Mage'}, {'BLM', 'Black Mage'},
+    {'RDM', 'Red Mage'}, {'THF', 'Thief'}, {'PLD', 'Paladin'}, {'DRK', 'Dark Knight'},
+    {'BST', 'Beastmaster'}, {'BRD', 'Bard'}, {'RNG', 'Ranger'}, {'SAM', 'Samurai'},
+    {'NIN', 'Ninja'}, {'DRG', 'Dragoon'}, {'SMN', 'Summoner'}, {'BLU', 'Blue Mage'},
+    {'COR', 'Corsair'}, {'PUP', 'Puppetmaster'}, {'DNC', 'Dancer'}, {'SCH', 'Scholar'},
+    {'GEO', 'Geomancer'}, {'RUN', 'Rune Fencer'},
+}
+
+-- GearSwap slot names and aliases -> canonical slot
+local SLOTS = {
+    main = 'main', sub = 'sub', range = 'range', ranged = 'range', ammo = 'ammo',
+    head = 'head', neck = 'neck', body = 'body', hands = 'hands', back = 'back',
+    waist = 'waist', legs = 'legs', feet = 'feet',
+    ear1 = 'left_ear', lear = 'left_ear', left_ear = 'left_ear',
+    ear2 = 'right_ear', rear = 'right_ear', right_ear = 'right_ear',
+    ring1 = 'left_ring', lring = 'left_ring', left_ring = 'left_ring',
+    ring2 = 'right_ring', rring = 'right_ring', right_ring = 'right_ring',
+}
+local SLOT_ORDER = {'main', 'sub', 'range', 'ammo', 'head', 'neck', 'left_ear', 'right_ear',
+    'body', 'hands', 'left_ring', 'right_ring', 'back', 'waist', 'legs', 'feet'}
+
+local STATUS_IDS = {Idle = 0, Engaged = 1, Dead = 2, ['Engaged dead'] = 3, Event = 4, Resting = 33}
+
+Env.stubbed = {}            -- 'windower.ffxi.get_xxx' -> call count
+Env.counters = {packets = 0, slots = 0, chat = 0, commands = 0}
+Env.now = 0                 -- virtual clock (seconds)
+Env.cancelled = false       -- cancel_spell() called during the current action
+
+local opts = nil
+local pending = {}          -- slot -> item (equip() calls since the last flush)
+local locked = {}           -- slot -> true (disable())
+local scheduled = {}        -- {at, fn, seq}
+local schedule_seq = 0
+local events = {}           -- event name -> {id -> fn}
+local event_seq = 0
+local real_open = io.open
+local real_remove = os.remove
+
+---============================================================================
+--- HELPERS
+---============================================================================
+
+local function noop() end
+
+--- Table whose unknown fields are no-op functions, counted in Env.stubbed.
+--- Fields starting with '_' stay nil (state the job files keep in windower._x).
+--- @param prefix string Name used in the report
+--- @param fields table|nil Real fields
+local function permissive(prefix, fields)
+    return setmetatable(fields or {}, {__index = function(t, key)
+        if type(key) ~= 'string' or key:sub(1, 1) == '_' then
+            return nil
+        end
+        local name = prefix .. '.' .. tostring(key)
+        local fn = function()
+            Env.stubbed[name] = (Env.stubbed[name] or 0) + 1
+            return nil
+        end
+        rawset(t, key, fn)
+        return fn
+    end})
+end
+
+--- Object whose every method answers 0 (windower.text / windower.prim)
+local function inert()
+    return setmetatable({}, {__index = function(t, key)
+        local fn = function() return 0, 0 end
+        rawset(t, key, fn)
+        return fn
+    end})
+end
+
+local function file_exists(path)
+    local file = real_open(path, 'rb')
+    if file then
+        file:close()
+        return true
+    end
+    return false
+end
+
+--- Item name of a set entry ('Name', {name='Name', ...} or 'empty')
+local function item_name(item)
+    if type(item) == 'table' then
+        item = item.name
+    end
+    if type(item) ~= 'string' then
+        return nil
+    end
+    return item:lower()
+end
+
+---============================================================================
+--- FILES (sandboxed writes)
+---============================================================================
+
+--- Sandbox path of a file written by the job files
+local function sandbox_path(path)
+    return opts.sandbox_dir .. tostring(path):gsub('[/\\:]', '_')
+end
+
+local function sandboxed_open(path, mode)
+    mode = mode or 'r'
+    if mode:find('[wa+]') then
+        return real_open(sandbox_path(path), mode)
+    end
+    local copy = sandbox_path(path)
+    if file_exists(copy) then
+        return real_open(copy, mode)
+    end
+    return real_open(path, mode)
+end
+
+local function sandboxed_remove(path)
+    return real_remove(sandbox_path(path))
+end
+
+---============================================================================
+--- MODULE LOOKUP (require / include)
+---============================================================================
+
+--- Candidate files of a `<Char>/...` module name
+local function char_candidates(name)
+    local head, rest = name:match('^([^/]+)/(.+)$')
+    if not head or head:lower() ~= opts.char:lower() then
+        return nil
+    end
+    local list = {}
+    for _, dir in ipairs(opts.char_dirs) do
+        table.insert(list, opts.data_dir .. dir .. '/' .. rest)
+    end
+    if rest:sub(1, 7) == 'config/' then
+        for _, dir in ipairs(opts.char_dirs) do
+            table.insert(list, opts.data_dir .. dir .. '/config_global/' .. rest:sub(8))
+        end
+    end
+    return list
+end
+
+--- package.loaders entry for `<Char>/...` modules
+local function char_loader(module)
+    local list = char_candidates(module:gsub('%.', '/') .. '.lua')
+    if not list then
+        return nil
+    end
+    for _, path in ipairs(list) do
+        if file_exists(path) then
+            local chunk, err = loadfile(path)
+            if not chunk then
+                error(err, 2)
+            end
+            return chunk
+        end
+    end
+    return '\n\tno character file for ' .. module
+end
+
+--- GearSwap include(): character folders, data/, then the GearSwap libs
+--- @param name string File name ('Mote-Include.lua', '../shared/x.lua', 'sets/war_sets.lua')
+--- @return string|nil Path
+function Env.find_include(name)
+    if not name:match('%.lua$') then
+        name = name .. '.lua'
+    end
+    local list = {}
+    if name:sub(1, 3) == '../' then
+        table.insert(list, opts.data_dir .. name:gsub('^[%./]+', ''))
+    else
+        for _, path in ipairs(char_candidates(opts.char .. '/' .. name) or {}) do
+            table.insert(list, path)
+        end
+        table.insert(list, opts.data_dir .. 'common/' .. name)
+        table.insert(list, opts.data_dir .. name)
+        table.insert(list, opts.gearswap_dir .. 'libs-dev/' .. name)
+        table.insert(list, opts.gearswap_dir .. 'libs/' .. name)
+        table.insert(list, opts.windower_dir .. 'addons/libs/' .. name)
+    end
+    for _, path in ipairs(list) do
+        if file_exists(path) then
+            return path
+        end
+    end
+    return nil
+end
+
+--- GearSwap require(): modules returning a table are cached in package.loaded;
+--- files that return nothing run again on every require and give nil (not
+--- Lua's `true`), which the job files rely on (pcall(require, 'X_MACROBOOK')).
+local function user_require(name)
+    local loaded = package.loaded[name]
+    if type(loaded) == 'table' then
+        return loaded
+    end
+    local errors = {}
+    for _, loader in ipairs(package.loaders) do
+        local chunk = loader(name)
+        if type(chunk) == 'function' then
+            local value = chunk(name)
+            if type(value) == 'table' then
+                package.loaded[name] = value
+            end
+            return value
+        elseif type(chunk) == 'string' then
+            table.insert(errors, chunk)
+        end
+    end
+    error("module '" .. name .. "' not found:" .. table.concat(errors), 2)
+end
+
+local function include(name)
+    local path = Env.find_include(name)
+    if not path then
+        error('include: file not found: ' .. tostring(name), 2)
+    end
+    local chunk, err = loadfile(path)
+    if not chunk then
+        error(err, 2)
+    end
+    return chunk()
+end
+
+---============================================================================
+--- GEAR (equip / set_combine / flush)
+---============================================================================
+
+local function equip(...)
+    for i = 1, select('#', ...) do
+        local set = select(i, ...)
+        if type(set) == 'table' then
+            for key, item in pairs(set) do
+                local slot = type(key) == 'string' and SLOTS[key:lower()]
+                if slot and not locked[slot] then
+                    pending[slot] = item
+                end
+            end
+        end
+    end
+end
+
+local function set_combine(...)
+    local combined = {}
+    for i = 1, select('#', ...) do
+        local set = select(i, ...)
+        if type(set) == 'table' then
+            for key, item in pairs(set) do
+                local slot = type(key) == 'string' and SLOTS[key:lower()]
+                if slot then
+                    -- Drop the aliases of the slot so the last set wins
+                    for alias, canonical in pairs(SLOTS) do
+                        if canonical == slot then
+                            combined[alias] = nil
+                        end
+                    end
+                    combined[slot] = item
+                else
+                    combined[key] = item
+                end
+            end
+        end
+    end
+    return combined
+end
+
+local function slot_list(...)
+    local list = {}
+    for i = 1, select('#', ...) do
+        local value = select(i, ...)
+        if type(value) == 'table' then
+            for _, slot in pairs(value) do
+                list[#list + 1] = slot
+            end
+        else
+            list[#list + 1] = value
+        end
+    end
+    if #list == 0 then
+        list = SLOT_ORDER
+    end
+    return list
+end
+
+local function disable(...)
+    for _, slot in ipairs(slot_list(...)) do
+        locked[SLOTS[tostring(slot):lower()] or slot] = true
+    end
+end
+
+local function enable(...)
+    for _, slot in ipairs(slot_list(...)) do
+        locked[SLOTS[tostring(slot):lower()] or slot] = nil
+    end
+end
+
+--- Send the pending equip() slots like GearSwap after a hook: one packet per
+--- flush that changes anything, one slot per changed item.
+--- @return number packets, number slots
+function Env.flush()
+    local changed = 0
+    local equipment = _G.player.equipment
+    for slot, item in pairs(pending) do
+        local name = item_name(item)
+        if name and name ~= (equipment[slot] or 'empty'):lower() then
+            equipment[slot] = type(item) == 'table' and item.name or item
+            changed = changed + 1
+        end
+    end
+    pending = {}
+    local packets = changed > 0 and 1 or 0
+    Env.counters.packets = Env.counters.packets + packets
+    Env.counters.slots = Env.counters.slots + changed
+    return packets, changed
+end
+
+---============================================================================
+--- SCHEDULER / EVENTS
+---============================================================================
+
+local function schedule(fn, delay)
+    schedule_seq = schedule_seq + 1
+    table.insert(scheduled, {at = Env.now + (tonumber(delay) or 0), fn = fn, seq = schedule_seq})
+    return schedule_seq
+end
+
+--- Advance the virtual clock and hand back the tasks that came due (in order)
+--- @param seconds number
+--- @return table List of functions
+function Env.advance(seconds)
+    Env.now = Env.now + (tonumber(seconds) or 0)
+    local due, later = {}, {}
+    for _, task in ipairs(scheduled) do
+        table.insert(task.at <= Env.now and due or later, task)
+    end
+    scheduled = later
+    table.sort(due, function(a, b)
+        if a.at ~= b.at then return a.at < b.at end
+        return a.seq < b.seq
+    end)
+    local fns = {}
+    for i, task in ipairs(due) do
+        fns[i] = task.fn
+    end
+    return fns
+end
+
+local function register_event(name, fn)
+    event_seq = event_seq + 1
+    events[name] = events[name] or {}
+    events[name][event_seq] = fn
+    return event_seq
+end
+
+local function unregister_event(id)
+    for _, handlers in pairs(events) do
+        handlers[id] = nil
+    end
+end
+
+---============================================================================
+--- PLAYER / WORLD
+---============================================================================
+
+local function job_info(code)
+    for id, job in ipairs(JOBS) do
+        if job[1] == code then
+            return id, job[2]
+        end
+    end
+    return 0, code
+end
+
+local function build_player(profile)
+    local main_id, main_full = job_info(profile.main_job)
+    local sub_id, sub_full = job_info(profile.sub_job or 'NON')
+    local equipment = {}
+    for _, slot in ipairs(SLOT_ORDER) do
+        equipment[slot] = (profile.equipment and profile.equipment[slot]) or 'empty'
+    end
+    local player = {
+        name = profile.name, id = 1, index = 1,
+        main_job = profile.main_job, main_job_id = main_id, main_job_full = main_full,
+        main_job_level = profile.main_job_level or 99,
+        sub_job = profile.sub_job, sub_job_id = sub_id, sub_job_full = sub_full,
+        sub_job_level = profile.sub_job_level or 49,
+        job = profile.main_job .. '/' .. (profile.sub_job or ''),
+        status = 'Idle', status_id = 0,
+        hp = 3000, max_hp = 3000, hpp = 100, mp = 1200, max_mp = 1200, mpp = 100, tp = 0,
+        buffs = {}, equipment = equipment, skills = {}, merits = {},
+        job_points = {[profile.main_job:lower()] = {jp_spent = 2100, cp = 0}},
+        inventory = {}, wardrobe = {}, target = {},
+    }
+    player.vitals = player
+    return player
+end
+
+--- Buff table with GearSwap's case-insensitive lookup
+local function build_buffactive()
+    return setmetatable({}, {__index = function(t, key)
+        if type(key) == 'string' then
+            return rawget(t, key:lower())
+        end
+    end})
+end
+
+--- Apply a buff gain/loss to player.buffs and buffactive
+--- @param name string Buff name
+--- @param gain boolean
+function Env.set_buff(name, gain)
+    local key = name:lower()
+    local count = rawget(_G.buffactive, key) or 0
+    count = gain and count + 1 or math.max(count - 1, 0)
+    rawset(_G.buffactive, key, count > 0 and count or nil)
+    local buffs = _G.player.buffs
+    if gain then
+        table.insert(buffs, name)
+    else
+        for i = #buffs, 1, -1 do
+            if buffs[i]:lower() == key then
+                table.remove(buffs, i)
+                break
+            end
+        end
+    end
+end
+
+--- Change player.status (the caller fires status_change)
+--- @param status string 'Idle', 'Engaged', 'Resting'...
+--- @return string Previous status
+function Env.set_status(status)
+    local player = _G.player
+    local old = player.status
+    player.status = status
+    player.status_id = STATUS_IDS[status] or 0
+    return old
+end
+
+local function mob(name, kind, distance)
+    return {name = name, id = kind == 'SELF' and 1 or 1000, index = kind == 'SELF' and 1 or 100,
+        hpp = 100, distance = (distance or 3) ^ 2, valid_target = true, is_npc = kind ~= 'SELF',
+        spawn_type = kind == 'SELF' and 13 or 16, status = 0, model_size = 1, x = 0, y = 0, z = 0}
+end
+
+local function get_mob_by_target(target)
+    target = tostring(target or ''):gsub('[<>]', '')
+    if target == 'me' or target == 'self' then
+        return mob(_G.player.name, 'SELF', 0)
+    end
+    if (target == 't' or target == 'bt') and _G.player.status == 'Engaged' then
+        return mob('Training Dummy', 'MONSTER')
+    end
+    return nil
+end
+
+local function build_ffxi()
+    return permissive('windower.ffxi', {
+        get_player = function()
+            local p = _G.player
+            local buffs = {}
+            for i = 1, #p.buffs do
+                buffs[i] = 0
+            end
+            return {name = p.name, id = p.id, index = p.index,
+                main_job = p.main_job, main_job_id = p.main_job_id, main_job_level = p.main_job_level,
+                sub_job = p.sub_job, sub_job_id = p.sub_job_id, sub_job_level = p.sub_job_level,
+                status = p.status_id, buffs = buffs, skills = {}, merits = {}, job_points = p.job_points,
+                vitals = {hp = p.hp, mp = p.mp, tp = p.tp, hpp = p.hpp, mpp = p.mpp, max_hp = p.max_hp, max_mp = p.max_mp},
+                item_level = 119}
+        end,
+        get_info = function()
+            return {language = 'English', logged_in = true, zone = _G.world.zone_id, mog_house = false,
+                server = 1, weather = 0, day = 0, time = 720}
+        end,
+        get_items = function(bag, index)
+            if bag and index then
+                return {id = 0, count = 0, status = 0}
+            end
+            local empty = {max = 80, count = 0, enabled = true}
+            if bag then
+                return empty
+            end
+            return setmetatable({equipment = {}}, {__index = function() return empty end})
+        end,
+        get_ability_recasts = function() return {} end,
+        get_spell_recasts = function() return {} end,
+        get_spells = function() return setmetatable({}, {__index = function() return true end}) end,
+        get_abilities = function() return {job_abilities = {}, weapon_skills = {}, pet_commands = {}} end,
+        get_key_items = function() return {} end,
+        get_mob_by_target = get_mob_by_target,
+        get_mob_by_id = function() return nil end,
+        get_mob_by_index = function() return nil end,
+        get_mob_array = function() return {} end,
+        get_party = function()
+            return {p0 = {name = _G.player.name, mob = mob(_G.player.name, 'SELF', 0)},
+                party1_count = 1, party2_count = 0, party3_count = 0}
+        end,
+        get_bag_info = function() return {max = 80, count = 0, enabled = true} end,
+    })
+end
+
+local function build_windower()
+    local windower_fields = {
+        addon_path = opts.data_dir:sub(1, -6),
+        windower_path = opts.windower_dir,
+        pol_path = opts.windower_dir,
+        version = '4.3.0.0',
+        ffxi = build_ffxi(),
+        text = inert(),
+        prim = inert(),
+        chat = permissive('windower.chat'),
+        packets = permissive('windower.packets'),
+        register_event = register_event,
+        raw_register_event = register_event,
+        unregister_event = unregister_event,
+        send_command = function() Env.counters.commands = Env.counters.commands + 1 end,
+        add_to_chat = function() Env.counters.chat = Env.counters.chat + 1 end,
+        file_exists = function(path) return file_exists(path) or file_exists(sandbox_path(path)) end,
+        dir_exists = function() return true end,
+        create_dir = noop,
+        get_dir = function() return {} end,
+        has_focus = function() return true end,
+        to_shift_jis = function(text) return text end,
+        from_shift_jis = function(text) return text end,
+        convert_auto_trans = function(text) return text end,
+        get_windower_settings = function()
+            return {x_res = 1920, y_res = 1080, ui_x_res = 1920, ui_y_res = 1080, window_x_pos = 0, window_y_pos = 0}
+        end,
+        wc_match = function(text, pattern)
+            pattern = '^' .. pattern:gsub('[%^%$%(%)%%%.%[%]%+%-]', '%%%0'):gsub('%*', '.*'):gsub('%?', '.') .. '$'
+            return tostring(text):match(pattern) ~= nil
+        end,
+    }
+    return permissive('windower', windower_fields)
+end
+
+---============================================================================
+--- INSTALL
+---============================================================================
+
+--- Install the stub environment in _G
+--- @param options table {data_dir, windower_dir, sandbox_dir, char, char_dirs, profile}
+function Env.install(options)
+    opts = options
+    assert(opts.data_dir:match('data/$'), 'data_dir must end with data/')
+    opts.gearswap_dir = opts.windower_dir .. 'addons/GearSwap/'
+
+    package.path = table.concat({
+        opts.data_dir .. '?.lua',
+        opts.gearswap_dir .. 'libs/?.lua',
+        opts.windower_dir .. 'addons/libs/?.lua',
+        package.path,
+    }, ';')
+    table.insert(package.loaders, 2, char_loader)
+
+    io.open = sandboxed_open
+    os.remove = sandboxed_remove
+
+    _G._addon = {name = 'GearSwap', version = '0.936', author = 'Byrth', commands = {'gs', 'gearswap'}}
+    _G.windower = build_windower()
+    coroutine.schedule = schedule
+    coroutine.sleep = noop
+
+    -- Windower libraries GearSwap puts in the user environment
+    for _, lib in ipairs({'tables', 'strings', 'lists', 'sets', 'functions', 'maths', 'texts'}) do
+        pcall(require, lib)
+    end
+
+    local player = build_player(opts.profile)
+    _G.player = player
+    _G.world = {area = 'Western Adoulin', zone = 'Western Adoulin', zone_id = 256,
+        weather_element = 'None', day_element = 'Light', time = 720, moon_pct = 50}
+    _G.buffactive = build_buffactive()
+    _G.pet = {isvalid = false, name = nil, status = 'Idle', hpp = 0, tp = 0}
+    _G.fellow = {isvalid = false}
+    _G.alliance = {{count = 1, leader = player.name, player}}
+    _G.party = _G.alliance[1]
+    _G.sets = {}
+    _G.empty = 'empty'
+    _G.lua_base_path = windower.addon_path
+    _G.language = 'english'
+
+    _G.equip = equip
+    _G.set_combine = set_combine
+    _G.disable = disable
+    _G.enable = enable
+    _G.include = include
+    _G.require = user_require
+    _G.cancel_spell = function() Env.cancelled = true end
+    _G.send_command = windower.send_command
+    _G.add_to_chat = windower.add_to_chat
+    _G.gearswap = permissive('gearswap', {res = package.loaded.resources})
+    for _, name in ipairs({'change_target', 'cast_delay', 'print_set', 'show_swaps', 'debug_mode',
+            'include_path', 'register_unhandled_command', 'move_spell_target', 'set_language',
+            'midaction', 'pet_midaction', 'verify_equip'}) do
+        _G[name] = function()
+            Env.stubbed[name] = (Env.stubbed[name] or 0) + 1
+            return false
+        end
+    end
+end
+
+--- Slot names in GearSwap order
+Env.SLOT_ORDER = SLOT_ORDER
+
+--- Unsandboxed io.open (harness output)
+Env.real_open = real_open
+
+return Env
@@ -0,0 +1,188 @@
+---============================================================================
+--- Harness Recorder - Record in-game hook traffic for the headless replay
+---============================================================================
+--- //gs c perf record starts recording the events GearSwap hands to the job
+--- (actions, status changes, buff changes, self commands) with the time spent
+--- between them; a second //gs c perf record writes
+--- data/harness_rec_<Char>_<JOB>_<date>.lua, which hook_bench.py --seq
+--- replays headless through shared/utils/debug/harness/replay.lua.
+---
+--- Recording stops with the GearSwap reload of a job change: record one job
+--- at a time.
+---
+--- @file    shared/utils/debug/harness/recorder.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local Recorder = {}
+
+local HOOKS = {'precast', 'status_change', 'buff_change', 'self_command'}
+
+-- Spell fields kept in an action step (the rest comes from res on replay)
+local SPELL_FIELDS = {'type', 'skill', 'element', 'prefix', 'action_type', 'cast_time', 'mp_cost', 'tp_cost', 'id'}
+
+-- Longest wait recorded between two events (AFK time is not replayed)
+local MAX_WAIT = 30
+
+local rec = nil             -- {steps, job, sub_job, name, equipment, last}
+local installed = false
+
+---============================================================================
+--- CAPTURE
+---============================================================================
+
+--- Append a step, preceded by the time elapsed since the previous one
+--- @param step table
+local function add_step(step)
+    local now = os.clock()
+    local gap = now - rec.last
+    if gap >= 0.05 then
+        table.insert(rec.steps, {event = 'wait', seconds = math.min(gap, MAX_WAIT)})
+    end
+    rec.last = now
+    table.insert(rec.steps, step)
+end
+
+local CAPTURE = {
+    precast = function(spell)
+        local step = {event = 'action', name = spell.english or spell.name, tp = player and player.tp,
+            target = spell.target and spell.target.raw}
+        for _, field in ipairs(SPELL_FIELDS) do
+            step[field] = spell[field]
+        end
+        add_step(step)
+    end,
+    status_change = function(new)
+        add_step({event = 'status', value = new})
+    end,
+    buff_change = function(name, gain)
+        add_step({event = 'buff', name = name, gain = gain})
+    end,
+    self_command = function(command)
+        if type(command) == 'table' then
+            command = table.concat(command, ' ')
+        end
+        -- The record toggle itself is not part of the sequence
+        if type(command) == 'string' and not command:match('^perf') then
+            add_step({event = 'command', value = command})
+        end
+    end,
+}
+
+--- Wrap the global hooks once per GearSwap load
+local function install()
+    if installed then
+        return
+    end
+    for _, name in ipairs(HOOKS) do
+        local original = _G[name]
+        local capture = CAPTURE[name]
+        if type(original) == 'function' then
+            _G[name] = function(...)
+                if rec then
+                    capture(...)
+                end
+                return original(...)
+            end
+        end
+    end
+    installed = true
+end
+
+---============================================================================
+--- OUTPUT
+---============================================================================
+
+local function lua_value(value)
+    if type(value) == 'string' then
+        return string.format('%q', value)
+    end
+    return tostring(value)
+end
+
+--- Write the recording to data/harness_rec_<Char>_<JOB>_<date>.lua
+--- @return string|nil Path written
+local function write()
+    local path = string.format('%sdata/harness_rec_%s_%s_%s.lua', windower.addon_path,
+        rec.name, rec.job, os.date('%Y%m%d_%H%M%S'))
+    local lines = {
+        '-- Recorded by //gs c perf record - replay with hook_bench.py --seq',
+        'return {',
+        '    version = 1,',
+        string.format('    name = %q, job = %q, sub_job = %q,', rec.name, rec.job, rec.sub_job),
+        '    equipment = {',
+    }
+    local slots = {}
+    for slot in pairs(rec.equipment) do
+        table.insert(slots, slot)
+    end
+    table.sort(slots)
+    for _, slot in ipairs(slots) do
+        table.insert(lines, string.format('        %s = %q,', slot, rec.equipment[slot]))
+    end
+    table.insert(lines, '    },')
+    table.insert(lines, '    steps = {')
+    for _, step in ipairs(rec.steps) do
+        local fields = {}
+        for key, value in pairs(step) do
+            if type(value) ~= 'table' and type(value) ~= 'function' then
+                table.insert(fields, key .. ' = ' .. lua_value(value))
+            end
+        end
+        table.sort(fields)
+        table.insert(lines, '        {' .. table.concat(fields, ', ') .. '},')
+    end
+    table.insert(lines, '    },')
+    table.insert(lines, '}')
+
+    local file = io.open(path, 'w')
+    if not file then
+        return nil
+    end
+    file:write(table.concat(lines, '\n') .. '\n')
+    file:close()
+    return path
+end
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- Start or stop recording (stop writes the file)
+function Recorder.toggle()
+    if rec then
+        local count = #rec.steps
+        local path = count > 0 and write() or nil
+        rec = nil
+        if path then
+            add_to_chat(207, string.format('[Perf] Recorded %d steps: %s', count, path))
+        elseif count == 0 then
+            add_to_chat(207, '[Perf] Recording stopped (nothing recorded)')
+        else
+            add_to_chat(167, '[Perf] ERROR: could not write the recording')
+        end
+        return
+    end
+
+    install()
+    local equipment = {}
+    for slot, item in pairs(player.equipment or {}) do
+        if type(item) == 'string' and item ~= 'empty' then
+            equipment[slot] = item
+        end
+    end
+    rec = {
+        steps = {}, equipment = equipment, last = os.clock(),
+        name = player.name or 'Unknown', job = player.main_job or 'UNK', sub_job = player.sub_job or '',
+    }
+    add_to_chat(207, '[Perf] Recording ' .. rec.job .. ' hooks - //gs c perf record again to save')
+end
+
+--- @return boolean True while recording
+function Recorder.is_recording()
+    return rec ~= nil
+end
+
+return Recorder
@@ -0,0 +1,345 @@
+---============================================================================
+--- Harness Replay - Load one job entry headless and replay an action sequence
+---============================================================================
+--- Run by hook_bench.py with a stock Lua 5.1 interpreter:
+---
+---     lua5.1 shared/utils/debug/harness/replay.lua <config.lua>
+---
+--- config.lua returns:
+---     {data_dir, windower_dir, sandbox_dir, out,   -- absolute paths ('/'-ended dirs)
+---      char, char_dirs, entry,                      -- entry / char_dirs relative to data_dir
+---      sequence, passes,                            -- sequence file, replay count
+---      bytecode, bytecode_files}                    -- optional: cache dir (+ files: build it and exit)
+---
+--- The sequence file (hook_bench.py suite or //gs c perf record) returns
+---     {job, sub_job, name, equipment, steps = {
+---         {event = 'status', value = 'Engaged'},
+---         {event = 'action', name = 'Upheaval', type = 'WeaponSkill', ..., tp = 2000},
+---         {event = 'buff', name = 'Haste', gain = true},
+---         {event = 'command', value = 'update'},
+---         {event = 'wait', seconds = 2}}}
+---
+--- Every hook GearSwap would fire (pretarget, precast, midcast, aftercast,
+--- status_change, buff_change, self_command, scheduled tasks) is timed with
+--- os.clock() with the garbage collector stopped, so the KB delta is the exact
+--- allocation of the hook; the equip() calls are then flushed into equip
+--- packets. Pass 1 is the cold pass (lazy requires, caches); the samples of
+--- passes 2..n are written to `out` as a Lua table for hook_bench.py.
+---
+--- With `bytecode` (hook_bench.py --bytecode) loadfile() and require() go
+--- through BytecodeCache's loader the way GearSwap's do in game, so load_ms
+--- compares reloads with and without the cache. The cache is built by a
+--- separate run (`bytecode_files` set), so the replay's os.clock() is not
+--- charged with the compile.
+---
+--- @file    shared/utils/debug/harness/replay.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local config = dofile(arg[1])
+package.path = config.data_dir .. '?.lua;' .. package.path
+
+local Env = require('shared/utils/debug/harness/env')
+
+-- Bytecode cache (hook_bench.py --bytecode): the build run compiles with the
+-- real io and exits; timed runs load through the cache once Env is installed
+local BytecodeCache
+if config.bytecode then
+    _G.windower = {addon_path = config.data_dir:sub(1, -6)}
+    BytecodeCache = require('shared/utils/core/bytecode_cache')
+    BytecodeCache.set_cache_dir(config.bytecode)
+    if config.bytecode_files then
+        local result = BytecodeCache.build(config.bytecode_files, {data_dir = config.data_dir})
+        for _, err in ipairs(result.failed) do
+            io.stderr:write(err, '\n')
+        end
+        os.exit(#result.failed == 0 and 0 or 1)
+    end
+end
+
+local sequence = dofile(config.sequence)
+local passes = math.max(tonumber(config.passes) or 3, 1)
+
+local result = {hooks = {}, cold = {}, errors = {}}
+local hook_order = {}
+local pass = 0
+
+---============================================================================
+--- MEASUREMENT
+---============================================================================
+
+--- Per-hook record of the current pass (cold pass -> result.cold)
+local function bucket(hook)
+    local target = (pass <= 1 and passes > 1) and result.cold or result.hooks
+    local entry = target[hook]
+    if not entry then
+        entry = {calls = 0, ms = {}, kb = 0, packets = 0, slots = 0, chat = 0, commands = 0, errors = 0}
+        target[hook] = entry
+        if target == result.hooks then
+            table.insert(hook_order, hook)
+        end
+    end
+    return entry
+end
+
+--- Call one hook the way GearSwap does, then flush the equip() calls
+--- @param hook string Name in the report
+--- @param fn function|nil Hook (skipped when the job does not define it)
+local function run_hook(hook, fn, ...)
+    if type(fn) ~= 'function' then
+        return false
+    end
+    local entry = bucket(hook)
+    local chat, commands = Env.counters.chat, Env.counters.commands
+
+    collectgarbage('stop')
+    local kb_before = collectgarbage('count')
+    local started = os.clock()
+    local ok, err = pcall(fn, ...)
+    local ms = (os.clock() - started) * 1000
+    local kb = collectgarbage('count') - kb_before
+    collectgarbage('restart')
+
+    local packets, slots = Env.flush()
+    entry.calls = entry.calls + 1
+    entry.ms[#entry.ms + 1] = ms
+    entry.kb = entry.kb + kb
+    entry.packets = entry.packets + packets
+    entry.slots = entry.slots + slots
+    entry.chat = entry.chat + Env.counters.chat - chat
+    entry.commands = entry.commands + Env.counters.commands - commands
+    if not ok then
+        entry.errors = entry.errors + 1
+        if #result.errors < 20 then
+            table.insert(result.errors, hook .. ': ' .. tostring(err))
+        end
+    end
+    return ok
+end
+
+---============================================================================
+--- SPELL OBJECTS
+---============================================================================
+
+local RES_TABLES = {
+    WeaponSkill = 'weapon_skills', JobAbility = 'job_abilities', CorsairRoll = 'job_abilities',
+    CorsairShot = 'job_abilities', Samba = 'job_abilities', Waltz = 'job_abilities', Step = 'job_abilities',
+    Flourish1 = 'job_abilities', Flourish2 = 'job_abilities', Flourish3 = 'job_abilities',
+    Jig = 'job_abilities', Rune = 'job_abilities', Ward = 'job_abilities', Effusion = 'job_abilities',
+    PetCommand = 'job_abilities', BloodPactRage = 'job_abilities', BloodPactWard = 'job_abilities',
+}
+local TARGET_TYPES = {me = 'SELF', t = 'MONSTER', bt = 'MONSTER', st = 'MONSTER', p1 = 'PLAYER', pet = 'NPC'}
+
+--- Build a GearSwap spell object from a sequence step (res fills the gaps)
+--- @param step table Action step
+--- @return table spell
+local function build_spell(step)
+    local spell = {}
+    local res = package.loaded.resources
+    if res then
+        local source = res[RES_TABLES[step.type] or 'spells']
+        local found = source and source:with('en', step.name)
+        if found then
+            for key, value in pairs(found) do
+                spell[key] = value
+            end
+            if type(spell.element) == 'number' and res.elements[spell.element] then
+                spell.element = res.elements[spell.element].en
+            end
+            if type(spell.skill) == 'number' and res.skills[spell.skill] then
+                spell.skill = res.skills[spell.skill].en
+            end
+        end
+    end
+    for key, value in pairs(step) do
+        if key ~= 'event' and key ~= 'tp' and key ~= 'target' then
+            spell[key] = value
+        end
+    end
+    spell.name = step.name
+    spell.english = step.name
+    spell.en = step.name
+    spell.interrupted = false
+
+    local raw = step.target or '<me>'
+    local kind = TARGET_TYPES[raw:gsub('[<>]', '')] or 'MONSTER'
+    spell.target = {
+        raw = raw, type = kind, hpp = 100, distance = kind == 'SELF' and 0 or 9,
+        name = kind == 'SELF' and player.name or 'Training Dummy',
+        id = kind == 'SELF' and player.id or 1000, index = kind == 'SELF' and player.index or 100,
+        is_npc = kind ~= 'SELF' and kind ~= 'PLAYER', model_size = 1, status = 'Idle',
+    }
+    return spell
+end
+
+---============================================================================
+--- STEPS
+---============================================================================
+
+local function run_scheduled(seconds)
+    for _, task in ipairs(Env.advance(seconds)) do
+        run_hook('scheduled', task)
+    end
+end
+
+local function run_action(step)
+    local spell = build_spell(step)
+    if step.tp then
+        player.tp = step.tp
+    end
+    Env.cancelled = false
+    run_hook('pretarget', _G.pretarget, spell)
+    if not Env.cancelled then
+        run_hook('precast', _G.precast, spell)
+    end
+    if Env.cancelled then
+        bucket('cancelled').calls = bucket('cancelled').calls + 1
+        return
+    end
+    run_scheduled(tonumber(spell.cast_time) or 0.5)
+    run_hook('midcast', _G.midcast, spell)
+    run_hook('aftercast', _G.aftercast, spell)
+    if spell.tp_cost or spell.prefix == '/weaponskill' then
+        player.tp = 0
+    end
+end
+
+local STEPS = {
+    action = run_action,
+    status = function(step)
+        local old = Env.set_status(step.value)
+        run_hook('status_change', _G.status_change, step.value, old)
+    end,
+    buff = function(step)
+        Env.set_buff(step.name, step.gain ~= false)
+        run_hook('buff_change', _G.buff_change, step.name, step.gain ~= false, {id = 0})
+    end,
+    command = function(step)
+        local hook = step.value:match('^%S+') == 'update' and 'update' or 'command'
+        run_hook(hook, _G.self_command, step.value)
+    end,
+    wait = function(step)
+        run_scheduled(step.seconds)
+    end,
+}
+
+---============================================================================
+--- OUTPUT
+---============================================================================
+
+local function write_result()
+    local lines = {'return {'}
+    local function add(fmt, ...)
+        lines[#lines + 1] = string.format(fmt, ...)
+    end
+    local function hooks_table(name, hooks, order)
+        add('    %s = {', name)
+        for _, hook in ipairs(order) do
+            local e = hooks[hook]
+            local ms = {}
+            for i, v in ipairs(e.ms) do
+                ms[i] = string.format('%.4f', v)
+            end
+            add('        {hook = %q, calls = %d, kb = %.3f, packets = %d, slots = %d, chat = %d, commands = %d, errors = %d, ms = {%s}},',
+                hook, e.calls, e.kb, e.packets, e.slots, e.chat, e.commands, e.errors, table.concat(ms, ', '))
+        end
+        add('    },')
+    end
+    add('    version = 1,')
+    add('    job = %q,', sequence.job or '')
+    add('    passes = %d,', passes)
+    add('    steps = %d,', #(sequence.steps or {}))
+    add('    load_ms = %.3f,', result.load_ms or 0)
+    add('    setup_ms = %.3f,', result.setup_ms or 0)
+    add('    setup_kb = %.1f,', result.setup_kb or 0)
+    add('    cold_ms = %.3f,', result.cold_ms or 0)
+    local cold_order = {}
+    for hook in pairs(result.cold) do
+        table.insert(cold_order, hook)
+    end
+    table.sort(cold_order)
+    hooks_table('hooks', result.hooks, hook_order)
+    hooks_table('cold', result.cold, cold_order)
+    add('    errors = {')
+    for _, err in ipairs(result.errors) do
+        add('        %q,', err)
+    end
+    add('    },')
+    add('    stubbed = {')
+    for name, count in pairs(Env.stubbed) do
+        add('        [%q] = %d,', name, count)
+    end
+    add('    },')
+    add('}')
+
+    local file = assert(Env.real_open(config.out, 'w'))
+    file:write(table.concat(lines, '\n') .. '\n')
+    file:close()
+end
+
+---============================================================================
+--- MAIN
+---============================================================================
+
+Env.install({
+    data_dir = config.data_dir, windower_dir = config.windower_dir, sandbox_dir = config.sandbox_dir,
+    char = config.char, char_dirs = config.char_dirs,
+    profile = {name = sequence.name or config.char, main_job = sequence.job, sub_job = sequence.sub_job,
+        equipment = sequence.equipment},
+})
+
+if BytecodeCache then
+    _G.loadfile = BytecodeCache.wrap(loadfile)
+    table.insert(package.loaders, 3, function(module)
+        local path = config.data_dir .. module:gsub('%.', '/') .. '.lua'
+        return (loadfile(path))
+    end)
+end
+
+-- Load the entry file and run get_sets() (GearSwap's load sequence)
+collectgarbage('collect')
+local kb_before = collectgarbage('count')
+local started = os.clock()
+local chunk, err = loadfile(config.data_dir .. config.entry)
+local ok = chunk ~= nil
+if ok then
+    ok, err = pcall(chunk)
+end
+result.load_ms = (os.clock() - started) * 1000
+if ok and type(_G.get_sets) == 'function' then
+    started = os.clock()
+    ok, err = pcall(_G.get_sets)
+    result.setup_ms = (os.clock() - started) * 1000
+end
+result.setup_kb = collectgarbage('count') - kb_before
+if not ok then
+    table.insert(result.errors, 'load: ' .. tostring(err))
+    write_result()
+    os.exit(1)
+end
+Env.flush()
+run_scheduled(10)
+
+for p = 1, passes do
+    pass = p
+    started = os.clock()
+    for _, step in ipairs(sequence.steps or {}) do
+        local handler = STEPS[step.event]
+        if handler then
+            handler(step)
+        end
+    end
+    if p == 1 then
+        result.cold_ms = (os.clock() - started) * 1000
+    end
+    -- Same starting point for every pass
+    if player.status ~= 'Idle' then
+        local old = Env.set_status('Idle')
+        run_hook('status_change', _G.status_change, 'Idle', old)
+    end
+    collectgarbage('collect')
+end
+
+write_result()
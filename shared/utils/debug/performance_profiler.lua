@@ -8,6 +8,10 @@
 ---   //gs c perf start   - Enable profiling
 ---   //gs c perf stop    - Disable profiling
 ---   //gs c perf status  - Show current status
+---   //gs c perf hist    - Toggle hook latency histograms (see HISTOGRAM MODE)
+---   //gs c perf report  - Show p50/p95/p99 per hook for the current job
+---   //gs c perf export  - Write histograms to data/perf_hist_<Char>_<date>.lua
+---   //gs c perf reset   - Clear histograms
 ---
 --- In code:
 ---   local Profiler = require('shared/utils/debug/performance_profiler')
@@ -20,8 +24,8 @@
 ---
 --- @file    shared/utils/debug/performance_profiler.lua
 --- @author  Tetsouo
---- @version 1.0
---- @date    2025-11-15
+--- @version 1.1 - Histogram mode (per hook/job latency, survives reloads)
+--- @date    Created: 2025-11-15 | Updated: 2026-10-18
 ---============================================================================
 
 local Profiler = {}
@@ -347,6 +351,262 @@ function Profiler.measure(label, code_block)
     })
 end
 
+---============================================================================
+--- HISTOGRAM MODE
+---============================================================================
+--- Aggregates the latency of the GearSwap hooks (precast, midcast, aftercast,
+--- status_change, update, command) per main job into fixed buckets.
+--- Histograms live in windower._perf_hist, so they keep accumulating across
+--- job changes and GearSwap reloads until reset or the addon is unloaded.
+--- Export files are read and merged by perf_hist.py.
+
+local HIST_STATE_FILE = windower.addon_path .. 'data/.profiler_histogram'
+local HIST_VERSION = 1
+
+-- Bucket upper bounds in ms; one extra overflow bucket follows the last bound
+local HIST_BOUNDS = {0.05, 0.1, 0.2, 0.5, 1, 2, 3, 5, 7.5, 10, 15, 20, 30, 50, 75, 100, 150, 200, 300, 500, 1000}
+local HIST_BUCKETS = #HIST_BOUNDS + 1
+
+local HOOKS = {'precast', 'midcast', 'aftercast', 'status_change', 'self_command'}
+local REPORT_ORDER = {'precast', 'midcast', 'aftercast', 'status_change', 'update', 'command'}
+
+if not windower._perf_hist then
+    windower._perf_hist = {
+        enabled = false,
+        started = nil,
+        jobs = {}   -- job -> hook -> {count, sum, max, buckets}
+    }
+    local file = io.open(HIST_STATE_FILE, 'r')
+    if file then
+        file:close()
+        windower._perf_hist.enabled = true
+        windower._perf_hist.started = os.time()
+    end
+end
+local H = windower._perf_hist
+
+--- Bucket index of a duration (binary search over HIST_BOUNDS)
+--- @param ms number Duration in milliseconds
+--- @return number Index in 1..HIST_BUCKETS
+local function bucket_index(ms)
+    local low, high = 1, HIST_BUCKETS
+    while low < high do
+        local mid = math.floor((low + high) / 2)
+        if ms <= HIST_BOUNDS[mid] then
+            high = mid
+        else
+            low = mid + 1
+        end
+    end
+    return low
+end
+
+--- Record one hook duration
+--- @param hook string Hook name
+--- @param ms number Duration in milliseconds
+--- @param job string|nil Job (default: player.main_job)
+function Profiler.record(hook, ms, job)
+    job = job or (player and player.main_job) or 'UNK'
+    local hooks = H.jobs[job]
+    if not hooks then
+        hooks = {}
+        H.jobs[job] = hooks
+    end
+    local hist = hooks[hook]
+    if not hist then
+        local buckets = {}
+        for i = 1, HIST_BUCKETS do
+            buckets[i] = 0
+        end
+        hist = {count = 0, sum = 0, max = 0, buckets = buckets}
+        hooks[hook] = hist
+    end
+    hist.count = hist.count + 1
+    hist.sum = hist.sum + ms
+    if ms > hist.max then
+        hist.max = ms
+    end
+    local index = bucket_index(ms)
+    hist.buckets[index] = hist.buckets[index] + 1
+end
+
+--- Estimate a percentile from a histogram (linear within the bucket)
+--- @param hist table {count, max, buckets}
+--- @param p number Percentile (0-100)
+--- @return number Milliseconds
+function Profiler.percentile(hist, p)
+    if not hist or hist.count == 0 then
+        return 0
+    end
+    local rank = hist.count * p / 100
+    local seen = 0
+    for i = 1, HIST_BUCKETS do
+        local n = hist.buckets[i]
+        if n > 0 and seen + n >= rank then
+            local low = HIST_BOUNDS[i - 1] or 0
+            local high = HIST_BOUNDS[i] or hist.max
+            local value = low + (high - low) * (rank - seen) / n
+            return math.min(value, hist.max)
+        end
+        seen = seen + n
+    end
+    return hist.max
+end
+
+--- Wrap one global hook with a timer
+--- @param name string Global function name
+local function wrap_hook(name)
+    local original = _G[name]
+    if type(original) ~= 'function' then
+        return false
+    end
+    local clock = os.clock
+    local record = Profiler.record
+    -- Records after the call and passes the hook's return values through
+    local function done(hook, start, ...)
+        record(hook, (clock() - start) * 1000)
+        return ...
+    end
+    local wrapped
+    if name == 'self_command' then
+        wrapped = function(command, ...)
+            if not H.enabled then
+                return original(command, ...)
+            end
+            local first = command
+            if type(command) == 'table' then
+                first = command[1]
+            elseif type(command) == 'string' then
+                first = command:match('^%S+')
+            end
+            local start = clock()
+            return done(first == 'update' and 'update' or 'command', start, original(command, ...))
+        end
+    else
+        wrapped = function(...)
+            if not H.enabled then
+                return original(...)
+            end
+            local start = clock()
+            return done(name, start, original(...))
+        end
+    end
+    _G[name] = wrapped
+    return true
+end
+
+--- Install the hook timers (INIT_SYSTEMS, once per GearSwap load).
+--- Hooks stay wrapped until the next reload; disabling skips the timing.
+function Profiler.install_hooks()
+    if _G.PERF_HIST_INSTALLED then
+        return
+    end
+    for _, name in ipairs(HOOKS) do
+        wrap_hook(name)
+    end
+    _G.PERF_HIST_INSTALLED = true
+end
+
+--- Check if histogram mode is enabled
+--- @return boolean
+function Profiler.hist_enabled()
+    return H.enabled == true
+end
+
+--- Toggle histogram mode (persisted in data/.profiler_histogram)
+--- @return boolean New state
+function Profiler.hist_toggle()
+    H.enabled = not H.enabled
+    if H.enabled then
+        local file = io.open(HIST_STATE_FILE, 'w')
+        if file then
+            file:write('enabled')
+            file:close()
+        end
+        H.started = H.started or os.time()
+        Profiler.install_hooks()
+        add_to_chat(207, '[Perf] Histograms ON - play normally, then //gs c perf report | export')
+    else
+        os.remove(HIST_STATE_FILE)
+        add_to_chat(207, '[Perf] Histograms OFF (data kept until reset)')
+    end
+    return H.enabled
+end
+
+--- Clear all histograms
+function Profiler.hist_reset()
+    H.jobs = {}
+    H.started = H.enabled and os.time() or nil
+    add_to_chat(207, '[Perf] Histograms cleared')
+end
+
+--- Show p50/p95/p99 per hook in chat
+--- @param job string|nil Job (default: current main job)
+function Profiler.hist_report(job)
+    job = job or (player and player.main_job) or 'UNK'
+    local hooks = H.jobs[job]
+    add_to_chat(207, string.format('[Perf] %s histograms (%s)', job, H.enabled and 'recording' or 'stopped'))
+    if not hooks then
+        add_to_chat(207, '[Perf] No samples for ' .. job)
+        return
+    end
+    for _, hook in ipairs(REPORT_ORDER) do
+        local hist = hooks[hook]
+        if hist then
+            add_to_chat(207, string.format('[Perf] %-13s n=%-6d p50=%6.2f p95=%6.2f p99=%6.2f max=%7.2f ms',
+                hook, hist.count,
+                Profiler.percentile(hist, 50), Profiler.percentile(hist, 95),
+                Profiler.percentile(hist, 99), hist.max))
+        end
+    end
+end
+
+--- Write the histograms to data/perf_hist_<Char>_<date>.lua
+--- @return string|nil Path written
+function Profiler.hist_export()
+    if not next(H.jobs) then
+        add_to_chat(207, '[Perf] Nothing to export - enable with //gs c perf hist')
+        return nil
+    end
+    local character = (player and player.name) or 'Unknown'
+    local path = string.format('%sdata/perf_hist_%s_%s.lua', windower.addon_path, character, os.date('%Y%m%d_%H%M%S'))
+
+    local bounds = {}
+    for i, bound in ipairs(HIST_BOUNDS) do
+        bounds[i] = tostring(bound)
+    end
+    local lines = {
+        '-- Generated by performance_profiler.lua (//gs c perf export)',
+        'return {',
+        '    version = ' .. HIST_VERSION .. ',',
+        string.format('    character = %q,', character),
+        string.format('    started = %q,', H.started and os.date('%Y-%m-%d %H:%M:%S', H.started) or ''),
+        string.format('    exported = %q,', os.date('%Y-%m-%d %H:%M:%S')),
+        '    bounds = {' .. table.concat(bounds, ', ') .. '},',
+        '    jobs = {',
+    }
+    for job, hooks in pairs(H.jobs) do
+        table.insert(lines, string.format('        [%q] = {', job))
+        for hook, hist in pairs(hooks) do
+            table.insert(lines, string.format('            [%q] = {count = %d, sum = %.4f, max = %.4f, buckets = {%s}},',
+                hook, hist.count, hist.sum, hist.max, table.concat(hist.buckets, ', ')))
+        end
+        table.insert(lines, '        },')
+    end
+    table.insert(lines, '    },')
+    table.insert(lines, '}')
+
+    local file = io.open(path, 'w')
+    if not file then
+        add_to_chat(207, '[Perf] ERROR: could not write to ' .. path)
+        return nil
+    end
+    file:write(table.concat(lines, '\n') .. '\n')
+    file:close()
+    add_to_chat(207, '[Perf] Export OK: ' .. path)
+    return path
+end
+
 ---============================================================================
 --- MODULE EXPORT
 ---============================================================================
@@ -5,17 +5,25 @@
 ---   bags, and identifies items not referenced by any job's sets.
 ---   Exports results to wardrobe_audit.txt for easy review.
 ---
+---   When <CharName>/wardrobe_index.lua (built offline by wardrobe_audit.py)
+---   is present and matches the current set files, it replaces the text
+---   parsing step entirely (also for the wardrobe organizer helpers below).
+---
 ---   Usage: //gs c wardrobeaudit  (or //gs c wa)
 ---
 ---   @file    shared/utils/equipment/wardrobe_auditor.lua
 ---   @author  Tetsouo
----   @version 1.1 - Text parsing (GearSwap blocks loadfile/setfenv)
----   @date    2026-02-13
+---   @version 1.3 - Item names from the shared ItemIndex (no res.items lookups)
+---   @date    2026-10-18
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 local WardrobeAuditor = {}
 
-local res = require('resources')
+local ItemIndex = require('shared/utils/data/item_index')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+-- Report lines share the 'audit' chat budget (message_settings CHAT_QUEUE)
+local add_to_chat = require('shared/utils/messages/core/chat_queue').writer('audit')
 
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   CONSTANTS
@@ -29,14 +37,20 @@ local VALID_JOBS = {
     rng=true, run=true, sam=true, sch=true, smn=true, thf=true, war=true, whm=true,
 }
 
---- Resolve the active character's sets directory. Each char has its own
---- sets folder under data/<CharName>/sets/. Falls back to 'Tetsouo/sets/'
---- if no player info is available (rare race during init).
+--- Resolve the active character's data directory (data/<CharName>/).
+--- Falls back to 'Tetsouo/' if no player info is available (rare race
+--- during init).
 --- @return string Absolute path with trailing slash
-local function sets_dir()
+local function char_dir()
     local p = windower.ffxi.get_player()
     local char_name = (p and p.name) or 'Tetsouo'
-    return windower.addon_path .. 'data/' .. char_name .. '/sets/'
+    return windower.addon_path .. 'data/' .. char_name .. '/'
+end
+
+--- Resolve the active character's sets directory (data/<CharName>/sets/).
+--- @return string Absolute path with trailing slash
+local function sets_dir()
+    return char_dir() .. 'sets/'
 end
 
 --- Recursively walk a directory tree and return all .lua file paths.
@@ -122,6 +136,57 @@ local function discover_jobs()
     return jobs
 end
 
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PREBUILT INDEX (wardrobe_audit.py)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local INDEX_FILE = 'wardrobe_index.lua'
+local INDEX_VERSION = 2
+
+--- Load data/<CharName>/wardrobe_index.lua (generated by wardrobe_audit.py).
+--- The index is only trusted when it lists exactly the current set files
+--- with the same content stamps (FileStamp) - any edit since the last
+--- `python wardrobe_audit.py` makes callers fall back to text parsing.
+--- @return table|nil {jobs={JOB,...}, items={[name_lower]={JOB,..., bags={id,...}}}}
+local function load_index()
+    local ok, index = pcall(dofile, char_dir() .. INDEX_FILE)
+    if not ok or type(index) ~= 'table' or index.version ~= INDEX_VERSION
+        or type(index.sources) ~= 'table' or type(index.items) ~= 'table' then
+        return nil
+    end
+
+    local dir = sets_dir()
+    local files = walk_lua_files(dir)
+    local indexed = 0
+    for _ in pairs(index.sources) do indexed = indexed + 1 end
+    if indexed ~= #files then
+        return nil
+    end
+    for _, path in ipairs(files) do
+        local rel = path:sub(#dir + 1):gsub('\\', '/')
+        if not FileStamp.matches(path, index.sources[rel]) then
+            return nil
+        end
+    end
+
+    return index
+end
+
+--- Convert index items to the text parser's accumulator format
+--- @param index table Loaded index
+--- @return table {[item_name_lower] = {[JOB]=true, ...}}
+local function used_items_from_index(index)
+    local used_items = {}
+    for name, entry in pairs(index.items) do
+        local jobs = {}
+        for _, job in ipairs(entry) do
+            jobs[job] = true
+        end
+        used_items[name] = jobs
+    end
+    return used_items
+end
+
 local WARDROBE_BAGS = {
     'wardrobe', 'wardrobe2', 'wardrobe3', 'wardrobe4',
     'wardrobe5', 'wardrobe6', 'wardrobe7', 'wardrobe8'
@@ -268,27 +333,6 @@ end
 ---   WARDROBE SCANNING
 ---  ═══════════════════════════════════════════════════════════════════════════
 
---- Collect all name variants for an item (short, full, log forms)
---- Set files may use any variant (e.g. "Spaekona's Coat +4" vs "Spae. Coat +4")
---- @param item_data table Resource item data from res.items[id]
---- @return table Array of lowercase name variants
-local function get_all_names(item_data)
-    local names = {}
-    local seen = {}
-    local fields = {'en', 'english', 'enl', 'english_log'}
-    for _, field in ipairs(fields) do
-        local n = item_data[field]
-        if n and type(n) == 'string' and n ~= '' then
-            local lower = n:lower()
-            if not seen[lower] then
-                seen[lower] = true
-                table.insert(names, lower)
-            end
-        end
-    end
-    return names
-end
-
 --- Scan all wardrobe bags and return their contents
 --- @return table {bag_name = {{name=string, id=number, all_names=table}, ...}}
 --- @return number Total item count
@@ -308,17 +352,16 @@ local function scan_wardrobes()
         if bag and type(bag) == 'table' then
             for _, item in pairs(bag) do
                 if type(item) == 'table' and item.id and item.id > 0 then
-                    local item_data = res.items[item.id]
-                    if item_data then
-                        local name = item_data.en or item_data.english
-                        if name then
-                            table.insert(wardrobe_contents[bag_name], {
-                                name = name,
-                                id = item.id,
-                                all_names = get_all_names(item_data),
-                            })
-                            total = total + 1
-                        end
+                    -- All name variants (short, full, log forms): set files
+                    -- may use any of them ("Spaekona's Coat +4" vs "Spae. Coat +4")
+                    local name = ItemIndex.name_of(item.id)
+                    if name then
+                        table.insert(wardrobe_contents[bag_name], {
+                            name = name,
+                            id = item.id,
+                            all_names = ItemIndex.names_of(item.id),
+                        })
+                        total = total + 1
                     end
                 end
             end
@@ -344,8 +387,9 @@ end
 --- @param used_items table Master used items set
 --- @param jobs_loaded table {job_upper = true}
 --- @param jobs_failed table {job_upper = error_msg}
+--- @param source string Where item usage came from (index or set files)
 --- @return string|nil File path on success
-local function export_report(unused, total_items, total_ignored, used_items, jobs_loaded, jobs_failed)
+local function export_report(unused, total_items, total_ignored, used_items, jobs_loaded, jobs_failed, source)
     local output_path = windower.addon_path .. 'data/wardrobe_audit.txt'
     local lines = {}
 
@@ -354,6 +398,7 @@ local function export_report(unused, total_items, total_ignored, used_items, job
     table.insert(lines, sep)
     table.insert(lines, "  WARDROBE AUDIT - Unused Items Report")
     table.insert(lines, "  Date: " .. os.date('%Y-%m-%d %H:%M'))
+    table.insert(lines, "  Source: " .. source)
 
     -- Jobs info
     local loaded_list = {}
@@ -485,19 +530,30 @@ function WardrobeAuditor.audit()
     local used_items = {}  -- {[item_name_lower] = {[JOB]=true}}
     local jobs_loaded = {}
     local jobs_failed = {}
+    local source
 
-    local jobs = discover_jobs()
-    for _, job_lower in ipairs(jobs) do
-        local job_upper = job_lower:upper()
-        local status, err = parse_job_sets(job_lower, used_items)
-
-        if status == true then
+    local index = load_index()
+    if index then
+        used_items = used_items_from_index(index)
+        for _, job_upper in ipairs(index.jobs or {}) do
             jobs_loaded[job_upper] = true
-        elseif status == 'missing' then
-            -- Should not happen since we auto-discovered, but skip silently
-        else
-            jobs_failed[job_upper] = err or 'unknown error'
         end
+        source = INDEX_FILE .. " (generated " .. tostring(index.generated) .. ")"
+    else
+        local jobs = discover_jobs()
+        for _, job_lower in ipairs(jobs) do
+            local job_upper = job_lower:upper()
+            local status, err = parse_job_sets(job_lower, used_items)
+
+            if status == true then
+                jobs_loaded[job_upper] = true
+            elseif status == 'missing' then
+                -- Should not happen since we auto-discovered, but skip silently
+            else
+                jobs_failed[job_upper] = err or 'unknown error'
+            end
+        end
+        source = "set files (text parse - run wardrobe_audit.py for exact results)"
     end
 
     local loaded_count = 0
@@ -565,7 +621,7 @@ function WardrobeAuditor.audit()
     end
 
     -- PHASE 4: Export to txt
-    local export_path = export_report(unused, total_items, total_ignored, used_items, jobs_loaded, jobs_failed)
+    local export_path = export_report(unused, total_items, total_ignored, used_items, jobs_loaded, jobs_failed, source)
 
     -- PHASE 5: Show in-game summary
     show_ingame_summary(unused, total_items, loaded_count, unique_count, export_path)
@@ -577,6 +633,10 @@ end
 --- Used by the wardrobe organizer to compute frequency-based wardrobe layout.
 --- @return table {[item_name_lower] = {[JOB]=true, ...}}
 function WardrobeAuditor.build_frequency_map()
+    local index = load_index()
+    if index then
+        return used_items_from_index(index)
+    end
     local used_items = {}
     for _, job_lower in ipairs(discover_jobs()) do
         parse_job_sets(job_lower, used_items)
@@ -608,6 +668,16 @@ local BAG_NAME_TO_ID = {
 function WardrobeAuditor.build_pinned_bags()
     local pinned = {}  -- item_name_lower -> set of bag ids (deduped)
 
+    local index = load_index()
+    if index then
+        for name, entry in pairs(index.items) do
+            if entry.bags then
+                pinned[name] = {unpack(entry.bags)}
+            end
+        end
+        return pinned
+    end
+
     local function add_pin(name, bag)
         local bag_id = BAG_NAME_TO_ID[bag:lower()]
         if not bag_id then return end
@@ -674,6 +744,10 @@ end
 ---
 --- @return table {[item_name_lower] = {[JOB_UPPER] = true, ...}}
 function WardrobeAuditor.collect_all_used_names()
+    local index = load_index()
+    if index then
+        return used_items_from_index(index)
+    end
     local used = {}
     for _, job_lower in ipairs(discover_jobs()) do
         local status, _err = parse_job_sets(job_lower, used)
@@ -16,12 +16,16 @@
 ---
 ---   @file    shared/utils/inventory/quiver_manager.lua
 ---   @author  Tetsouo
----   @version 1.0
+---   @version 1.1
 ---   @date    Created: 2026-05-03
+---   @date    Updated: 2026-10-18 - Shared ItemIndex / BagScanner lookups
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 local QuiverManager = {}
 
+local BagScanner = require('shared/utils/inventory/refill/bag_scanner')
+local ItemIndex  = require('shared/utils/data/item_index')
+
 --- Bag string keys scanned for ammo (matches windower.ffxi.get_items()).
 --- Inventory + every wardrobe; W7 (craft) included for completeness.
 local AMMO_BAGS = {
@@ -38,47 +42,6 @@ local OPEN_COOLDOWN = 8.0
 --- Per-quiver-name last-use timestamp.
 local last_open = {}
 
---- Count total instances of an item in a bag.
---- @param bag table|nil  windower.ffxi.get_items()[bag_key]
---- @param target_id number
---- @return number
-local function count_in_bag(bag, target_id)
-    if type(bag) ~= 'table' then return 0 end
-    local total = 0
-    for slot, item in pairs(bag) do
-        if type(slot) == 'number' and type(item) == 'table'
-           and item.id == target_id and item.count and item.count > 0 then
-            total = total + item.count
-        end
-    end
-    return total
-end
-
---- Lazy-built name->id index over res.items (covers en/enl/log forms).
-local _name_to_id = nil
-
-local function build_name_index()
-    local res = require('resources')
-    local idx = {}
-    for id, data in pairs(res.items) do
-        if data then
-            for _, field in ipairs({'en', 'enl', 'name', 'name_log'}) do
-                local v = data[field]
-                if type(v) == 'string' then
-                    local key = v:lower()
-                    if not idx[key] then idx[key] = id end
-                end
-            end
-        end
-    end
-    return idx
-end
-
-local function resolve_id(name)
-    if not _name_to_id then _name_to_id = build_name_index() end
-    return _name_to_id[name:lower()]
-end
-
 --- Check if a quiver should be opened, and open it if so.
 --- @param ammo_name string    e.g. 'Acid Bolt'
 --- @param quiver_name string  e.g. 'Ac. Bolt Quiver'
@@ -94,8 +57,8 @@ function QuiverManager.check_and_refill(ammo_name, quiver_name, threshold)
         return false
     end
 
-    local ammo_id = resolve_id(ammo_name)
-    local quiver_id = resolve_id(quiver_name)
+    local ammo_id = ItemIndex.id_of(ammo_name)
+    local quiver_id = ItemIndex.id_of(quiver_name)
     if not ammo_id or not quiver_id then
         return false
     end
@@ -106,7 +69,7 @@ function QuiverManager.check_and_refill(ammo_name, quiver_name, threshold)
     -- Count ammo across inventory + all wardrobes
     local ammo_total = 0
     for _, bag_key in ipairs(AMMO_BAGS) do
-        ammo_total = ammo_total + count_in_bag(items[bag_key], ammo_id)
+        ammo_total = ammo_total + BagScanner.count_item_in_bag(items, bag_key, ammo_id)
     end
 
     if ammo_total > threshold then
@@ -114,7 +77,7 @@ function QuiverManager.check_and_refill(ammo_name, quiver_name, threshold)
     end
 
     -- Quiver must be in inventory for /item to work
-    local quiver_in_inv = count_in_bag(items.inventory, quiver_id)
+    local quiver_in_inv = BagScanner.count_item_in_bag(items, 'inventory', quiver_id)
     if quiver_in_inv <= 0 then
         local ok, MessageFormatter = pcall(require, 'shared/utils/messages/message_formatter')
         if ok and MessageFormatter and MessageFormatter.show_warning then
@@ -1,10 +1,10 @@
 ---  ═══════════════════════════════════════════════════════════════════════════
----   Item Resolver - Lazy item name -> resource ID lookup
+---   Item Resolver - Item name -> resource ID lookup for refill entries
 ---  ═══════════════════════════════════════════════════════════════════════════
----   Builds a name-to-id index from res.items on first call (one-time cost,
----   ~30k entries) and caches it for O(1) lookups thereafter. Without this
----   cache, scanning all res.items for every refill entry causes a
----   multi-second freeze.
+---   Thin wrapper over the shared ItemIndex (shared/utils/data/item_index.lua).
+---   The index used to be rebuilt here from res.items (~30k entries) after
+---   every `gs reload`, i.e. after every job change; ItemIndex keeps it in a
+---   windower-persisted table and can load it prebuilt by build_item_index.py.
 ---
 ---   Matches against ALL common name fields (en, enl, name, name_log) so
 ---   callers can use either the full form ("Red Curry Bun +1") or FFXI's
@@ -16,44 +16,20 @@
 ---
 ---   @file    shared/utils/inventory/refill/item_resolver.lua
 ---   @author  Tetsouo
----   @version 1.0
+---   @version 1.1
 ---   @date    Created: 2026-05-09 (extracted from refill_manager.lua)
+---   @date    Updated: 2026-10-18 - Shared ItemIndex instead of a private scan
 ---  ═══════════════════════════════════════════════════════════════════════════
 
-local res = require('resources')
+local ItemIndex = require('shared/utils/data/item_index')
 
 local ItemResolver = {}
 
--- Lazy-built name->id lookup table (populated once on first call)
-local _name_to_id = nil
-
-local function build_name_index()
-    local idx = {}
-    for id, item_data in pairs(res.items) do
-        if item_data then
-            for _, field in ipairs({'en', 'enl', 'name', 'name_log'}) do
-                local v = item_data[field]
-                if type(v) == 'string' then
-                    local key = v:lower()
-                    -- First match wins; later collisions ignored (rare anyway)
-                    if not idx[key] then
-                        idx[key] = id
-                    end
-                end
-            end
-        end
-    end
-    return idx
-end
-
---- Resolve item name to resource ID via res.items.
+--- Resolve item name to resource ID via the shared item index.
 --- @param item_name string The English item name (full or log form)
 --- @return number|nil Item ID or nil if not found
 function ItemResolver.resolve_item_id(item_name)
-    if not _name_to_id then
-        _name_to_id = build_name_index()
-    end
-    return _name_to_id[item_name:lower()]
+    return ItemIndex.id_of(item_name)
 end
 
 --- Normalise an entry's name field into a list of {display_name, item_id} tuples,
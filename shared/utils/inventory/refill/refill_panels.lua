@@ -19,6 +19,8 @@
 
 local RefillPanels = {}
 
+local ChatQueue = require('shared/utils/messages/core/chat_queue')
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   CONSTANTS
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -58,7 +60,7 @@ local AMMO_KEYWORDS = {'bolt', 'arrow', 'bullet', 'shuriken', 'quiver', 'cartrid
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 local function send(line)
-    windower.add_to_chat(CHANNEL, line)
+    ChatQueue.send(CHANNEL, line, 'refill')
 end
 
 local function separator()
@@ -10,7 +10,7 @@
 ---
 ---   This file is now a thin orchestrator (~150 lines). The actual logic
 ---   lives in 4 specialized sub-modules under refill/:
----     • item_resolver   - lazy item name -> resource ID lookup with cache
+---     • item_resolver   - item name -> resource ID lookup (shared ItemIndex)
 ---     • bag_scanner     - count item stacks across FFXI bags
 ---     • config_resolver - load per-character refill configs + foreign detection
 ---     • refill_panels   - 74-char ASCII display (start banner, report, errors)
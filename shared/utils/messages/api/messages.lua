@@ -127,7 +127,8 @@ function Messages.system(level, message)
     local formatted = string.format("[SYSTEM] %s", message)
 
     get_MessageRenderer().send(formatted, color, {
-        level = (level == "error" and 2) or (level == "warning" and 1) or 0
+        level = (level == "error" and 2) or (level == "warning" and 1) or 0,
+        category = (level == "error" or level == "debug") and level or nil
     })
 end
 
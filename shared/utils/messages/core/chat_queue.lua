@@ -0,0 +1,211 @@
+---============================================================================
+--- Chat Queue - Coalesced, rate-limited chat output
+---============================================================================
+--- Every line of the message system goes through ChatQueue.send(). A line
+--- is sent at once while its category has budget left in the current tick
+--- (MessageSettings.CHAT_QUEUE.budgets). Past the budget:
+---   • 'debug' lines are dropped (counted in //gs c chatqueue)
+---   • other lines wait in their category queue, and a repeat of the last
+---     queued line only raises its count (sent once as "line (x12)")
+---   • a scheduled tick sends each category's budget of waiting lines,
+---     until all queues are empty
+---
+--- Order is kept inside a category; categories flush side by side, so a
+--- long command listing does not hold back an error line.
+---
+--- Usage:
+---   ChatQueue.send(color, text, category)
+---   local add_to_chat = ChatQueue.writer('commands')   -- drop-in replacement
+---
+--- @file    shared/utils/messages/core/chat_queue.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local ChatQueue = {}
+
+local DEFAULTS = {
+    enabled = true,
+    interval = 0.1,
+    max_queue = 400,
+    budgets = {default = 12, debug = 4},
+}
+
+-- Settings (message_settings.lua), read once per load. Not cached while
+-- message_settings itself is loading (its error message comes through here)
+local settings = nil
+local function get_settings()
+    if not settings then
+        local ok, MessageSettings = pcall(require, 'shared/config/message_settings')
+        settings = ok and type(MessageSettings) == 'table' and MessageSettings.CHAT_QUEUE or nil
+    end
+    return settings or DEFAULTS
+end
+
+local queues = {}        -- [category] = {{color, text, count}, ...}
+local order = {}         -- categories with waiting lines, first queued first
+local used = {}          -- [category] = lines sent in the current tick
+local tick_started = 0
+local waiting = 0
+local scheduled = false
+
+local stats = {sent = 0, queued = 0, merged = 0, dropped = 0, ticks = 0, peak = 0}
+
+---============================================================================
+--- INTERNALS
+---============================================================================
+
+--- Lines per tick for a category
+local function budget(category)
+    local budgets = get_settings().budgets or DEFAULTS.budgets
+    return budgets[category] or budgets.default or DEFAULTS.budgets.default
+end
+
+--- Start a new tick once the interval has passed
+local function refresh_tick()
+    local now = os.clock()
+    if now - tick_started >= (get_settings().interval or DEFAULTS.interval) then
+        tick_started = now
+        used = {}
+    end
+end
+
+local function emit(color, text, category)
+    add_to_chat(color, text)
+    used[category] = (used[category] or 0) + 1
+    stats.sent = stats.sent + 1
+end
+
+local flush_tick
+
+local function schedule_flush()
+    if not scheduled then
+        scheduled = true
+        coroutine.schedule(flush_tick, get_settings().interval or DEFAULTS.interval)
+    end
+end
+
+--- Send each category's budget of waiting lines
+--- @param drain boolean|nil Ignore budgets and empty every queue
+local function flush(drain)
+    local remaining = {}
+    for _, category in ipairs(order) do
+        local queue = queues[category]
+        local limit = drain and math.huge or budget(category) - (used[category] or 0)
+        local sent = 0
+        while sent < limit and #queue > 0 do
+            local line = table.remove(queue, 1)
+            local text = line.count > 1 and string.format('%s (x%d)', line.text, line.count) or line.text
+            emit(line.color, text, category)
+            waiting = waiting - 1
+            sent = sent + 1
+        end
+        if #queue > 0 then
+            remaining[#remaining + 1] = category
+        else
+            queues[category] = nil
+        end
+    end
+    order = remaining
+end
+
+flush_tick = function()
+    scheduled = false
+    stats.ticks = stats.ticks + 1
+    tick_started = os.clock()
+    used = {}
+    flush()
+    if waiting > 0 then
+        schedule_flush()
+    end
+end
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- Send one chat line under its category budget
+--- @param color number FFXI chat color
+--- @param text string Line (already formatted)
+--- @param category string|nil Budget category (default 'default')
+function ChatQueue.send(color, text, category)
+    category = category or 'default'
+    local config = get_settings()
+    if not config.enabled then
+        add_to_chat(color, text)
+        stats.sent = stats.sent + 1
+        return
+    end
+
+    refresh_tick()
+    local queue = queues[category]
+    if not queue and (used[category] or 0) < budget(category) then
+        emit(color, text, category)
+        return
+    end
+    if category == 'debug' then
+        stats.dropped = stats.dropped + 1
+        return
+    end
+
+    if not queue then
+        queue = {}
+        queues[category] = queue
+        order[#order + 1] = category
+    end
+    local last = queue[#queue]
+    if last and last.color == color and last.text == text then
+        last.count = last.count + 1
+        stats.merged = stats.merged + 1
+        return
+    end
+    if waiting >= (config.max_queue or DEFAULTS.max_queue) then
+        stats.dropped = stats.dropped + 1
+        return
+    end
+    queue[#queue + 1] = {color = color, text = text, count = 1}
+    waiting = waiting + 1
+    stats.queued = stats.queued + 1
+    if waiting > stats.peak then
+        stats.peak = waiting
+    end
+    schedule_flush()
+end
+
+--- add_to_chat replacement bound to one category
+--- @param category string Budget category
+--- @return function(color, text)
+function ChatQueue.writer(category)
+    return function(color, text)
+        ChatQueue.send(color, text, category)
+    end
+end
+
+--- Send every waiting line now (job file unload)
+function ChatQueue.flush_all()
+    if waiting > 0 then
+        flush(true)
+    end
+end
+
+--- @return number Lines waiting
+function ChatQueue.pending()
+    return waiting
+end
+
+--- Show counters in chat (sent directly, not queued)
+function ChatQueue.status()
+    local config = get_settings()
+    add_to_chat(207, string.format('[ChatQueue] %s | %.2fs tick, %d lines default budget',
+        config.enabled and 'ON' or 'OFF', config.interval or DEFAULTS.interval, budget('default')))
+    add_to_chat(207, string.format('[ChatQueue] sent %d, queued %d (peak %d, waiting %d), merged %d, dropped %d, ticks %d',
+        stats.sent, stats.queued, stats.peak, waiting, stats.merged, stats.dropped, stats.ticks))
+end
+
+--- Reset the counters
+function ChatQueue.reset_stats()
+    stats = {sent = 0, queued = 0, merged = 0, dropped = 0, ticks = 0, peak = 0}
+end
+
+return ChatQueue
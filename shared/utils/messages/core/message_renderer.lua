@@ -12,6 +12,9 @@
 
 local MessageRenderer = {}
 
+-- Lines go out through the rate-limited chat queue (budget per options.category)
+local ChatQueue = require('shared/utils/messages/core/chat_queue')
+
 ---============================================================================
 --- CONFIGURATION
 ---============================================================================
@@ -111,6 +114,9 @@ function MessageRenderer.send(message, color, options)
         message = string.format("[%s] %s", time, message)
     end
 
+    -- Chat budget: explicit category, else the namespace ('COMMANDS' -> 'commands')
+    local category = options.category or (options.namespace and options.namespace:lower())
+
     -- Check if message contains newlines (\n)
     -- If yes: split into multiple add_to_chat() calls (fixes FFXI alignment issues)
     if message:find("\n") then
@@ -121,11 +127,11 @@ function MessageRenderer.send(message, color, options)
 
         -- Send each line separately
         for _, line in ipairs(lines) do
-            add_to_chat(color, line)
+            ChatQueue.send(color, line, category)
         end
     else
         -- Single line: normal send
-        add_to_chat(color, message)
+        ChatQueue.send(color, message, category)
     end
 
     -- Update statistics
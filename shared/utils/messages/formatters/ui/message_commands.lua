@@ -14,6 +14,9 @@ local MessageCommands = {}
 local M = require('shared/utils/messages/api/messages')
 local MessageColors = require('shared/utils/messages/message_colors')
 
+-- Command listings share the 'commands' chat budget (message_settings CHAT_QUEUE)
+local add_to_chat = require('shared/utils/messages/core/chat_queue').writer('commands')
+
 ---============================================================================
 --- TESTCOLORS COMMAND
 ---============================================================================
@@ -553,6 +556,8 @@ function MessageCommands.show_commands_list()
     add_to_chat(121, cyan .. "   //gs c wardrobeaudit" .. gray .. " (or " .. cyan .. "wa" .. gray .. ") " .. white .. "Audit wardrobe across all jobs")
     add_to_chat(121, cyan .. "   //gs c worganize" .. gray .. " (or " .. cyan .. "wo" .. gray .. ") ... " .. white .. "Organize wardrobes by job usage")
     add_to_chat(121, cyan .. "   //gs c worganize alt" .. gray .. " ..... " .. white .. "Alt mode (4-wardrobe characters)")
+    add_to_chat(121, cyan .. "   //gs c worganize plan" .. gray .. " .... " .. white .. "Precomputed move plan (fewer packets)")
+    add_to_chat(121, cyan .. "   //gs c worganize bench" .. gray .. " ... " .. white .. "Planner vs current algorithm (no moves)")
     add_to_chat(121, cyan .. "   //gs c refill" .. gray .. " (or " .. cyan .. "rf" .. gray .. ") ..... " .. white .. "Pull consumables from Case/Sack")
 
     -- Craft & Fish
@@ -620,10 +625,19 @@ function MessageCommands.show_commands_list()
     -- Performance & Testing
     add_to_chat(121, " ")
     add_to_chat(121, green .. ">> PERFORMANCE & TESTING")
-    add_to_chat(121, cyan .. "   //gs c perf " .. yellow .. "[start|stop]" .. gray .. " .. " .. white .. "Performance profiler")
+    add_to_chat(121, cyan .. "   //gs c perf " .. yellow .. "[start|stop|hist|report|export|record]" .. gray .. " " .. white .. "Performance profiler")
     add_to_chat(121, cyan .. "   //gs c fulltest" .. gray .. " (or " .. cyan .. "ft" .. gray .. ") ... " .. white .. "Run full in-game test suite")
     add_to_chat(121, cyan .. "   //gs c syscheck" .. gray .. " (or " .. cyan .. "sc" .. gray .. ") ... " .. white .. "System health check with score")
     add_to_chat(121, cyan .. "   //gs c lagdebug" .. gray .. " (or " .. cyan .. "ldb" .. gray .. ") .. " .. white .. "Lag debugger (toggle/export/reset)")
+    add_to_chat(121, cyan .. "   //gs c equipdiff " .. yellow .. "[on|off|stats]" .. gray .. " " .. white .. "Skip already-worn slots in equip()")
+    add_to_chat(121, cyan .. "   //gs c actionindex " .. yellow .. "[stats|check]" .. gray .. " " .. white .. "Spell/ability/WS index vs databases")
+    add_to_chat(121, cyan .. "   //gs c bytecode " .. yellow .. "[build|bench|on|off]" .. gray .. " " .. white .. "Precompiled Lua cache for faster reloads")
+    add_to_chat(121, cyan .. "   //gs c warmreload " .. yellow .. "[on|off|check]" .. gray .. " " .. white .. "Keep job-agnostic modules across job changes")
+    add_to_chat(121, cyan .. "   //gs c chatqueue " .. yellow .. "[flush|reset]" .. gray .. " " .. white .. "Chat output budget counters")
+    add_to_chat(121, cyan .. "   //gs c cmdbench " .. yellow .. "[n]" .. gray .. " " .. white .. "Command table vs scan dispatch benchmark")
+    add_to_chat(121, cyan .. "   //gs c debuffbench " .. yellow .. "[n]" .. gray .. " " .. white .. "Precast debuff state vs scan benchmark")
+    add_to_chat(121, cyan .. "   //gs c packets " .. yellow .. "[reset]" .. gray .. " " .. white .. "Shared packet listener counters")
+    add_to_chat(121, cyan .. "   //gs c automove " .. yellow .. "[poll|event|reset]" .. gray .. " " .. white .. "AutoMove detection mode / wakeups per minute")
     add_to_chat(121, cyan .. "   //gs c memcheck " .. yellow .. "[gc]" .. gray .. " (or " .. cyan .. "mem" .. gray .. ") " .. white .. "Show GearSwap Lua RAM usage")
     add_to_chat(121, cyan .. "   //gs c testmsg " .. yellow .. "[job]" .. gray .. " (or " .. cyan .. "msgtest" .. gray .. ") " .. white .. "Test message system")
     add_to_chat(121, cyan .. "   //gs c msgtests" .. gray .. " ........ " .. white .. "Validate message system")
@@ -183,11 +183,37 @@ function MessageUI.show_help()
     add_to_chat(121, green .. "//gs c ui bg <r> <g> <b> <a>" .. gray .. " [Set custom RGBA]")
     add_to_chat(121, green .. "//gs c ui bg toggle" .. gray .. " [Toggle background visibility]")
     add_to_chat(121, green .. "//gs c ui bg list" .. gray .. " [List all available presets]")
+    add_to_chat(121, green .. "//gs c ui tracker [dirty|snapshot]" .. gray .. " [Update stats / switch change tracking]")
 
     -- Footer
     add_to_chat(121, gray .. separator)
 end
 
+--- Display UI update tracker stats (//gs c ui tracker)
+--- @param stats table StateTracker.stats
+function MessageUI.show_tracker_stats(stats)
+    local gray = string.char(0x1F, 160)
+    local yellow = string.char(0x1F, 50)
+    local green = string.char(0x1F, 158)
+    local separator = string.rep("=", 70)
+
+    local redraws = stats.full + stats.partial
+    local avg_kb = stats.alloc_samples > 0 and (stats.alloc_kb / stats.alloc_samples) or 0
+    local sections = stats.sections_rendered + stats.sections_reused
+
+    add_to_chat(121, gray .. separator)
+    add_to_chat(121, yellow .. "[UI] Update Tracker - " .. stats.mode .. " mode")
+    add_to_chat(121, gray .. separator)
+    add_to_chat(121, green .. "Updates: " .. gray .. string.format("%d (%d skipped, %d redraws: %d full / %d partial)",
+        stats.updates, stats.skipped, redraws, stats.full, stats.partial))
+    add_to_chat(121, green .. "Sections: " .. gray .. string.format("%d rendered / %d reused",
+        stats.sections_rendered, stats.sections_reused) ..
+        (sections > 0 and string.format(" (%.0f%% reused)", stats.sections_reused * 100 / sections) or ""))
+    add_to_chat(121, green .. "Allocated: " .. gray .. string.format("%.2f KB/update avg, %.2f KB max (%d samples)",
+        avg_kb, stats.alloc_max, stats.alloc_samples))
+    add_to_chat(121, gray .. separator)
+end
+
 ---============================================================================
 --- MODULE EXPORT
 ---============================================================================
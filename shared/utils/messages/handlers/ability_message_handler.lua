@@ -44,6 +44,7 @@ local AbilityMessageHandler = {}
 
 local MessageFormatter = require('shared/utils/messages/message_formatter')
 local MessageCore = require('shared/utils/messages/message_core')
+local ActionIndex = require('shared/utils/data/action_index')
 
 ---============================================================================
 --- DUPLICATE PREVENTION
@@ -119,23 +120,41 @@ local function find_ability_in_databases(ability_name)
         return abilities_table and abilities_table[ability_name] or nil
     end
 
-    -- FAST PATH: the caster's own main + sub job databases (1-2 files).
+    -- Action index: only the job databases that hold the ability are opened;
+    -- a name the index does not know as an ability skips straight to Blood Pacts.
+    -- A stale entry (no owner matched) falls through to the full scan.
+    local entry = ActionIndex.get('ability', ability_name)
+    local owners = entry and entry.owners
+    local skip_jobs = not entry and ActionIndex.get('spell', ability_name) ~= nil
+
     local player = windower.ffxi.get_player()
-    if player then
-        for _, job_code in ipairs({ player.main_job, player.sub_job }) do
-            local ability_data = lookup(load_ja_db(job_code))
-            if ability_data then
-                return ability_data, job_code
+    for pass = 1, owners and 2 or 1 do
+        if skip_jobs then
+            break
+        end
+
+        -- FAST PATH: the caster's own main + sub job databases (1-2 files).
+        if player then
+            for _, job_code in ipairs({ player.main_job, player.sub_job }) do
+                if not owners or owners[job_code] then
+                    local ability_data = lookup(load_ja_db(job_code))
+                    if ability_data then
+                        return ability_data, job_code
+                    end
+                end
             end
         end
-    end
 
-    -- FALLBACK: remaining job databases (abilities outside the caster's main/sub).
-    for _, job_code in ipairs(JOBS) do
-        local ability_data = lookup(load_ja_db(job_code))
-        if ability_data then
-            return ability_data, job_code
+        -- FALLBACK: remaining job databases (abilities outside the caster's main/sub).
+        for _, job_code in ipairs(JOBS) do
+            if not owners or owners[job_code] then
+                local ability_data = lookup(load_ja_db(job_code))
+                if ability_data then
+                    return ability_data, job_code
+                end
+            end
         end
+        owners = nil
     end
 
     -- PRIORITY 2: Fallback to SMN spell database for Blood Pacts
@@ -20,6 +20,8 @@
 ---   - Databases load on-demand when first spell is cast (not at require time)
 ---   - Lazy-loaded on first spell usage
 ---   - Once loaded, databases remain cached for instant access
+---   - Action index (action_index.py) names the database(s) holding a spell,
+---     so a miss on the fast path no longer opens every database in turn
 ---
 --- Examples:
 ---   - WAR/RDM casting Haste >> Shows message from ENHANCING_MAGIC_DATABASE
@@ -43,6 +45,7 @@ local SpellMessageHandler = {}
 
 local MessageFormatter = require('shared/utils/messages/message_formatter')
 local MessageCore = require('shared/utils/messages/message_core')
+local ActionIndex = require('shared/utils/data/action_index')
 
 ---============================================================================
 --- MAGIC DATABASES (LAZY, PER-SKILL LOADING)
@@ -139,6 +142,7 @@ end
 ---============================================================================
 
 --- Search for a spell, loading only the database(s) actually needed.
+--- The action index, when present, restricts both paths to the owning databases.
 --- Fast path: the spell's own skill maps to a single database (1 require).
 --- Fallback: scan the remaining databases in priority order (skill before job).
 --- @param spell table Spell object from GearSwap (needs .name and .skill)
@@ -147,23 +151,31 @@ end
 local function find_spell_in_databases(spell)
     local spell_name = spell.name
 
-    -- FAST PATH: one database, selected by the spell's skill.
-    local fast_path = spell.skill and SKILL_PATH[spell.skill]
-    if fast_path then
-        local db = load_db(fast_path)
-        if db and db.spells and db.spells[spell_name] then
-            return db.spells[spell_name], spell.skill
-        end
-    end
+    -- Action index: only the databases that hold the spell are opened.
+    -- A stale entry (no owner matched) falls through to the full scan below.
+    local entry = ActionIndex.get('spell', spell_name)
+    local owners = entry and entry.owners
 
-    -- FALLBACK: handles skill/category mismatches and job-unique spells.
-    for _, db_entry in ipairs(FALLBACK_DATABASES) do
-        if db_entry.path ~= fast_path then
-            local db = load_db(db_entry.path)
+    for pass = 1, owners and 2 or 1 do
+        -- FAST PATH: one database, selected by the spell's skill.
+        local fast_path = spell.skill and SKILL_PATH[spell.skill]
+        if fast_path and (not owners or owners[fast_path]) then
+            local db = load_db(fast_path)
             if db and db.spells and db.spells[spell_name] then
-                return db.spells[spell_name], db_entry.name
+                return db.spells[spell_name], spell.skill
+            end
+        end
+
+        -- FALLBACK: handles skill/category mismatches and job-unique spells.
+        for _, db_entry in ipairs(FALLBACK_DATABASES) do
+            if db_entry.path ~= fast_path and (not owners or owners[db_entry.path]) then
+                local db = load_db(db_entry.path)
+                if db and db.spells and db.spells[spell_name] then
+                    return db.spells[spell_name], db_entry.name
+                end
             end
         end
+        owners = nil
     end
 
     return nil, nil
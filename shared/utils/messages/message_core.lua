@@ -13,6 +13,17 @@ local MessageCore = {}
 local MessageColors = require('shared/utils/messages/message_colors')
 MessageCore.COLORS = MessageColors
 
+-- Every line goes through the rate-limited chat queue
+local ChatQueue = require('shared/utils/messages/core/chat_queue')
+
+--- Send one chat line under a budget category (message_settings CHAT_QUEUE)
+--- @param color number FFXI chat color
+--- @param message string Line to display
+--- @param category string|nil Budget category ('error', 'debug', ...; default 'default')
+function MessageCore.send(color, message, category)
+    ChatQueue.send(color, message, category)
+end
+
 --- Create FFXI color code string
 --- @param color_code number FFXI color code (1-255)
 --- @return string Formatted color code for inline use
@@ -43,7 +54,7 @@ function MessageCore.show_separator(length)
     local fixed_length = 74
     local colorGray = MessageCore.create_color_code(MessageCore.COLORS.SEPARATOR)
     local separator = string.rep("=", fixed_length)
-    add_to_chat(1, colorGray .. separator)
+    ChatQueue.send(1, colorGray .. separator)
 end
 
 --- Get dynamic job tag [MAIN/SUB] based on current player state
@@ -69,39 +80,40 @@ end
 --- @param message string Message to display
 function MessageCore.info(message)
     local job_tag = MessageCore.get_job_tag()
-    add_to_chat(121, string.format("[%s] %s", job_tag, message))
+    ChatQueue.send(121, string.format("[%s] %s", job_tag, message))
 end
 
 --- Display success message (green)
 --- @param message string Message to display
 function MessageCore.success(message)
     local job_tag = MessageCore.get_job_tag()
-    add_to_chat(158, string.format("[%s] %s", job_tag, message))
+    ChatQueue.send(158, string.format("[%s] %s", job_tag, message))
 end
 
 --- Display error message (red)
 --- @param message string Message to display
 function MessageCore.error(message)
     local job_tag = MessageCore.get_job_tag()
-    add_to_chat(167, string.format("[%s] %s", job_tag, message))
+    ChatQueue.send(167, string.format("[%s] %s", job_tag, message), 'error')
 end
 
 --- Display warning message (yellow)
 --- @param message string Message to display
 function MessageCore.warning(message)
     local job_tag = MessageCore.get_job_tag()
-    add_to_chat(205, string.format("[%s] %s", job_tag, message))
+    ChatQueue.send(205, string.format("[%s] %s", job_tag, message))
 end
 
 --- Send a pre-formatted message that already contains embedded color codes
 --- (built via `create_color_code`). Uses chat color 001 (neutral) so the
 --- embedded codes are honored verbatim. This is the canonical entry point
 --- for module-specific formatters that build their own colored output;
---- always preferred over a raw `add_to_chat(001, ...)` so we have one
---- choke point if we ever need to filter/route chat output centrally.
+--- always preferred over a raw `add_to_chat(001, ...)`: it goes through
+--- the chat queue like every other MessageCore line.
 --- @param message string Pre-formatted message with embedded color codes
-function MessageCore.raw(message)
-    add_to_chat(001, message)
+--- @param category string|nil Budget category (default 'default')
+function MessageCore.raw(message, category)
+    ChatQueue.send(001, message, category)
 end
 
 ---============================================================================
@@ -111,38 +123,38 @@ end
 --- Show lockstyle status message
 --- @param status_msg string Status message
 function MessageCore.show_lockstyle_status(status_msg)
-    add_to_chat(207, status_msg)
+    ChatQueue.send(207, status_msg)
 end
 
 --- Show AutoMove callback error
 --- @param error_msg string Error message
 function MessageCore.show_automove_error(error_msg)
-    add_to_chat(167, string.format("[AutoMove] Callback error: %s", error_msg))
+    ChatQueue.send(167, string.format("[AutoMove] Callback error: %s", error_msg), 'error')
 end
 
 --- Show config loader error
 --- @param module_name string Module name (e.g., 'ConfigLoader', 'WHM')
 --- @param error_msg string Error message
 function MessageCore.show_config_error(module_name, error_msg)
-    add_to_chat(167, string.format('[%s] %s', module_name, error_msg))
+    ChatQueue.send(167, string.format('[%s] %s', module_name, error_msg), 'error')
 end
 
 --- Show UI module error
 --- @param error_msg string Error message
 function MessageCore.show_ui_error(error_msg)
-    add_to_chat(167, string.format('[UI] %s', error_msg))
+    ChatQueue.send(167, string.format('[UI] %s', error_msg), 'error')
 end
 
 --- Show UI module info
 --- @param info_msg string Info message
 function MessageCore.show_ui_info(info_msg)
-    add_to_chat(122, string.format('[UI] %s', info_msg))
+    ChatQueue.send(122, string.format('[UI] %s', info_msg))
 end
 
 --- Show test mode message
 --- @param test_msg string Test mode message
 function MessageCore.show_test_mode(test_msg)
-    add_to_chat(8, string.format('[TEST MODE] %s', test_msg))
+    ChatQueue.send(8, string.format('[TEST MODE] %s', test_msg))
 end
 
 ---============================================================================
@@ -492,7 +492,7 @@ MessageFormatter.show_curemanager_not_loaded = function(...) return get_MessageW
 function MessageFormatter.show_debug(prefix, message)
     local MessageRenderer = require('shared/utils/messages/core/message_renderer')
     local formatted = string.format('[%s] %s', prefix, message)
-    MessageRenderer.send(formatted, 8)  -- Color 8 = gray debug
+    MessageRenderer.send(formatted, 8, {category = 'debug'})  -- Color 8 = gray debug
 end
 
 return MessageFormatter
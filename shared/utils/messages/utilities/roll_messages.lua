@@ -19,6 +19,11 @@ local RollMessages = {}
 -- Load message core for formatting
 local MessageCore = require('shared/utils/messages/message_core')
 
+-- Roll panels share the 'roll' chat budget (message_settings CHAT_QUEUE)
+local function raw(message)
+    MessageCore.raw(message, 'roll')
+end
+
 -- Windower chars for special characters (circled numbers ①②③④⑤⑥⑦⑧⑨⑩⑪)
 -- Embedded directly to avoid path issues with require('chat.chars')
 local chars = {
@@ -54,7 +59,8 @@ local chars = {
 --- @param bust_rate number Bust rate percentage for next Double-Up
 --- @param job_bonus_info string|nil Job code if job bonus active (e.g., "DNC")
 --- @param roll_range number|nil Roll range in yalms (8 without Luzaf, 16 with Luzaf)
-function RollMessages.show_roll_result(roll_name, value_display, bonus_display, is_crooked, affected_count, total_count, lucky_num, unlucky_num, missed_names, bust_rate, job_bonus_info, roll_range)
+--- @param advice table|nil {action = 'S'|'D'|'E', bust = plan bust %} (RollAdvice)
+function RollMessages.show_roll_result(roll_name, value_display, bonus_display, is_crooked, affected_count, total_count, lucky_num, unlucky_num, missed_names, bust_rate, job_bonus_info, roll_range, advice)
     local job_tag = MessageCore.get_job_tag()
     local job_color = MessageCore.create_color_code(MessageCore.COLORS.JOB_TAG)      -- Cyan
     local roll_color = MessageCore.create_color_code(MessageCore.COLORS.JA)         -- Yellow
@@ -233,6 +239,22 @@ function RollMessages.show_roll_result(roll_name, value_display, bonus_display,
         table.insert(lines, bust_line)
     end
 
+    -- Line 5b: Double-Up advice (best expected bonus; bust chance of that plan)
+    if advice then
+        local advice_line
+        if advice.action == 'S' then
+            advice_line = white_color .. "  - Advice: " .. bonus_color .. "Stop"
+        else
+            local action_text = advice.action == 'E' and "Snake Eye" or "Double-Up"
+            local action_color = advice.bust >= 50
+                and MessageCore.create_color_code(MessageCore.COLORS.get_warning_color())
+                or MessageCore.create_color_code(MessageCore.COLORS.JOB_TAG)
+            advice_line = white_color .. "  - Advice: " .. action_color .. action_text ..
+                white_color .. string.format(" (plan bust %d%%)", advice.bust)
+        end
+        table.insert(lines, advice_line)
+    end
+
     -- Line 6: Natural 11 special benefits (if roll value is 11)
     if roll_value == 11 then
         local success_color = MessageCore.create_color_code(MessageCore.COLORS.SUCCESS)
@@ -261,15 +283,15 @@ function RollMessages.show_roll_result(roll_name, value_display, bonus_display,
     local separator = string.rep("=", max_length)
 
     -- Display opening separator
-    MessageCore.raw( separator_color .. separator)
+    raw(separator_color .. separator)
 
     -- Display all lines
     for _, line in ipairs(lines) do
-        MessageCore.raw( line)
+        raw(line)
     end
 
     -- Display closing separator
-    MessageCore.raw( separator_color .. separator)
+    raw(separator_color .. separator)
 end
 
 --- Display Natural 11 special benefits (simple one-line format)
@@ -292,7 +314,7 @@ function RollMessages.show_roll_natural_eleven()
         white_color
     )
 
-    MessageCore.raw( message)
+    raw(message)
 end
 
 --- Display bust rate warning (integrated in multi-line format)
@@ -337,7 +359,7 @@ function RollMessages.show_roll_bust_rate(bust_rate)
     end
 
     -- Display bust line
-    MessageCore.raw( string.format(
+    raw(string.format(
         "%sBust: %s%.1f%% %s(%s)",
         white_color,
         risk_color, bust_rate,
@@ -346,7 +368,7 @@ function RollMessages.show_roll_bust_rate(bust_rate)
 
     -- Final separator (gray, matching opening separator)
     local separator = string.rep("=", 48)
-    MessageCore.raw( separator_color .. separator)
+    raw(separator_color .. separator)
 end
 
 ---============================================================================
@@ -379,7 +401,7 @@ function RollMessages.show_roll_bust(roll_name, bust_effect, effect_type)
                     white_color .. " / " ..
                     warning_color .. "Penalty: " .. bust_effect .. effect_type
 
-    add_to_chat(121, message)  -- Use channel 121 instead of 001 to preserve inline colors
+    MessageCore.send(121, message, 'roll')  -- Use channel 121 instead of 001 to preserve inline colors
 end
 
 ---============================================================================
@@ -426,7 +448,7 @@ function RollMessages.show_active_rolls(active_rolls)
 
     -- Header
     local job_tag = MessageCore.get_job_tag()
-    MessageCore.raw( string.format("%s[%s]%s Active Rolls (%s%d%s):",
+    raw(string.format("%s[%s]%s Active Rolls (%s%d%s):",
         job_color, job_tag,
         white_color,
         number_color, #active_rolls, white_color))
@@ -441,7 +463,7 @@ function RollMessages.show_active_rolls(active_rolls)
             white_color,
             number_color, roll.value
         )
-        MessageCore.raw( formatted_message)
+        raw(formatted_message)
     end
 end
 
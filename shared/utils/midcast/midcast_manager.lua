@@ -6,6 +6,12 @@
 --   - `select_standard_set()` for the 9-priority chain (all other skills)
 --   - `equip_with_debug()` for the duplicated equipment debug dump
 --   - `try_path()` lifted to module-private helper
+--
+-- 2026-10-18: the standard chain result is memoized in a lookup index keyed by
+-- (skill base set, spell, type, target, mode), so repeat casts resolve with a
+-- few table probes instead of re-walking P0-P9. The index is dropped when
+-- sets.midcast is replaced (gs reload / job change) and by invalidate_index()
+-- for code that swaps midcast sets at runtime. Debug mode bypasses it.
 
 local MidcastManager = {}
 
@@ -348,12 +354,12 @@ local function resolve_metadata(config)
     return mode_value, type_value, target_value
 end
 
-local function select_standard_set(config, base_set)
+--- Walk the P0-P9 chain for already-resolved metadata (no equip).
+--- @return table selected_set, string selected_set_path
+local function find_standard_set(config, base_set, mode_value, type_value, target_value)
     local selected_set = nil
     local selected_set_path = nil
 
-    local mode_value, type_value, target_value = resolve_metadata(config)
-
     if is_debug_enabled() then
         MessageMidcast.show_priorities_header()
     end
@@ -507,6 +513,85 @@ local function select_standard_set(config, base_set)
         selected_set_path = 'sets.midcast["' .. config.skill .. '"]'
     end
 
+    return selected_set, selected_set_path
+end
+
+---============================================================================
+--- LOOKUP INDEX (memoized P0-P9 results)
+--- index.by_base[base_set][spell][type][target][mode] = selected set
+--- nil metadata is stored under the NONE key.
+---============================================================================
+
+local NONE = {}
+
+local index = {
+    owner   = nil,   -- sets.midcast table the entries were resolved against
+    by_base = setmetatable({}, { __mode = 'k' }),
+    hits    = 0,
+    misses  = 0,
+    resets  = 0,
+}
+
+--- Drop every memoized result. Call after replacing or editing a table under
+--- sets.midcast at runtime (e.g. BLM dynamic nuke set, PLD/RUN Cure swap).
+function MidcastManager.invalidate_index()
+    index.owner = sets and sets.midcast
+    index.by_base = setmetatable({}, { __mode = 'k' })
+    index.resets = index.resets + 1
+end
+
+--- @return table|nil Memoized set for this key, nil on miss
+local function index_get(base_set, spell_name, type_value, target_value, mode_value)
+    if index.owner ~= sets.midcast then
+        MidcastManager.invalidate_index()
+        return nil
+    end
+    local node = index.by_base[base_set]
+    node = node and node[spell_name or NONE]
+    node = node and node[type_value == nil and NONE or type_value]
+    node = node and node[target_value == nil and NONE or target_value]
+    return node and node[mode_value == nil and NONE or mode_value]
+end
+
+local function index_put(base_set, spell_name, type_value, target_value, mode_value, selected_set)
+    local node = index.by_base
+    local keys = {
+        base_set,
+        spell_name or NONE,
+        type_value == nil and NONE or type_value,
+        target_value == nil and NONE or target_value,
+    }
+    for _, key in ipairs(keys) do
+        node[key] = node[key] or {}
+        node = node[key]
+    end
+    node[mode_value == nil and NONE or mode_value] = selected_set
+end
+
+--- Index statistics (for //gs c midcastbench and debugging)
+--- @return table {hits, misses, resets}
+function MidcastManager.index_stats()
+    return { hits = index.hits, misses = index.misses, resets = index.resets }
+end
+
+local function select_standard_set(config, base_set)
+    local mode_value, type_value, target_value = resolve_metadata(config)
+    local spell_name = config.spell and config.spell.english
+
+    local selected_set, selected_set_path
+    if is_debug_enabled() then
+        selected_set, selected_set_path = find_standard_set(config, base_set, mode_value, type_value, target_value)
+    else
+        selected_set = index_get(base_set, spell_name, type_value, target_value, mode_value)
+        if selected_set then
+            index.hits = index.hits + 1
+        else
+            index.misses = index.misses + 1
+            selected_set, selected_set_path = find_standard_set(config, base_set, mode_value, type_value, target_value)
+            index_put(base_set, spell_name, type_value, target_value, mode_value, selected_set)
+        end
+    end
+
     if not selected_set then
         return false
     end
@@ -563,6 +648,82 @@ function MidcastManager.select_set(config)
     end
 end
 
+--- Micro-benchmark: P0-P9 chain vs lookup index (//gs c midcastbench [n]).
+--- Samples are synthetic casts built from the current sets.midcast: for each
+--- skill, a bare cast plus one cast per sub-table key used as spell name,
+--- type (database) and mode. Also checks that the index returns the same set
+--- as the chain for every sample. Equip and metadata resolution are excluded.
+--- @param iterations number|nil Passes over the sample list (default 2000)
+--- @return table|nil {samples, iterations, chain_us, index_us, mismatches}
+function MidcastManager.benchmark(iterations)
+    iterations = iterations or 2000
+    if not sets or not sets.midcast then
+        return nil
+    end
+
+    local samples = {}
+    for skill, base_set in pairs(sets.midcast) do
+        if type(skill) == 'string' and type(base_set) == 'table' and skill ~= 'BardSong' then
+            table.insert(samples, { skill = skill, base_set = base_set, spell = 'Benchmark' })
+            for key, sub in pairs(base_set) do
+                if type(key) == 'string' and type(sub) == 'table' then
+                    table.insert(samples, { skill = skill, base_set = base_set, spell = key })
+                    table.insert(samples, { skill = skill, base_set = base_set, spell = 'Benchmark', type_value = key })
+                    table.insert(samples, { skill = skill, base_set = base_set, spell = 'Benchmark', mode_value = key })
+                end
+            end
+        end
+    end
+    for _, sample in ipairs(samples) do
+        sample.config = { skill = sample.skill, spell = { english = sample.spell } }
+    end
+
+    -- Debug output would dominate the timings (and flood the chat)
+    local debug_state = _G.MidcastManagerDebugState
+    _G.MidcastManagerDebugState = false
+
+    -- Equivalence: fill the index first, then read every key back
+    for _, s in ipairs(samples) do
+        s.expected = find_standard_set(s.config, s.base_set, s.mode_value, s.type_value, nil)
+        if not index_get(s.base_set, s.spell, s.type_value, nil, s.mode_value) then
+            index_put(s.base_set, s.spell, s.type_value, nil, s.mode_value, s.expected)
+        end
+    end
+    local mismatches = 0
+    for _, s in ipairs(samples) do
+        if index_get(s.base_set, s.spell, s.type_value, nil, s.mode_value) ~= s.expected then
+            mismatches = mismatches + 1
+        end
+    end
+
+    local started = os.clock()
+    for _ = 1, iterations do
+        for _, s in ipairs(samples) do
+            find_standard_set(s.config, s.base_set, s.mode_value, s.type_value, nil)
+        end
+    end
+    local chain_time = os.clock() - started
+
+    started = os.clock()
+    for _ = 1, iterations do
+        for _, s in ipairs(samples) do
+            index_get(s.base_set, s.spell, s.type_value, nil, s.mode_value)
+        end
+    end
+    local index_time = os.clock() - started
+
+    _G.MidcastManagerDebugState = debug_state
+
+    local casts = math.max(1, #samples * iterations)
+    return {
+        samples    = #samples,
+        iterations = iterations,
+        chain_us   = chain_time * 1e6 / casts,
+        index_us   = index_time * 1e6 / casts,
+        mismatches = mismatches,
+    }
+end
+
 ---============================================================================
 --- HELPER FUNCTIONS (common job patterns)
 ---============================================================================
@@ -6,8 +6,15 @@
 ---
 --- @file utils/movement/automove.lua
 --- @author Tetsouo
---- @version 2.2.0 - Discontinuity guard + self-heal + adaptive/engaged polling
---- @date Created: 2025-09-30 | Updated: 2026-06-08
+--- @version 2.3.0 - Event-driven mode (position updates + watchdog)
+--- @date Created: 2025-09-30 | Updated: 2026-10-18
+---
+--- v2.3.0 changes:
+---   - Event mode (//gs c automove event): checks run on the player's own
+---     position updates (outgoing 0x015, skipped while the position bytes do
+---     not change) and status/zone events, with one 1s watchdog chain as the
+---     desync backstop instead of the 0.12-0.5s poll chain.
+---   - Wakeup counters per minute for both modes (//gs c automove).
 ---
 --- v2.2.0 changes:
 ---   - Teleport/zone desync fix: jump guard (instant re-sync on large position
@@ -54,12 +61,30 @@ local config = {
     check_interval      = 0.12,  -- Time in seconds between position checks (~8.3 Hz, ~33% CPU saving vs 0.08)
     update_debounce     = 0.3,   -- Minimum time between gs c update calls
     job_change_cooldown = 2.0,   -- Cooldown after job change before sending commands
-    jump_threshold      = 5.0,   -- Single-tick delta above this = teleport/zone (running maxes ~1 yalm/tick)
+    jump_threshold      = 5.0,   -- Single-tick delta above this = teleport/zone (running maxes ~1 yalm/tick; event mode scales it by elapsed ticks)
     heal_interval       = 2.0,   -- Max interval to re-sync gear while moving (desync backstop)
     idle_interval       = 0.3,   -- Slower poll while standing still (movespeed not changing)
-    engaged_interval    = 0.5    -- Slowest poll while Engaged (movespeed is idle-only; just watch for disengage)
+    engaged_interval    = 0.5,   -- Slowest poll while Engaged (movespeed is idle-only; just watch for disengage)
+    watchdog_interval   = 1.0    -- Event mode: desync backstop when no position update arrives
 }
 
+-- Detection mode: 'poll' (timer chain) or 'event' (//gs c automove event,
+-- persisted in data/.automove_event). windower table: survives gs reload.
+local MODE_FILE = windower.addon_path .. 'data/.automove_event'
+if windower._automove_mode == nil then
+    local mode_file = io.open(MODE_FILE, 'r')
+    windower._automove_mode = mode_file and 'event' or 'poll'
+    if mode_file then mode_file:close() end
+end
+
+-- Wakeup counters (compare modes with //gs c automove), kept across reloads
+windower._automove_stats = windower._automove_stats or {since = os.clock(), wakeups = 0, steps = 0,
+    skipped = 0, watchdog = 0, updates = 0, transitions = 0}
+local stats = windower._automove_stats
+
+-- Last position check (event mode watchdog)
+local last_step_time = 0
+
 -- Track last update time for debouncing
 local last_update_time = 0
 
@@ -95,11 +120,25 @@ function AutoMove.clear_callbacks()
     callbacks = {}
 end
 
+--- Drop the event mode handlers (this or an earlier load)
+local function unregister_events()
+    local ok, PacketDispatcher = pcall(require, 'shared/utils/core/packet_dispatcher')
+    if ok and PacketDispatcher then
+        PacketDispatcher.unsubscribe_outgoing(0x015, 'automove')
+    end
+    for _, id in ipairs(windower._automove_events or {}) do
+        pcall(windower.unregister_event, id)
+    end
+    windower._automove_events = nil
+end
+
 --- Stop the movement detection loop (called during job change cleanup)
 --- Increments windower sequence to invalidate ALL running closures
 function AutoMove.stop()
     _G.AUTOMOVE_RUNNING = false
     windower._automove_seq = windower._automove_seq + 1
+    -- Event mode handlers (guarded by the sequence too, dropped here)
+    unregister_events()
     _G._automove_sequence = windower._automove_seq  -- keep _G in sync for debug tools
     if _G.LagDebugger then _G.LagDebugger.on_automove_stop(windower._automove_seq) end
     DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'STOP called | seq=%d', windower._automove_seq)
@@ -183,6 +222,228 @@ function AutoMove.reinit_position()
     return init_position()
 end
 
+---============================================================================
+--- POSITION CHECK (shared by both modes)
+---============================================================================
+
+--- Check the position once: moving/stopped transitions, gs c update, callbacks
+--- @return number Seconds until the next poll (poll mode)
+local function step()
+    stats.steps = stats.steps + 1
+    local now = os.clock()
+    local elapsed = now - last_step_time
+    last_step_time = now
+
+    -- Player not ready: wait
+    if not player or not player.index then
+        return config.check_interval
+    end
+
+    -------------------------------------------------------------------
+    -- ENGAGED: movespeed is idle-only, so skip movement detection entirely.
+    -- Keep the reference position fresh for a clean resume on disengage and
+    -- reset the moving flag (combat set is active anyway). Poll slowly just
+    -- to notice the disengage. Saves ~8 checks/s during fights.
+    -------------------------------------------------------------------
+    if player.status == 'Engaged' then
+        local pe = windower.ffxi.get_mob_by_index(player.index)
+        if pe and pe.x then
+            mov.x, mov.y, mov.z = pe.x, pe.y, pe.z
+        end
+        if moving then
+            moving = false
+            if state.Moving then state.Moving.value = 'false' end
+        end
+        return config.engaged_interval
+    end
+
+    -- Get current position
+    local pl = windower.ffxi.get_mob_by_index(player.index)
+    if not pl or not pl.x or not pl.y or not pl.z or mov.x == nil then
+        return config.check_interval
+    end
+
+    -- Calculate distance moved
+    local dx = pl.x - mov.x
+    local dy = pl.y - mov.y
+    local dz = pl.z - mov.z
+    local dist = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    mov.last_distance = dist
+    mov.x = pl.x
+    mov.y = pl.y
+    mov.z = pl.z
+
+    -------------------------------------------------------------------
+    -- DISCONTINUITY GUARD (teleport / zone)
+    -- A single-tick delta this large is impossible by running (~1 yalm/tick),
+    -- so it is a teleport or zone. Position is already recaled above; force an
+    -- immediate re-equip so movespeed isn't lost across the jump. Covers cases
+    -- with no loading screen (e.g. in-area teleports).
+    -- Event mode has no fixed tick: the limit grows with the time since the
+    -- last check (a watchdog step can follow ~1s of running).
+    -------------------------------------------------------------------
+    local jump_threshold = config.jump_threshold
+    if windower._automove_mode == 'event' then
+        jump_threshold = jump_threshold * math.max(1, elapsed / config.check_interval)
+    end
+    if dist > jump_threshold then
+        if _G.LagDebugger then _G.LagDebugger.on_automove_update('jump', dist, moving) end
+        stats.updates = stats.updates + 1
+        windower.send_command('gs c update')
+        return config.check_interval
+    end
+
+    -------------------------------------------------------------------
+    -- MOVEMENT DETECTED
+    -------------------------------------------------------------------
+    if dist > config.movement_threshold then
+        local should_move = (player.status ~= 'Engaged')
+
+        if should_move and not moving then
+            state.Moving.value = 'true'
+            moving = true
+            pending_update = true
+            stats.transitions = stats.transitions + 1
+        end
+
+        local now = os.clock()
+        if pending_update and should_move then
+            if (now - start_time) < config.job_change_cooldown then
+                DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'COOLDOWN moving (%.1fs left)',
+                    config.job_change_cooldown - (now - start_time))
+            elseif (now - last_update_time) >= config.update_debounce then
+                last_update_time = now
+                pending_update   = false
+                DebugLogger.log_if('AUTOMOVE_DEBUG', 'AutoMove', 'moving')
+                if _G.UPDATE_DEBUG then
+                    _G._update_sent_time = os.clock()
+                    DebugLogger.logf('UPDATE_DEBUG', '1. AutoMove SEND gs c update | t=%.3f',
+                        _G._update_sent_time)
+                end
+                if _G.LagDebugger then _G.LagDebugger.on_automove_update('moving', dist, moving) end
+                stats.updates = stats.updates + 1
+                windower.send_command('gs c update')
+            end
+        end
+
+        -- SELF-HEAL: while moving, re-sync gear <-> state.Moving at most every
+        -- heal_interval. Backstop for desyncs the jump guard may miss (e.g. an
+        -- in-area teleport that slides instead of jumping). Throttled by
+        -- last_update_time and suppressed during the job-change cooldown.
+        if moving and should_move
+            and (now - start_time) >= config.job_change_cooldown
+            and (now - last_update_time) >= config.heal_interval then
+            last_update_time = now
+            if _G.LagDebugger then _G.LagDebugger.on_automove_update('heal', dist, moving) end
+            stats.updates = stats.updates + 1
+            windower.send_command('gs c update')
+        end
+
+        trigger_callbacks(true, dist, player.status)
+
+    -------------------------------------------------------------------
+    -- STOPPED
+    -------------------------------------------------------------------
+    elseif dist < config.movement_threshold then
+        if moving then
+            state.Moving.value = 'false'
+            moving = false
+            pending_update = true
+            stats.transitions = stats.transitions + 1
+            trigger_callbacks(false, dist, player.status)
+        end
+
+        local now = os.clock()
+        if pending_update and not moving then
+            if (now - start_time) < config.job_change_cooldown then
+                DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'COOLDOWN stopping (%.1fs left)',
+                    config.job_change_cooldown - (now - start_time))
+            elseif (now - last_update_time) >= config.update_debounce then
+                last_update_time = now
+                pending_update   = false
+                DebugLogger.log_if('AUTOMOVE_DEBUG', 'AutoMove', 'stopping')
+                if _G.UPDATE_DEBUG then
+                    _G._update_sent_time = os.clock()
+                    DebugLogger.logf('UPDATE_DEBUG', '1. AutoMove SEND gs c update | t=%.3f',
+                        _G._update_sent_time)
+                end
+                if _G.LagDebugger then _G.LagDebugger.on_automove_update('stopping', dist, moving) end
+                stats.updates = stats.updates + 1
+                windower.send_command('gs c update')
+            end
+        end
+    end
+
+    -- Adaptive: fast while moving, slower while idle (Engaged is handled
+    -- above with its own slow interval)
+    return moving and config.check_interval or config.idle_interval
+end
+
+---============================================================================
+--- EVENT MODE (position updates + status/zone events + watchdog)
+---============================================================================
+-- The client sends its position to the server (outgoing 0x015) on its own
+-- cadence. Bytes 0x04-0x0F are X/Z/Y: while they do not change and nothing
+-- is pending, the packet is dropped without reading the mob table. Status
+-- and zone changes check at once; a slow watchdog catches the stop when no
+-- packet comes, the job-change cooldown, and any desync.
+
+local last_position = nil   -- raw X/Z/Y bytes of the last 0x015
+
+--- @param my_seq number Sequence of the start() call owning the handlers
+local function start_events(my_seq)
+    local function alive()
+        return my_seq == windower._automove_seq and _G.AUTOMOVE_RUNNING
+    end
+
+    last_position = nil
+    local PacketDispatcher = require('shared/utils/core/packet_dispatcher')
+    PacketDispatcher.subscribe_outgoing(0x015, 'automove', function(packet)
+        if not alive() then return end
+        stats.wakeups = stats.wakeups + 1
+        local position = packet.original:sub(5, 16)
+        if position == last_position and not moving and not pending_update then
+            stats.skipped = stats.skipped + 1
+            return
+        end
+        -- Keep checks at least check_interval apart: the distance threshold
+        -- assumes that spacing (a closer pair would read as a stop)
+        if os.clock() - last_step_time < config.check_interval then
+            stats.skipped = stats.skipped + 1
+            return
+        end
+        last_position = position
+        step()
+    end)
+
+    windower._automove_events = {
+        windower.raw_register_event('status change', function()
+            if not alive() then return end
+            stats.wakeups = stats.wakeups + 1
+            step()
+        end),
+        windower.raw_register_event('zone change', function()
+            if not alive() then return end
+            stats.wakeups = stats.wakeups + 1
+            last_position = nil
+            step()
+        end),
+    }
+
+    -- Watchdog: one slow chain, checks only when nothing else did lately
+    local function watchdog()
+        if not alive() then return end
+        stats.wakeups = stats.wakeups + 1
+        if os.clock() - last_step_time >= config.watchdog_interval * 0.9 then
+            stats.watchdog = stats.watchdog + 1
+            step()
+        end
+        coroutine.schedule(watchdog, config.watchdog_interval)
+    end
+    coroutine.schedule(watchdog, config.watchdog_interval)
+end
+
 ---============================================================================
 --- START API (creates isolated closure chain - one per call)
 ---============================================================================
@@ -206,9 +467,15 @@ function AutoMove.start()
     pending_update = false
     last_update_time = 0
     init_position()
+    unregister_events()
 
     if _G.LagDebugger then _G.LagDebugger.on_automove_start(my_seq) end
-    DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'START | seq=%d', my_seq)
+    DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'START | seq=%d | %s mode', my_seq, AutoMove.get_mode())
+
+    if AutoMove.get_mode() == 'event' then
+        start_events(my_seq)
+        return
+    end
 
     -------------------------------------------------------------------
     -- CLOSURE: my_seq is fixed for the lifetime of this chain.
@@ -222,145 +489,63 @@ function AutoMove.start()
         -- Guard 2: explicitly stopped
         if not _G.AUTOMOVE_RUNNING then return end
 
-        -- Player not ready: reschedule and wait
-        if not player or not player.index then
-            coroutine.schedule(run, config.check_interval)
-            return
-        end
-
-        -------------------------------------------------------------------
-        -- ENGAGED: movespeed is idle-only, so skip movement detection entirely.
-        -- Keep the reference position fresh for a clean resume on disengage and
-        -- reset the moving flag (combat set is active anyway). Poll slowly just
-        -- to notice the disengage. Saves ~8 checks/s during fights.
-        -------------------------------------------------------------------
-        if player.status == 'Engaged' then
-            local pe = windower.ffxi.get_mob_by_index(player.index)
-            if pe and pe.x then
-                mov.x, mov.y, mov.z = pe.x, pe.y, pe.z
-            end
-            if moving then
-                moving = false
-                if state.Moving then state.Moving.value = 'false' end
-            end
-            coroutine.schedule(run, config.engaged_interval)
-            return
-        end
-
-        -- Get current position
-        local pl = windower.ffxi.get_mob_by_index(player.index)
-        if not pl or not pl.x or not pl.y or not pl.z or mov.x == nil then
-            coroutine.schedule(run, config.check_interval)
-            return
-        end
-
-        -- Calculate distance moved
-        local dx = pl.x - mov.x
-        local dy = pl.y - mov.y
-        local dz = pl.z - mov.z
-        local dist = math.sqrt(dx * dx + dy * dy + dz * dz)
-
-        mov.last_distance = dist
-        mov.x = pl.x
-        mov.y = pl.y
-        mov.z = pl.z
-
-        -------------------------------------------------------------------
-        -- DISCONTINUITY GUARD (teleport / zone)
-        -- A single-tick delta this large is impossible by running (~1 yalm/tick),
-        -- so it is a teleport or zone. Position is already recaled above; force an
-        -- immediate re-equip so movespeed isn't lost across the jump. Covers cases
-        -- with no loading screen (e.g. in-area teleports).
-        -------------------------------------------------------------------
-        if dist > config.jump_threshold then
-            if _G.LagDebugger then _G.LagDebugger.on_automove_update('jump', dist, moving) end
-            windower.send_command('gs c update')
-            coroutine.schedule(run, config.check_interval)
-            return
-        end
-
-        -------------------------------------------------------------------
-        -- MOVEMENT DETECTED
-        -------------------------------------------------------------------
-        if dist > config.movement_threshold then
-            local should_move = (player.status ~= 'Engaged')
-
-            if should_move and not moving then
-                state.Moving.value = 'true'
-                moving = true
-                pending_update = true
-            end
+        stats.wakeups = stats.wakeups + 1
+        -- my_seq preserved via closure
+        coroutine.schedule(run, step())
+    end
 
-            local now = os.clock()
-            if pending_update and should_move then
-                if (now - start_time) < config.job_change_cooldown then
-                    DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'COOLDOWN moving (%.1fs left)',
-                        config.job_change_cooldown - (now - start_time))
-                elseif (now - last_update_time) >= config.update_debounce then
-                    last_update_time = now
-                    pending_update   = false
-                    DebugLogger.log_if('AUTOMOVE_DEBUG', 'AutoMove', 'moving')
-                    if _G.UPDATE_DEBUG then
-                        _G._update_sent_time = os.clock()
-                        DebugLogger.logf('UPDATE_DEBUG', '1. AutoMove SEND gs c update | t=%.3f',
-                            _G._update_sent_time)
-                    end
-                    if _G.LagDebugger then _G.LagDebugger.on_automove_update('moving', dist, moving) end
-                    windower.send_command('gs c update')
-                end
-            end
+    coroutine.schedule(run, config.check_interval)
+end
 
-            -- SELF-HEAL: while moving, re-sync gear <-> state.Moving at most every
-            -- heal_interval. Backstop for desyncs the jump guard may miss (e.g. an
-            -- in-area teleport that slides instead of jumping). Throttled by
-            -- last_update_time and suppressed during the job-change cooldown.
-            if moving and should_move
-                and (now - start_time) >= config.job_change_cooldown
-                and (now - last_update_time) >= config.heal_interval then
-                last_update_time = now
-                if _G.LagDebugger then _G.LagDebugger.on_automove_update('heal', dist, moving) end
-                windower.send_command('gs c update')
-            end
+---============================================================================
+--- MODE / COUNTERS (//gs c automove)
+---============================================================================
 
-            trigger_callbacks(true, dist, player.status)
-
-        -------------------------------------------------------------------
-        -- STOPPED
-        -------------------------------------------------------------------
-        elseif dist < config.movement_threshold then
-            if moving then
-                state.Moving.value = 'false'
-                moving = false
-                pending_update = true
-                trigger_callbacks(false, dist, player.status)
-            end
+--- @return string 'poll' or 'event'
+function AutoMove.get_mode()
+    return windower._automove_mode or 'poll'
+end
 
-            local now = os.clock()
-            if pending_update and not moving then
-                if (now - start_time) < config.job_change_cooldown then
-                    DebugLogger.logf_if('AUTOMOVE_DEBUG', 'AutoMove', 'COOLDOWN stopping (%.1fs left)',
-                        config.job_change_cooldown - (now - start_time))
-                elseif (now - last_update_time) >= config.update_debounce then
-                    last_update_time = now
-                    pending_update   = false
-                    DebugLogger.log_if('AUTOMOVE_DEBUG', 'AutoMove', 'stopping')
-                    if _G.UPDATE_DEBUG then
-                        _G._update_sent_time = os.clock()
-                        DebugLogger.logf('UPDATE_DEBUG', '1. AutoMove SEND gs c update | t=%.3f',
-                            _G._update_sent_time)
-                    end
-                    if _G.LagDebugger then _G.LagDebugger.on_automove_update('stopping', dist, moving) end
-                    windower.send_command('gs c update')
-                end
-            end
+--- Switch detection mode (persisted in data/.automove_event) and restart
+--- @param mode string 'poll' or 'event'
+function AutoMove.set_mode(mode)
+    windower._automove_mode = mode
+    if mode == 'event' then
+        local file = io.open(MODE_FILE, 'w')
+        if file then
+            file:write('event')
+            file:close()
         end
-
-        -- Adaptive reschedule: fast while moving, slower while idle (Engaged is
-        -- handled above with its own slow interval). my_seq preserved via closure.
-        coroutine.schedule(run, moving and config.check_interval or config.idle_interval)
+    else
+        os.remove(MODE_FILE)
+    end
+    AutoMove.reset_stats()
+    if _G.AUTOMOVE_RUNNING then
+        AutoMove.start()
     end
+end
 
-    coroutine.schedule(run, config.check_interval)
+--- @return table {mode, wakeups, per_minute, steps, skipped, watchdog, updates, transitions, minutes}
+function AutoMove.get_stats()
+    local minutes = math.max(os.clock() - stats.since, 0.001) / 60
+    return {
+        mode = AutoMove.get_mode(),
+        minutes = minutes,
+        wakeups = stats.wakeups,
+        per_minute = stats.wakeups / minutes,
+        steps = stats.steps,
+        skipped = stats.skipped,
+        watchdog = stats.watchdog,
+        updates = stats.updates,
+        transitions = stats.transitions,
+    }
+end
+
+--- Reset the wakeup counters
+function AutoMove.reset_stats()
+    windower._automove_stats = {since = os.clock(), wakeups = 0, steps = 0, skipped = 0,
+        watchdog = 0, updates = 0, transitions = 0}
+    stats = windower._automove_stats
 end
 
 ---============================================================================
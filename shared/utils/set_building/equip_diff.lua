@@ -0,0 +1,188 @@
+---============================================================================
+--- Equip Diff - Send only the slots that differ from the worn gear
+---============================================================================
+--- Mote hands equip() whole resolved sets on every transition (idle ->
+--- precast -> midcast -> aftercast, engaged <-> WS), so most slots name the
+--- item that is already worn. The wrapped equip() drops those slots before
+--- GearSwap sees them; the rest of the call is forwarded unchanged.
+---
+--- A slot is dropped only when BOTH agree that the item is already on:
+---   • player.equipment (GearSwap's view at the start of the event)
+---   • the last item this wrapper forwarded for the slot (so a later call in
+---     the same event can still put back an item an earlier call replaced)
+--- Items pinned to a bag or carrying augments are always forwarded: two
+--- copies share the name in player.equipment.
+---
+--- python equip_diff.py reports the redundant swaps per job offline.
+---
+--- Usage:
+---   Opt-in: //gs c equipdiff on (persisted in data/.equip_diff_on). While on,
+---   INIT_SYSTEMS installs it once per load; off leaves equip() untouched from
+---   the next load on. //gs c equipdiff [on|off|stats|reset]; counters survive
+---   reloads.
+---
+--- @file    utils/set_building/equip_diff.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local EquipDiff = {}
+
+local STATE_FILE = windower.addon_path .. 'data/.equip_diff_on'
+
+-- GearSwap slot aliases -> player.equipment key
+local SLOT_ALIASES = {
+    main = 'main', sub = 'sub', range = 'range', ranged = 'range', ammo = 'ammo',
+    head = 'head', neck = 'neck',
+    ear1 = 'left_ear', lear = 'left_ear', left_ear = 'left_ear',
+    ear2 = 'right_ear', rear = 'right_ear', right_ear = 'right_ear',
+    body = 'body', hands = 'hands',
+    ring1 = 'left_ring', lring = 'left_ring', left_ring = 'left_ring',
+    ring2 = 'right_ring', rring = 'right_ring', right_ring = 'right_ring',
+    back = 'back', waist = 'waist', legs = 'legs', feet = 'feet',
+}
+
+-- Enabled flag and counters live in the windower table (survive job changes)
+if not windower._equip_diff then
+    local state_file = io.open(STATE_FILE, 'r')
+    windower._equip_diff = {
+        enabled = state_file ~= nil,
+        calls = 0,      -- equip() calls seen
+        skipped = 0,    -- calls with nothing left to send
+        slots = 0,      -- slots requested
+        dropped = 0,    -- slots already worn
+    }
+    if state_file then
+        state_file:close()
+    end
+end
+local D = windower._equip_diff
+
+-- Lowercase item name forwarded per slot (this load only)
+local forwarded = {}
+
+---============================================================================
+--- DIFF
+---============================================================================
+
+--- Item name of a set value, nil when the exact copy cannot be told apart
+--- @param item string|table
+--- @return string|nil Lowercase name
+local function plain_name(item)
+    if type(item) == 'string' then
+        return item:lower()
+    end
+    if type(item) == 'table' and item.bag == nil and item.augments == nil and item.augment == nil then
+        local name = item.name or item[1]
+        if type(name) == 'string' then
+            return name:lower()
+        end
+    end
+    return nil
+end
+
+--- Merge the sets of one equip() call (later sets win, like GearSwap)
+--- @return table Merged set keyed by canonical slot (other keys kept as-is)
+local function merge(...)
+    local out = {}
+    for i = 1, select('#', ...) do
+        local set = select(i, ...)
+        if type(set) == 'table' then
+            for key, item in pairs(set) do
+                out[SLOT_ALIASES[key] or key] = item
+            end
+        end
+    end
+    return out
+end
+
+--- Remove the slots already worn from a merged set
+--- @param set table Merged set (modified in place)
+--- @return number Entries left
+local function drop_worn(set)
+    local worn = player and player.equipment or {}
+    local left = 0
+    for slot, item in pairs(set) do
+        if SLOT_ALIASES[slot] then
+            D.slots = D.slots + 1
+            local name = plain_name(item)
+            local current = worn[slot]
+            if name and forwarded[slot] == name and type(current) == 'string' and current:lower() == name then
+                set[slot] = nil
+                D.dropped = D.dropped + 1
+            else
+                forwarded[slot] = name
+                left = left + 1
+            end
+        else
+            left = left + 1
+        end
+    end
+    return left
+end
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- Wrap the global equip() (INIT_SYSTEMS, once per GearSwap load)
+function EquipDiff.install()
+    if _G.EQUIP_DIFF_INSTALLED or type(_G.equip) ~= 'function' then
+        return
+    end
+    local original = _G.equip
+    _G.equip = function(...)
+        if not D.enabled then
+            return original(...)
+        end
+        D.calls = D.calls + 1
+        local set = merge(...)
+        if drop_worn(set) == 0 then
+            D.skipped = D.skipped + 1
+            return
+        end
+        return original(set)
+    end
+    _G.EQUIP_DIFF_INSTALLED = true
+end
+
+--- Enable or disable the diff (persisted in data/.equip_diff_on)
+--- @param enabled boolean
+function EquipDiff.set_enabled(enabled)
+    D.enabled = enabled
+    if enabled then
+        local file = io.open(STATE_FILE, 'w')
+        if file then
+            file:write('on')
+            file:close()
+        end
+        EquipDiff.install()
+    else
+        os.remove(STATE_FILE)
+    end
+    -- Items may have changed while the diff was off
+    forwarded = {}
+    add_to_chat(207, '[EquipDiff] ' .. (enabled and 'ON - worn slots are no longer re-sent' or 'OFF - full sets are sent'))
+end
+
+--- @return boolean
+function EquipDiff.is_enabled()
+    return D.enabled == true
+end
+
+--- Show the counters in chat
+function EquipDiff.stats()
+    add_to_chat(207, string.format('[EquipDiff] %s | equip() calls %d (%d with nothing to send)',
+        D.enabled and 'ON' or 'OFF', D.calls, D.skipped))
+    add_to_chat(207, string.format('[EquipDiff] slots requested %d, sent %d, dropped %d (%.0f%%)',
+        D.slots, D.slots - D.dropped, D.dropped, D.slots > 0 and 100 * D.dropped / D.slots or 0))
+end
+
+--- Clear the counters
+function EquipDiff.reset()
+    D.calls, D.skipped, D.slots, D.dropped = 0, 0, 0, 0
+    add_to_chat(207, '[EquipDiff] Counters cleared')
+end
+
+return EquipDiff
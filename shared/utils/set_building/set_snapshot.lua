@@ -0,0 +1,101 @@
+---============================================================================
+--- Set Snapshot Loader - Prebuilt (flattened) gear sets
+---============================================================================
+--- Loads data/<Char>/snapshots/<job>_sets.lua generated by set_snapshot.py.
+--- A snapshot holds every set already resolved (set_combine chains flattened
+--- offline), so init_gear_sets() can skip re-running the set file on each
+--- `gs load` / job change.
+---
+--- Safety:
+---   • The snapshot records size + Adler-32 of sets/<job>_sets.lua (checked
+---     by FileStamp); if the file changed since the snapshot was built,
+---     load() returns nil and the entry falls back to
+---     include('sets/<job>_sets.lua') (live build).
+---   • Any error while loading/building also falls back to the live build.
+---
+--- Usage (entry file):
+---   function init_gear_sets()
+---       local snap_ok, SetSnapshot = pcall(require, 'shared/utils/set_building/set_snapshot')
+---       if not (snap_ok and SetSnapshot.apply('Tetsouo', 'rdm')) then
+---           include('sets/rdm_sets.lua')
+---       end
+---   end
+---
+--- @file    utils/set_building/set_snapshot.lua
+--- @author  Tetsouo
+--- @version 1.0
+--- @date    Created: 2026-10-18
+---============================================================================
+
+local SetSnapshot = {}
+
+local DebugLogger = require('shared/utils/debug/debug_logger')
+local FileStamp = require('shared/utils/core/file_stamp')
+
+local SNAPSHOT_VERSION = 1
+
+-- Result of the last apply() call: 'snapshot', 'missing', 'stale' or 'error'
+SetSnapshot.status = nil
+
+---============================================================================
+--- PUBLIC API
+---============================================================================
+
+--- Load a job snapshot if it matches the current set file.
+--- @param char_name string Character folder (e.g. 'Tetsouo')
+--- @param job string Job code (e.g. 'rdm')
+--- @return table|nil globals {sets = ..., [other globals the set file defines]}
+--- @return table|string snapshot info on success, reason on failure
+function SetSnapshot.load(char_name, job)
+    local char_dir = windower.addon_path .. 'data/' .. char_name .. '/'
+    local ok, snapshot = pcall(dofile, char_dir .. 'snapshots/' .. job:lower() .. '_sets.lua')
+    if not ok or type(snapshot) ~= 'table' or snapshot.version ~= SNAPSHOT_VERSION
+        or type(snapshot.source) ~= 'table' or type(snapshot.build) ~= 'function' then
+        return nil, 'missing'
+    end
+
+    local source = snapshot.source
+    if not FileStamp.matches(char_dir .. tostring(source.path), {source.size, source.adler32}) then
+        return nil, 'stale'
+    end
+
+    if snapshot.uses_set_literal and not S then
+        return nil, 'error'
+    end
+    local built, globals = pcall(snapshot.build, S)
+    if not built or type(globals) ~= 'table' or type(globals.sets) ~= 'table' then
+        return nil, 'error'
+    end
+    return globals, snapshot
+end
+
+--- Install a job snapshot in place of include('sets/<job>_sets.lua').
+--- Files that reset `sets` (sets = {}) replace it; files that build on the
+--- Mote-Include skeleton get their top-level set groups merged into it.
+--- @param char_name string Character folder (e.g. 'Tetsouo')
+--- @param job string Job code (e.g. 'rdm')
+--- @return boolean true if the snapshot was applied, false to use the live build
+function SetSnapshot.apply(char_name, job)
+    local globals, info = SetSnapshot.load(char_name, job)
+    if not globals then
+        SetSnapshot.status = info
+        DebugLogger.logf_if('JOBCHANGE_DEBUG', 'Snapshot', '%s: %s - live build', job:upper(), info)
+        return false
+    end
+
+    for name, value in pairs(globals) do
+        if name == 'sets' and not info.reset and type(_G.sets) == 'table' then
+            for key, set in pairs(value) do
+                _G.sets[key] = set
+            end
+        else
+            _G[name] = value
+        end
+    end
+
+    SetSnapshot.status = 'snapshot'
+    DebugLogger.logf_if('JOBCHANGE_DEBUG', 'Snapshot', '%s: loaded (built %s)', job:upper(), tostring(info.generated))
+    return true
+end
+
+return SetSnapshot
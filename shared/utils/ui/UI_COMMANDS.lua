@@ -84,6 +84,14 @@ function UICommands.handle_ui_command(cmdParams)
                 end
             end
         end
+    elseif subcommand == 'tracker' then
+        -- Update tracker stats, optional mode switch (resets the stats)
+        local mode = cmdParams[3] and cmdParams[3]:lower()
+        if mode and mode ~= 'dirty' and mode ~= 'snapshot' then
+            MessageUI.show_error("Unknown tracker mode: " .. mode .. ". Use: //gs c ui tracker [dirty|snapshot]")
+        else
+            MessageUI.show_tracker_stats(KeybindUI.tracker(mode))
+        end
     elseif subcommand == 'help' or subcommand == '?' then
         MessageUI.show_help()
     else
@@ -7,7 +7,7 @@
 --- then composes the public KeybindUI API by attaching methods from the
 --- specialized sub-modules:
 ---
----   ui_state_tracker        - capture/diff Mote state values
+---   ui_state_tracker        - dirty-flag (or snapshot diff) state tracking
 ---   ui_state_value          - read individual state values for display
 ---   ui_display              - render UI text
 ---   ui_appearance           - background presets/RGBA + font
@@ -23,7 +23,7 @@
 ---   toggle_header, toggle_legend, toggle_column_headers, toggle_footer
 ---   set_background_preset, set_background_rgba, toggle_background, set_font
 ---   update, force_reinit, schedule_update, needs_reinit, get_status,
----   handle_job_configuration_change
+---   handle_job_configuration_change, tracker
 ---
 --- Commands: //gs c ui (toggle), //gs c uisave (save position manually)
 ---
@@ -138,7 +138,7 @@ Lifecycle.attach(KeybindUI)
 Visibility.attach(KeybindUI)
 
 -- Update orchestration: update, force_reinit, schedule_update, needs_reinit,
--- get_status, handle_job_configuration_change
+-- get_status, handle_job_configuration_change, tracker
 -- Attach AFTER Lifecycle (force_reinit calls KeybindUI.init/destroy)
 Orchestrator.attach(KeybindUI)
 
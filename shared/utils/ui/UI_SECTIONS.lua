@@ -6,7 +6,7 @@
 ---
 --- @file ui/UI_SECTIONS.lua
 --- @author Tetsouo
---- @version 1.0
+--- @version 1.1 - Section cache for dirty redraws (render_dirty_ui)
 --- @date Created: 2025-09-26
 ---============================================================================
 
@@ -212,6 +212,47 @@ end
 --- COMPLETE UI RENDERING
 ---============================================================================
 
+-- Last complete render, reused by render_dirty_ui()
+-- {args = {...}, widths = {...}, parts = {[i] = text}, states = {[i] = {[state_name] = true}}}
+local render_cache = nil
+
+-- Section order of the complete UI (after header + column headers)
+local SECTION_RENDERERS = {
+    {name = "spell", keys = "spell_keys", render = UISections.render_spells_section},
+    {name = "enhancing", keys = "enhancing_keys", render = UISections.render_enhancing_section},
+    {name = "ja", keys = "ja_keys", render = UISections.render_ja_section},
+    {name = "weapon", keys = "weapon_keys", render = UISections.render_weapons_section},
+    {name = "mode", keys = "mode_keys", render = UISections.render_modes_section},
+}
+
+--- Collect the state names shown by one section
+--- @param keys table|nil Section keys from the display structure
+--- @param keybinds table All keybinds
+--- @return table Set of state names
+local function section_states(keys, keybinds)
+    local states = {}
+    if not keys then
+        return states
+    end
+    local wanted = {}
+    for _, key in ipairs(keys) do
+        wanted[key] = true
+    end
+    for _, bind in ipairs(keybinds) do
+        if bind.state and wanted[bind.key] then
+            states[bind.state] = true
+        end
+    end
+    return states
+end
+
+--- Concatenate the cached parts into the final UI text
+--- @param cache table render_cache
+--- @return string Complete UI text
+local function join_parts(cache)
+    return cache.head .. table.concat(cache.parts) .. cache.tail
+end
+
 --- Render all sections for a complete UI display
 --- @param display_structure table Display structure from UIDisplayBuilder
 --- @param keybinds table All keybinds
@@ -243,45 +284,87 @@ function UISections.render_complete_ui(display_structure, keybinds, job, get_sta
     text = text .. UIFormatter.create_column_headers(key_column_width, function_column_width, content_width)
 
     -- Render sections in order without separators between them (pass content_width for centering)
-    -- 1. Spells/Abilities
-    local spells = UISections.render_spells_section(display_structure, keybinds, job, key_column_width, function_column_width, get_state_value_func, content_width, value_column_width)
-    if spells ~= "" then
-        text = text .. spells
+    -- 1. Spells/Abilities, 2. Enhancing (RDM specific), 3. Job Abilities / Song Slots,
+    -- 4. Weapons, 5. Modes - each kept for render_dirty_ui()
+    local cache = {
+        display_structure = display_structure,
+        keybinds = keybinds,
+        job = job,
+        get_state_value_func = get_state_value_func,
+        get_all_values_func = get_all_values_func,
+        widths = {key_column_width, function_column_width, content_width, value_column_width},
+        head = text,
+        parts = {},
+        states = {},
+    }
+    for i, section in ipairs(SECTION_RENDERERS) do
+        cache.parts[i] = section.render(display_structure, keybinds, job, key_column_width, function_column_width,
+            get_state_value_func, content_width, value_column_width)
+        cache.states[i] = section_states(display_structure[section.keys], keybinds)
     end
 
-    -- 2. Enhancing (RDM specific)
-    local enhancing = UISections.render_enhancing_section(display_structure, keybinds, job, key_column_width, function_column_width, get_state_value_func, content_width, value_column_width)
-    if enhancing ~= "" then
-        text = text .. enhancing
-    end
+    -- 6. Universal Commands (footer)
+    local tail = UISections.render_commands_footer(job, content_width)
 
-    -- 3. Job Abilities / Song Slots
-    local ja = UISections.render_ja_section(display_structure, keybinds, job, key_column_width, function_column_width, get_state_value_func, content_width, value_column_width)
-    if ja ~= "" then
-        text = text .. ja
+    -- Add bottom margin if NO footer (footer adds its own margin)
+    if not _G.ui_display_config or not _G.ui_display_config.show_footer then
+        tail = tail .. "\\cs(0,0,0)" .. string.rep(" ", content_width) .. "\\cr\n"
     end
+    cache.tail = tail
 
-    -- 4. Weapons
-    local weapons = UISections.render_weapons_section(display_structure, keybinds, job, key_column_width, function_column_width, get_state_value_func, content_width, value_column_width)
-    if weapons ~= "" then
-        text = text .. weapons
-    end
+    render_cache = cache
+    return join_parts(cache)
+end
 
-    -- 5. Modes
-    local modes = UISections.render_modes_section(display_structure, keybinds, job, key_column_width, function_column_width, get_state_value_func, content_width, value_column_width)
-    if modes ~= "" then
-        text = text .. modes
+--- Re-render only the sections showing a dirty state, reusing the others from
+--- the last render_complete_ui() call (same job and keybinds).
+--- Column widths are re-measured first: states whose value list cannot be
+--- read are measured on their current value, so a change can resize the UI
+--- (then nil is returned and the caller redraws everything).
+--- BRD song slots are derived from other states, so that section is always
+--- re-rendered for BRD.
+--- @param job string Current job
+--- @param dirty table Set of changed state names
+--- @return string|nil Complete UI text, nil if there is no usable cache
+--- @return number Sections rendered
+--- @return number Sections reused
+function UISections.render_dirty_ui(job, dirty)
+    local cache = render_cache
+    if not cache or cache.job ~= job then
+        return nil, 0, 0
     end
 
-    -- 6. Universal Commands (footer)
-    text = text .. UISections.render_commands_footer(job, content_width)
+    local key_w, function_w, content_w, value_w = unpack(cache.widths)
+    if UIFormatter.calculate_value_column_width(cache.keybinds, cache.get_all_values_func) ~= value_w
+        or UIFormatter.calculate_content_width(cache.keybinds, key_w, function_w, cache.get_all_values_func) ~= content_w then
+        return nil, 0, 0
+    end
 
-    -- Add bottom margin if NO footer (footer adds its own margin)
-    if not _G.ui_display_config or not _G.ui_display_config.show_footer then
-        text = text .. "\\cs(0,0,0)" .. string.rep(" ", content_width) .. "\\cr\n"
+    local rendered, reused = 0, 0
+    for i, section in ipairs(SECTION_RENDERERS) do
+        local stale = job == "BRD" and section.name == "ja"
+        if not stale then
+            for state_name in pairs(dirty) do
+                if cache.states[i][state_name] then
+                    stale = true
+                    break
+                end
+            end
+        end
+        if stale then
+            cache.parts[i] = section.render(cache.display_structure, cache.keybinds, job, key_w, function_w,
+                cache.get_state_value_func, content_w, value_w)
+            rendered = rendered + 1
+        else
+            reused = reused + 1
+        end
     end
+    return join_parts(cache), rendered, reused
+end
 
-    return text
+--- Forget the last render (next redraw must be complete).
+function UISections.clear_render_cache()
+    render_cache = nil
 end
 
 --- Render simple command footer
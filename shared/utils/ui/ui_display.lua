@@ -5,11 +5,12 @@
 --- the display structure (sections + columns) and live state values. Two
 --- functions:
 ---   • get_current_job_keybinds() - load keybinds for current job (with fallback)
----   • update_display()           - render and push text to keybind_ui_display
+---   • update_display([dirty])    - render and push text to keybind_ui_display
+---                                  (only the dirty sections when given)
 ---
 --- @file ui/ui_display.lua
 --- @author Tetsouo
---- @version 1.0
+--- @version 1.1
 ---============================================================================
 
 local KeybindLoader     = require('shared/utils/ui/UI_LOADER')
@@ -39,10 +40,19 @@ function Display.get_current_job_keybinds()
     return keybinds or {}
 end
 
---- Build the complete UI text and push it to the live keybind_ui_display.
+-- Last text pushed to the texts object (skip identical pushes)
+local last_pushed = {display = nil, text = nil}
+
+--- Build the UI text and push it to the live keybind_ui_display.
+--- With a dirty set (from StateTracker.consume), only the sections showing
+--- one of those states are re-rendered; otherwise the whole UI is rebuilt.
 --- No-op if display element doesn't exist yet (early call before init).
-function Display.update_display()
-    if not _G.keybind_ui_display then return end
+--- @param dirty table|nil Set of changed state names (nil = complete redraw)
+--- @return string|nil 'full' or 'partial' (nil if no display)
+--- @return number Sections rendered
+--- @return number Sections reused
+function Display.update_display(dirty)
+    if not _G.keybind_ui_display then return nil, 0, 0 end
 
     local job = player and player.main_job or "UNK"
 
@@ -51,21 +61,36 @@ function Display.update_display()
         _G.update_brd_song_slots()
     end
 
-    local keybinds = Display.get_current_job_keybinds()
-    local display_structure = UIDisplayBuilder.build_display_structure(job)
-
-    -- Render via the modular UI system. Pass both state value getters:
-    --   - get_state_value: current value for live display
-    --   - get_all_state_values: all values for max column width calculation
-    local text = UISections.render_complete_ui(
-        display_structure,
-        keybinds,
-        job,
-        StateValue.get_state_value,
-        StateValue.get_all_state_values
-    )
-
-    _G.keybind_ui_display:text(text)
+    local text, rendered, reused
+    local redraw = 'partial'
+    if dirty then
+        text, rendered, reused = UISections.render_dirty_ui(job, dirty)
+    end
+
+    if not text then
+        redraw = 'full'
+        local keybinds = Display.get_current_job_keybinds()
+        local display_structure = UIDisplayBuilder.build_display_structure(job)
+
+        -- Render via the modular UI system. Pass both state value getters:
+        --   - get_state_value: current value for live display
+        --   - get_all_state_values: all values for max column width calculation
+        text = UISections.render_complete_ui(
+            display_structure,
+            keybinds,
+            job,
+            StateValue.get_state_value,
+            StateValue.get_all_state_values
+        )
+        rendered, reused = 5, 0
+    end
+
+    if last_pushed.display ~= _G.keybind_ui_display or last_pushed.text ~= text then
+        _G.keybind_ui_display:text(text)
+        last_pushed.display = _G.keybind_ui_display
+        last_pushed.text = text
+    end
+    return redraw, rendered, reused
 end
 
 return Display
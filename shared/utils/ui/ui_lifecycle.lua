@@ -98,8 +98,8 @@ function Lifecycle.attach(KeybindUI)
         if _G.ui_display_config.enabled then
             _G.keybind_ui_display:show()
             Display.update_display()
-            -- Capture initial state after first display
-            _G.ui_manager_state.cached_states = StateTracker.capture_current_states()
+            -- Track changes from the state just drawn
+            StateTracker.reset_baseline()
         end
     end
 
@@ -188,6 +188,7 @@ function Lifecycle.attach(KeybindUI)
         if ui_state then
             ui_state.cached_states = {}
         end
+        StateTracker.mark_all_dirty()
     end
 end
 
@@ -1,18 +1,61 @@
 ---============================================================================
---- UI State Tracker - Capture and Compare Mote State Values
+--- UI State Tracker - Detect Mote State Changes for the Keybind UI
 ---============================================================================
---- Pure helpers extracted from UI_MANAGER.lua to track which Mote states are
---- relevant to the keybind UI and detect changes between successive update
---- ticks. The display layer redraws only when this module reports a change,
---- which prevents per-frame redraw spam (e.g. AutoMove triggering 1-2 Hz).
+--- Tracks which Mote states changed between successive update ticks so the
+--- display layer redraws only when needed (AutoMove triggers updates at
+--- 1-2 Hz).
+---
+--- Two modes:
+---   • dirty    (default) - the Mote mode methods (set, cycle, cycleback,
+---                          toggle, reset, unset, options) and the M{}
+---                          constructor are wrapped once; a changed value
+---                          marks its state name dirty. An update with no
+---                          dirty state costs nothing (no table, no tostring).
+---   • snapshot (fallback) - capture every state as a string and diff against
+---                          _G.ui_manager_state.cached_states (pre-1.1
+---                          behavior). Used when the Mote mode methods cannot
+---                          be found, or forced with //gs c ui tracker snapshot.
+---
+--- Changes that bypass the methods (new M{} objects, options()) mark the
+--- whole UI dirty; raw writes to .value (BRD song slots) are refreshed by the
+--- display itself on every redraw, as before.
+---
+--- Stats (//gs c ui tracker): updates, skips, full / partial redraws,
+--- sections re-rendered / reused and KB allocated per update.
 ---
 --- @file ui/ui_state_tracker.lua
 --- @author Tetsouo
---- @version 1.0
+--- @version 1.1 - Dirty-flag observers + allocation counter
 ---============================================================================
 
 local StateTracker = {}
 
+-- High-frequency states that don't affect UI display (excluded from change detection)
+-- Moving: AutoMove toggles this on every step start/stop (~1-2 Hz)
+local EXCLUDED_STATES = {
+    Moving = true,
+}
+
+-- Mote mode methods that can change a state value
+local MUTATORS = {'set', 'cycle', 'cycleback', 'toggle', 'reset', 'unset'}
+
+-- Dirty tracking (module state: reset with every gs reload, like the states)
+local dirty = {}
+local dirty_count = 0
+local all_dirty = true
+local observing = false
+
+-- state object -> state name (rebuilt lazily after new M{} objects)
+local names = setmetatable({}, {__mode = 'k'})
+local names_built = false
+
+-- Wrapped functions (never wrap twice)
+local wrapped = setmetatable({}, {__mode = 'k'})
+
+---============================================================================
+--- SNAPSHOT MODE (fallback)
+---============================================================================
+
 --- Capture all current state values, excluding internal Mote fields and
 --- high-frequency states that don't affect the displayed UI.
 --- @return table Dictionary of state_name -> string value
@@ -21,16 +64,10 @@ function StateTracker.capture_current_states()
 
     local states = {}
 
-    -- High-frequency states that don't affect UI display (excluded from change detection)
-    -- Moving: AutoMove toggles this on every step start/stop (~1-2 Hz)
-    local excluded_states = {
-        Moving = true,
-    }
-
     for state_name, state_obj in pairs(_G.state) do
         if state_name:sub(1, 1) ~= '_'
            and type(state_obj) ~= 'function'
-           and not excluded_states[state_name] then
+           and not EXCLUDED_STATES[state_name] then
 
             local value = nil
 
@@ -86,4 +123,189 @@ function StateTracker.have_states_changed(current_states)
     return false
 end
 
+---============================================================================
+--- DIRTY MODE (observers)
+---============================================================================
+
+--- Mark one state name dirty.
+--- @param state_name string
+function StateTracker.mark_dirty(state_name)
+    if all_dirty or EXCLUDED_STATES[state_name] or dirty[state_name] then
+        return
+    end
+    dirty[state_name] = true
+    dirty_count = dirty_count + 1
+end
+
+--- Mark the whole UI dirty (next update redraws every section).
+function StateTracker.mark_all_dirty()
+    all_dirty = true
+end
+
+--- Find the state name of a mode object (walks _G.state once per new object).
+--- @param mode table Mote mode object
+--- @return string|nil State name
+local function name_of(mode)
+    local name = names[mode]
+    if name or names_built or not _G.state then
+        return name
+    end
+    for state_name, state_obj in pairs(_G.state) do
+        if type(state_obj) == 'table' then
+            names[state_obj] = state_name
+        end
+    end
+    names_built = true
+    return names[mode]
+end
+
+--- Wrap a mode method so a changed value marks its state dirty.
+--- @param fn function Original method
+--- @return function Wrapped method
+local function observe_method(fn)
+    local observer = function(mode, ...)
+        local before = mode.value
+        local a, b, c = fn(mode, ...)
+        if mode.value ~= before then
+            local state_name = name_of(mode)
+            if state_name then
+                StateTracker.mark_dirty(state_name)
+            end
+        end
+        return a, b, c
+    end
+    wrapped[observer] = true
+    return observer
+end
+
+--- Install the observers on the Mote mode methods (idempotent).
+--- @return boolean True if observing (dirty mode available)
+function StateTracker.install_observers()
+    local meta = _G._meta
+    local methods = meta and meta.M and meta.M.__methods
+    if type(methods) ~= 'table' then
+        observing = false
+        return false
+    end
+
+    for _, method in ipairs(MUTATORS) do
+        local fn = methods[method]
+        if type(fn) == 'function' and not wrapped[fn] then
+            methods[method] = observe_method(fn)
+        end
+    end
+
+    -- options() changes the value list (column widths): full redraw
+    local options = methods.options
+    if type(options) == 'function' and not wrapped[options] then
+        methods.options = function(...)
+            all_dirty = true
+            return options(...)
+        end
+        wrapped[methods.options] = true
+    end
+
+    -- New M{} objects replace states (BST species / ammo lists): full redraw
+    local constructor = _G.M
+    if type(constructor) == 'function' and not wrapped[constructor] then
+        _G.M = function(...)
+            all_dirty = true
+            names_built = false
+            return constructor(...)
+        end
+        wrapped[_G.M] = true
+    end
+
+    observing = true
+    return true
+end
+
+--- Active tracking mode.
+--- @return string 'dirty' or 'snapshot'
+function StateTracker.mode()
+    local ui_state = _G.ui_manager_state
+    if not observing or (ui_state and ui_state.tracker_mode == 'snapshot') then
+        return 'snapshot'
+    end
+    return 'dirty'
+end
+
+--- True if a redraw is needed since the last consume().
+--- @return boolean
+function StateTracker.has_changes()
+    return all_dirty or dirty_count > 0
+end
+
+--- Take the pending changes and clear them.
+--- @return table|nil Dirty state names (set), nil when everything is dirty
+function StateTracker.consume()
+    local changed = (not all_dirty) and dirty or nil
+    dirty = {}
+    dirty_count = 0
+    all_dirty = false
+    return changed
+end
+
+--- Start tracking from the state currently on screen (after a full draw).
+function StateTracker.reset_baseline()
+    StateTracker.install_observers()
+    dirty = {}
+    dirty_count = 0
+    all_dirty = false
+    names_built = false
+    local ui_state = _G.ui_manager_state
+    if ui_state and StateTracker.mode() == 'snapshot' then
+        ui_state.cached_states = StateTracker.capture_current_states()
+    end
+end
+
+---============================================================================
+--- STATS
+---============================================================================
+
+StateTracker.stats = {}
+
+--- Reset the update counters.
+function StateTracker.reset_stats()
+    StateTracker.stats = {
+        mode = StateTracker.mode(),
+        updates = 0, skipped = 0,
+        full = 0, partial = 0,
+        sections_rendered = 0, sections_reused = 0,
+        alloc_kb = 0, alloc_samples = 0, alloc_max = 0,
+    }
+end
+
+StateTracker.reset_stats()
+
+--- Record one update() call.
+--- @param redraw string|nil nil (skipped), 'full' or 'partial'
+--- @param alloc_kb number collectgarbage('count') delta (negative if a GC step ran)
+function StateTracker.record_update(redraw, alloc_kb)
+    local s = StateTracker.stats
+    s.updates = s.updates + 1
+    if not redraw then
+        s.skipped = s.skipped + 1
+    else
+        s[redraw] = s[redraw] + 1
+    end
+    -- A GC step during the update makes the delta meaningless: skip it
+    if alloc_kb >= 0 then
+        s.alloc_kb = s.alloc_kb + alloc_kb
+        s.alloc_samples = s.alloc_samples + 1
+        if alloc_kb > s.alloc_max then
+            s.alloc_max = alloc_kb
+        end
+    end
+end
+
+--- Record section reuse of one redraw.
+--- @param rendered number Sections rendered
+--- @param reused number Sections taken from the cache
+function StateTracker.record_sections(rendered, reused)
+    local s = StateTracker.stats
+    s.sections_rendered = s.sections_rendered + rendered
+    s.sections_reused = s.sections_reused + reused
+end
+
 return StateTracker
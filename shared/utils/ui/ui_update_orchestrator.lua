@@ -4,6 +4,7 @@
 --- Coordinates UI redraws and reinits with debouncing, cancellation tokens
 --- and state-change detection. The main entry points:
 ---   • update()                       - state-aware redraw (skips if no change)
+---   • tracker(mode)                  - switch dirty/snapshot tracking, stats
 ---   • force_reinit()                 - destroy + init with timeout polling
 ---   • schedule_update()              - debounced update with cancel token
 ---   • handle_job_configuration_change - dispatched by JobChangeManager
@@ -14,7 +15,7 @@
 ---
 --- @file ui/ui_update_orchestrator.lua
 --- @author Tetsouo
---- @version 1.0
+--- @version 1.1 - Dirty-flag tracking, section redraws, allocation stats
 ---============================================================================
 
 local Display      = require('shared/utils/ui/ui_display')
@@ -40,7 +41,10 @@ end
 function Orchestrator.attach(KeybindUI)
     --- Update UI when states change with error handling.
     --- Only redraws if states have actually changed (prevents redraw spam).
+    --- Dirty mode re-renders only the sections showing a changed state;
+    --- snapshot mode diffs a full capture of _G.state (see ui_state_tracker).
     function KeybindUI.update()
+        local alloc_start = collectgarbage('count')
         local debug_start
         if _G.UPDATE_DEBUG then
             debug_start = os.clock()
@@ -54,19 +58,33 @@ function Orchestrator.attach(KeybindUI)
         end
 
         -- STATE CHANGE DETECTION: Only update if states actually changed
-        local current_states = StateTracker.capture_current_states()
-        if not StateTracker.have_states_changed(current_states) then
-            debug_log('[UPDATE_DEBUG] UI.update SKIPPED (states unchanged)')
-            return
+        local dirty_mode = StateTracker.mode() == 'dirty'
+        local current_states, dirty
+        if dirty_mode then
+            if not StateTracker.has_changes() then
+                debug_log('[UPDATE_DEBUG] UI.update SKIPPED (no dirty state)')
+                StateTracker.record_update(nil, collectgarbage('count') - alloc_start)
+                return
+            end
+            dirty = StateTracker.consume()
+        else
+            current_states = StateTracker.capture_current_states()
+            if not StateTracker.have_states_changed(current_states) then
+                debug_log('[UPDATE_DEBUG] UI.update SKIPPED (states unchanged)')
+                StateTracker.record_update(nil, collectgarbage('count') - alloc_start)
+                return
+            end
         end
 
         -- States changed, update display
         debug_log('[UPDATE_DEBUG] UI.update -> update_display (states changed)')
         local ui_state = _G.ui_manager_state
-        local success, error_msg = pcall(Display.update_display)
+        local success, redraw, rendered, reused = pcall(Display.update_display, dirty)
         if not success then
             ui_state.consecutive_failures = ui_state.consecutive_failures + 1
-            ui_state.last_error = error_msg
+            ui_state.last_error = redraw
+            -- Redraw everything on the next attempt
+            StateTracker.mark_all_dirty()
 
             -- Try to recover if too many failures
             if ui_state.consecutive_failures > 5 then
@@ -78,8 +96,14 @@ function Orchestrator.attach(KeybindUI)
             ui_state.consecutive_failures = 0
             ui_state.last_update = os.clock()
             -- Cache states for next comparison
-            ui_state.cached_states = current_states
+            if current_states then
+                ui_state.cached_states = current_states
+            end
+            if redraw then
+                StateTracker.record_sections(rendered, reused)
+            end
         end
+        StateTracker.record_update(success and redraw or 'full', collectgarbage('count') - alloc_start)
 
         if _G.UPDATE_DEBUG and debug_start then
             local debug_end = os.clock()
@@ -87,6 +111,23 @@ function Orchestrator.attach(KeybindUI)
         end
     end
 
+    --- Switch the change tracker ('dirty' / 'snapshot') and reset its stats.
+    --- @param mode string|nil New mode (nil = keep current)
+    --- @return table Tracker stats
+    function KeybindUI.tracker(mode)
+        local ui_state = _G.ui_manager_state
+        if mode == 'dirty' or mode == 'snapshot' then
+            ui_state.tracker_mode = mode
+            ui_state.cached_states = {}
+            StateTracker.mark_all_dirty()
+            StateTracker.install_observers()
+            StateTracker.mark_all_dirty()
+            StateTracker.reset_stats()
+        end
+        StateTracker.stats.mode = StateTracker.mode()
+        return StateTracker.stats
+    end
+
     --- Force complete UI reinitialization with cancel support.
     --- Uses cancel ID system (similar to JCM counter) to handle rapid job changes.
     --- Uses coroutine.schedule() for non-blocking state checking.
@@ -112,6 +153,7 @@ function Orchestrator.attach(KeybindUI)
                 ui_state.consecutive_failures = 0
                 ui_state.update_count = ui_state.update_count + 1
                 ui_state.cached_states = {}
+                StateTracker.mark_all_dirty()
             else
                 ui_state.consecutive_failures = ui_state.consecutive_failures + 1
             end
@@ -138,6 +180,7 @@ function Orchestrator.attach(KeybindUI)
                     ui_state.consecutive_failures = 0
                     ui_state.update_count = ui_state.update_count + 1
                     ui_state.cached_states = {}
+                    StateTracker.mark_all_dirty()
                 else
                     ui_state.consecutive_failures = ui_state.consecutive_failures + 1
                 end
@@ -25,6 +25,7 @@
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 local Config = require('shared/utils/wardrobe/lib/config')
+local ChatQueue = require('shared/utils/messages/core/chat_queue')
 
 local Chat = {}
 
@@ -45,18 +46,21 @@ local TAG     = Config.CHAT_TAG
 local WIDTH   = Config.SEP_LEN
 local SEP     = string.rep('=', WIDTH)
 
+-- Organizer phases share the 'wardrobe' chat budget (message_settings CHAT_QUEUE)
+local emit = ChatQueue.writer('wardrobe')
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   PRIMITIVES
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 --- Full-width gray '=' separator.
 function Chat.separator()
-    windower.add_to_chat(CHANNEL, C.gray .. SEP)
+    emit(CHANNEL, C.gray .. SEP)
 end
 
 --- Full-width gray '-' divider for sub-sections.
 function Chat.divider()
-    windower.add_to_chat(CHANNEL, C.gray .. string.rep('-', WIDTH))
+    emit(CHANNEL, C.gray .. string.rep('-', WIDTH))
 end
 
 --- Banner panel: a single line with the title centered between '=' chars
@@ -67,7 +71,7 @@ function Chat.banner(title)
     local total_pad = math.max(2, WIDTH - #padded)
     local left      = math.floor(total_pad / 2)
     local right     = total_pad - left
-    windower.add_to_chat(CHANNEL,
+    emit(CHANNEL,
         C.gray   .. string.rep('=', left) ..
         C.yellow .. padded ..
         C.gray   .. string.rep('=', right))
@@ -77,7 +81,7 @@ end
 function Chat.section(name)
     local padded = ' ' .. name .. ' '
     local right_pad = math.max(3, WIDTH - 3 - #padded)
-    windower.add_to_chat(CHANNEL,
+    emit(CHANNEL,
         C.gray .. '--- ' .. C.cyan .. name .. C.gray .. ' ' .. string.rep('-', right_pad))
 end
 
@@ -90,25 +94,25 @@ local function tagged(color, message)
 end
 
 function Chat.info(message)
-    windower.add_to_chat(CHANNEL, tagged(C.white, message))
+    emit(CHANNEL, tagged(C.white, message))
 end
 
 function Chat.success(message)
-    windower.add_to_chat(158, tagged(C.green, message))
+    emit(158, tagged(C.green, message))
 end
 
 function Chat.error(message)
-    windower.add_to_chat(167, tagged(C.red, 'Error: ' .. C.white .. message))
+    emit(167, tagged(C.red, 'Error: ' .. C.white .. message))
 end
 
 function Chat.warn(message)
-    windower.add_to_chat(205, tagged(C.orange, message))
+    emit(205, tagged(C.orange, message))
 end
 
 --- Like error, but WITHOUT the "Error:" prefix - used for blocking notices
 --- (e.g. "PROCESSING - do not move") that need maximum visual urgency.
 function Chat.alert(message)
-    windower.add_to_chat(167, tagged(C.red, message))
+    emit(167, tagged(C.red, message))
 end
 
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -124,7 +128,7 @@ function Chat.phase(phase_num, label, info)
     local pnum  = C.yellow .. ('Phase %d'):format(phase_num)
     local lbl   = C.white .. label
     local extra = info and (C.gray .. '  (' .. C.green .. info .. C.gray .. ')') or ''
-    windower.add_to_chat(CHANNEL,
+    emit(CHANNEL,
         C.gray .. '[' .. C.cyan .. TAG .. C.gray .. '] ' ..
         arrow .. ' ' .. pnum .. C.gray .. '  ' .. lbl .. extra)
 end
@@ -139,7 +143,7 @@ function Chat.detail(label, value)
     local label_str = tostring(label)
     local pad_count = math.max(3, 26 - #label_str)
     local pad = string.rep('.', pad_count)
-    windower.add_to_chat(CHANNEL,
+    emit(CHANNEL,
         '  ' .. C.cyan .. label_str .. ' ' ..
         C.gray .. pad .. ' ' ..
         C.green .. tostring(value))
@@ -13,6 +13,9 @@
 ---   alternation with re-discovery + cycle detection). Each phase only supplies
 ---   its own discover_pending() and discover_drainable() closures.
 ---
+---   `replay_plan()` sends a precomputed Planner.solve() plan instead (no
+---   discovery between bursts, used by `//gs c wo plan`).
+---
 ---   @file shared/utils/wardrobe/lib/phases.lua
 ---  ═══════════════════════════════════════════════════════════════════════════
 
@@ -21,6 +24,7 @@ local Log    = require('shared/utils/wardrobe/lib/log')
 local Items  = require('shared/utils/wardrobe/lib/items')
 local Moves  = require('shared/utils/wardrobe/lib/moves')
 local State  = require('shared/utils/wardrobe/lib/state')
+local Planner = require('shared/utils/wardrobe/lib/planner')
 
 local Phases = {}
 
@@ -317,6 +321,80 @@ local function run_burst_loop(opts)
     coroutine.schedule(step, 0)
 end
 
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PLANNED REPLAY  (Planner.solve bursts, no re-discovery)
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Each planned burst is already ordered pushes-then-pulls and sized to
+---   BURST_SIZE / inventory room, so the replay only resolves slots:
+---     - push: first inventory slot holding the id (not taken in this burst)
+---     - pull: the planned slot, or the first slot of that bag holding the id
+---   Missing items are skipped (logged); finish_run's verify catches them.
+
+function Phases.replay_plan(plan, on_done)
+    dlog(('===== PLANNED REPLAY: %d bursts, %d packets ====='):format(#plan.bursts, plan.packets))
+    local index = 0
+    local total_sent, total_skipped = 0, 0
+
+    local function step()
+        index = index + 1
+        local burst = plan.bursts[index]
+        if not burst then
+            dlog(('PLANNED REPLAY DONE: sent=%d skipped=%d in %d bursts'):format(
+                total_sent, total_skipped, index - 1))
+            on_done()
+            return
+        end
+
+        local sent, skipped = 0, 0
+        local inv = windower.ffxi.get_items(INV_BAG) or {}
+        local taken = {}
+        for _, push in ipairs(burst.pushes) do
+            local slot = nil
+            for s, it in ipairs(inv) do
+                if not taken[s] and it.id == push.id and it.status == 0 then
+                    slot = s
+                    break
+                end
+            end
+            if slot and push_slot(slot, push.dst) then
+                taken[slot] = true
+                sent = sent + 1
+            else
+                skipped = skipped + 1
+                dlog(('  replay SKIP push %s >> %s'):format(push.name, bag_name(push.dst)))
+            end
+        end
+
+        for _, pull in ipairs(burst.pulls) do
+            local slot = pull.slot
+            local items = windower.ffxi.get_items(pull.bag)
+            if items and (not items[slot] or items[slot].id ~= pull.id) then
+                slot = nil
+                for s, it in ipairs(items) do
+                    if it.id == pull.id and it.status == 0 then
+                        slot = s
+                        break
+                    end
+                end
+            end
+            if slot and pull_slot(pull.bag, slot) then
+                sent = sent + 1
+            else
+                skipped = skipped + 1
+                dlog(('  replay SKIP pull %s @%s'):format(pull.name, bag_name(pull.bag)))
+            end
+        end
+
+        total_sent = total_sent + sent
+        total_skipped = total_skipped + skipped
+        dlog(('[REPLAY] burst %d/%d: %d pushes + %d pulls (%d skipped)'):format(
+            index, #plan.bursts, #burst.pushes, #burst.pulls, skipped))
+        coroutine.schedule(step, Planner.burst_delay(sent))
+    end
+
+    coroutine.schedule(step, 0)
+end
+
 ---  ═══════════════════════════════════════════════════════════════════════════
 ---   PHASE 2  -  EMPTY W1/W2  (W1/W2 unused  >>  overflow chain)
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,683 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Wardrobe Organizer - Offline Move Planner
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Solves the whole bag assignment from ONE inventory snapshot, then emits
+---   the ordered move list already cut into bursts. The orchestrator replays
+---   it (Phases.replay_plan) with no re-discovery between bursts.
+---
+---   Assignment (minimum moves):
+---     - pinned item   -> its pin bag (same claim pool as State; spare copies
+---                        only go behind the last pin bag, see classify)
+---     - used item     -> first PRIMARY bag with room
+---     - unused item   -> first OVERFLOW bag with room
+---     Items already in an acceptable bag never move, so every planned item
+---     costs exactly one pull + one push (one push if already in inventory):
+---     the move count is the lower bound for the layout. Items that cannot
+---     fit anywhere stay where they are (reported as `unplaced`).
+---     PROTECTED bags are never read from nor written to.
+---
+---   Burst schedule (same packet model as run_burst_loop):
+---     each burst = pushes of items already in inventory, then pulls,
+---     <= BURST_SIZE packets. A pull is scheduled only when its destination
+---     will have room next burst (counting slots freed by this burst's
+---     pulls), so nothing waits in inventory longer than one burst. Full
+---     bags are unblocked by pulling one item of a swap pair first ("seed")
+---     as long as two inventory slots are free.
+---
+---   Snapshot shape (Planner.capture / simulator / saved snapshot files):
+---     {
+---        version, character, mode = 'job'|'alt', job,
+---        primary = {bag,...}, overflow = {bag,...}, protected = {[bag]=true},
+---        cleanup = {primary, overflow, fallback}   -- Phase 4 lists (simulator)
+---        used_names  = {[name_lower] = true},
+---        pinned_bags = {[name_lower] = {bag,...}},
+---        bags = {[bag_id] = {max = N, items = {[slot] = {id, count, status,
+---                                                        name, names, equip}}}},
+---     }
+---     Bag 0 (inventory) is always present. Empty slots are {id = 0}.
+---
+---   Public functions:
+---     Planner.capture(mode)          - snapshot of the live bags (in game)
+---     Planner.solve(snapshot)        - plan {bursts, moves, unplaced, ...}
+---     Planner.burst_delay(packets)   - adaptive delay used after a burst
+---     Planner.claim_pool / claim_pin - pin claim pools (shared with simulator)
+---     Planner.save(snapshot, path)   - write a snapshot as a Lua table file
+---     Planner.load(path)             - dofile a saved snapshot
+---
+---   @file shared/utils/wardrobe/lib/planner.lua
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local Config = require('shared/utils/wardrobe/lib/config')
+
+local Planner = {}
+
+local INV_BAG = Config.INV_BAG
+local SNAPSHOT_VERSION = 1
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   SNAPSHOT
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Copy a list (config lists are shared tables).
+local function copy_list(list)
+    local out = {}
+    for i, v in ipairs(list or {}) do out[i] = v end
+    return out
+end
+
+--- Read one live bag into snapshot form.
+local function capture_bag(bag_id, Items)
+    local info = windower.ffxi.get_bag_info(bag_id)
+    if not info or not info.enabled then
+        return {max = 0, items = {}}
+    end
+    local live = windower.ffxi.get_items(bag_id) or {}
+    local items = {}
+    for slot = 1, info.max do
+        local it = live[slot]
+        if it and it.id and it.id > 0 then
+            items[slot] = {
+                id     = it.id,
+                count  = it.count or 1,
+                status = it.status or 0,
+                name   = Items.display_name(it.id),
+                names  = Items.item_names(it.id),
+                equip  = Items.is_equipment(it.id),
+            }
+        else
+            items[slot] = {id = 0}
+        end
+    end
+    return {max = info.max, items = items}
+end
+
+--- Snapshot the live bags for the given mode.
+--- 'job' : active job's sets, pins from the auditor, PRIMARY/OVERFLOW bags.
+--- 'alt' : items used by any job, no pins, ALT_PRIMARY/ALT_OVERFLOW bags.
+--- @param mode string|nil 'job' (default) or 'alt'
+--- @return table|nil snapshot, string|nil error
+function Planner.capture(mode)
+    mode = mode or 'job'
+    local Items = require('shared/utils/wardrobe/lib/items')
+    local ok, Auditor = pcall(require, 'shared/utils/equipment/wardrobe_auditor')
+    if not ok then Auditor = nil end
+
+    local used_names, pinned_bags, primary, overflow, scan
+    if mode == 'alt' then
+        if not Auditor or not Auditor.collect_all_used_names then
+            return nil, 'Auditor.collect_all_used_names not available'
+        end
+        used_names  = Auditor.collect_all_used_names()
+        pinned_bags = {}
+        primary     = Config.ALT_PRIMARY_BAGS
+        overflow    = Config.ALT_OVERFLOW_BAGS
+        scan        = Config.ALT_ALL_BAGS
+    else
+        used_names = Items.collect_used_names()
+        pinned_bags = {}
+        if Auditor and Auditor.build_pinned_bags then
+            local ok2, pb = pcall(Auditor.build_pinned_bags)
+            if ok2 and type(pb) == 'table' then pinned_bags = pb end
+        end
+        primary  = Config.PRIMARY_BAGS
+        overflow = Config.OVERFLOW_BAGS
+        scan     = Config.ALL_WARDROBES
+    end
+    if not used_names or not next(used_names) then
+        return nil, 'no used items found (load a job / populate sets folder)'
+    end
+
+    local player_info = windower.ffxi.get_player()
+    local snapshot = {
+        version     = SNAPSHOT_VERSION,
+        character   = player_info and player_info.name or 'Unknown',
+        job         = player and player.main_job or nil,
+        mode        = mode,
+        primary     = copy_list(primary),
+        overflow    = copy_list(overflow),
+        protected   = {},
+        cleanup     = {
+            primary  = copy_list(Config.PRIMARY_BAGS),
+            overflow = copy_list(Config.OVERFLOW_BAGS),
+            fallback = copy_list(Config.FILL_FALLBACK),
+        },
+        used_names  = used_names,
+        pinned_bags = pinned_bags,
+        bags        = {},
+    }
+    for b in pairs(Config.PROTECTED) do snapshot.protected[b] = true end
+
+    snapshot.bags[INV_BAG] = capture_bag(INV_BAG, Items)
+    local function add(list)
+        for _, b in ipairs(list) do
+            if not snapshot.bags[b] and not snapshot.protected[b] then
+                snapshot.bags[b] = capture_bag(b, Items)
+            end
+        end
+    end
+    add(scan)
+    add(primary)
+    add(overflow)
+    return snapshot
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   CLASSIFICATION
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- True for a movable equipment entry (what the live phases consider).
+function Planner.is_movable(it)
+    return it and it.id and it.id > 0 and it.status == 0 and it.equip and true or false
+end
+
+--- True if any name variant is in used_names.
+function Planner.is_used(it, used_names)
+    for _, n in ipairs(it.names or {}) do
+        if used_names[n] then return true end
+    end
+    return false
+end
+
+--- First name variant with a pin list, and that list.
+function Planner.pins_of(it, pinned_bags)
+    for _, n in ipairs(it.names or {}) do
+        local pins = pinned_bags[n]
+        if pins and #pins > 0 then return n, pins end
+    end
+    return nil, nil
+end
+
+--- Bags scanned for a snapshot, in config order (primary first), minus protected.
+function Planner.scope(snapshot)
+    local out, seen = {}, {}
+    local function add(list)
+        for _, b in ipairs(list) do
+            if not seen[b] and not snapshot.protected[b] and snapshot.bags[b] then
+                seen[b] = true
+                table.insert(out, b)
+            end
+        end
+    end
+    add(snapshot.primary)
+    add(snapshot.overflow)
+    return out
+end
+
+--- Claim pool of a pinned name: pins minus bags holding a locked
+--- (status ~= 0) copy of the same name, minus protected bags.
+--- @param snapshot table Snapshot (or simulator world, same `bags` shape)
+--- @param pools table name -> pool (mutated)
+function Planner.claim_pool(snapshot, name, pins, pools)
+    if pools[name] then return pools[name] end
+    local remaining = {}
+    for _, b in ipairs(pins) do
+        local locked = snapshot.protected[b] or not snapshot.bags[b]
+        if not locked then
+            for _, it in ipairs(snapshot.bags[b].items) do
+                if it.id > 0 and it.status ~= 0 then
+                    for _, n in ipairs(it.names or {}) do
+                        if n == name then locked = true break end
+                    end
+                    if locked then break end
+                end
+            end
+        end
+        if not locked then table.insert(remaining, b) end
+    end
+    pools[name] = {remaining = remaining}
+    return pools[name]
+end
+
+--- Claim a pin bag for one copy (prefers the bag it is already in).
+function Planner.claim_pin(pool, current_bag)
+    for i, b in ipairs(pool.remaining) do
+        if b == current_bag then
+            table.remove(pool.remaining, i)
+            return b
+        end
+    end
+    if #pool.remaining > 0 then
+        return table.remove(pool.remaining, 1)
+    end
+    return nil
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   SOLVER
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Packets per burst, adaptive delay (kept identical to run_burst_loop).
+function Planner.burst_delay(packets)
+    return math.max(1.0, math.min(Config.POST_BURST_DELAY, packets * 0.1))
+end
+
+--- Bags of `list` scanned at or after scope position `after`.
+local function behind(list, rank, after)
+    local out = {}
+    for _, b in ipairs(list) do
+        if rank[b] and rank[b] >= after then table.insert(out, b) end
+    end
+    return out
+end
+
+--- List every movable item with its goal.
+--- Pins: copies already in one of their pin bags keep it, the other copies
+--- claim what is left in scan order. The verify (State / Simulator.misplaced)
+--- hands pins out in scope order on the FINAL layout, so a spare copy (more
+--- copies than pins) left in a bag scanned before the last pin bag would
+--- take that pin from its holder: spares only go to bags scanned at or after
+--- the last pin bag (a used spare behind an overflow pin goes to overflow).
+--- @return table entries {bag, slot, id, name, kind='pin'|'primary'|'overflow', pin, dsts}
+local function classify(snapshot)
+    local entries, pinned = {}, {}
+    local use_pins = snapshot.mode ~= 'alt'
+    local order = Planner.scope(snapshot)
+    local rank = {}
+    for i, b in ipairs(order) do rank[b] = i end
+    table.insert(order, INV_BAG)
+    for _, b in ipairs(order) do
+        for slot, it in ipairs(snapshot.bags[b].items) do
+            if Planner.is_movable(it) then
+                local entry = {bag = b, slot = slot, id = it.id, name = it.name or ('id:' .. it.id)}
+                if use_pins then entry.pin_name, entry.pins = Planner.pins_of(it, snapshot.pinned_bags) end
+                if entry.pins then table.insert(pinned, entry) end
+                entry.used = Planner.is_used(it, snapshot.used_names)
+                entry.kind = entry.used and 'primary' or 'overflow'
+                table.insert(entries, entry)
+            end
+        end
+    end
+
+    local pools = {}
+    for pass = 1, 2 do
+        for _, e in ipairs(pinned) do
+            if not e.pin then
+                local pool = Planner.claim_pool(snapshot, e.pin_name, e.pins, pools)
+                local holds = false
+                for _, b in ipairs(pool.remaining) do
+                    if b == e.bag then holds = true break end
+                end
+                if holds or pass == 2 then e.pin = Planner.claim_pin(pool, e.bag) end
+            end
+        end
+    end
+    local last = {}   -- pinned name -> scope position of its last pin bag
+    for _, e in ipairs(pinned) do
+        if e.pin then last[e.pin_name] = math.max(last[e.pin_name] or 0, rank[e.pin] or 0) end
+    end
+
+    for _, e in ipairs(entries) do
+        if e.pin then
+            e.kind, e.dsts = 'pin', {e.pin}
+        else
+            local list = e.kind == 'primary' and snapshot.primary or snapshot.overflow
+            local after = e.pin_name and last[e.pin_name]
+            if after then
+                list = behind(list, rank, after)
+                if #list == 0 then list = behind(snapshot.overflow, rank, after) end
+            end
+            e.dsts = list
+        end
+    end
+    return entries
+end
+
+--- Verify-style misplaced count of the copies of one pinned name, on the
+--- current layout or on the projected one (copies at their `dst`).
+local function copies_misplaced(snapshot, copies, rank, projected)
+    local primary_set = {}
+    for _, b in ipairs(snapshot.primary) do primary_set[b] = true end
+    local at, order = {}, {}
+    for i, e in ipairs(copies) do
+        at[e] = projected and e.dst or e.bag
+        order[e] = (rank[at[e]] or #snapshot.primary + #snapshot.overflow + 1) * 100000 + i
+    end
+    local sorted = {}
+    for i, e in ipairs(copies) do sorted[i] = e end
+    table.sort(sorted, function(a, b) return order[a] < order[b] end)
+
+    local pools, misplaced = {}, 0
+    for _, e in ipairs(sorted) do
+        local b = at[e]
+        if b == INV_BAG then
+            if not e.used then misplaced = misplaced + 1 end
+        else
+            local pin = Planner.claim_pin(Planner.claim_pool(snapshot, e.pin_name, e.pins, pools), b)
+            if pin then
+                if pin ~= b then misplaced = misplaced + 1 end
+            elseif e.used ~= (primary_set[b] == true) then
+                misplaced = misplaced + 1
+            end
+        end
+    end
+    return misplaced
+end
+
+--- Assign a destination to every misplaced entry, honoring final capacities.
+--- Entries that cannot be placed stay put; their bag then loses the slot it
+--- would have freed, so the assignment is recomputed until stable.
+--- The verify's claim is then re-run on the projected layout: a pinned name
+--- whose copies would end up more misplaced than they are now (a spare that
+--- found no room behind the last pin bag takes that pin) keeps all its
+--- copies in place, and the assignment is recomputed again.
+local function assign(snapshot, entries)
+    local rank, by_name = {}, {}
+    for i, b in ipairs(Planner.scope(snapshot)) do rank[b] = i end
+    for _, e in ipairs(entries) do
+        if e.pin_name then
+            by_name[e.pin_name] = by_name[e.pin_name] or {}
+            table.insert(by_name[e.pin_name], e)
+        end
+    end
+
+    local function acceptable(e)
+        for _, b in ipairs(e.dsts) do
+            if b == e.bag then return true end
+        end
+        return false
+    end
+
+    local base_free = {}
+    for _, b in ipairs(Planner.scope(snapshot)) do
+        local bag = snapshot.bags[b]
+        local used = 0
+        for _, it in ipairs(bag.items) do
+            if it.id > 0 then used = used + 1 end
+        end
+        base_free[b] = bag.max - used
+    end
+
+    local stays = {}   -- [entry] = true: could not be placed
+    while true do
+        local free = {}
+        for b, n in pairs(base_free) do free[b] = n end
+        local moving = {}
+        for _, e in ipairs(entries) do
+            e.dst = nil
+            if not acceptable(e) and not stays[e] then
+                table.insert(moving, e)
+                if free[e.bag] then free[e.bag] = free[e.bag] + 1 end
+            end
+        end
+
+        -- Pins first (one bag only), then used, then unused
+        local function place(e, bags)
+            for _, b in ipairs(bags) do
+                if (free[b] or 0) > 0 then
+                    free[b] = free[b] - 1
+                    e.dst = b
+                    return true
+                end
+            end
+            return false
+        end
+        local failed = false
+        for pass = 1, 3 do
+            for _, e in ipairs(moving) do
+                local ok = true
+                if (pass == 1 and e.kind == 'pin') or (pass == 2 and e.kind == 'primary')
+                   or (pass == 3 and e.kind == 'overflow') then
+                    ok = place(e, e.dsts)
+                end
+                if not ok then
+                    stays[e] = true
+                    failed = true
+                end
+            end
+        end
+        if not failed then
+            for _, copies in pairs(by_name) do
+                if copies_misplaced(snapshot, copies, rank, true) > copies_misplaced(snapshot, copies, rank, false) then
+                    for _, e in ipairs(copies) do
+                        if e.dst then
+                            stays[e] = true
+                            failed = true
+                        end
+                    end
+                end
+            end
+        end
+        if not failed then
+            local planned, unplaced = {}, {}
+            for _, e in ipairs(entries) do
+                if e.dst then
+                    table.insert(planned, e)
+                elseif stays[e] then
+                    table.insert(unplaced, e)
+                end
+            end
+            return planned, unplaced
+        end
+    end
+end
+
+--- Cut the planned moves into bursts.
+--- @return table bursts, table stuck (entries never scheduled)
+local function schedule(snapshot, planned)
+    local burst_size = Config.BURST_SIZE
+    local space = {}
+    for b, bag in pairs(snapshot.bags) do
+        local used = 0
+        for _, it in ipairs(bag.items) do
+            if it.id > 0 then used = used + 1 end
+        end
+        space[b] = bag.max - used
+    end
+
+    local waiting, pending = {}, {}   -- in inventory / still in their bag
+    for _, e in ipairs(planned) do
+        if e.bag == INV_BAG then
+            table.insert(waiting, e)
+        else
+            table.insert(pending, e)
+        end
+    end
+    -- Evictions from primary first: they free the slots promotions need
+    local primary_set = {}
+    for _, b in ipairs(snapshot.primary) do primary_set[b] = true end
+    local rank = {}
+    for i, e in ipairs(pending) do
+        rank[e] = (primary_set[e.bag] and 0 or 1) * 100000 + i
+    end
+    table.sort(pending, function(a, b) return rank[a] < rank[b] end)
+
+    local bursts = {}
+    while #waiting > 0 or #pending > 0 do
+        local burst = {pushes = {}, pulls = {}}
+        local budget = burst_size
+        -- pull_slot() checks the burst-start inventory view: no pulls if full.
+        -- Keep one slot free when possible so the next burst can pull too.
+        local inv_open = space[INV_BAG] > 0
+        local inv_floor = space[INV_BAG] >= 2 and 1 or 0
+
+        -- Pushes: items already in inventory whose destination has room
+        local still = {}
+        for _, e in ipairs(waiting) do
+            if budget > 0 and space[e.dst] > 0 then
+                space[e.dst] = space[e.dst] - 1
+                space[INV_BAG] = space[INV_BAG] + 1
+                budget = budget - 1
+                table.insert(burst.pushes, {id = e.id, name = e.name, dst = e.dst, from = e.bag})
+            else
+                table.insert(still, e)
+            end
+        end
+        waiting = still
+
+        -- Projected room for next burst's pushes
+        local proj = {}
+        for b, n in pairs(space) do proj[b] = n end
+        for _, e in ipairs(waiting) do proj[e.dst] = proj[e.dst] - 1 end
+
+        local picked = {}
+        local function pull(i)
+            local e = pending[i]
+            picked[i] = true
+            proj[e.dst] = proj[e.dst] - 1
+            proj[e.bag] = proj[e.bag] + 1
+            space[INV_BAG] = space[INV_BAG] - 1
+            budget = budget - 1
+            table.insert(burst.pulls, {bag = e.bag, slot = e.slot, id = e.id, name = e.name, dst = e.dst})
+        end
+        local function pull_ready(floor)
+            local any = true
+            local count = 0
+            while any do
+                any = false
+                for i, e in ipairs(pending) do
+                    if budget <= 0 or space[INV_BAG] <= floor then return count end
+                    if not picked[i] and proj[e.dst] > 0 then
+                        pull(i)
+                        count = count + 1
+                        any = true
+                    end
+                end
+            end
+            return count
+        end
+
+        -- Swap seeds: both bags full, item A must go where B sits and B where
+        -- A sits. Pulling A makes B ready, pulling B frees A's destination.
+        -- Needs two inventory slots per pair.
+        if not inv_open then budget = 0 end
+        local pulled = pull_ready(inv_floor)
+        while budget >= 2 and space[INV_BAG] >= 2 do
+            local seed = nil
+            for i, e in ipairs(pending) do
+                if not picked[i] then
+                    for j, other in ipairs(pending) do
+                        if not picked[j] and other.dst == e.bag and other.bag == e.dst then
+                            seed = i
+                            break
+                        end
+                    end
+                    if seed then break end
+                end
+            end
+            if not seed then break end
+            pull(seed)
+            pulled = pulled + pull_ready(0)
+        end
+        -- Longer cycles: pull any item sitting where another one must go.
+        if pulled == 0 and #burst.pushes == 0 and budget >= 2 and space[INV_BAG] >= 2 then
+            local wanted = {}
+            for i, e in ipairs(pending) do
+                if not picked[i] then wanted[e.dst] = true end
+            end
+            for i, e in ipairs(pending) do
+                if not picked[i] and wanted[e.bag] then
+                    pull(i)
+                    pull_ready(0)
+                    break
+                end
+            end
+        end
+
+        if #burst.pushes == 0 and #burst.pulls == 0 then
+            break
+        end
+        for i = #pending, 1, -1 do
+            if picked[i] then
+                local e = pending[i]
+                space[e.bag] = space[e.bag] + 1
+                table.insert(waiting, e)
+                table.remove(pending, i)
+            end
+        end
+        table.insert(bursts, burst)
+    end
+
+    local stuck = {}
+    for _, e in ipairs(waiting) do table.insert(stuck, e) end
+    for _, e in ipairs(pending) do table.insert(stuck, e) end
+    return bursts, stuck
+end
+
+--- Solve the layout of a snapshot.
+--- @param snapshot table See header
+--- @return table plan {bursts, moves, packets, items, unplaced, stuck, est_seconds}
+function Planner.solve(snapshot)
+    local entries = classify(snapshot)
+    local planned, unplaced = assign(snapshot, entries)
+    local bursts, stuck = schedule(snapshot, planned)
+
+    local packets, seconds = 0, 0
+    for _, burst in ipairs(bursts) do
+        local n = #burst.pushes + #burst.pulls
+        packets = packets + n
+        seconds = seconds + Planner.burst_delay(n)
+    end
+    return {
+        bursts      = bursts,
+        packets     = packets,
+        items       = #planned,
+        unplaced    = unplaced,
+        stuck       = stuck,
+        est_seconds = seconds,
+    }
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   SAVE / LOAD
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Serialize a plain value (tables with string/number keys) as Lua source.
+local function serialize(value, indent, out)
+    local t = type(value)
+    if t == 'string' then
+        table.insert(out, string.format('%q', value))
+    elseif t ~= 'table' then
+        table.insert(out, tostring(value))
+    else
+        local pad = string.rep('  ', indent + 1)
+        table.insert(out, '{\n')
+        local n = #value
+        for i = 1, n do
+            table.insert(out, pad)
+            serialize(value[i], indent + 1, out)
+            table.insert(out, ',\n')
+        end
+        local keys = {}
+        for k in pairs(value) do
+            if not (type(k) == 'number' and k >= 1 and k <= n and k % 1 == 0) then
+                table.insert(keys, k)
+            end
+        end
+        table.sort(keys, function(a, b) return tostring(a) < tostring(b) end)
+        for _, k in ipairs(keys) do
+            if type(k) == 'string' and k:match('^[%a_][%w_]*$') then
+                table.insert(out, pad .. k .. ' = ')
+            else
+                table.insert(out, pad .. '[' .. (type(k) == 'string' and string.format('%q', k) or tostring(k)) .. '] = ')
+            end
+            serialize(value[k], indent + 1, out)
+            table.insert(out, ',\n')
+        end
+        table.insert(out, string.rep('  ', indent) .. '}')
+    end
+end
+
+--- Write a snapshot to a Lua file (reloaded with Planner.load).
+--- @return boolean success
+function Planner.save(snapshot, path)
+    local out = {'-- Wardrobe snapshot (//gs c wo snapshot)\nreturn '}
+    serialize(snapshot, 0, out)
+    table.insert(out, '\n')
+    local f = io.open(path, 'w')
+    if not f then return false end
+    f:write(table.concat(out))
+    f:close()
+    return true
+end
+
+--- Load a saved snapshot.
+--- @return table|nil snapshot, string|nil error
+function Planner.load(path)
+    local ok, snapshot = pcall(dofile, path)
+    if not ok or type(snapshot) ~= 'table' or snapshot.version ~= SNAPSHOT_VERSION then
+        return nil, 'invalid snapshot: ' .. tostring(ok and 'version' or snapshot)
+    end
+    return snapshot
+end
+
+return Planner
@@ -0,0 +1,514 @@
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Wardrobe Organizer - Move Simulator & Benchmark
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Runs organize flows against an in-memory copy of a planner snapshot
+---   (no packets sent), so the planner and the live algorithm can be compared
+---   on the same inventory:
+---
+---     planned : replay of Planner.solve() bursts (what Phases.replay_plan sends)
+---     legacy  : model of the current flow - Phase 2/3 run_burst_loop with
+---               re-discovery each step, Phase 4 cleanup passes and the
+---               outer auto-retry loop (job mode) - using the same budgets,
+---               stuck/cycle limits and delays as phases.lua.
+---
+---   Server model: packets are applied in send order; a pull needs a free
+---   inventory slot, a push a free slot in the destination, otherwise the
+---   packet is rejected (counted). Within a burst the client view is the
+---   burst-start state, as with space_in() in the live code.
+---
+---   Public functions:
+---     Simulator.run_plan(snapshot, plan)  - replay a plan, return stats
+---     Simulator.run_legacy(snapshot)      - simulate the current algorithm
+---     Simulator.misplaced(world)          - verify-style misplaced count
+---     Simulator.compare(snapshot)         - both + solve time (benchmark)
+---     Simulator.cases()                   - built-in regression snapshots
+---
+---   @file shared/utils/wardrobe/lib/simulator.lua
+---  ═══════════════════════════════════════════════════════════════════════════
+
+local Config  = require('shared/utils/wardrobe/lib/config')
+local Planner = require('shared/utils/wardrobe/lib/planner')
+
+local Simulator = {}
+
+local INV_BAG = Config.INV_BAG
+local is_movable = Planner.is_movable
+local is_used = Planner.is_used
+
+-- Fixed overheads of one organize iteration (Phase 0 naked + lock, settle)
+local UNEQUIP_TIME = 1.2 + 0.3
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   WORLD MODEL
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Deep copy of the snapshot bags (the snapshot itself is never mutated).
+local function new_world(snapshot)
+    local world = {
+        snapshot  = snapshot,
+        protected = snapshot.protected,
+        bags      = {},
+        packets   = 0,
+        rejected  = 0,
+        seconds   = 0,
+    }
+    for b, bag in pairs(snapshot.bags) do
+        local items = {}
+        for slot, it in ipairs(bag.items) do
+            local copy = {}
+            for k, v in pairs(it) do copy[k] = v end
+            items[slot] = copy
+        end
+        world.bags[b] = {max = bag.max, items = items}
+    end
+    return world
+end
+
+local function free_in(world, b)
+    local bag = world.bags[b]
+    if not bag then return 0 end
+    local used = 0
+    for _, it in ipairs(bag.items) do
+        if it.id > 0 then used = used + 1 end
+    end
+    return bag.max - used
+end
+
+local function first_empty(bag)
+    for slot = 1, bag.max do
+        if not bag.items[slot] or bag.items[slot].id == 0 then return slot end
+    end
+    return nil
+end
+
+--- Server side of get_item: bag[slot] -> first empty inventory slot.
+local function server_get(world, b, slot)
+    world.packets = world.packets + 1
+    local src = world.bags[b]
+    local it = src and src.items[slot]
+    local dst_slot = first_empty(world.bags[INV_BAG])
+    if not it or not is_movable(it) or not dst_slot then
+        world.rejected = world.rejected + 1
+        return false
+    end
+    world.bags[INV_BAG].items[dst_slot] = it
+    src.items[slot] = {id = 0}
+    return true
+end
+
+--- Server side of put_item: inventory[slot] -> first empty slot of dst.
+local function server_put(world, dst, inv_slot)
+    world.packets = world.packets + 1
+    local inv = world.bags[INV_BAG]
+    local it = inv.items[inv_slot]
+    local bag = world.bags[dst]
+    local dst_slot = bag and first_empty(bag)
+    if not it or not is_movable(it) or not dst_slot then
+        world.rejected = world.rejected + 1
+        return false
+    end
+    bag.items[dst_slot] = it
+    inv.items[inv_slot] = {id = 0}
+    return true
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   LAYOUT CHECK  (same rules as State.build_state + count_inv_gear)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Misplaced count of a world: W1/W2 unused + overflow used + unused gear in inv.
+function Simulator.misplaced(world)
+    local snapshot = world.snapshot
+    local primary_set = {}
+    for _, b in ipairs(snapshot.primary) do primary_set[b] = true end
+    local use_pins = snapshot.mode ~= 'alt'
+    local pools = {}
+    local misplaced = 0
+    for _, b in ipairs(Planner.scope(snapshot)) do
+        for _, it in ipairs(world.bags[b].items) do
+            if is_movable(it) then
+                local name, pins = nil, nil
+                if use_pins then name, pins = Planner.pins_of(it, snapshot.pinned_bags) end
+                local pin = pins and Planner.claim_pin(Planner.claim_pool(world, name, pins, pools), b)
+                if pin then
+                    if pin ~= b then misplaced = misplaced + 1 end
+                elseif is_used(it, snapshot.used_names) then
+                    if not primary_set[b] then misplaced = misplaced + 1 end
+                elseif primary_set[b] then
+                    misplaced = misplaced + 1
+                end
+            end
+        end
+    end
+    for _, it in ipairs(world.bags[INV_BAG].items) do
+        if is_movable(it) and not is_used(it, snapshot.used_names) then
+            misplaced = misplaced + 1
+        end
+    end
+    return misplaced
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PLANNED REPLAY  (mirrors Phases.replay_plan)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Replay a plan burst by burst.
+--- @return table {packets, rejected, bursts, misplaced, est_seconds}
+function Simulator.run_plan(snapshot, plan)
+    local world = new_world(snapshot)
+    for _, burst in ipairs(plan.bursts) do
+        -- Pushes resolve their inventory slot by id on the burst-start view
+        local taken = {}
+        local inv_open = free_in(world, INV_BAG) > 0
+        local inv = world.bags[INV_BAG].items
+        local targets = {}
+        for _, push in ipairs(burst.pushes) do
+            for slot, it in ipairs(inv) do
+                if not taken[slot] and it.id == push.id and it.status == 0 then
+                    taken[slot] = true
+                    table.insert(targets, {slot = slot, dst = push.dst})
+                    break
+                end
+            end
+        end
+        for _, t in ipairs(targets) do
+            server_put(world, t.dst, t.slot)
+        end
+        world.rejected = world.rejected + (#burst.pushes - #targets)
+        for _, pull in ipairs(burst.pulls) do
+            if inv_open then
+                server_get(world, pull.bag, pull.slot)
+            else
+                world.rejected = world.rejected + 1
+            end
+        end
+        world.seconds = world.seconds + Planner.burst_delay(#burst.pushes + #burst.pulls)
+    end
+    return {
+        packets     = world.packets,
+        rejected    = world.rejected,
+        bursts      = #plan.bursts,
+        iterations  = 1,
+        misplaced   = Simulator.misplaced(world),
+        est_seconds = UNEQUIP_TIME + world.seconds + Config.SETTLE_DELAY,
+    }
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   LEGACY MODEL  (phases.lua run_burst_loop / cleanup_inv / outer loop)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Pins of an inventory item, bags without a copy of the same id first
+--- (Moves.unclaimed_pins_first).
+local function unclaimed_pins_first(world, it)
+    local snapshot = world.snapshot
+    if snapshot.mode == 'alt' then return {} end
+    local _, pins = Planner.pins_of(it, snapshot.pinned_bags)
+    if not pins then return {} end
+    if #pins <= 1 then return pins end
+    local unclaimed, claimed = {}, {}
+    for _, b in ipairs(pins) do
+        local has_copy = false
+        for _, other in ipairs(world.bags[b] and world.bags[b].items or {}) do
+            if other.id == it.id then has_copy = true break end
+        end
+        table.insert(has_copy and claimed or unclaimed, b)
+    end
+    for _, b in ipairs(claimed) do table.insert(unclaimed, b) end
+    return unclaimed
+end
+
+--- Phase 2 / A2 (evict=true) or Phase 3 / A3 (evict=false) discovery.
+local function discover(world, evict)
+    local snapshot = world.snapshot
+    local use_pins = snapshot.mode ~= 'alt'
+    local pending, drainable = {}, {}
+    local pools = {}
+    for _, b in ipairs(evict and snapshot.primary or snapshot.overflow) do
+        if world.bags[b] and not world.protected[b] then
+            for slot, it in ipairs(world.bags[b].items) do
+                if is_movable(it) then
+                    local name, pins = nil, nil
+                    if use_pins then name, pins = Planner.pins_of(it, snapshot.pinned_bags) end
+                    local pin = pins and Planner.claim_pin(Planner.claim_pool(world, name, pins, pools), b)
+                    local used = is_used(it, snapshot.used_names)
+                    if (pin and pin ~= b) or (not pin and used ~= evict) then
+                        table.insert(pending, {bag = b, slot = slot})
+                    end
+                end
+            end
+        end
+    end
+    for slot, it in ipairs(world.bags[INV_BAG].items) do
+        if is_movable(it) then
+            local pins = unclaimed_pins_first(world, it)
+            local used = is_used(it, snapshot.used_names)
+            if #pins > 0 then
+                table.insert(drainable, {slot = slot, id = it.id, dst_list = pins, is_pinned = true})
+            elseif used ~= evict then
+                table.insert(drainable, {slot = slot, id = it.id,
+                    dst_list = evict and snapshot.overflow or snapshot.primary})
+            end
+        end
+    end
+    return pending, drainable
+end
+
+--- One run_burst_loop phase. Returns the number of steps (bursts).
+local function legacy_burst_loop(world, evict)
+    local steps, stuck = 0, 0
+    local last_remaining, same_remaining = nil, 0
+    while true do
+        steps = steps + 1
+        if steps > Config.MAX_STEPS then return steps - 1 end
+        local pending, drainable = discover(world, evict)
+        local remaining = #pending + #drainable
+        if remaining == 0 then return steps - 1 end
+        if last_remaining == remaining then
+            same_remaining = same_remaining + 1
+            if same_remaining >= Config.TRULY_STUCK_THRESHOLD then return steps - 1 end
+        else
+            same_remaining = 0
+        end
+        last_remaining = remaining
+
+        -- Client view = burst-start free counts
+        local view = {}
+        for b in pairs(world.bags) do view[b] = free_in(world, b) end
+        local inv_free = view[INV_BAG]
+
+        local push_budget = math.min(Config.BURST_SIZE, #drainable)
+        local pull_budget = math.min(Config.BURST_SIZE - push_budget, inv_free + push_budget, #pending)
+
+        local burst_claims, sends = {}, {}
+        local pushes = 0
+        for i = 1, push_budget do
+            local d = drainable[i]
+            local claimed = d.is_pinned and burst_claims[d.id] or nil
+            for _, dst in ipairs(d.dst_list) do
+                if (not claimed or not claimed[dst]) and (view[dst] or 0) > 0 then
+                    if d.is_pinned then
+                        burst_claims[d.id] = burst_claims[d.id] or {}
+                        burst_claims[d.id][dst] = true
+                    end
+                    table.insert(sends, {put = true, dst = dst, slot = d.slot})
+                    pushes = pushes + 1
+                    break
+                end
+            end
+        end
+        local pulls = 0
+        for i = 1, pull_budget do
+            if inv_free > 0 then
+                table.insert(sends, {bag = pending[i].bag, slot = pending[i].slot})
+                pulls = pulls + 1
+            end
+        end
+        for _, s in ipairs(sends) do
+            if s.put then server_put(world, s.dst, s.slot) else server_get(world, s.bag, s.slot) end
+        end
+
+        local total = pushes + pulls
+        stuck = (total == 0) and (stuck + 1) or 0
+        if stuck >= Config.STUCK_LIMIT then return steps end
+        world.seconds = world.seconds + Planner.burst_delay(total)
+        world.bursts = (world.bursts or 0) + 1
+    end
+end
+
+--- Phase 4 cleanup passes (one push per MOVE_DELAY).
+local function legacy_cleanup(world)
+    local snapshot = world.snapshot
+    local lists = snapshot.cleanup or {}
+    local primary = lists.primary or snapshot.primary
+    local fallback = lists.fallback or snapshot.overflow
+    local overflow = lists.overflow or snapshot.overflow
+    local pass = 0
+    while true do
+        pass = pass + 1
+        local plan = {}
+        for slot, it in ipairs(world.bags[INV_BAG].items) do
+            if is_movable(it) then
+                local pins = unclaimed_pins_first(world, it)
+                local used = is_used(it, snapshot.used_names)
+                local dsts, seen = {}, {}
+                local function add(list)
+                    for _, b in ipairs(list) do
+                        if not seen[b] then seen[b] = true table.insert(dsts, b) end
+                    end
+                end
+                if #pins > 0 then
+                    add(pins)
+                    if used then add(primary) end
+                    add(fallback)
+                elseif used then
+                    add(primary)
+                    add(fallback)
+                else
+                    add(overflow)
+                end
+                table.insert(plan, {slot = slot, id = it.id, dsts = dsts, is_pinned = #pins > 0})
+            end
+        end
+        if #plan == 0 or pass > Config.CLEANUP_MAX_PASSES then return end
+        local claims = {}
+        for _, p in ipairs(plan) do
+            local it = world.bags[INV_BAG].items[p.slot]
+            if it and it.id == p.id and it.status == 0 then
+                local claimed = p.is_pinned and claims[p.id] or nil
+                for _, dst in ipairs(p.dsts) do
+                    if (not claimed or not claimed[dst]) and free_in(world, dst) > 0 then
+                        if server_put(world, dst, p.slot) then
+                            if p.is_pinned then
+                                claims[p.id] = claims[p.id] or {}
+                                claims[p.id][dst] = true
+                            end
+                            break
+                        end
+                    end
+                end
+            end
+            world.seconds = world.seconds + Config.MOVE_DELAY
+        end
+        world.seconds = world.seconds + Config.MOVE_DELAY * 2
+    end
+end
+
+--- Simulate the current organize flow on a snapshot.
+--- @return table {packets, rejected, bursts, iterations, misplaced, est_seconds}
+function Simulator.run_legacy(snapshot)
+    local world = new_world(snapshot)
+    world.bursts = 0
+    local iterations = 0
+
+    if snapshot.mode == 'alt' then
+        iterations = 1
+        world.seconds = world.seconds + UNEQUIP_TIME
+        legacy_burst_loop(world, true)
+        world.seconds = world.seconds + Config.PHASE_DELAY
+        legacy_burst_loop(world, false)
+        world.seconds = world.seconds + Config.PHASE_DELAY
+        legacy_cleanup(world)
+        world.seconds = world.seconds + Config.SETTLE_DELAY
+    else
+        local last, same = math.huge, 0
+        while true do
+            iterations = iterations + 1
+            world.seconds = world.seconds + UNEQUIP_TIME
+            local misplaced = Simulator.misplaced(world)
+            if misplaced == 0 then break end
+            local pending2, _ = discover(world, true)
+            local pending3, _ = discover(world, false)
+            if #pending2 > 0 or #pending3 > 0 then
+                legacy_burst_loop(world, true)
+                world.seconds = world.seconds + Config.PHASE_DELAY
+                legacy_burst_loop(world, false)
+                world.seconds = world.seconds + Config.PHASE_DELAY
+            end
+            legacy_cleanup(world)
+            world.seconds = world.seconds + Config.SETTLE_DELAY
+
+            -- finish_run / should_retry
+            misplaced = Simulator.misplaced(world)
+            same = (misplaced == last) and (same + 1) or 0
+            if misplaced == 0 or same >= Config.TRULY_STUCK_THRESHOLD
+               or iterations >= Config.MAX_OUTER_ITERATIONS then
+                if misplaced > 0 then
+                    world.seconds = world.seconds + Config.SETTLE_DELAY  -- last-chance verify
+                end
+                break
+            end
+            last = misplaced
+            world.seconds = world.seconds + Config.RETRY_DELAY
+        end
+    end
+
+    return {
+        packets     = world.packets,
+        rejected    = world.rejected,
+        bursts      = world.bursts,
+        iterations  = iterations,
+        misplaced   = Simulator.misplaced(world),
+        est_seconds = world.seconds,
+    }
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   BENCHMARK
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Solve + replay the plan and simulate the current flow on one snapshot.
+--- @return table {plan, planned, legacy, solve_ms}
+function Simulator.compare(snapshot)
+    local start = os.clock()
+    local plan = Planner.solve(snapshot)
+    local solve_ms = (os.clock() - start) * 1000
+    return {
+        plan     = plan,
+        planned  = Simulator.run_plan(snapshot, plan),
+        legacy   = Simulator.run_legacy(snapshot),
+        solve_ms = solve_ms,
+    }
+end
+
+---  ═══════════════════════════════════════════════════════════════════════════
+---   BENCH CASES  (//gs c wo bench cases)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Job-mode snapshot from a compact layout: {[bag_id] = {item_id, ...}}.
+--- Item names are 'item<id>'; every bag has `max` slots (default 10).
+local function case_snapshot(layout, used, pins, max)
+    max = max or 10
+    local snapshot = {
+        version     = 1,
+        character   = 'bench',
+        mode        = 'job',
+        primary     = {},
+        overflow    = {},
+        protected   = {},
+        used_names  = {},
+        pinned_bags = pins or {},
+        bags        = {},
+    }
+    for i, b in ipairs(Config.PRIMARY_BAGS) do snapshot.primary[i] = b end
+    for i, b in ipairs(Config.OVERFLOW_BAGS) do snapshot.overflow[i] = b end
+    for b in pairs(Config.PROTECTED) do snapshot.protected[b] = true end
+    for _, id in ipairs(used or {}) do snapshot.used_names['item' .. id] = true end
+    local bags = {INV_BAG}
+    for _, b in ipairs(Config.ALL_WARDROBES) do table.insert(bags, b) end
+    for _, b in ipairs(bags) do
+        local items = {}
+        for slot = 1, max do
+            local id = layout[b] and layout[b][slot]
+            if id then
+                local name = 'item' .. id
+                items[slot] = {id = id, count = 1, status = 0, name = name, names = {name}, equip = true}
+            else
+                items[slot] = {id = 0}
+            end
+        end
+        snapshot.bags[b] = {max = max, items = items}
+    end
+    return snapshot
+end
+
+--- Small snapshots with a known trap. The planned run must never end with
+--- more misplaced items than the current flow.
+--- @return table list of {name, snapshot}
+function Simulator.cases()
+    local W1, W2, W3, W6 = 8, 10, 11, 14
+    local full_w3 = {301, 302, 303, 304, 305, 306, 307, 308, 309}
+    return {
+        -- Spare copy of a name pinned to W6: scanned before W6 it would take
+        -- the pin from the copy moved there.
+        {name = 'pin W6, used spare in W3',
+         snapshot = case_snapshot({[W2] = {211}, [W3] = {211}}, {211}, {item211 = {W6}})},
+        {name = 'pin W6, unused spare in W3',
+         snapshot = case_snapshot({[W2] = {211}, [W3] = {211}}, {}, {item211 = {W6}})},
+        -- Spare with no room behind its pin bag (W3 is scanned last)
+        {name = 'pin W3 (full), spares in W1',
+         snapshot = case_snapshot({[W1] = {221, 221}, [W3] = full_w3}, {221}, {item221 = {W3}})},
+    }
+end
+
+return Simulator
@@ -9,6 +9,8 @@
 ---     lib/moves.lua   - Move primitives (pull_slot, push_slot, space_in)
 ---     lib/state.lua   - State recensement (build_state, pin assignment)
 ---     lib/phases.lua  - Phase 0 unequip + Phase 2/3/4 algorithms
+---     lib/planner.lua - Offline move planner (snapshot -> burst plan)
+---     lib/simulator.lua - Plan/legacy simulation + benchmark (no packets)
 ---
 ---   This file owns:
 ---     - Public API exposed to COMMON_COMMANDS (organize/preview/verify_global/reset)
@@ -23,6 +25,11 @@
 ---     Phase 4  Cleanup any leftover inventory gear (with retries)
 ---     ----     Re-enable all slots, snapshot final state, auto-retry if needed
 ---
+---   Planned mode (//gs c wo plan [alt]):
+---     Phase 0, then ONE snapshot -> Planner.solve -> replay the bursts with
+---     no re-discovery -> verify. Job mode falls back to finish_run's
+---     auto-retry only if more items are off than the plan could place.
+---
 ---   @file    shared/utils/wardrobe/wardrobe_organizer.lua
 ---   @author  Tetsouo
 ---   @version 3.0  (modularized)
@@ -36,6 +43,7 @@ local Items = require('shared/utils/wardrobe/lib/items')
 local Moves = require('shared/utils/wardrobe/lib/moves')
 local State = require('shared/utils/wardrobe/lib/state')
 local Phases = require('shared/utils/wardrobe/lib/phases')
+local Planner = require('shared/utils/wardrobe/lib/planner')
 
 local WardrobeOrganizer = {}
 
@@ -614,6 +622,176 @@ function WardrobeOrganizer.recover()
     Chat.success('Recovery sent: 3 spaced enable passes for all 16 slots.')
 end
 
+---  ═══════════════════════════════════════════════════════════════════════════
+---   PLANNED MODE  (offline planner + replay, benchmark, snapshot file)
+---  ═══════════════════════════════════════════════════════════════════════════
+
+--- Path of the saved snapshot for the current character.
+local function snapshot_path()
+    local p = windower.ffxi.get_player()
+    local name = p and p.name or 'Unknown'
+    return windower.addon_path .. 'data/' .. name .. '/wardrobe_snapshot.lua'
+end
+
+--- Final check of a planned run. Items the plan could not place (no room in
+--- their target bags) are expected leftovers; anything beyond that (dropped
+--- packets) goes through finish_run's auto-retry in job mode.
+local function finish_planned(mode, plan)
+    coroutine.schedule(with_panic_unlock(function()
+        local snapshot = Planner.capture(mode)
+        local Simulator = require('shared/utils/wardrobe/lib/simulator')
+        local misplaced = snapshot and Simulator.misplaced({
+            snapshot = snapshot, bags = snapshot.bags, protected = snapshot.protected,
+        }) or -1
+        local expected = #plan.unplaced
+        dlog(('PLAN VERIFY: misplaced=%d (unplaced by plan=%d)'):format(misplaced, expected))
+        if mode == 'job' and misplaced > expected then
+            Chat.warn(string.format('%d items still off after replay, switching to the standard flow...', misplaced))
+            finish_run()
+            return
+        end
+        Chat.banner('Wardrobe Organize (planned) - Complete')
+        Chat.detail('Moves sent', plan.packets)
+        Chat.detail('Bursts', #plan.bursts)
+        Chat.detail('Misplaced', misplaced)
+        if expected > 0 then Chat.detail('No room (left in place)', expected) end
+        Chat.separator()
+        if misplaced == 0 then
+            Chat.success('DONE - safe to move, zone, change job.')
+        else
+            Chat.warn('DONE (with leftovers) - safe to move, zone, change job.')
+        end
+        dlog('========== WARDROBE ORGANIZE PLAN END ==========')
+        clean_exit()
+        schedule_lockstyle()
+    end, 'finish_planned'), Config.SETTLE_DELAY)
+end
+
+--- Organize from a precomputed plan: one snapshot, one solve, then replay.
+--- @param mode string|nil 'job' (default) or 'alt'
+function WardrobeOrganizer.organize_plan(mode)
+    mode = (mode == 'alt') and 'alt' or 'job'
+    if IS_RUNNING then
+        Chat.warn('Organize already in progress (use //gs c wo reset to clear).')
+        return
+    end
+    if mode == 'job' and (not _G.sets or type(_G.sets) ~= 'table') then
+        Chat.error('No sets table found (load a job first).')
+        return
+    end
+    Config.refresh()
+    reset_module_state()
+    IS_RUNNING = true
+    outer_iteration = 1
+    start_job_tag = active_job_tag()
+    Log.dlog_clear()
+    dlog(('========== WARDROBE ORGANIZE PLAN START (%s) =========='):format(mode))
+    Chat.banner('Wardrobe Organize - Planned')
+    Chat.detail('Active job', start_job_tag)
+    Chat.detail('Mode',       mode)
+    Chat.alert('PROCESSING - please wait. Do NOT move, zone or change job.')
+    Chat.phase(0, 'Unequipping current gear', nil)
+
+    Phases.unequip(with_panic_unlock(function()
+        if job_changed() then
+            abort_run('Job changed mid-run, aborting.')
+            return
+        end
+        local snapshot, err = Planner.capture(mode)
+        if not snapshot then
+            Chat.error('Failed to snapshot bags: ' .. tostring(err))
+            clean_exit()
+            return
+        end
+        local start = os.clock()
+        local plan = Planner.solve(snapshot)
+        dlog(('PLAN: %d items, %d packets, %d bursts, %d unplaced, %d stuck (%.1f ms)'):format(
+            plan.items, plan.packets, #plan.bursts, #plan.unplaced, #plan.stuck,
+            (os.clock() - start) * 1000))
+        for _, e in ipairs(plan.unplaced) do
+            dlog(('  UNPLACED: %s @%s[%d] (%s, no room)'):format(e.name, Log.bag_name(e.bag), e.slot, e.kind))
+        end
+        Chat.phase(1, 'Plan ready', string.format('%d items  %d moves  %d bursts  ~%ds',
+            plan.items, plan.packets, #plan.bursts, math.floor(plan.est_seconds + 0.5)))
+        if #plan.bursts == 0 then
+            Chat.success('Wardrobes already optimized (nothing to move).')
+            dlog('========== WARDROBE ORGANIZE PLAN END (clean) ==========')
+            clean_exit()
+            schedule_lockstyle()
+            return
+        end
+        Chat.phase(2, 'Replaying plan', nil)
+        Phases.replay_plan(plan, function() finish_planned(mode, plan) end)
+    end, 'organize_plan'))
+end
+
+--- Benchmark: planner vs the current algorithm on the same snapshot (no moves).
+--- @param source string|nil 'alt' (live, alt bags), 'saved' (snapshot file),
+---        'cases' (built-in regression snapshots) or nil (live, job)
+function WardrobeOrganizer.bench(source)
+    Config.refresh()
+    local function row(label, s)
+        Chat.detail(label, string.format('%d moves (%d rejected)  %d bursts  %d iter  ~%ds  misplaced %d',
+            s.packets, s.rejected, s.bursts, s.iterations, math.floor(s.est_seconds + 0.5), s.misplaced))
+    end
+    if source == 'cases' then
+        local Simulator = require('shared/utils/wardrobe/lib/simulator')
+        local worse = 0
+        Chat.banner('Wardrobe Bench (built-in cases)')
+        for _, case in ipairs(Simulator.cases()) do
+            local r = Simulator.compare(case.snapshot)
+            Chat.section(case.name)
+            row('Planned', r.planned)
+            row('Current', r.legacy)
+            if r.planned.misplaced > r.legacy.misplaced then worse = worse + 1 end
+        end
+        Chat.separator()
+        if worse > 0 then
+            Chat.error(string.format('%d case(s) end with more misplaced items than the current flow', worse))
+        else
+            Chat.success('Planned flow never ends worse than the current one')
+        end
+        return
+    end
+    local snapshot, err
+    if source == 'saved' or source == 'file' then
+        snapshot, err = Planner.load(snapshot_path())
+    else
+        snapshot, err = Planner.capture(source == 'alt' and 'alt' or 'job')
+    end
+    if not snapshot then
+        Chat.error(tostring(err))
+        return
+    end
+    local Simulator = require('shared/utils/wardrobe/lib/simulator')
+    local r = Simulator.compare(snapshot)
+    Chat.banner('Wardrobe Bench (' .. (snapshot.character or '?') .. ', ' .. snapshot.mode .. ')')
+    Chat.detail('Items to move', r.plan.items)
+    Chat.detail('Unplaced (no room)', #r.plan.unplaced)
+    Chat.detail('Solve time', string.format('%.1f ms', r.solve_ms))
+    row('Planned', r.planned)
+    row('Current', r.legacy)
+    Chat.separator()
+end
+
+--- Save a snapshot of the live bags to data/<char>/wardrobe_snapshot.lua
+--- (re-run the benchmark on it later with //gs c wo bench saved).
+--- @param mode string|nil 'job' (default) or 'alt'
+function WardrobeOrganizer.save_snapshot(mode)
+    Config.refresh()
+    local snapshot, err = Planner.capture(mode == 'alt' and 'alt' or 'job')
+    if not snapshot then
+        Chat.error(tostring(err))
+        return
+    end
+    local path = snapshot_path()
+    if Planner.save(snapshot, path) then
+        Chat.success('Snapshot saved: ' .. path)
+    else
+        Chat.error('Could not write ' .. path)
+    end
+end
+
 -- Legacy command compatibility (//gs c wo global / preview)
 WardrobeOrganizer.organize_global = WardrobeOrganizer.organize
 WardrobeOrganizer.preview_global = WardrobeOrganizer.preview
@@ -11,6 +11,8 @@
 
 local CastHelpers = {}
 
+local ItemIndex = require('shared/utils/data/item_index')
+
 ---============================================================================
 --- INVENTORY CHECKING
 ---============================================================================
@@ -39,8 +41,8 @@ function CastHelpers.has_item(item_name, item_id)
         'wardrobe8'     -- Bag 16
     }
 
-    -- Load resources for item name lookups
-    local res = require('resources')
+    -- Resolve the name once (shared index) instead of a res lookup per item
+    local name_id = ItemIndex.id_of(item_name)
 
     -- Check all equippable bags using STRING keys (like equipment_checker)
     for _, bag_name in ipairs(EQUIPPABLE_BAGS) do
@@ -48,14 +50,8 @@ function CastHelpers.has_item(item_name, item_id)
         if bag_items and type(bag_items) == 'table' then
             for _, item in ipairs(bag_items) do
                 if item and item.id and item.id > 0 then
-                    -- Check by ID (most reliable)
-                    if item_id and item.id == item_id then
-                        return true
-                    end
-
-                    -- Check by name
-                    local res_item = res.items[item.id]
-                    if res_item and res_item.en and res_item.en:lower() == item_name:lower() then
+                    -- Check by ID (most reliable), then by resolved name
+                    if (item_id and item.id == item_id) or (name_id and item.id == name_id) then
                         return true
                     end
                 end
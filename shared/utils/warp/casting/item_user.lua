@@ -3,6 +3,7 @@
 local MessageWarp = require('shared/utils/messages/formatters/system/message_warp')
 local MessageCore = require('shared/utils/messages/message_core')
 local CastHelpers = require('shared/utils/warp/casting/cast_helpers')
+local ItemIndex = require('shared/utils/data/item_index')
 
 -- Cache resources for performance
 local res = require('resources')
@@ -427,7 +428,7 @@ function ItemUser._wait_for_ring_usable(ring_name, ring_id, is_warp_ring, tag, i
                 MessageWarp.show_tele_using(ring_name)
             end
 
-            local item_name = res.items[ring_id] and res.items[ring_id].en or ring_name
+            local item_name = ItemIndex.name_of(ring_id) or ring_name
 
             -- Get cast time from database for proper timing
             local WarpDatabase = require('shared/utils/warp/warp_item_database')
@@ -532,7 +533,7 @@ function ItemUser._setup_auto_fix(ring_id, tag, cast_duration, initial_ring1, it
         debug_log('Verifying ring1 restoration...')
 
         -- Get warp item name for comparison
-        local warp_item_name = res.items[ring_id] and res.items[ring_id].en or 'unknown'
+        local warp_item_name = ItemIndex.name_of(ring_id) or 'unknown'
 
         coroutine.schedule(function()
             -- Wait for GearSwap to restore equipment
@@ -166,28 +166,25 @@ function WarpDetector.clear_callbacks()
 end
 
 --- Initialize action event listener for item usage detection.
---- Idempotent: unregister-then-register so each gs reload gets a fresh handler
---- and we never accumulate stale ones. The event id lives on `windower.*` so
---- it survives the `_G` wipe that comes with `gs reload` (cf the same
---- convention in dualbox_sync_ipc.init_listener).
+--- Idempotent: the shared action listener (PacketDispatcher) replaces the
+--- handler registered under the same key, and drops the previous load's
+--- registration on gs reload.
 function WarpDetector.init_action_listener()
     -- ALWAYS clear callbacks on init (ensures fresh start on reload)
     WarpDetector.clear_callbacks()
 
-    if not windower or not windower.register_event then return end
+    if not windower or not windower.raw_register_event then return end
 
+    -- Legacy: event id registered directly by older versions of this module
     if windower._warp_detector_event_id then
         pcall(windower.unregister_event, windower._warp_detector_event_id)
         windower._warp_detector_event_id = nil
     end
 
-    windower._warp_detector_event_id = windower.register_event('action', function(act)
-        -- Safety: Check if act exists (Windower sometimes sends nil)
-        if not act then return end
-
-        -- Category 9 = Item usage
-        if act.category ~= 9 then return end
+    local PacketDispatcher = require('shared/utils/core/packet_dispatcher')
 
+    -- Category 9 = Item usage
+    PacketDispatcher.on_action('warp_item', function(act)
         -- Check if action is from player
         if not player or act.actor_id ~= player.id then return end
 
@@ -201,7 +198,7 @@ function WarpDetector.init_action_listener()
                 pcall(callback, 'item', warp_data)
             end
         end
-    end)
+    end, 9)
 end
 
 ---============================================================================
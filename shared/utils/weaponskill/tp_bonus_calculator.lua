@@ -15,10 +15,16 @@
 ---   Logic: Only equip TP bonus gear if it allows reaching the next TP threshold (2000 or 3000)
 ---   Equipment strategy: Equip the MINIMUM necessary pieces to reach threshold
 ---
+---   Lookup table: the piece choice only depends on the real TP (TP + weapon +
+---   buff + Fencer bonuses), so each tp_config gets a table built once from
+---   search() for every whole real TP between the lowest reachable TP and the
+---   top threshold. calculate() adds the bonuses and reads one entry.
+---   //gs c tpbench checks the table against search() and times both.
+---
 ---   @module  TP_BONUS_CALCULATOR
 ---   @author  Tetsouo
----   @version 1.3 - Lazy loading for MessageWeaponskill
----   @date    Created: 2025-01-02 | Updated: 2025-11-27
+---   @version 1.4 - Precomputed piece lookup per tp_config
+---   @date    Created: 2025-01-02 | Updated: 2026-10-18
 ---  ═══════════════════════════════════════════════════════════════════════════
 
 ---  ═══════════════════════════════════════════════════════════════════════════
@@ -51,14 +57,15 @@ TPBonusCalculator.config = {
 ---   Core Functions
 ---  ═══════════════════════════════════════════════════════════════════════════
 
---- Calculate which TP bonus gear to equip based on current TP and available bonuses
+--- Search which TP bonus gear to equip (reference implementation, debug output)
+--- calculate() returns the same gear from the lookup table.
 --- @param current_tp number Current TP amount (1000-2999)
 --- @param tp_config table Job-specific TP config (pieces, weapons, buffs)
 --- @param weapon_name string Current main weapon name
 --- @param active_buffs table Table of active buffs (buffactive)
 --- @param sub_weapon string Current sub weapon name (optional, for Fencer detection)
 --- @return table|nil Table of gear to equip {ear1="...", legs="..."} or nil if none needed
-function TPBonusCalculator.calculate(current_tp, tp_config, weapon_name, active_buffs, sub_weapon)
+function TPBonusCalculator.search(current_tp, tp_config, weapon_name, active_buffs, sub_weapon)
     -- Validation
     if not current_tp or not tp_config then
         if TPBonusCalculator.config.debug_mode then
@@ -196,6 +203,227 @@ function TPBonusCalculator.calculate(current_tp, tp_config, weapon_name, active_
     return nil
 end
 
+---  ═══════════════════════════════════════════════════════════════════════════
+---   Lookup Table
+---  ═══════════════════════════════════════════════════════════════════════════
+
+-- tp_config -> {pieces, thresholds, exact, low, high, [real_tp] = gear}
+local lookups = setmetatable({}, { __mode = 'k' })
+
+--- Real TP before gear: TP + weapon + buff + Fencer bonuses (same sum as search())
+local function real_tp_of(current_tp, tp_config, weapon_name, active_buffs, sub_weapon)
+    local weapon_bonus = 0
+    if weapon_name and tp_config.get_weapon_bonus then
+        weapon_bonus = tp_config.get_weapon_bonus(weapon_name)
+    end
+
+    local buff_bonus = 0
+    if active_buffs and active_buffs['Warcry'] and tp_config.get_warcry_bonus then
+        buff_bonus = buff_bonus + tp_config.get_warcry_bonus()
+    end
+    if tp_config.get_hagakure_bonus then
+        buff_bonus = buff_bonus + tp_config.get_hagakure_bonus()
+    end
+
+    local fencer_bonus = 0
+    if weapon_name and tp_config.get_fencer_bonus then
+        fencer_bonus = tp_config.get_fencer_bonus(weapon_name, sub_weapon)
+    end
+
+    return current_tp + weapon_bonus + buff_bonus + fencer_bonus
+end
+
+--- Same gear content (slot -> name)
+local function same_gear(a, b)
+    if a == nil or b == nil then
+        return a == b
+    end
+    for slot, name in pairs(a) do
+        if b[slot] ~= name then
+            return false
+        end
+    end
+    for slot in pairs(b) do
+        if a[slot] == nil then
+            return false
+        end
+    end
+    return true
+end
+
+--- Build the real TP -> gear table of a tp_config
+--- Thresholds and piece bonuses are whole numbers, so every real TP in
+--- [n, n+1) picks the same pieces as n: one entry per whole real TP.
+--- @return table lookup (exact = false when a bonus is fractional)
+local function build_lookup(tp_config)
+    local thresholds = TPBonusCalculator.config.thresholds
+    local lookup = { pieces = tp_config.pieces, thresholds = thresholds, exact = true }
+    lookups[tp_config] = lookup
+    if type(tp_config.pieces) ~= 'table' or #thresholds == 0 then
+        return lookup
+    end
+
+    local total, low, high = 0, math.huge, -math.huge
+    for _, piece in ipairs(tp_config.pieces) do
+        total = total + piece.bonus
+        if piece.bonus % 1 ~= 0 then
+            lookup.exact = false
+        end
+    end
+    for _, threshold in ipairs(thresholds) do
+        low = math.min(low, threshold - total)
+        high = math.max(high, threshold - 1)
+        if threshold % 1 ~= 0 then
+            lookup.exact = false
+        end
+    end
+    if not lookup.exact then
+        return lookup
+    end
+
+    -- search() with no bonus source: real TP == current TP
+    local bare = { pieces = tp_config.pieces }
+    local debug_mode = TPBonusCalculator.config.debug_mode
+    TPBonusCalculator.config.debug_mode = false
+    local previous = nil
+    for real_tp = math.max(low, 0), high do
+        local gear = TPBonusCalculator.search(real_tp, bare)
+        -- Consecutive TPs share one gear table
+        if same_gear(gear, previous) then
+            gear = previous
+        end
+        lookup[real_tp] = gear
+        previous = gear
+    end
+    TPBonusCalculator.config.debug_mode = debug_mode
+    lookup.low, lookup.high = low, high
+    return lookup
+end
+
+--- Lookup table of a tp_config (rebuilt when pieces or thresholds are replaced)
+local function get_lookup(tp_config)
+    local lookup = lookups[tp_config]
+    if not lookup or lookup.pieces ~= tp_config.pieces or lookup.thresholds ~= TPBonusCalculator.config.thresholds then
+        lookup = build_lookup(tp_config)
+    end
+    return lookup
+end
+
+--- Calculate which TP bonus gear to equip based on current TP and available bonuses
+--- The returned table is shared between calls: equip() it, do not modify it.
+--- @param current_tp number Current TP amount (1000-2999)
+--- @param tp_config table Job-specific TP config (pieces, weapons, buffs)
+--- @param weapon_name string Current main weapon name
+--- @param active_buffs table Table of active buffs (buffactive)
+--- @param sub_weapon string Current sub weapon name (optional, for Fencer detection)
+--- @return table|nil Table of gear to equip {ear1="...", legs="..."} or nil if none needed
+function TPBonusCalculator.calculate(current_tp, tp_config, weapon_name, active_buffs, sub_weapon)
+    if TPBonusCalculator.config.debug_mode or not current_tp or not tp_config then
+        return TPBonusCalculator.search(current_tp, tp_config, weapon_name, active_buffs, sub_weapon)
+    end
+    local lookup = get_lookup(tp_config)
+    if not lookup.exact then
+        return TPBonusCalculator.search(current_tp, tp_config, weapon_name, active_buffs, sub_weapon)
+    end
+    return lookup[math.floor(real_tp_of(current_tp, tp_config, weapon_name, active_buffs, sub_weapon))]
+end
+
+--- Drop the lookup tables (after editing pieces or thresholds in place)
+function TPBonusCalculator.invalidate()
+    lookups = setmetatable({}, { __mode = 'k' })
+end
+
+--- Check calculate() against search() for every TP, weapon, sub and buff
+--- state of a tp_config, then time both.
+--- @param tp_config table Job-specific TP config
+--- @param iterations number|nil Timing passes over the samples (default 20)
+--- @return table {samples, iterations, search_us, lookup_us, mismatches, entries}
+function TPBonusCalculator.benchmark(tp_config, iterations)
+    iterations = iterations or 20
+
+    local mains = { false }
+    for _, weapon in ipairs(tp_config.weapons or {}) do
+        table.insert(mains, weapon.name)
+    end
+    for _, weapon in ipairs(tp_config.one_hand_weapons or {}) do
+        table.insert(mains, weapon)
+    end
+    table.insert(mains, 'Benchmark Weapon')
+    local subs = { false, 'empty', 'Benchmark Weapon' }
+    for _, list in ipairs({ tp_config.shields or {}, tp_config.grips or {} }) do
+        for _, item in ipairs(list) do
+            table.insert(subs, item)
+        end
+    end
+    local buff_states = { {}, { Warcry = true }, { Hagakure = true }, { Warcry = true, Hagakure = true } }
+
+    -- get_hagakure_bonus() reads the global buffactive
+    local saved_buffs = buffactive
+    local debug_mode = TPBonusCalculator.config.debug_mode
+    TPBonusCalculator.config.debug_mode = false
+
+    local samples = {}
+    local mismatches = 0
+    for _, buffs in ipairs(buff_states) do
+        buffactive = buffs
+        for _, main in ipairs(mains) do
+            for _, sub in ipairs(subs) do
+                for tp = 0, 3000 do
+                    local expected = TPBonusCalculator.search(tp, tp_config, main or nil, buffs, sub or nil)
+                    local got = TPBonusCalculator.calculate(tp, tp_config, main or nil, buffs, sub or nil)
+                    if not same_gear(expected, got) then
+                        mismatches = mismatches + 1
+                    end
+                end
+                table.insert(samples, { main = main or nil, sub = sub or nil, buffs = buffs })
+            end
+        end
+    end
+
+    -- Timing: WS range TPs over every weapon/sub/buff combination
+    local tps = {}
+    for tp = 1000, 3000, 50 do
+        table.insert(tps, tp)
+    end
+    local search, calculate = TPBonusCalculator.search, TPBonusCalculator.calculate
+    local started = os.clock()
+    for _ = 1, iterations do
+        for _, s in ipairs(samples) do
+            buffactive = s.buffs
+            for _, tp in ipairs(tps) do
+                search(tp, tp_config, s.main, s.buffs, s.sub)
+            end
+        end
+    end
+    local search_time = os.clock() - started
+
+    started = os.clock()
+    for _ = 1, iterations do
+        for _, s in ipairs(samples) do
+            buffactive = s.buffs
+            for _, tp in ipairs(tps) do
+                calculate(tp, tp_config, s.main, s.buffs, s.sub)
+            end
+        end
+    end
+    local lookup_time = os.clock() - started
+
+    buffactive = saved_buffs
+    TPBonusCalculator.config.debug_mode = debug_mode
+
+    local lookup = get_lookup(tp_config)
+    local calls = math.max(1, #samples * #tps * iterations)
+    return {
+        samples    = #samples * 3001,
+        iterations = iterations,
+        search_us  = search_time * 1e6 / calls,
+        lookup_us  = lookup_time * 1e6 / calls,
+        mismatches = mismatches,
+        entries    = lookup.exact and lookup.high and (lookup.high - math.max(lookup.low, 0) + 1) or 0,
+        exact      = lookup.exact,
+    }
+end
+
 --- Get expected final TP after applying TP bonus gear
 --- @param current_tp number Current TP
 --- @param gear_table table Gear to equip (result from calculate())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tool Arguments - Tetsouo GearSwap System
+========================================
+Command-line handling shared by the Python tools. Each tool declares its
+flags (no value) and options (one value); check_args() rejects anything
+else before the tool does any work, so a typo or `--help` prints the usage
+instead of running a full build.
+
+    FLAGS = ('--check',)
+    OPTIONS = ('--char',)
+
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
+    char = arg_value('--char')
+
+An option followed by another `--flag` (or by nothing) has no value.
+Options listed in `integers` / `numbers` must have a whole / numeric
+value. The usage text is the "Usage:" part of the tool's docstring, up to
+"Author:".
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import sys
+
+HELP = ('--help', '-h')
+
+
+def arg_value(flag, default=None):
+    """Return the value following `flag` in sys.argv, or default."""
+    if flag in sys.argv:
+        idx = sys.argv.index(flag)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return default
+
+
+def usage(doc):
+    """The "Usage:" section of a tool docstring."""
+    if not doc or 'Usage:' not in doc:
+        return ''
+    return 'Usage:' + doc.split('Usage:', 1)[1].split('Author:', 1)[0].rstrip()
+
+
+def _is_number(text, kind):
+    try:
+        kind(text)
+    except ValueError:
+        return False
+    return True
+
+
+def bad_argument(args, flags=(), options=(), integers=(), numbers=(), positional=False):
+    """First argument that is not a known flag or a complete option, or None.
+
+    positional: plain (non '-') arguments are allowed (file lists).
+    """
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in options:
+            value = args[i + 1] if i + 1 < len(args) else None
+            if value is None or value.startswith('--'):
+                return f'{arg} (missing value)'
+            if (arg in integers and not _is_number(value, int)
+                    or arg in numbers and not _is_number(value, float)):
+                return f'{arg} {value}'
+            i += 2
+        elif arg in flags or (positional and not arg.startswith('-')):
+            i += 1
+        else:
+            return arg
+    return None
+
+
+def check_args(doc, flags=(), options=(), integers=(), numbers=(), positional=False, argv=None):
+    """Check the command line of a tool before it runs.
+
+    Returns None when every argument is known, otherwise prints the problem
+    and the usage and returns exit code 2 (also for --help / -h).
+    """
+    args = sys.argv[1:] if argv is None else argv
+    bad = bad_argument(args, flags, options, integers, numbers, positional)
+    if bad is None:
+        return None
+    if bad not in HELP:
+        print(f"[ERROR] Unknown or incomplete argument: {bad}")
+    print(usage(doc))
+    return 2
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Wardrobe Audit Index - Tetsouo GearSwap System
+==============================================
+Offline counterpart of shared/utils/equipment/wardrobe_auditor.lua.
+
+Evaluates every job set file once (local item tables such as ChirichRing1,
+set_combine inheritance, slot aliases) and builds an inverted index:
+
+    item name -> [(job, set path, slot, bag), ...]
+
+The compact part of the index (item -> jobs + pinned bags) is written to
+<Char>/wardrobe_index.lua. `//gs c wardrobeaudit` and the wardrobe organizer
+load that file with dofile() instead of text-parsing every set file inside
+the game client; they fall back to the in-game parser when the index is
+missing or any set file changed since it was built (size + Adler-32 per file).
+
+--find only prints where an item is used; it does not rewrite the index.
+
+Usage:
+    python wardrobe_audit.py                        (every <Char>/sets/ folder)
+    python wardrobe_audit.py --char Tetsouo
+    python wardrobe_audit.py --master               (_master/sets/, report only)
+    python wardrobe_audit.py --find "Chirich Ring +1" [--char Tetsouo]
+    python wardrobe_audit.py --char Tetsouo --json index.json
+
+Author: Tetsouo GearSwap Project
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import gear_sets
+from clone_character import CharacterDB
+from gear_sets import file_stamp, format_path, item_of, iter_sets, lua_string
+from tool_args import arg_value, check_args
+
+INDEX_FILE = 'wardrobe_index.lua'
+INDEX_VERSION = 2
+
+# "wardrobe N" -> FFXI bag id (same table as wardrobe_auditor.lua BAG_NAME_TO_ID)
+BAG_NAME_TO_ID = {
+    'wardrobe': 8, 'wardrobe 1': 8, 'wardrobe1': 8,
+    'wardrobe 2': 10, 'wardrobe2': 10,
+    'wardrobe 3': 11, 'wardrobe3': 11,
+    'wardrobe 4': 12, 'wardrobe4': 12,
+    'wardrobe 5': 13, 'wardrobe5': 13,
+    'wardrobe 6': 14, 'wardrobe6': 14,
+    'wardrobe 7': 15, 'wardrobe7': 15,
+    'wardrobe 8': 16, 'wardrobe8': 16,
+}
+
+
+# ============================================================================
+# INDEX BUILD
+# ============================================================================
+
+def build_index(sets_dir):
+    """
+    Evaluate all job set files under sets_dir and invert them.
+
+    Returns {
+        'jobs':    ['BLM', ...],
+        'sources': {relative_path: (size_in_bytes, adler32)},
+        'items':   {name_lower: {'name': str, 'jobs': {JOB},
+                                 'bags': {bag_id}, 'refs': [(JOB, path, slot, bag)]}},
+        'errors':  [str, ...],
+    }
+    """
+    sets_dir = Path(sets_dir)
+    job_files = gear_sets.discover_job_files(sets_dir)
+    index = {'jobs': [], 'sources': {}, 'items': {}, 'errors': []}
+
+    for path in sorted(sets_dir.rglob('*.lua')):
+        index['sources'][path.relative_to(sets_dir).as_posix()] = file_stamp(path)
+
+    for job_lower, paths in job_files.items():
+        job = job_lower.upper()
+        evaluator = gear_sets.evaluate_job(paths)
+        index['errors'].extend(evaluator.errors)
+        index['jobs'].append(job)
+        for set_path, slots in iter_sets(evaluator.sets):
+            label = format_path(set_path)
+            for slot, value in slots.items():
+                name, bag = item_of(value)
+                if not name:
+                    continue
+                entry = index['items'].setdefault(name.lower(), {
+                    'name': name, 'jobs': set(), 'bags': set(), 'refs': [],
+                })
+                entry['jobs'].add(job)
+                bag_id = BAG_NAME_TO_ID.get(bag.lower()) if bag else None
+                if bag_id:
+                    entry['bags'].add(bag_id)
+                entry['refs'].append((job, label, slot, bag))
+
+    return index
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_lua_index(index, out_path, character):
+    """Write the compact in-game index (item -> jobs + pinned bags)."""
+    lines = [
+        '---============================================================================',
+        f'--- Wardrobe Index - {character}',
+        '---============================================================================',
+        '--- GENERATED by wardrobe_audit.py - do not edit, re-run the script instead.',
+        '--- Loaded by shared/utils/equipment/wardrobe_auditor.lua. `sources` holds',
+        '--- {size, adler32} of every set file; any mismatch makes the auditor fall',
+        '--- back to parsing the set files in-game.',
+        '---============================================================================',
+        '',
+        'return {',
+        f'    version = {INDEX_VERSION},',
+        f"    generated = '{time.strftime('%Y-%m-%d %H:%M')}',",
+        f'    character = {lua_string(character)},',
+        '    jobs = { ' + ', '.join(lua_string(j) for j in index['jobs']) + ' },',
+        '    sources = {',
+    ]
+    for rel, (size, adler32) in sorted(index['sources'].items()):
+        lines.append(f'        [{lua_string(rel)}] = {{{size}, {adler32}}},')
+    lines.append('    },')
+    lines.append('    items = {')
+    for key in sorted(index['items']):
+        entry = index['items'][key]
+        fields = [lua_string(j) for j in sorted(entry['jobs'])]
+        if entry['bags']:
+            fields.append('bags = { ' + ', '.join(str(b) for b in sorted(entry['bags'])) + ' }')
+        lines.append(f"        [{lua_string(key)}] = {{ {', '.join(fields)} }},")
+    lines.append('    },')
+    lines.append('}')
+    Path(out_path).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def to_json(index):
+    """JSON-friendly copy of the full index (refs included)."""
+    return {
+        'jobs': index['jobs'],
+        'sources': index['sources'],
+        'errors': index['errors'],
+        'items': {
+            key: {
+                'name': e['name'],
+                'jobs': sorted(e['jobs']),
+                'bags': sorted(e['bags']),
+                'refs': [{'job': j, 'set': s, 'slot': slot, 'bag': bag}
+                         for j, s, slot, bag in e['refs']],
+            }
+            for key, e in sorted(index['items'].items())
+        },
+    }
+
+
+def print_summary(label, index, elapsed):
+    pinned = sum(1 for e in index['items'].values() if e['bags'])
+    refs = sum(len(e['refs']) for e in index['items'].values())
+    print(f"[OK] {label}: {len(index['jobs'])} jobs, {len(index['sources'])} files, "
+          f"{len(index['items'])} unique items ({pinned} pinned), {refs} slot refs "
+          f"in {elapsed * 1000:.0f} ms")
+    for err in index['errors']:
+        print(f"   [WARNING] {err}")
+
+
+def print_find(index, query):
+    entry = index['items'].get(query.lower())
+    if not entry:
+        print(f"   '{query}' is not used by any set")
+        return
+    print(f"   {entry['name']} - jobs: {', '.join(sorted(entry['jobs']))}")
+    for job, set_path, slot, bag in entry['refs']:
+        print(f"      {job:<4} {set_path:<50} {slot:<11} {bag or ''}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+# Command line: flags, and options that take a value
+FLAGS = ('--master',)
+OPTIONS = ('--find', '--char', '--json')
+
+
+def main():
+    code = check_args(__doc__, flags=FLAGS, options=OPTIONS)
+    if code is not None:
+        return code
+    base_dir = Path(__file__).parent.absolute()
+    find = arg_value('--find')
+    json_path = arg_value('--json')
+
+    if '--master' in sys.argv:
+        targets = [('_master', base_dir / '_master' / 'sets', None)]
+    else:
+        char = arg_value('--char')
+        if char:
+            names = [char]
+        else:
+            names = []
+            db_path = base_dir / 'character_db.lua'
+            if db_path.exists():
+                names = CharacterDB.load(db_path).get_character_names()
+        targets = []
+        for name in names:
+            char_dir = base_dir / name
+            if not (char_dir / 'sets').is_dir():
+                # Case-insensitive folder match (Windows users type 'tetsouo')
+                match = [d for d in base_dir.iterdir() if d.is_dir() and d.name.lower() == name.lower()]
+                if not match or not (match[0] / 'sets').is_dir():
+                    print(f"[SKIP] {name}: no {name}/sets/ folder")
+                    continue
+                char_dir = match[0]
+            targets.append((char_dir.name, char_dir / 'sets', char_dir / INDEX_FILE))
+
+    if not targets:
+        print("ERROR: nothing to index (use --char <Name> or --master)")
+        return 1
+
+    for label, sets_dir, out_path in targets:
+        started = time.perf_counter()
+        index = build_index(sets_dir)
+        print_summary(label, index, time.perf_counter() - started)
+        if out_path and not find:
+            write_lua_index(index, out_path, label)
+            print(f"   Wrote {out_path.relative_to(base_dir)}")
+        if find:
+            print_find(index, find)
+        if json_path:
+            out = Path(json_path)
+            if len(targets) > 1:
+                out = out.with_name(f"{out.stem}_{label}{out.suffix}")
+            out.write_text(json.dumps(to_json(index), indent=1, ensure_ascii=False),
+                           encoding='utf-8')
+            print(f"   Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())